@@ -0,0 +1,219 @@
+"""
+ALERTAS - Sistema Agencia Riviera Maya
+Avisos del dashboard y de Riviera Maya: citas próximas de pasaportes y visas,
+reservas por vencer y pagos pendientes.
+
+Las alertas ya vienen calculadas de la tabla `alertas` (motor_alertas.py);
+aquí sólo se muestran: una tabla paginada por tipo en lugar de una tarjeta
+por fila.
+"""
+
+from datetime import date, datetime
+
+import streamlit as st
+import pandas as pd
+
+from app_nucleo import conectar_db, obtener_alertas
+
+ALERTAS_POR_PAGINA = 10
+
+
+def _encabezado(fondo, borde, color, titulo, detalle):
+    st.markdown(
+        f"""<div style="background:{fondo};border-left:5px solid {borde};border-radius:12px;
+        padding:12px 20px;margin-bottom:8px;">
+        <div style="font-size:1.1rem;font-weight:700;color:{color};">{titulo}</div>
+        <div style="font-size:0.85rem;color:{color};margin-top:4px;">{detalle}</div>
+        </div>""", unsafe_allow_html=True)
+
+
+def _pagina(clave, alertas):
+    """Alertas de la página actual de `clave` (el número se guarda en la sesión)."""
+    paginas = max(1, -(-len(alertas) // ALERTAS_POR_PAGINA))
+    pagina = min(st.session_state.get(clave, 0), paginas - 1)
+    st.session_state[clave] = pagina
+    return pagina, paginas, alertas[pagina * ALERTAS_POR_PAGINA:(pagina + 1) * ALERTAS_POR_PAGINA]
+
+
+def _paginador(clave, pagina, paginas, total, unidad):
+    if paginas == 1:
+        st.caption(f"Total: **{total}** {unidad}.")
+        return
+    col1, col2, col3 = st.columns([1, 3, 1])
+    with col1:
+        if st.button("◀", key=f"{clave}_ant", disabled=pagina == 0, use_container_width=True):
+            st.session_state[clave] = pagina - 1
+            st.rerun()
+    with col2:
+        desde = pagina * ALERTAS_POR_PAGINA + 1
+        hasta = min(total, desde + ALERTAS_POR_PAGINA - 1)
+        st.caption(f"{desde}–{hasta} de **{total}** {unidad} · página {pagina + 1} de {paginas}")
+    with col3:
+        if st.button("▶", key=f"{clave}_sig", disabled=pagina == paginas - 1, use_container_width=True):
+            st.session_state[clave] = pagina + 1
+            st.rerun()
+
+
+def _dias(alerta, hoy):
+    return (date.fromisoformat(alerta["fecha_iso"]) - hoy).days
+
+
+def _cuando(dias):
+    return "¡HOY!" if dias == 0 else ("¡Mañana!" if dias == 1 else f"En {dias} días")
+
+
+_MONEDA = st.column_config.NumberColumn(format="$%.2f")
+
+
+def alertas_otros():
+    """Alertas de citas próximas de Pasaportes y Visas (7 días)"""
+    citas = obtener_alertas("cita", st.session_state.usuario_actual)
+    if not citas:
+        return
+
+    _encabezado("linear-gradient(135deg,#f3e5f5,#ede7f6)", "#7B1FA2", "#4A148C",
+                "🗓️ Citas Próximas — Pasaportes y Visas (próximos 7 días)",
+                "Recuerda confirmar y preparar la documentación con anticipación. "
+                "Detalle en <b>🗂️ Otros</b>.")
+
+    hoy = date.today()
+    pagina, paginas, visibles = _pagina("alertas_pag_citas", citas)
+    st.dataframe(pd.DataFrame([{
+        "Cuándo":   _cuando(_dias(a, hoy)),
+        "Cita":     a["fecha"],
+        "Trámite":  ("🛂 " if a["producto"] == "pasaporte" else "🌎 ") + a["tipo_venta"],
+        "Cliente":  a["cliente"],
+        "Celular":  a["celular"] or "—",
+        "Destino":  a["destino"] or "—",
+        "Estado":   a["estado"],
+    } for a in visibles]), hide_index=True, use_container_width=True)
+    _paginador("alertas_pag_citas", pagina, paginas, len(citas), "cita(s) en los próximos 7 días")
+    st.divider()
+
+
+def _confirmar_reservas(ids, nombre):
+    """Marca como confirmadas las reservas `ids` (una sola sentencia)."""
+    conn = conectar_db()
+    try:
+        conn.execute(f"""
+            UPDATE ventas
+            SET reserva_confirmada = 1,
+                reserva_confirmada_por = ?,
+                reserva_confirmada_fecha = ?
+            WHERE id IN ({', '.join('?' * len(ids))})
+        """, (nombre, datetime.now().strftime("%Y-%m-%d %H:%M"), *ids))
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def alertas_riviera():
+    """
+    Alertas para Riviera Maya:
+      🔴 Adeudos a 45 días del viaje
+      🟡 Viajes en los próximos 10 días (se confirman desde la tabla)
+    """
+    usuario   = st.session_state.usuario_actual
+    adeudos   = obtener_alertas("adeudo", usuario)
+    proximos  = obtener_alertas("proximo", usuario)
+    if not adeudos and not proximos:
+        return
+
+    hoy = date.today()
+    st.markdown("## 🚨 Alertas Importantes")
+
+    # ── Bloque 1: Adeudos ────────────────────────────────────────────────────
+    if adeudos:
+        _encabezado("linear-gradient(135deg,#fff0f0,#ffe0e0)", "#FF4444", "#CC0000",
+                    "🔴 Adeudos Críticos — Viajes en menos de 45 días",
+                    "⚠️ El mayorista exige liquidación <b>30 días antes</b>. "
+                    "Estos clientes aún tienen saldo pendiente.")
+        pagina, paginas, visibles = _pagina("alertas_pag_adeudos", adeudos)
+        filas = []
+        for a in visibles:
+            dias = _dias(a, hoy)
+            filas.append({
+                "Faltan":    f"{'🚨' if dias <= 30 else '⚠️'} {dias} días",
+                "Viaje":     a["fecha"],
+                "Cliente":   a["cliente"],
+                "Destino":   a["destino"],
+                "Saldo":     a["saldo"],
+                "Total":     a["total"],
+                "Pagado":    a["pagado"] / a["total"] * 100 if a["total"] else 0,
+                "Vendedora": a["vendedora"],
+                "Tipo":      a["tipo_venta"],
+                "Celular":   a["celular"] or "—",
+            })
+        st.dataframe(pd.DataFrame(filas), hide_index=True, use_container_width=True, column_config={
+            "Saldo":  _MONEDA,
+            "Total":  _MONEDA,
+            "Pagado": st.column_config.ProgressColumn(format="%.0f%%", min_value=0, max_value=100),
+        })
+        _paginador("alertas_pag_adeudos", pagina, paginas, len(adeudos),
+                   "cliente(s) con adeudo en los próximos 45 días")
+
+    # ── Bloque 2: Próximos viajes ─────────────────────────────────────────────
+    if proximos:
+        _encabezado("linear-gradient(135deg,#fffde7,#fff8c4)", "#F9A825", "#E65100",
+                    "🟡 Viajes en los Próximos 10 Días — Acción Requerida",
+                    "📋 Confirma con el <b>mayorista y el hotel</b> que la reserva existe y los "
+                    "pasajeros no tendrán problemas.<br>✅ Marca los viajes verificados y pulsa "
+                    "<b>Reserva Confirmada</b> para quitarlos de esta lista.")
+        pagina, paginas, visibles = _pagina("alertas_pag_proximos", proximos)
+        filas = []
+        for a in visibles:
+            menores = f" + {a['menores']} menor(es)" if a["menores"] else ""
+            filas.append({
+                "Confirmar":  False,
+                "Salida":     a["fecha"],
+                "Cuándo":     _cuando(_dias(a, hoy)),
+                "Cliente":    a["cliente"],
+                "Destino":    a["destino"],
+                "Estado":     a["estado"],
+                "Habitación": f"{a['tipo_habitacion'] or '—'} · {a['adultos']} adultos{menores}",
+                "Operador":   a["operador"] or "—",
+                "Regreso":    f"{a['fecha_fin'] or '—'} ({a['noches']} noches)",
+                "Saldo":      a["saldo"],
+                "Vendedora":  a["vendedora"],
+                "Celular":    a["celular"] or "—",
+                "ID":         a["referencia_id"],
+            })
+        df = pd.DataFrame(filas)
+        clave_editor = f"alertas_confirmar_{pagina}"
+        editado = st.data_editor(
+            df, key=clave_editor, hide_index=True, use_container_width=True,
+            disabled=[c for c in df.columns if c != "Confirmar"],
+            column_config={
+                "Confirmar": st.column_config.CheckboxColumn(
+                    "✅", help="Verificaste la reserva con el hotel/mayorista"),
+                "Saldo": _MONEDA,
+                "ID": st.column_config.NumberColumn(format="%d"),
+            })
+        marcadas = editado[editado["Confirmar"]]
+
+        col_btn, col_pag = st.columns([1, 3])
+        with col_btn:
+            if st.button(
+                f"✅ Reserva Confirmada ({len(marcadas)})",
+                key="alertas_confirmar",
+                disabled=marcadas.empty,
+                use_container_width=True,
+                help="Confirma que verificaste las reservas marcadas con el hotel/mayorista. Se quitarán permanentemente de esta alerta."
+            ):
+                nombre_quien = usuario.get("nombre", "—")
+                try:
+                    _confirmar_reservas([int(i) for i in marcadas["ID"]], nombre_quien)
+                    if len(marcadas) == 1:
+                        st.toast(f"✅ Reserva de {marcadas['Cliente'].iloc[0]} confirmada por {nombre_quien}", icon="✅")
+                    else:
+                        st.toast(f"✅ {len(marcadas)} reservas confirmadas por {nombre_quien}", icon="✅")
+                except Exception as e:
+                    st.error(f"Error al confirmar: {e}")
+                else:
+                    st.session_state.pop(clave_editor, None)
+                    st.rerun()
+        with col_pag:
+            _paginador("alertas_pag_proximos", pagina, paginas, len(proximos),
+                       "viaje(s) pendiente(s) de confirmación en los próximos 10 días")
+
+    st.divider()
@@ -0,0 +1,1328 @@
+"""
+NÚCLEO DE LA APP - Sistema Agencia Riviera Maya
+Lo que comparten las páginas de app_streamlit.py: configuración y pool de
+conexiones, cache de consultas, migraciones de arranque, tipo de cambio,
+folios de recibo, login y catálogos (operadores, vendedoras, hoteles,
+bloqueos y grupos).
+
+Streamlit vuelve a ejecutar app_streamlit.py en cada interacción; este
+módulo (como las páginas pagina_*.py) se importa una sola vez por proceso.
+"""
+
+import io
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+import streamlit as st
+import pandas as pd
+
+# Reducir memoria de pandas
+pd.set_option('display.max_columns', None)
+pd.set_option('display.max_rows', 100)
+
+from busqueda_clientes import buscar_clientes, instalar_busqueda_clientes
+from folios_recibo import FoliosRecibo
+from indice_hoteles import IndiceHoteles
+from inventario_habitaciones import instalar_apartados, liberar_apartados_vencidos
+from migracion_fechas_iso import aplicar_migracion_fechas_iso
+from migracion_indices import aplicar_migraciones_indices, verificar_indices
+from motor_alertas import TABLAS_FUENTE as TABLAS_ALERTAS, MotorAlertas, instalar_alertas
+from perfilador import PerfiladorConsultas, sumar_medicion
+from movimientos_pagos import FUENTES as FUENTES_MOVIMIENTOS, instalar_movimientos_pagos
+from resumen_ventas import instalar_resumen_ventas
+from sqlite_concurrencia import SQLITE_MODO, TurnoEscritura, configurar_conexion, es_escritura
+from tipo_cambio import ServicioTipoCambio
+from transacciones import transaccion
+
+# Configuración de base de datos
+DATABASE_URL = os.environ.get("DATABASE_URL", "")
+ES_POSTGRES = bool(DATABASE_URL)
+PSYCOPG2_DISPONIBLE = False
+
+if ES_POSTGRES:
+    try:
+        import psycopg2
+        PSYCOPG2_DISPONIBLE = True
+    except ImportError:
+        PSYCOPG2_DISPONIBLE = False
+        ES_POSTGRES = False
+
+# SQLite local (para desarrollo o fallback)
+DB_NAME = "agencia.db"
+
+# Función helper para ejecutar queries con el placeholder correcto
+def ejecutar_query(conn, query, params=None):
+    """Ejecuta una query con el placeholder correcto según la base de datos"""
+    cursor = conn.cursor()
+    # Convertir ? a %s para PostgreSQL
+    if ES_POSTGRES and PSYCOPG2_DISPONIBLE:
+        query = query.replace('?', '%s')
+    with _obtener_perfilador().origen("ejecutar_query"):
+        if params:
+            cursor.execute(query, params)
+        else:
+            cursor.execute(query)
+    return cursor
+
+def query_a_dataframe(conn, query, params=None):
+    """Ejecuta una query y devuelve un DataFrame"""
+    # Convertir ? a %s para PostgreSQL
+    if ES_POSTGRES and PSYCOPG2_DISPONIBLE:
+        query = query.replace('?', '%s')
+    cursor = conn.cursor()
+    with _obtener_perfilador().origen("query_a_dataframe"):
+        if params:
+            cursor.execute(query, params)
+        else:
+            cursor.execute(query)
+        columns = [desc[0] for desc in cursor.description] if cursor.description else []
+        rows = cursor.fetchall()
+    cursor.close()
+    if columns:
+        return pd.DataFrame(rows, columns=columns)
+    return pd.DataFrame()
+
+# Wrapper para pd.read_sql_query que maneja PostgreSQL
+def read_sql_query(sql, con, params=None):
+    """Wrapper para pd.read_sql_query que convierte placeholders para PostgreSQL"""
+    if ES_POSTGRES and PSYCOPG2_DISPONIBLE:
+        sql = sql.replace('?', '%s')
+    with _obtener_perfilador().origen("read_sql_query"):
+        return pd.read_sql_query(sql, con, params=params)
+
+# Rutas a los assets del recibo (misma carpeta que app_streamlit.py)
+_DIR   = os.path.dirname(os.path.abspath(__file__)) if "__file__" in dir() else "."
+LOGO_PATH = os.path.join(_DIR, "logo_turismar_clean.png")
+NINA_PATH  = os.path.join(_DIR, "nina_turismar.png")
+SELLO_PATH = os.path.join(_DIR, "sello_abono.jpg")
+
+# Folios de recibo: sobre la base configurada (secuencia en PostgreSQL)
+@st.cache_resource(show_spinner=False)
+def _obtener_folios_recibo():
+    return FoliosRecibo(conectar_db, es_postgres=ES_POSTGRES and PSYCOPG2_DISPONIBLE)
+
+def siguiente_num_recibo() -> int:
+    """Obtiene y avanza el correlativo de recibos."""
+    return _obtener_folios_recibo().siguiente()
+
+def reservar_nums_recibo(cantidad) -> list:
+    """Reserva `cantidad` folios de recibo de una vez (lotes)."""
+    return _obtener_folios_recibo().reservar(cantidad)
+
+
+@st.cache_resource(show_spinner=False)
+def logo_pantalla(ancho=600):
+    """
+    Logo reducido para mostrarlo en pantalla (PNG en bytes), o None si no está.
+    El original es de 5000x5000 px: pasarlo tal cual a st.image lo decodifica
+    y reduce en cada rerun.
+    """
+    if not os.path.exists(LOGO_PATH):
+        return None
+    from PIL import Image
+    with Image.open(LOGO_PATH) as im:
+        im = im.convert("RGB")
+        im.thumbnail((ancho, ancho), Image.LANCZOS)
+        buf = io.BytesIO()
+        im.save(buf, format="PNG", optimize=True)
+    return buf.getvalue()
+
+
+# ── Pool de conexiones ────────────────────────────────────────────────────
+# Streamlit re-ejecuta este script en cada interacción, por eso el pool vive
+# en st.cache_resource: es uno solo por proceso y sobrevive a los reruns.
+DB_POOL_MIN = int(os.environ.get("DB_POOL_MIN", "1"))
+DB_POOL_MAX = int(os.environ.get("DB_POOL_MAX", "10"))
+DB_POOL_ESPERA_MAX = float(os.environ.get("DB_POOL_ESPERA_MAX", "10"))  # seg
+DB_POOL_PING_INACTIVA = 60  # seg sin uso antes de verificar la conexión (Neon cierra las inactivas)
+
+
+class CursorWrapper:
+    """
+    Cursor de PostgreSQL que acepta placeholders '?' y hace rollback si falla.
+    Anota cada consulta (tiempo y filas) en el perfilador.
+    """
+    def __init__(self, cursor, conn, perfilador=None):
+        self._cursor = cursor
+        self._conn = conn
+        self._perfilador = perfilador
+        self._perfil = None
+
+    def execute(self, sql, params=None):
+        sql = sql.replace('?', '%s')
+        self._perfil = self._perfilador.consulta(sql, params) if self._perfilador else None
+        t0 = time.perf_counter()
+        try:
+            resultado = self._cursor.execute(sql, params)
+        except Exception as e:
+            self._conn.rollback()
+            raise e
+        sumar_medicion(self._perfil, t0, None if self._cursor.description else max(self._cursor.rowcount, 0))
+        _invalidar_cache_por_sql(sql)
+        return resultado
+
+    def fetchone(self):
+        t0 = time.perf_counter()
+        fila = self._cursor.fetchone()
+        sumar_medicion(self._perfil, t0, 0 if fila is None else 1)
+        return fila
+
+    def fetchmany(self, size=None):
+        t0 = time.perf_counter()
+        filas = self._cursor.fetchmany(size) if size is not None else self._cursor.fetchmany()
+        sumar_medicion(self._perfil, t0, len(filas))
+        return filas
+
+    def fetchall(self):
+        t0 = time.perf_counter()
+        filas = self._cursor.fetchall()
+        sumar_medicion(self._perfil, t0, len(filas))
+        return filas
+
+    def __getattr__(self, attr):
+        return getattr(self._cursor, attr)
+
+
+class ConnectionWrapper:
+    """Conexión PostgreSQL prestada por el pool; close() la devuelve al pool."""
+    def __init__(self, conn, pool=None):
+        self._conn = conn
+        self._pool = pool
+        self._liberada = False
+
+    def cursor(self):
+        return CursorWrapper(self._conn.cursor(), self._conn, _obtener_perfilador())
+
+    def execute(self, sql, params=None):
+        cur = self.cursor()
+        cur.execute(sql, params)
+        return cur
+
+    def commit(self):
+        return self._conn.commit()
+
+    def rollback(self):
+        return self._conn.rollback()
+
+    # Se asigna en la conexión real (transacciones.transaccion lo apaga por bloque)
+    @property
+    def autocommit(self):
+        return self._conn.autocommit
+
+    @autocommit.setter
+    def autocommit(self, valor):
+        self._conn.autocommit = valor
+
+    def close(self):
+        if self._liberada:
+            return
+        self._liberada = True
+        if self._pool is None:
+            return self._conn.close()
+        self._pool.devolver(self._conn)
+
+    def __del__(self):
+        # Si una página olvida cerrar la conexión, se devuelve al pool al recolectarse
+        if "_conn" in self.__dict__:
+            try:
+                self.close()
+            except Exception:
+                pass
+
+    def __getattr__(self, attr):
+        return getattr(self._conn, attr)
+
+
+class CursorSQLite(sqlite3.Cursor):
+    """
+    Cursor SQLite que avisa al cache de consultas qué tablas se modificaron,
+    pide el turno de escritura antes del primer INSERT/UPDATE/DELETE y anota
+    cada consulta (tiempo y filas) en el perfilador.
+    """
+    _perfil = None
+
+    def _perfilar(self, sql, params):
+        perfilador = self.connection._perfilador
+        self._perfil = perfilador.consulta(sql, params) if perfilador else None
+        return time.perf_counter()
+
+    def execute(self, sql, params=()):
+        if es_escritura(sql):
+            self.connection._iniciar_escritura()
+        t0 = self._perfilar(sql, params)
+        resultado = super().execute(sql, params)
+        sumar_medicion(self._perfil, t0, None if self.description else max(self.rowcount, 0))
+        self.connection._tablas_modificadas |= _invalidar_cache_por_sql(sql)
+        return resultado
+
+    def executemany(self, sql, seq_params):
+        if es_escritura(sql):
+            self.connection._iniciar_escritura()
+        t0 = self._perfilar(sql, None)
+        resultado = super().executemany(sql, seq_params)
+        sumar_medicion(self._perfil, t0, max(self.rowcount, 0))
+        self.connection._tablas_modificadas |= _invalidar_cache_por_sql(sql)
+        return resultado
+
+    def fetchone(self):
+        t0 = time.perf_counter()
+        fila = super().fetchone()
+        sumar_medicion(self._perfil, t0, 0 if fila is None else 1)
+        return fila
+
+    def fetchmany(self, size=None):
+        t0 = time.perf_counter()
+        filas = super().fetchmany(size) if size is not None else super().fetchmany()
+        sumar_medicion(self._perfil, t0, len(filas))
+        return filas
+
+    def fetchall(self):
+        t0 = time.perf_counter()
+        filas = super().fetchall()
+        sumar_medicion(self._perfil, t0, len(filas))
+        return filas
+
+    def executescript(self, script):
+        # executescript confirma lo pendiente y corre en autocommit: el turno
+        # se toma sólo mientras dura el script
+        propio = self.connection._tomar_turno()
+        try:
+            resultado = super().executescript(script)
+        finally:
+            if propio:
+                self.connection._soltar_turno()
+        self.connection._tablas_modificadas |= _invalidar_cache_por_sql(script)
+        return resultado
+
+
+class ConexionSQLite(sqlite3.Connection):
+    """
+    Conexión SQLite reutilizable dentro de un mismo hilo.
+    close() sólo la libera: descarta lo no confirmado (igual que un cierre real)
+    cuando el último usuario del hilo la suelta, pero la deja abierta para el
+    siguiente conectar_db().
+
+    Las escrituras abren la transacción con BEGIN IMMEDIATE después de tomar
+    el turno de escritura del proceso (sqlite_concurrencia.py), que se suelta
+    al confirmar o descartar.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._usos = 0
+        self._tablas_modificadas = set()
+        self._escritura = None      # TurnoEscritura del pool
+        self._perfilador = None     # PerfiladorConsultas del proceso
+        self._turno = None          # turno tomado por la transacción en curso
+
+    def _tomar_turno(self):
+        if self._escritura is None or self._turno is not None:
+            return False
+        self._turno = self._escritura.tomar()
+        return True
+
+    def _soltar_turno(self):
+        if self._turno is not None:
+            turno, self._turno = self._turno, None
+            self._escritura.soltar(turno)
+
+    def _iniciar_escritura(self):
+        if self.in_transaction or not self._tomar_turno():
+            return
+        try:
+            super().execute("BEGIN IMMEDIATE")
+        except Exception:
+            self._soltar_turno()
+            raise
+
+    def cursor(self, factory=CursorSQLite):
+        return super().cursor(factory)
+
+    def execute(self, sql, params=()):
+        return self.cursor().execute(sql, params)
+
+    def executemany(self, sql, seq_params):
+        return self.cursor().executemany(sql, seq_params)
+
+    def executescript(self, script):
+        return self.cursor().executescript(script)
+
+    def commit(self):
+        try:
+            super().commit()
+        finally:
+            self._soltar_turno()
+        # Se invalida otra vez al confirmar: otro hilo pudo cachear la versión
+        # anterior entre el execute() y el commit()
+        if self._tablas_modificadas:
+            _obtener_cache_consultas().invalidar(self._tablas_modificadas)
+            self._tablas_modificadas = set()
+
+    def rollback(self):
+        try:
+            super().rollback()
+        finally:
+            self._soltar_turno()
+
+    def close(self):
+        self._usos = max(0, self._usos - 1)
+        if self._usos == 0:
+            if self.in_transaction:
+                self.rollback()
+            self._soltar_turno()
+            self._tablas_modificadas = set()
+            self.row_factory = None
+
+
+class PoolConexiones:
+    """
+    Pool de conexiones del proceso.
+    PostgreSQL: ThreadedConnectionPool de psycopg2 (máx. DB_POOL_MAX conexiones).
+    SQLite: una conexión reutilizable por hilo, en el modo SQLITE_MODO y con
+    un solo turno de escritura para todas.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._escritura = TurnoEscritura()
+        self._pg_pool = None
+        self._semaforo = None
+        self._ultimo_uso = {}
+        self._metricas = {
+            "motor": "sqlite",
+            "tamano_max": 0,
+            "en_uso": 0,
+            "checkouts": 0,
+            "reusos": 0,
+            "conexiones_creadas": 0,
+            "descartadas": 0,
+            "desbordes": 0,
+            "espera_total_s": 0.0,
+            "espera_max_s": 0.0,
+        }
+        if ES_POSTGRES and PSYCOPG2_DISPONIBLE and DATABASE_URL:
+            from psycopg2 import pool as pg_pool
+            self._pg_pool = pg_pool.ThreadedConnectionPool(DB_POOL_MIN, DB_POOL_MAX, DATABASE_URL)
+            self._semaforo = threading.BoundedSemaphore(DB_POOL_MAX)
+            self._metricas["motor"] = "postgres"
+            self._metricas["tamano_max"] = DB_POOL_MAX
+
+    # ── PostgreSQL ────────────────────────────────────────
+    def _conexion_viva(self, conn):
+        if conn.closed:
+            return False
+        if time.time() - self._ultimo_uso.get(id(conn), 0) < DB_POOL_PING_INACTIVA:
+            return True
+        try:
+            conn.autocommit = True
+            cur = conn.cursor()
+            cur.execute("SELECT 1")
+            cur.close()
+            return True
+        except Exception:
+            return False
+
+    def _obtener_postgres(self):
+        inicio = time.perf_counter()
+        obtuvo = self._semaforo.acquire(timeout=DB_POOL_ESPERA_MAX)
+        espera = time.perf_counter() - inicio
+        with self._lock:
+            self._metricas["espera_total_s"] += espera
+            self._metricas["espera_max_s"] = max(self._metricas["espera_max_s"], espera)
+            self._metricas["checkouts"] += 1
+
+        if not obtuvo:
+            # Pool agotado: conexión directa para no dejar la página colgada
+            with self._lock:
+                self._metricas["desbordes"] += 1
+            conn = psycopg2.connect(DATABASE_URL)
+            conn.autocommit = True
+            return ConnectionWrapper(conn)
+
+        try:
+            while True:
+                conn = self._pg_pool.getconn()
+                nueva = id(conn) not in self._ultimo_uso
+                if self._conexion_viva(conn):
+                    break
+                self._ultimo_uso.pop(id(conn), None)
+                self._pg_pool.putconn(conn, close=True)
+                with self._lock:
+                    self._metricas["descartadas"] += 1
+            conn.autocommit = True
+        except Exception:
+            self._semaforo.release()
+            raise
+
+        with self._lock:
+            self._metricas["en_uso"] += 1
+            self._metricas["conexiones_creadas" if nueva else "reusos"] += 1
+        return ConnectionWrapper(conn, self)
+
+    def devolver(self, conn):
+        """Regresa una conexión PostgreSQL al pool (la descarta si quedó rota)."""
+        try:
+            descartar = bool(conn.closed)
+            if not descartar and conn.get_transaction_status() != psycopg2.extensions.TRANSACTION_STATUS_IDLE:
+                try:
+                    conn.rollback()
+                    if conn.get_transaction_status() != psycopg2.extensions.TRANSACTION_STATUS_IDLE:
+                        # BEGIN a mano con autocommit: rollback() no envía nada
+                        conn.cursor().execute("ROLLBACK")
+                except Exception:
+                    descartar = True
+            if descartar:
+                self._ultimo_uso.pop(id(conn), None)
+            else:
+                self._ultimo_uso[id(conn)] = time.time()
+            self._pg_pool.putconn(conn, close=descartar)
+            if descartar:
+                with self._lock:
+                    self._metricas["descartadas"] += 1
+        finally:
+            with self._lock:
+                self._metricas["en_uso"] -= 1
+            self._semaforo.release()
+
+    # ── SQLite ────────────────────────────────────────────
+    def _obtener_sqlite(self):
+        conn = getattr(self._local, "conn", None)
+        with self._lock:
+            self._metricas["checkouts"] += 1
+            if conn is None:
+                self._metricas["conexiones_creadas"] += 1
+            else:
+                self._metricas["reusos"] += 1
+        if conn is None:
+            conn = sqlite3.connect(DB_NAME, check_same_thread=False, factory=ConexionSQLite)
+            configurar_conexion(conn)
+            conn._escritura = self._escritura
+            conn._perfilador = _obtener_perfilador()
+            self._local.conn = conn
+        conn._usos += 1
+        return conn
+
+    def obtener(self):
+        if self._pg_pool is not None:
+            return self._obtener_postgres()
+        return self._obtener_sqlite()
+
+    def metricas(self):
+        with self._lock:
+            m = dict(self._metricas)
+        m["espera_promedio_ms"] = round(m["espera_total_s"] * 1000 / m["checkouts"], 3) if m["checkouts"] else 0.0
+        if self._pg_pool is not None:
+            m["abiertas"] = len(self._pg_pool._pool) + len(self._pg_pool._used)
+        else:
+            m["modo_sqlite"] = SQLITE_MODO
+            m["escritura"] = self._escritura.metricas()
+        return m
+
+
+@st.cache_resource(show_spinner=False)
+def _obtener_pool_db():
+    return PoolConexiones()
+
+
+def metricas_pool_db():
+    """Métricas del pool: tamaño, conexiones en uso, checkouts y tiempo de espera."""
+    return _obtener_pool_db().metricas()
+
+
+# ── Cache de consultas ────────────────────────────────────────────────────
+# Resultados de lecturas frecuentes (catálogos, métricas del dashboard) por
+# SQL + parámetros, con TTL y expulsión LRU. Cualquier INSERT/UPDATE/DELETE
+# que pase por los cursores de conectar_db() invalida las entradas que leen
+# de esa tabla. El TTL acota lo que pueda cambiar por fuera de la app.
+CACHE_CONSULTAS_TTL = 300      # seg
+CACHE_CONSULTAS_MAX = 256      # entradas
+
+_RE_TABLA_ESCRITA = re.compile(
+    r"(?:^|;)\s*(?:INSERT(?:\s+OR\s+\w+)?\s+INTO|REPLACE\s+INTO|UPDATE(?:\s+OR\s+\w+)?"
+    r"|DELETE\s+FROM|ALTER\s+TABLE|DROP\s+TABLE(?:\s+IF\s+EXISTS)?)\s+[\"`]?(\w+)",
+    re.IGNORECASE)
+_RE_TABLA_LEIDA = re.compile(r"\b(?:FROM|JOIN)\s+[\"`]?(\w+)", re.IGNORECASE)
+
+
+# Tablas que los triggers de la base actualizan al escribir en otra
+_TABLAS_DERIVADAS = {"ventas": {"resumen_ventas"}}
+_TABLAS_DERIVADAS.update({tabla: {"movimientos_pagos"} for tabla in FUENTES_MOVIMIENTOS})
+
+
+def tablas_modificadas(sql):
+    """Tablas que modifica una sentencia (o script) SQL, en minúsculas."""
+    tablas = {t.lower() for t in _RE_TABLA_ESCRITA.findall(sql)}
+    for tabla in list(tablas):
+        tablas |= _TABLAS_DERIVADAS.get(tabla, set())
+    return tablas
+
+
+class CacheConsultas:
+    """Cache LRU con TTL de resultados de consultas, indexado por tabla."""
+    def __init__(self, ttl=CACHE_CONSULTAS_TTL, max_entradas=CACHE_CONSULTAS_MAX):
+        self._lock = threading.Lock()
+        self._datos = OrderedDict()     # clave -> (expira, filas)
+        self._por_tabla = {}            # tabla -> {claves}
+        self.ttl = ttl
+        self.max_entradas = max_entradas
+        self._metricas = {"aciertos": 0, "fallos": 0, "invalidaciones": 0, "expulsiones": 0}
+        self._suscriptores = {}         # tabla -> [funciones a llamar al invalidarla]
+
+    def obtener(self, clave):
+        with self._lock:
+            entrada = self._datos.get(clave)
+            if entrada is None or entrada[0] < time.time():
+                if entrada is not None:
+                    del self._datos[clave]
+                self._metricas["fallos"] += 1
+                return None
+            self._datos.move_to_end(clave)
+            self._metricas["aciertos"] += 1
+            return entrada[1]
+
+    def guardar(self, clave, filas, tablas, ttl=None):
+        with self._lock:
+            self._datos[clave] = (time.time() + (ttl or self.ttl), filas)
+            self._datos.move_to_end(clave)
+            for tabla in tablas:
+                self._por_tabla.setdefault(tabla, set()).add(clave)
+            while len(self._datos) > self.max_entradas:
+                self._datos.popitem(last=False)
+                self._metricas["expulsiones"] += 1
+
+    def suscribir(self, tabla, funcion):
+        """Llama a `funcion()` cada vez que se invalide `tabla` (cachés en memoria fuera de éste)."""
+        with self._lock:
+            self._suscriptores.setdefault(tabla, []).append(funcion)
+
+    def invalidar(self, tablas):
+        with self._lock:
+            avisar = []
+            for tabla in tablas:
+                for clave in self._por_tabla.pop(tabla, ()):
+                    if self._datos.pop(clave, None) is not None:
+                        self._metricas["invalidaciones"] += 1
+                avisar += self._suscriptores.get(tabla, [])
+        for funcion in avisar:
+            funcion()
+
+    def limpiar(self):
+        with self._lock:
+            self._datos.clear()
+            self._por_tabla.clear()
+
+    def metricas(self):
+        with self._lock:
+            m = dict(self._metricas)
+            m["entradas"] = len(self._datos)
+        return m
+
+
+@st.cache_resource(show_spinner=False)
+def _obtener_cache_consultas():
+    return CacheConsultas()
+
+
+def _invalidar_cache_por_sql(sql):
+    """Invalida el cache para las tablas que modifica `sql`; devuelve esas tablas."""
+    tablas = tablas_modificadas(sql)
+    if tablas:
+        _obtener_cache_consultas().invalidar(tablas)
+    return tablas
+
+
+def consulta_cacheada(sql, params=None, ttl=None):
+    """
+    Ejecuta una consulta de lectura y devuelve sus filas (lista de tuplas),
+    sirviéndolas desde el cache mientras las tablas que lee no cambien.
+    """
+    clave = (sql, tuple(params) if params else ())
+    cache = _obtener_cache_consultas()
+    filas = cache.obtener(clave)
+    if filas is not None:
+        sumar_medicion(_obtener_perfilador().consulta(sql, params, origen="cache"), time.perf_counter(), len(filas))
+        return list(filas)
+
+    conn = conectar_db()
+    try:
+        cursor = conn.cursor()
+        with _obtener_perfilador().origen("consulta_cacheada"):
+            if params:
+                cursor.execute(sql, params)
+            else:
+                cursor.execute(sql)
+            filas = [tuple(r) for r in cursor.fetchall()]
+    finally:
+        conn.close()
+    tablas = {t.lower() for t in _RE_TABLA_LEIDA.findall(sql)}
+    cache.guardar(clave, filas, tablas, ttl)
+    return list(filas)
+
+
+def metricas_cache_consultas():
+    """Aciertos, fallos, invalidaciones y entradas del cache de consultas."""
+    return _obtener_cache_consultas().metricas()
+
+
+# ── Perfilador de consultas ───────────────────────────────────────────────
+# Consultas y tiempo de cada rerun (perfilador.py); main() abre y cierra el
+# rerun y el panel de rendimiento del menú lo muestra al ADMIN.
+@st.cache_resource(show_spinner=False)
+def _obtener_perfilador():
+    return PerfiladorConsultas()
+
+
+def perfilador_consultas():
+    """Perfilador del proceso: reruns recientes con sus consultas."""
+    return _obtener_perfilador()
+
+
+def conectar_db():
+    """Conecta a la base de datos (PostgreSQL si está configurada, SQLite si no)"""
+    return _obtener_pool_db().obtener()
+
+
+@st.cache_resource(show_spinner=False)
+def migraciones_al_arranque():
+    """
+    Migraciones idempotentes que se aplican una sola vez por proceso.
+    Devuelve los índices esperados que siguen faltando en la base.
+    """
+    es_pg = ES_POSTGRES and PSYCOPG2_DISPONIBLE
+    conn = conectar_db()
+    try:
+        aplicar_migracion_fechas_iso(conn, es_postgres=es_pg)
+        try:
+            aplicar_migraciones_indices(conn, es_postgres=es_pg)
+        except Exception as e:
+            print(f"⚠️ No se pudieron aplicar las migraciones de índices: {e}")
+        try:
+            instalar_resumen_ventas(conn, es_postgres=es_pg)
+        except Exception as e:
+            print(f"⚠️ No se pudo instalar el resumen de ventas: {e}")
+        try:
+            instalar_movimientos_pagos(conn, es_postgres=es_pg)
+        except Exception as e:
+            print(f"⚠️ No se pudo instalar el libro de movimientos de pagos: {e}")
+        try:
+            instalar_busqueda_clientes(conn, es_postgres=es_pg)
+        except Exception as e:
+            print(f"⚠️ No se pudo instalar el índice de búsqueda de clientes: {e}")
+        try:
+            instalar_apartados(conn)
+        except Exception as e:
+            print(f"⚠️ No se pudo crear la tabla de apartados de habitaciones: {e}")
+        try:
+            instalar_alertas(conn)
+        except Exception as e:
+            print(f"⚠️ No se pudo crear la tabla de alertas: {e}")
+        faltantes = verificar_indices(conn, es_postgres=es_pg)
+    finally:
+        conn.close()
+    for nombre, tabla, columnas in faltantes:
+        print(f"⚠️ Falta índice {nombre} ON {tabla} ({columnas})")
+    return faltantes
+
+
+@st.cache_resource(show_spinner=False)
+def _obtener_servicio_tipo_cambio():
+    """Servicio de tipo de cambio compartido por todas las sesiones."""
+    servicio = ServicioTipoCambio(conectar_db)
+    servicio.iniciar()
+    return servicio
+
+
+def obtener_tipo_cambio(esperar=10):
+    """
+    Tipo de cambio USD/MXN vigente (sábado y domingo usan el del viernes).
+    Sale de memoria; sólo espera a la consulta web si aún no hay dato del día.
+    Retorna (tipo_cambio_float, fuente_str) o (None, None)
+    """
+    return _obtener_servicio_tipo_cambio().obtener(esperar=esperar)
+
+
+def inicializar_base_datos():
+    """Crea todas las tablas si no existen (incluyendo grupos y bloqueos)"""
+    migraciones_al_arranque()
+    # Arranca la consulta del tipo de cambio para que ya esté en memoria al abonar
+    _obtener_servicio_tipo_cambio()
+
+    # Crea config_recibos (y la secuencia de folios en PostgreSQL) si no existen
+    _obtener_folios_recibo()
+
+    # Si es PostgreSQL, ya no necesita crear tablas (ya existen de la migración)
+    # Solo crear tablas SQLite
+    return
+
+    # SQLite: crear todas las tablas
+    conn = conectar_db()
+    cursor = conn.cursor()
+    cursor.executescript("""
+        CREATE TABLE IF NOT EXISTS vendedoras (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            nombre TEXT NOT NULL,
+            usuario TEXT,
+            activa INTEGER DEFAULT 1,
+            fecha_registro TEXT
+        );
+        CREATE TABLE IF NOT EXISTS operadores (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            nombre TEXT NOT NULL,
+            contacto TEXT,
+            notas TEXT,
+            activo INTEGER DEFAULT 1
+        );
+        CREATE TABLE IF NOT EXISTS hoteles (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            nombre TEXT NOT NULL,
+            activo INTEGER DEFAULT 1,
+            veces_usado INTEGER DEFAULT 0
+        );
+        CREATE TABLE IF NOT EXISTS ventas (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            cliente TEXT,
+            celular_responsable TEXT,
+            tipo_venta TEXT DEFAULT 'General',
+            destino TEXT,
+            fecha_inicio TEXT,
+            fecha_fin TEXT,
+            noches INTEGER DEFAULT 0,
+            adultos INTEGER DEFAULT 0,
+            menores INTEGER DEFAULT 0,
+            tipo_habitacion TEXT,
+            precio_adulto REAL DEFAULT 0,
+            precio_menor REAL DEFAULT 0,
+            precio_total REAL DEFAULT 0,
+            porcentaje_ganancia REAL DEFAULT 0,
+            ganancia REAL DEFAULT 0,
+            costo_mayorista REAL DEFAULT 0,
+            pagado REAL DEFAULT 0,
+            saldo REAL DEFAULT 0,
+            estado TEXT DEFAULT 'ACTIVO',
+            vendedora_id INTEGER,
+            usuario_id INTEGER,
+            es_bloqueo INTEGER DEFAULT 0,
+            bloqueo_id INTEGER,
+            es_grupo INTEGER DEFAULT 0,
+            grupo_id INTEGER,
+            operador TEXT,
+            comision_vendedora REAL DEFAULT 0,
+            comision_pagada INTEGER DEFAULT 0,
+            fecha_registro TEXT
+        );
+        CREATE TABLE IF NOT EXISTS abonos (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            venta_id INTEGER,
+            monto REAL,
+            fecha TEXT,
+            metodo_pago TEXT DEFAULT 'Efectivo'
+        );
+        CREATE TABLE IF NOT EXISTS pasajeros (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            venta_id INTEGER,
+            nombre TEXT,
+            tipo TEXT DEFAULT 'ADULTO'
+        );
+        CREATE TABLE IF NOT EXISTS bloqueos (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            hotel TEXT,
+            operador TEXT,
+            celular_responsable TEXT,
+            fecha_inicio TEXT,
+            fecha_fin TEXT,
+            noches INTEGER DEFAULT 0,
+            habitaciones_totales INTEGER DEFAULT 0,
+            habitaciones_vendidas INTEGER DEFAULT 0,
+            habitaciones_disponibles INTEGER DEFAULT 0,
+            precio_noche_doble REAL DEFAULT 0,
+            precio_noche_triple REAL DEFAULT 0,
+            precio_noche_cuadruple REAL DEFAULT 0,
+            precio_menor_doble REAL DEFAULT 0,
+            precio_menor_triple REAL DEFAULT 0,
+            precio_menor_cuadruple REAL DEFAULT 0,
+            costo_real REAL DEFAULT 0,
+            estado TEXT DEFAULT 'ACTIVO',
+            fecha_registro TEXT
+        );
+        CREATE TABLE IF NOT EXISTS grupos (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            nombre_grupo TEXT NOT NULL,
+            operador TEXT,
+            hotel TEXT,
+            fecha_inicio TEXT,
+            fecha_fin TEXT,
+            noches INTEGER DEFAULT 0,
+            habitaciones_totales INTEGER DEFAULT 0,
+            habitaciones_vendidas INTEGER DEFAULT 0,
+            habitaciones_disponibles INTEGER DEFAULT 0,
+            precio_noche_doble REAL DEFAULT 0,
+            precio_noche_triple REAL DEFAULT 0,
+            precio_noche_cuadruple REAL DEFAULT 0,
+            precio_menor_doble REAL DEFAULT 0,
+            precio_menor_triple REAL DEFAULT 0,
+            precio_menor_cuadruple REAL DEFAULT 0,
+            costo_real REAL DEFAULT 0,
+            responsable TEXT DEFAULT 'Mamá',
+            celular_responsable TEXT,
+            estado TEXT DEFAULT 'ACTIVO',
+            fecha_registro TEXT
+        );
+        CREATE TABLE IF NOT EXISTS viajes_nacionales (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            cotizacion_id INTEGER,
+            nombre_viaje TEXT NOT NULL,
+            destino TEXT,
+            fecha_salida TEXT,
+            fecha_regreso TEXT,
+            dias INTEGER DEFAULT 0,
+            noches INTEGER DEFAULT 0,
+            cupos_totales INTEGER DEFAULT 0,
+            cupos_vendidos INTEGER DEFAULT 0,
+            cupos_disponibles INTEGER DEFAULT 0,
+            precio_persona_doble REAL DEFAULT 0,
+            precio_persona_triple REAL DEFAULT 0,
+            estado TEXT DEFAULT 'ACTIVO',
+            fecha_registro TEXT
+        );
+        CREATE TABLE IF NOT EXISTS clientes_nacionales (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            viaje_id INTEGER,
+            vendedora_id INTEGER,
+            nombre_cliente TEXT,
+            celular_responsable TEXT,
+            adultos INTEGER DEFAULT 0,
+            menores INTEGER DEFAULT 0,
+            habitaciones_doble INTEGER DEFAULT 0,
+            habitaciones_triple INTEGER DEFAULT 0,
+            total_pagar REAL DEFAULT 0,
+            total_abonado REAL DEFAULT 0,
+            saldo REAL DEFAULT 0,
+            ganancia REAL DEFAULT 0,
+            estado TEXT DEFAULT 'ADEUDO',
+            comision_pagada INTEGER DEFAULT 0,
+            fecha_registro TEXT
+        );
+        CREATE TABLE IF NOT EXISTS abonos_nacionales (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            cliente_id INTEGER,
+            monto REAL,
+            fecha TEXT,
+            vendedora_id INTEGER,
+            metodo_pago TEXT DEFAULT 'Efectivo'
+        );
+        CREATE TABLE IF NOT EXISTS pasajeros_nacionales (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            cliente_id INTEGER,
+            nombre_completo TEXT,
+            tipo TEXT DEFAULT 'ADULTO',
+            habitacion_asignada TEXT
+        );
+        CREATE TABLE IF NOT EXISTS cotizaciones_nacionales (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            nombre_viaje TEXT NOT NULL,
+            destino TEXT,
+            fecha_salida TEXT,
+            fecha_regreso TEXT,
+            dias INTEGER DEFAULT 0,
+            noches INTEGER DEFAULT 0,
+            personas_proyectadas INTEGER DEFAULT 20,
+            costo_vuelo_real REAL DEFAULT 0,
+            precio_vuelo_venta REAL DEFAULT 0,
+            costo_traslados_total REAL DEFAULT 0,
+            precio_traslados_persona REAL DEFAULT 0,
+            costo_entradas_real REAL DEFAULT 0,
+            precio_entradas_venta REAL DEFAULT 0,
+            precio_persona_doble REAL DEFAULT 0,
+            precio_persona_triple REAL DEFAULT 0,
+            inversion_total REAL DEFAULT 0,
+            ganancia_proyectada REAL DEFAULT 0,
+            estado TEXT DEFAULT 'BORRADOR',
+            fecha_registro TEXT
+        );
+        CREATE TABLE IF NOT EXISTS hoteles_cotizacion (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            cotizacion_id INTEGER,
+            nombre_hotel TEXT,
+            noches INTEGER DEFAULT 0,
+            costo_doble_real REAL DEFAULT 0,
+            precio_doble_venta REAL DEFAULT 0,
+            costo_triple_real REAL DEFAULT 0,
+            precio_triple_venta REAL DEFAULT 0
+        );
+        CREATE TABLE IF NOT EXISTS viajes_internacionales (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            destino TEXT,
+            fecha_salida TEXT,
+            fecha_regreso TEXT,
+            dias INTEGER DEFAULT 0,
+            noches INTEGER DEFAULT 0,
+            cupos_totales INTEGER DEFAULT 0,
+            cupos_vendidos INTEGER DEFAULT 0,
+            cupos_disponibles INTEGER DEFAULT 0,
+            precio_adulto_doble_usd REAL DEFAULT 0,
+            precio_adulto_triple_usd REAL DEFAULT 0,
+            precio_menor_doble_usd REAL DEFAULT 0,
+            precio_menor_triple_usd REAL DEFAULT 0,
+            porcentaje_ganancia REAL DEFAULT 0,
+            estado TEXT DEFAULT 'ACTIVO',
+            fecha_registro TEXT
+        );
+        CREATE TABLE IF NOT EXISTS clientes_internacionales (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            viaje_id INTEGER,
+            vendedora_id INTEGER,
+            nombre_cliente TEXT,
+            adultos INTEGER DEFAULT 0,
+            menores INTEGER DEFAULT 0,
+            habitaciones_doble INTEGER DEFAULT 0,
+            habitaciones_triple INTEGER DEFAULT 0,
+            total_usd REAL DEFAULT 0,
+            abonado_usd REAL DEFAULT 0,
+            saldo_usd REAL DEFAULT 0,
+            ganancia_usd REAL DEFAULT 0,
+            estado TEXT DEFAULT 'ADEUDO',
+            estado_comision TEXT DEFAULT 'PENDIENTE',
+            comision_pagada INTEGER DEFAULT 0,
+            fecha_registro TEXT
+        );
+        CREATE TABLE IF NOT EXISTS abonos_internacionales (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            cliente_id INTEGER,
+            monto_usd REAL,
+            tipo_cambio REAL DEFAULT 0,
+            monto_mxn REAL DEFAULT 0,
+            fecha TEXT,
+            vendedora_id INTEGER,
+            metodo_pago TEXT DEFAULT 'Efectivo'
+        );
+        CREATE TABLE IF NOT EXISTS pasajeros_internacionales (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            cliente_id INTEGER,
+            nombre_completo TEXT,
+            tipo TEXT DEFAULT 'ADULTO',
+            habitacion_asignada TEXT
+        );
+        CREATE TABLE IF NOT EXISTS pasaportes (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            vendedora_id INTEGER,
+            cliente TEXT NOT NULL,
+            celular TEXT,
+            tipo TEXT DEFAULT 'Nuevo',
+            fecha_cita TEXT,
+            fecha_entrega_est TEXT,
+            costo_oficial REAL DEFAULT 0,
+            cargo_servicio REAL DEFAULT 0,
+            total REAL DEFAULT 0,
+            pagado REAL DEFAULT 0,
+            saldo REAL DEFAULT 0,
+            estado TEXT DEFAULT 'En trámite',
+            notas TEXT,
+            fecha_registro TEXT
+        );
+        CREATE TABLE IF NOT EXISTS visas (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            vendedora_id INTEGER,
+            cliente TEXT NOT NULL,
+            celular TEXT,
+            pais_destino TEXT,
+            tipo_visa TEXT DEFAULT 'Turista',
+            es_familiar INTEGER DEFAULT 0,
+            num_integrantes INTEGER DEFAULT 1,
+            fecha_cita TEXT,
+            fecha_entrega_est TEXT,
+            costo_oficial REAL DEFAULT 0,
+            cargo_servicio REAL DEFAULT 0,
+            total REAL DEFAULT 0,
+            pagado REAL DEFAULT 0,
+            saldo REAL DEFAULT 0,
+            estado TEXT DEFAULT 'En trámite',
+            notas TEXT,
+            fecha_registro TEXT
+        );
+        CREATE TABLE IF NOT EXISTS vuelos (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            vendedora_id INTEGER,
+            pasajero TEXT NOT NULL,
+            celular TEXT,
+            tipo TEXT DEFAULT 'Nacional',
+            aerolinea TEXT,
+            origen TEXT,
+            destino TEXT,
+            fecha_vuelo TEXT,
+            hora_vuelo TEXT,
+            num_pasajeros INTEGER DEFAULT 1,
+            costo_compra REAL DEFAULT 0,
+            cargo_servicio REAL DEFAULT 0,
+            total REAL DEFAULT 0,
+            pagado REAL DEFAULT 0,
+            saldo REAL DEFAULT 0,
+            estado TEXT DEFAULT 'Cotizado',
+            notas TEXT,
+            fecha_registro TEXT
+        );
+        CREATE TABLE IF NOT EXISTS abonos_pasaportes (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            pasaporte_id INTEGER,
+            monto REAL,
+            fecha TEXT,
+            metodo_pago TEXT DEFAULT 'Efectivo'
+        );
+        CREATE TABLE IF NOT EXISTS abonos_visas (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            visa_id INTEGER,
+            monto REAL,
+            fecha TEXT,
+            metodo_pago TEXT DEFAULT 'Efectivo'
+        );
+        CREATE TABLE IF NOT EXISTS abonos_vuelos (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            vuelo_id INTEGER,
+            monto REAL,
+            fecha TEXT,
+            metodo_pago TEXT DEFAULT 'Efectivo'
+        );
+        CREATE TABLE IF NOT EXISTS config_comisiones (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            tipo TEXT UNIQUE,
+            porcentaje_comision REAL DEFAULT 10
+        );
+        CREATE TABLE IF NOT EXISTS historial_comisiones (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            vendedora TEXT,
+            fecha TEXT,
+            tipo TEXT,
+            referencia_id INTEGER,
+            monto REAL,
+            metodo_pago TEXT,
+            nota TEXT
+        );
+    """)
+    cursor.execute("INSERT OR IGNORE INTO config_comisiones (tipo, porcentaje_comision) VALUES ('riviera', 10)")
+    cursor.execute("INSERT OR IGNORE INTO config_comisiones (tipo, porcentaje_comision) VALUES ('nacionales', 10)")
+    cursor.execute("INSERT OR IGNORE INTO config_comisiones (tipo, porcentaje_comision) VALUES ('internacionales', 10)")
+
+    migraciones = [
+        "ALTER TABLE abonos ADD COLUMN metodo_pago TEXT DEFAULT 'Efectivo'",
+        "ALTER TABLE clientes_nacionales ADD COLUMN ganancia REAL DEFAULT 0",
+        "ALTER TABLE clientes_internacionales ADD COLUMN ganancia_usd REAL DEFAULT 0",
+        "ALTER TABLE clientes_internacionales ADD COLUMN vendedora_id INTEGER DEFAULT 0",
+        "ALTER TABLE abonos_nacionales ADD COLUMN metodo_pago TEXT DEFAULT 'Efectivo'",
+        "ALTER TABLE abonos_internacionales ADD COLUMN metodo_pago TEXT DEFAULT 'Efectivo'",
+        "ALTER TABLE abonos_internacionales ADD COLUMN monto_mxn REAL DEFAULT 0",
+        "ALTER TABLE abonos_internacionales ADD COLUMN tipo_cambio REAL DEFAULT 0",
+        "ALTER TABLE historial_comisiones ADD COLUMN vendedora_id INTEGER DEFAULT 0",
+        "ALTER TABLE ventas ADD COLUMN celular_responsable TEXT",
+        # ── Localización y datos para cupón ──
+        "ALTER TABLE ventas ADD COLUMN no_localizador TEXT",
+        "ALTER TABLE ventas ADD COLUMN clave_confirmacion TEXT",
+        "ALTER TABLE ventas ADD COLUMN plan_alimento TEXT DEFAULT 'Todo incluido'",
+        "ALTER TABLE ventas ADD COLUMN requerimientos_especiales TEXT",
+        "ALTER TABLE ventas ADD COLUMN edades_menores TEXT",
+        # ── Hoteles: ampliar catálogo ──
+        "ALTER TABLE hoteles ADD COLUMN direccion TEXT",
+        "ALTER TABLE hoteles ADD COLUMN telefono TEXT",
+        "ALTER TABLE hoteles ADD COLUMN estrellas INTEGER DEFAULT 4",
+        # ── Confirmación de reserva hotel ──
+        "ALTER TABLE ventas ADD COLUMN reserva_confirmada INTEGER DEFAULT 0",
+        "ALTER TABLE ventas ADD COLUMN reserva_confirmada_por TEXT",
+        "ALTER TABLE ventas ADD COLUMN reserva_confirmada_fecha TEXT",
+    ]
+    for sql in migraciones:
+        try:
+            cursor.execute(sql)
+        except Exception:
+            pass
+
+    conn.commit()
+    conn.close()
+
+
+def verificar_login(usuario, password):
+    """Verifica las credenciales del usuario"""
+    import json
+    import os
+    
+    # Cargar usuarios desde JSON
+    ruta_usuarios = "usuarios.json"
+    
+    if not os.path.exists(ruta_usuarios):
+        return None
+    
+    try:
+        with open(ruta_usuarios, "r", encoding="utf-8") as archivo:
+            usuarios = json.load(archivo)
+        
+        for u in usuarios:
+            if u["usuario"] == usuario and u["password"] == password:
+                return {
+                    "id_vendedora": u.get("id_vendedora", 1),
+                    "nombre": u.get("nombre", usuario),
+                    "rol": u["rol"],
+                    "usuario": usuario
+                }
+    except:
+        pass
+    
+    return None
+
+
+def _tabla_inexistente(error):
+    """True si `error` es sólo que la tabla aún no existe en esta base (SQLite o PostgreSQL)."""
+    if isinstance(error, sqlite3.OperationalError):
+        return str(error).startswith("no such table")
+    return getattr(error, "pgcode", None) == "42P01"     # undefined_table
+
+
+def busqueda_global(texto):
+    """
+    Clientes, pasajeros y trámites de todas las líneas que coinciden con `texto`.
+    Sin índice instalado devuelve []; cualquier otro error se propaga.
+    """
+    conn = conectar_db()
+    try:
+        return buscar_clientes(conn.cursor(), texto, es_postgres=ES_POSTGRES and PSYCOPG2_DISPONIBLE)
+    except Exception as e:
+        if _tabla_inexistente(e):
+            return []     # índice aún no instalado en esta base
+        raise
+    finally:
+        conn.close()
+
+
+def obtener_operadores():
+    try:
+        return consulta_cacheada("SELECT id, nombre FROM operadores WHERE activo = 1 ORDER BY nombre")
+    except:
+        return []
+
+
+def obtener_vendedoras():
+    return consulta_cacheada("SELECT id, nombre FROM vendedoras WHERE activa = 1 ORDER BY nombre")
+
+
+@st.cache_resource(show_spinner=False)
+def _obtener_indice_hoteles():
+    """
+    Catálogo de hoteles en memoria (indice_hoteles.py), uno por proceso.
+    Cada escritura en hoteles que pasa por conectar_db() lo marca para que la
+    siguiente lectura reindexe sólo los hoteles que cambiaron.
+    """
+    indice = IndiceHoteles(conectar_db, refresco=CACHE_CONSULTAS_TTL)
+    _obtener_cache_consultas().suscribir("hoteles", indice.marcar_pendiente)
+    return indice
+
+
+def obtener_hoteles():
+    return _obtener_indice_hoteles().nombres()
+
+
+def obtener_hoteles_completos():
+    """Devuelve lista de dicts con todos los datos del hotel para el cupón."""
+    cols = ['nombre','direccion','telefono','estrellas']
+    return [{c: h[c] for c in cols} for h in _obtener_indice_hoteles().activos()]
+
+
+def obtener_hotel(nombre):
+    """Datos del hotel (nombre, direccion, telefono, estrellas) por nombre exacto, o {}."""
+    hotel = _obtener_indice_hoteles().por_nombre(nombre)
+    return {c: hotel[c] for c in ('nombre','direccion','telefono','estrellas')} if hotel else {}
+
+
+def liberar_apartados():
+    """Devuelve al inventario los apartados de habitaciones vencidos (una lectura si no hay)."""
+    conn = conectar_db()
+    try:
+        with transaccion(conn, ES_POSTGRES and PSYCOPG2_DISPONIBLE):
+            liberar_apartados_vencidos(conn.cursor())
+    except Exception as e:
+        # Sin tabla de apartados (migraciones_al_arranque ya avisó) no hay nada que liberar;
+        # cualquier otro error (base bloqueada, PostgreSQL) se reporta
+        if not _tabla_inexistente(e):
+            print(f"⚠️ No se pudieron liberar los apartados vencidos: {e}")
+    finally:
+        conn.close()
+
+
+def obtener_bloqueos_disponibles(incluir=None):
+    """
+    Bloqueos activos con habitaciones disponibles. `incluir` agrega el bloqueo
+    que la sesión tiene apartado aunque ya no le queden (su habitación es ésa).
+    """
+    liberar_apartados()
+    rows = consulta_cacheada("""
+        SELECT id, hotel, fecha_inicio, fecha_fin, noches,
+               habitaciones_disponibles,
+               precio_noche_doble, precio_noche_triple, precio_noche_cuadruple,
+               precio_menor_doble, precio_menor_triple, precio_menor_cuadruple
+        FROM bloqueos
+        WHERE (estado = 'ACTIVO' AND habitaciones_disponibles > 0) OR id = ?
+        ORDER BY fecha_inicio
+    """, [incluir or 0])
+    cols = ['id','hotel','fecha_inicio','fecha_fin','noches','disponibles',
+            'precio_doble','precio_triple','precio_cuadruple',
+            'menor_doble','menor_triple','menor_cuadruple']
+    return [dict(zip(cols, r)) for r in rows]
+
+
+def obtener_grupos_disponibles(incluir=None):
+    """Retorna grupos activos con habitaciones disponibles (y el apartado por la sesión, `incluir`)"""
+    liberar_apartados()
+    try:
+        rows = consulta_cacheada("""
+            SELECT id, nombre_grupo, operador, hotel, fecha_inicio, fecha_fin, noches,
+                   habitaciones_totales, habitaciones_vendidas, habitaciones_disponibles,
+                   precio_noche_doble, precio_noche_triple, precio_noche_cuadruple,
+                   precio_menor_doble, precio_menor_triple, precio_menor_cuadruple,
+                   costo_real, responsable, celular_responsable, estado
+            FROM grupos
+            WHERE (estado = 'ACTIVO' AND habitaciones_disponibles > 0) OR id = ?
+            ORDER BY fecha_inicio
+        """, [incluir or 0])
+    except Exception:
+        return []
+    cols = ['id','nombre_grupo','operador','hotel','fecha_inicio','fecha_fin','noches',
+            'habitaciones_totales','habitaciones_vendidas','habitaciones_disponibles',
+            'precio_noche_doble','precio_noche_triple','precio_noche_cuadruple',
+            'precio_menor_doble','precio_menor_triple','precio_menor_cuadruple',
+            'costo_real','responsable','celular_responsable','estado']
+    return [dict(zip(cols, r)) for r in rows]
+
+
+@st.cache_resource(show_spinner=False)
+def _obtener_motor_alertas():
+    """
+    Tabla de alertas (motor_alertas.py), una por proceso. Cada escritura en
+    ventas, vendedoras, pasaportes o visas que pasa por conectar_db() la marca
+    para recalcularse en la siguiente lectura; también al cambiar el día.
+    """
+    motor = MotorAlertas(conectar_db, es_postgres=ES_POSTGRES and PSYCOPG2_DISPONIBLE,
+                         refresco=CACHE_CONSULTAS_TTL)
+    for tabla in TABLAS_ALERTAS:
+        _obtener_cache_consultas().suscribir(tabla, motor.marcar_pendiente)
+    return motor
+
+
+ALERTAS_COLUMNAS = ['producto','referencia_id','fecha_iso','fecha','cliente','celular',
+                    'destino','vendedora','tipo_venta','estado','total','pagado','saldo',
+                    'tipo_habitacion','adultos','menores','operador','fecha_fin','noches']
+
+
+def obtener_alertas(tipo, usuario):
+    """
+    Alertas vigentes de un tipo (adeudo, proximo o cita) visibles para el
+    usuario, de la más cercana a la más lejana. Lista de dicts.
+    """
+    _obtener_motor_alertas().vigente()
+    sql = f"SELECT {', '.join(ALERTAS_COLUMNAS)} FROM alertas WHERE tipo = ?"
+    params = [tipo]
+    if usuario.get("rol") != "ADMIN":
+        sql += " AND vendedora_id = ?"
+        params.append(usuario.get("id_vendedora") or 0)
+    try:
+        rows = consulta_cacheada(sql + " ORDER BY fecha_iso, referencia_id", params)
+    except Exception:
+        return []     # tabla de alertas aún no creada en esta base
+    return [dict(zip(ALERTAS_COLUMNAS, r)) for r in rows]
@@ -0,0 +1,298 @@
+"""
+BENCHMARK REPORTES EXCEL - Sistema Agencia Riviera Maya
+Compara el reporte "Todas las Ventas" de Riviera Maya (_excel_riviera) con el
+motor anterior (Workbook normal en memoria + Font/PatternFill/Border por celda)
+contra el motor actual (excel_stream: write-only + NamedStyles + cursor).
+
+Arma una base SQLite sintética con el esquema de agencia.db y corre cada
+combinación (motor, tamaño) en un proceso aparte para que la memoria pico
+de una no contamine a la otra.
+
+Uso:
+    python benchmark_excel.py                         # 10k, 100k y 500k ventas
+    python benchmark_excel.py --tamanos 10000 50000
+    python benchmark_excel.py --limite-mb 3500        # tope de memoria por proceso
+"""
+
+import io
+import os
+import sys
+import json
+import time
+import random
+import sqlite3
+import argparse
+import resource
+import tempfile
+import subprocess
+from datetime import date, timedelta
+
+from migracion_fechas_iso import aplicar_migracion_fechas_iso
+from migracion_indices import aplicar_migraciones_indices
+
+DB_NAME = "agencia.db"
+RAIZ = os.path.dirname(os.path.abspath(__file__))
+TAMANOS = [10_000, 100_000, 500_000]
+ABONOS_POR_VENTA = 2
+
+
+# ─── BASE SINTÉTICA ──────────────────────────────────────────────────────────
+
+def crear_base_sintetica(ruta, n_ventas, semilla=7):
+    """Base vacía con el esquema de agencia.db + n_ventas ventas y sus abonos."""
+    origen = sqlite3.connect(os.path.join(RAIZ, DB_NAME))
+    esquema = [r[0] for r in origen.execute(
+        "SELECT sql FROM sqlite_master WHERE sql IS NOT NULL AND name NOT LIKE 'sqlite_%' "
+        "ORDER BY CASE type WHEN 'table' THEN 0 WHEN 'index' THEN 1 ELSE 2 END")]
+    origen.close()
+
+    conn = sqlite3.connect(ruta)
+    for sql in esquema:
+        conn.execute(sql)
+    # La base del repo puede no tener aún las columnas *_iso ni los índices
+    aplicar_migracion_fechas_iso(conn)
+    aplicar_migraciones_indices(conn)
+
+    rnd = random.Random(semilla)
+    conn.executemany("INSERT INTO vendedoras (id, nombre, activa, fecha_registro) VALUES (?, ?, 1, '2024-01-01')",
+                     [(i, f"Vendedora {i}") for i in range(1, 9)])
+
+    destinos = ["Cancún", "Playa del Carmen", "Tulum", "Puerto Morelos", "Cozumel"]
+    habitaciones = ["DOBLE", "TRIPLE", "CUÁDRUPLE", "SENCILLA", None]
+    estados = ["ACTIVO", "LIQUIDADO", "CERRADO"]
+    inicio = date(2022, 1, 1)
+
+    def ventas():
+        for i in range(1, n_ventas + 1):
+            salida = inicio + timedelta(days=rnd.randint(0, 1400))
+            noches = rnd.randint(2, 7)
+            total = round(rnd.uniform(8_000, 60_000), 2)
+            pagado = round(total * rnd.choice([0.3, 0.5, 1.0]), 2)
+            ganancia = round(total * 0.12, 2)
+            regreso = salida + timedelta(days=noches)
+            yield (i, f"Cliente {i}", "RIVIERA", rnd.choice(destinos),
+                   salida.strftime("%d-%m-%Y"), regreso.strftime("%d-%m-%Y"),
+                   salida.isoformat(), regreso.isoformat(),
+                   noches, 2, rnd.randint(0, 2), rnd.choice(habitaciones),
+                   total / 2, 0, total, 12, ganancia, total - ganancia,
+                   pagado, total - pagado, round(ganancia * 0.1, 2), rnd.randint(0, 1),
+                   rnd.choice(estados), rnd.randint(1, 8), 1,
+                   (salida - timedelta(days=60)).isoformat(), f"998{i:07d}")
+
+    conn.executemany("""
+        INSERT INTO ventas (id, cliente, tipo_venta, destino, fecha_inicio, fecha_fin,
+            fecha_inicio_iso, fecha_fin_iso, noches, adultos, menores, tipo_habitacion,
+            precio_adulto, precio_menor, precio_total, porcentaje_ganancia, ganancia,
+            costo_mayorista, pagado, saldo, comision_vendedora, comision_pagada,
+            estado, vendedora_id, usuario_id, fecha_registro, celular_responsable)
+        VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)
+    """, ventas())
+
+    def abonos():
+        for venta_id in range(1, n_ventas + 1):
+            for _ in range(ABONOS_POR_VENTA):
+                yield (venta_id, (inicio + timedelta(days=rnd.randint(0, 1400))).isoformat(),
+                       round(rnd.uniform(1_000, 10_000), 2), rnd.choice(["Efectivo", "Transferencia", "Tarjeta"]))
+
+    conn.executemany("INSERT INTO abonos (venta_id, fecha, monto, metodo_pago) VALUES (?,?,?,?)", abonos())
+    conn.commit()
+    conn.close()
+
+
+# ─── MOTOR ANTERIOR (referencia) ─────────────────────────────────────────────
+# Copia de los helpers y de _excel_riviera tal como estaban antes de
+# excel_stream: DataFrames completos + un objeto de estilo por celda.
+
+def _estilo_header(ws, row, cols, bg="1F4E79", fg="FFFFFF"):
+    from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+    fill  = PatternFill("solid", fgColor=bg)
+    font  = Font(bold=True, color=fg, size=11, name="Arial")
+    align = Alignment(horizontal="center", vertical="center", wrap_text=True)
+    thin  = Border(left=Side(style="thin"), right=Side(style="thin"),
+                   top=Side(style="thin"),  bottom=Side(style="thin"))
+    for c in range(1, cols+1):
+        cell = ws.cell(row=row, column=c)
+        cell.fill = fill; cell.font = font
+        cell.alignment = align; cell.border = thin
+
+def _estilo_row(ws, row, cols, bg=None, bold=False):
+    from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+    font  = Font(bold=bold, name="Arial", size=10)
+    align = Alignment(vertical="center", wrap_text=True)
+    thin  = Border(left=Side(style="thin"), right=Side(style="thin"),
+                   top=Side(style="thin"),  bottom=Side(style="thin"))
+    for c in range(1, cols+1):
+        cell = ws.cell(row=row, column=c)
+        cell.font = font; cell.alignment = align; cell.border = thin
+        if bg:
+            cell.fill = PatternFill("solid", fgColor=bg)
+
+def _fmt_cur(ws, row, cols_idx):
+    for c in cols_idx:
+        ws.cell(row=row, column=c).number_format = "$#,##0.00"
+
+def _titulo_sheet(ws, titulo):
+    from openpyxl.styles import Font, Alignment, PatternFill
+    ws.merge_cells("A1:N1")
+    c = ws["A1"]
+    c.value = titulo
+    c.font  = Font(bold=True, size=14, color="FFFFFF", name="Arial")
+    c.fill  = PatternFill("solid", fgColor="E91E8C")
+    c.alignment = Alignment(horizontal="center", vertical="center")
+    ws.row_dimensions[1].height = 28
+    return 2
+
+def excel_riviera_anterior(conn):
+    import pandas as pd
+    from openpyxl import Workbook
+
+    df_v = pd.read_sql_query("""
+        SELECT v.id, COALESCE(vd.nombre,'—') AS vendedora,
+               v.cliente, v.celular_responsable AS celular, v.destino, v.tipo_habitacion,
+               v.fecha_inicio, v.fecha_fin, v.noches, v.adultos, v.menores,
+               v.precio_total, v.pagado, v.saldo, v.ganancia,
+               COALESCE(v.comision_vendedora, ROUND(v.ganancia*0.10,2)) AS comision,
+               v.estado,
+               CASE v.comision_pagada WHEN 1 THEN 'Pagada' ELSE 'Pendiente' END AS estado_comision
+        FROM ventas v LEFT JOIN vendedoras vd ON v.vendedora_id = vd.id ORDER BY v.id DESC
+    """, conn)
+    df_a = pd.read_sql_query("""
+        SELECT a.venta_id, a.fecha, a.monto, COALESCE(a.metodo_pago,'Efectivo') AS metodo
+        FROM abonos a ORDER BY a.venta_id, a.fecha
+    """, conn)
+
+    wb = Workbook()
+    ws1 = wb.active; ws1.title = "Resumen"
+    r = _titulo_sheet(ws1, "Resumen")
+    totales = [("Total ventas", len(df_v)),
+               ("Total vendido ($)", float(df_v['precio_total'].sum())),
+               ("Total cobrado ($)", float(df_v['pagado'].sum())),
+               ("Saldo por cobrar ($)", float(df_v['saldo'].sum())),
+               ("Ganancia total ($)", float(df_v['ganancia'].sum()))]
+    _estilo_header(ws1, r, 2, bg="29ABE2"); r += 1
+    for i, (k, v_val) in enumerate(totales):
+        ws1.cell(row=r, column=1).value = k; ws1.cell(row=r, column=2).value = v_val
+        _estilo_row(ws1, r, 2, bg="F0F9FF" if i % 2 == 0 else "FFFFFF"); r += 1
+
+    ws2 = wb.create_sheet("Clientes y Pagos")
+    r2 = _titulo_sheet(ws2, "Clientes")
+    _estilo_header(ws2, r2, 18, bg="E91E8C"); r2 += 1
+    for _, row in df_v.iterrows():
+        for c, val in enumerate(row.tolist(), 1): ws2.cell(row=r2, column=c).value = val
+        _estilo_row(ws2, r2, 18, bg="FFF0F7" if r2 % 2 == 0 else "FFFFFF")
+        _fmt_cur(ws2, r2, [12, 13, 14, 15, 16]); r2 += 1
+
+    ws3 = wb.create_sheet("Habitaciones")
+    r3 = _titulo_sheet(ws3, "Habitaciones")
+    df_h = df_v.copy()
+    df_h["tipo_habitacion"] = df_h["tipo_habitacion"].fillna("SIN TIPO").replace("", "SIN TIPO")
+    dist = df_h.groupby("tipo_habitacion").agg(
+        cantidad=("id", "count"), total=("precio_total", "sum"), cobrado=("pagado", "sum"),
+        saldo=("saldo", "sum"), ganancia=("ganancia", "sum")).reset_index()
+    _estilo_header(ws3, r3, 6, bg="1F4E79"); r3 += 1
+    for _, row in dist.iterrows():
+        for c, val in enumerate(row.tolist(), 1): ws3.cell(row=r3, column=c).value = val
+        _estilo_row(ws3, r3, 6, bg="EFF9FF" if r3 % 2 == 0 else "FFFFFF"); r3 += 1
+
+    ws4 = wb.create_sheet("Historial Pagos")
+    r4 = _titulo_sheet(ws4, "Historial")
+    df_a2 = df_a[df_a["venta_id"].isin(set(df_v["id"].tolist()))].copy()
+    mapa = df_v.set_index("id")[["cliente", "destino", "vendedora"]].to_dict("index")
+    for col in ("cliente", "destino", "vendedora"):
+        df_a2[col] = df_a2["venta_id"].map(lambda x: mapa.get(x, {}).get(col, "—"))
+    _estilo_header(ws4, r4, 7, bg="2D6A4F"); r4 += 1
+    for _, row in df_a2.iterrows():
+        for c, val in enumerate([row["venta_id"], row["cliente"], row["destino"], row["vendedora"],
+                                 row["fecha"], row["monto"], row["metodo"]], 1):
+            ws4.cell(row=r4, column=c).value = val
+        _estilo_row(ws4, r4, 7, bg="F0FFF4" if r4 % 2 == 0 else "FFFFFF")
+        _fmt_cur(ws4, r4, [6]); r4 += 1
+
+    buf = io.BytesIO()
+    wb.save(buf)
+    return buf.getvalue()
+
+
+# ─── MEDICIÓN ────────────────────────────────────────────────────────────────
+
+def _rss_pico_mb():
+    # ru_maxrss viene en KB en Linux y en bytes en macOS
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return pico / (1024 * 1024) if sys.platform == "darwin" else pico / 1024
+
+
+def _correr_motor(motor, directorio):
+    """Proceso hijo: genera el reporte en `directorio` y devuelve las métricas."""
+    os.chdir(directorio)
+    sys.path.insert(0, RAIZ)
+    import pagina_reportes  # misma base de memoria para ambos motores
+
+    base = _rss_pico_mb()
+    t0 = time.perf_counter()
+    if motor == "anterior":
+        conn = sqlite3.connect(DB_NAME)
+        xls = excel_riviera_anterior(conn)
+        conn.close()
+    else:
+        xls = pagina_reportes._excel_riviera()
+    return {
+        "segundos": time.perf_counter() - t0,
+        "rss_mb": _rss_pico_mb() - base,
+        "kb": len(xls) / 1024,
+    }
+
+
+def _medir(motor, directorio, limite_mb):
+    cmd = [sys.executable, os.path.abspath(__file__), "--hijo", motor, directorio]
+    if limite_mb:
+        cmd += ["--limite-mb", str(limite_mb)]
+    proc = subprocess.run(cmd, capture_output=True, text=True)
+    for linea in reversed(proc.stdout.splitlines()):
+        if linea.startswith("{"):
+            return json.loads(linea)
+    return None
+
+
+def ejecutar_benchmark(tamanos, limite_mb=0):
+    print("\n" + "="*72)
+    print("⏱️  BENCHMARK - REPORTE EXCEL RIVIERA MAYA (Todas las Ventas)")
+    print("="*72)
+    print(f"\n{'Ventas':>9} {'Abonos':>9}  {'Motor':<9} {'Tiempo':>9} {'Memoria':>11} {'Archivo':>10}")
+    print("-"*72)
+
+    for n in tamanos:
+        with tempfile.TemporaryDirectory() as directorio:
+            crear_base_sintetica(os.path.join(directorio, DB_NAME), n)
+            resultados = {}
+            for motor in ("anterior", "stream"):
+                res = _medir(motor, directorio, limite_mb)
+                resultados[motor] = res
+                if res is None:
+                    print(f"{n:>9,} {n*ABONOS_POR_VENTA:>9,}  {motor:<9} {'— falló (memoria/tiempo)':>33}")
+                else:
+                    print(f"{n:>9,} {n*ABONOS_POR_VENTA:>9,}  {motor:<9} {res['segundos']:>8.1f}s "
+                          f"{res['rss_mb']:>8.0f} MB {res['kb']/1024:>7.1f} MB")
+            ant, nvo = resultados["anterior"], resultados["stream"]
+            if ant and nvo:
+                print(f"{'':>21}→ {ant['segundos']/nvo['segundos']:.1f}x más rápido, "
+                      f"{ant['rss_mb']/max(nvo['rss_mb'], 1):.1f}x menos memoria")
+            print("-"*72)
+
+    print("\nMemoria = pico de RSS del proceso durante el reporte (sin contar la carga de la app).\n")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark del reporte Excel de Riviera Maya")
+    parser.add_argument("--tamanos", type=int, nargs="+", default=TAMANOS)
+    parser.add_argument("--limite-mb", type=int, default=0,
+                        help="tope de memoria virtual por proceso (0 = sin tope)")
+    parser.add_argument("--hijo", nargs=2, metavar=("MOTOR", "DIR"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.hijo:
+        if args.limite_mb:
+            tope = args.limite_mb * 1024 * 1024
+            resource.setrlimit(resource.RLIMIT_AS, (tope, tope))
+        print(json.dumps(_correr_motor(*args.hijo)))
+    else:
+        ejecutar_benchmark(args.tamanos, args.limite_mb)
@@ -0,0 +1,239 @@
+"""
+BENCHMARK DE PÁGINAS - Sistema Agencia Riviera Maya
+Prueba de carga sin navegador: abre las páginas de la app con AppTest de
+Streamlit, con N usuarias simuladas por rol (ADMIN y VENDEDORA) haciendo
+reruns al mismo tiempo contra una base sembrada con generar_datos_prueba.py.
+
+Por página reporta:
+    - latencia de rerun p50 / p95 (primera carga aparte);
+    - consultas por rerun (del perfilador de consultas de la app);
+    - pico de RSS del proceso.
+
+Cada página corre en un proceso aparte, para que la memoria y las cachés de
+una no contaminen a la otra. Todos los procesos usan la misma base sembrada.
+
+Uso:
+    python benchmark_paginas.py                          # 10k ventas, 4 usuarias por rol
+    python benchmark_paginas.py --ventas 100k --usuarios 8 --reruns 10
+    python benchmark_paginas.py --base copia.db --paginas dashboard riviera
+    python benchmark_paginas.py --salida antes.json
+    python benchmark_paginas.py --comparar antes.json     # marca regresiones
+
+Nunca toca agencia.db ni DATABASE_URL: la base se copia a un directorio
+temporal y la app corre ahí con SQLite.
+"""
+
+import io
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import contextlib
+import resource
+import tempfile
+import threading
+import subprocess
+from datetime import date
+
+DB_NAME = "agencia.db"
+RAIZ = os.path.dirname(os.path.abspath(__file__))
+PAGINAS = ["dashboard", "riviera", "nacionales", "reportes", "reporte_semanal"]
+USUARIOS = {
+    "ADMIN": {"id_vendedora": 1, "usuario": "admin", "nombre": "Administrador", "rol": "ADMIN"},
+    "VENDEDORA": {"id_vendedora": 1, "usuario": "ZajhiaG", "nombre": "Zajhia G", "rol": "VENDEDORA"},
+}
+TIMEOUT_RERUN = 300   # seg
+TOLERANCIA = 1.20     # --comparar: p95 o consultas 20% arriba = regresión
+
+
+# ─── BASE SEMBRADA ───────────────────────────────────────────────────────────
+
+def sembrar_base(directorio, ventas, base=None):
+    """Deja agencia.db en `directorio`: copia de `base` o generada con `ventas` ventas."""
+    ruta = os.path.join(directorio, DB_NAME)
+    if base:
+        shutil.copyfile(base, ruta)
+        return ruta
+    from generar_datos_prueba import DestinoSQLite, PLANTILLA, _escala, generar
+    with contextlib.redirect_stdout(io.StringIO()):
+        generar(_escala(ventas), DestinoSQLite(ruta, reemplazar=False),
+                plantilla=PLANTILLA, hasta=date.today())
+    return ruta
+
+
+# ─── MEDICIÓN ────────────────────────────────────────────────────────────────
+
+def _rss_pico_mb():
+    # ru_maxrss viene en KB en Linux y en bytes en macOS
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return pico / (1024 * 1024) if sys.platform == "darwin" else pico / 1024
+
+
+def _percentil(valores, p):
+    if not valores:
+        return 0.0
+    valores = sorted(valores)
+    return valores[min(len(valores) - 1, int(round(p / 100 * (len(valores) - 1))))]
+
+
+def _correr_pagina(pagina, directorio, usuarios, reruns):
+    """Proceso hijo: N usuarias por rol sobre `pagina`; devuelve las métricas."""
+    os.chdir(directorio)
+    sys.path.insert(0, RAIZ)
+    from streamlit.testing.v1 import AppTest
+    import app_nucleo
+
+    sesiones = []
+    for rol, usuario in USUARIOS.items():
+        for _ in range(usuarios):
+            at = AppTest.from_file(os.path.join(RAIZ, "app_streamlit.py"), default_timeout=TIMEOUT_RERUN)
+            at.session_state.logged_in = True
+            at.session_state.usuario_actual = dict(usuario)
+            at.session_state.pagina_actual = pagina
+            sesiones.append((rol, at))
+
+    # Primera carga de cada sesión, una tras otra (importa la página y llena cachés)
+    primera = []
+    for _, at in sesiones:
+        t0 = time.perf_counter()
+        at.run()
+        primera.append((time.perf_counter() - t0) * 1000)
+        if at.exception:
+            return {"error": str(at.exception[0].value)[:500]}
+
+    perfilador = app_nucleo.perfilador_consultas()
+    perfilador.limpiar()
+    tiempos = {rol: [] for rol in USUARIOS}
+    errores = []
+
+    def usuaria(rol, at):
+        for _ in range(reruns):
+            t0 = time.perf_counter()
+            at.run()
+            tiempos[rol].append((time.perf_counter() - t0) * 1000)
+            if at.exception:
+                errores.append(str(at.exception[0].value)[:500])
+                return
+
+    hilos = [threading.Thread(target=usuaria, args=s) for s in sesiones]
+    for h in hilos:
+        h.start()
+    for h in hilos:
+        h.join()
+    if errores:
+        return {"error": errores[0]}
+
+    consultas = [len(r["consultas"]) for r in perfilador.reruns() if r["pagina"] == pagina]
+    todos = tiempos["ADMIN"] + tiempos["VENDEDORA"]
+    return {
+        "pagina": pagina,
+        "reruns": len(todos),
+        "primera_ms": round(max(primera), 1),
+        "p50_ms": round(_percentil(todos, 50), 1),
+        "p95_ms": round(_percentil(todos, 95), 1),
+        "p95_admin_ms": round(_percentil(tiempos["ADMIN"], 95), 1),
+        "p95_vendedora_ms": round(_percentil(tiempos["VENDEDORA"], 95), 1),
+        "consultas_por_rerun": round(sum(consultas) / len(consultas), 1) if consultas else None,
+        "consultas_max": max(consultas) if consultas else None,
+        "rss_mb": round(_rss_pico_mb(), 1),
+    }
+
+
+def _medir(pagina, directorio, usuarios, reruns):
+    cmd = [sys.executable, os.path.abspath(__file__), "--hijo", pagina, directorio,
+           "--usuarios", str(usuarios), "--reruns", str(reruns)]
+    env = dict(os.environ)
+    env.pop("DATABASE_URL", None)                  # siempre la copia SQLite
+    env.setdefault("TIPO_CAMBIO_FUENTE", "stub")   # sin internet durante la medición
+    env["PERFIL_CONSULTAS"] = "1"
+    env["PERFIL_RERUNS_MAX"] = str(2 * usuarios * (reruns + 1) + 10)
+    proc = subprocess.run(cmd, capture_output=True, text=True, env=env)
+    for linea in reversed(proc.stdout.splitlines()):
+        if linea.startswith("{"):
+            return json.loads(linea)
+    return {"error": (proc.stderr.strip().splitlines() or ["sin salida"])[-1][:500]}
+
+
+# ─── REPORTE ─────────────────────────────────────────────────────────────────
+
+def _comparar(res, anterior):
+    """Texto con el cambio contra la corrida anterior; marca ⚠️ si empeoró más de la tolerancia."""
+    if not anterior or "error" in anterior or "error" in res:
+        return ""
+    marcas = []
+    for campo, etiqueta in (("p95_ms", "p95"), ("consultas_por_rerun", "consultas")):
+        antes, ahora = anterior.get(campo), res.get(campo)
+        if not antes or ahora is None:
+            continue
+        factor = ahora / antes
+        marca = "⚠️ " if factor > TOLERANCIA else ""
+        marcas.append(f"{marca}{etiqueta} {factor:.2f}x")
+    return "  " + ", ".join(marcas)
+
+
+def ejecutar_benchmark(paginas, ventas, base, usuarios, reruns, salida=None, comparar=None):
+    print("\n" + "="*92)
+    print("⏱️  BENCHMARK - PÁGINAS DE LA APP (AppTest, usuarias concurrentes)")
+    print("="*92)
+
+    anteriores = {}
+    if comparar:
+        with open(comparar, encoding="utf-8") as f:
+            anteriores = {r.get("pagina"): r for r in json.load(f)["paginas"]}
+
+    resultados = []
+    with tempfile.TemporaryDirectory() as directorio:
+        t0 = time.perf_counter()
+        sembrar_base(directorio, ventas, base)
+        print(f"\n🗄️ Base: {base or f'sintética de {ventas} ventas'} (lista en {time.perf_counter() - t0:.1f}s)")
+        print(f"👥 {usuarios} usuarias por rol (ADMIN y VENDEDORA) × {reruns} reruns cada una\n")
+        print(f"{'Página':<16} {'1ª carga':>9} {'p50':>8} {'p95':>8} {'p95 ADM':>8} {'p95 VEN':>8} "
+              f"{'Consultas':>10} {'RSS pico':>9}")
+        print("-"*92)
+        for pagina in paginas:
+            res = _medir(pagina, directorio, usuarios, reruns)
+            res["pagina"] = pagina
+            resultados.append(res)
+            if "error" in res:
+                print(f"{pagina:<16} ❌ {res['error']}")
+                continue
+            consultas = "—" if res["consultas_por_rerun"] is None else f"{res['consultas_por_rerun']:.1f}"
+            print(f"{pagina:<16} {res['primera_ms']:>7.0f}ms {res['p50_ms']:>6.0f}ms {res['p95_ms']:>6.0f}ms "
+                  f"{res['p95_admin_ms']:>6.0f}ms {res['p95_vendedora_ms']:>6.0f}ms {consultas:>10} "
+                  f"{res['rss_mb']:>6.0f} MB{_comparar(res, anteriores.get(pagina))}")
+        print("-"*92)
+
+    print("\np50/p95 = latencia de un rerun con todas las usuarias activas a la vez (sin la primera carga).")
+    print("Consultas = promedio por rerun según el perfilador. RSS pico = proceso completo de la página.\n")
+
+    if salida:
+        with open(salida, "w", encoding="utf-8") as f:
+            json.dump({"fecha": time.strftime("%Y-%m-%d %H:%M:%S"), "ventas": None if base else ventas,
+                       "base": base, "usuarios": usuarios, "reruns": reruns, "paginas": resultados},
+                      f, ensure_ascii=False, indent=2)
+        print(f"💾 Resultados en {salida}\n")
+
+    regresiones = [r["pagina"] for r in resultados if "⚠️" in _comparar(r, anteriores.get(r["pagina"]))]
+    return not regresiones and not any("error" in r for r in resultados)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Prueba de carga de las páginas de la app con AppTest")
+    parser.add_argument("--paginas", nargs="+", default=PAGINAS)
+    parser.add_argument("--ventas", default="10k", help="tamaño de la base sintética (1k, 10k, 100k, 1m)")
+    parser.add_argument("--base", help="usar una copia de esta base en lugar de generar una")
+    parser.add_argument("--usuarios", type=int, default=4, help="usuarias simuladas por rol")
+    parser.add_argument("--reruns", type=int, default=5, help="reruns por usuaria")
+    parser.add_argument("--salida", help="guardar los resultados en JSON")
+    parser.add_argument("--comparar", help="JSON de una corrida anterior; sale con código 1 si hay regresión")
+    parser.add_argument("--hijo", nargs=2, metavar=("PAGINA", "DIR"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.hijo:
+        print(json.dumps(_correr_pagina(args.hijo[0], args.hijo[1], args.usuarios, args.reruns)))
+    else:
+        ok = ejecutar_benchmark(args.paginas, args.ventas, args.base, args.usuarios, args.reruns,
+                                args.salida, args.comparar)
+        sys.exit(0 if ok else 1)
@@ -0,0 +1,157 @@
+"""
+BENCHMARK RECIBOS Y CUPONES PDF - Sistema Agencia Riviera Maya
+Mide cuántos PDFs por segundo se generan con generar_recibo_pdf y
+generar_cupon_pdf, el tiempo del primer PDF (cuando se llena la cache del
+logo) y el tamaño de cada archivo.
+
+Compara la versión actual (pdf_assets: logo reducido y cacheado + plantilla
+de página reusada) contra la versión anterior de los generadores, que se
+toma del historial de git (el commit previo a pdf_assets.py). Cada
+combinación corre en un proceso aparte para que la cache de una no ayude a
+la otra.
+
+Uso:
+    python benchmark_pdf.py                 # 200 PDFs de cada tipo
+    python benchmark_pdf.py --cantidad 500
+    python benchmark_pdf.py --sin-anterior  # sólo la versión actual
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import subprocess
+
+RAIZ = os.path.dirname(os.path.abspath(__file__))
+LOGO_PATH = os.path.join(RAIZ, "logo_turismar_clean.png")
+CANTIDAD = 200
+MODULOS = {"recibo": "generar_recibo", "cupon": "generar_cupon"}
+
+
+def _datos(tipo, i):
+    """Argumentos de un recibo o cupón sintético (cambian en cada PDF)."""
+    if tipo == "recibo":
+        return dict(
+            numero=i + 1, fecha="21-febrero-2026", recibide=f"Cliente {i:04d} González",
+            cantidad=1500.0 + i, concepto="Viaje Riviera Maya - Hotel Barceló Maya Grand, 4 noches",
+            forma_pago="Transferencia", agente="Laura", logo_path=LOGO_PATH,
+            total_viaje=15000.0, pagado_acumulado=1500.0 + i, nuevo_saldo=13500.0 - i,
+        )
+    return dict(
+        titular=f"Cliente {i:04d} Varguez", clave_confirm=f"69-{7543060 + i}",
+        hotel_nombre="Barceló Maya Grand", hotel_direccion="Carr. Cancún–Tulum Km. 266,3, Xpu Ha, Q.R.",
+        hotel_telefono="984 875 1500", hotel_estrellas=5, fecha_entrada="2026-08-08",
+        fecha_salida="2026-08-12", adultos=2, menores=1, edades_menores="5 años",
+        requerimientos="Aniversario de bodas", logo_path=LOGO_PATH,
+    )
+
+
+# ─── VERSIÓN ANTERIOR (git) ──────────────────────────────────────────────────
+
+def _commit_anterior():
+    """Commit previo a la introducción de pdf_assets.py, o None."""
+    try:
+        salida = subprocess.run(
+            ["git", "log", "--diff-filter=A", "--format=%H", "--", "pdf_assets.py"],
+            cwd=RAIZ, capture_output=True, text=True, check=True).stdout.split()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return f"{salida[-1]}^" if salida else None
+
+
+def _extraer_anterior(commit, directorio):
+    """Copia generar_recibo.py y generar_cupon.py de `commit` a `directorio`."""
+    for modulo in MODULOS.values():
+        fuente = subprocess.run(["git", "show", f"{commit}:{modulo}.py"],
+                                cwd=RAIZ, capture_output=True, check=True).stdout
+        with open(os.path.join(directorio, f"{modulo}.py"), "wb") as f:
+            f.write(fuente)
+
+
+# ─── MEDICIÓN ────────────────────────────────────────────────────────────────
+
+def _correr(tipo, cantidad, directorio):
+    """Proceso hijo: genera `cantidad` PDFs y devuelve las métricas."""
+    sys.path.insert(0, directorio or RAIZ)
+    modulo = __import__(MODULOS[tipo])
+    generar = getattr(modulo, f"generar_{tipo}_pdf")
+
+    t0 = time.perf_counter()
+    primero = generar(**_datos(tipo, 0))
+    t_primero = time.perf_counter() - t0
+
+    total_bytes = 0
+    t0 = time.perf_counter()
+    for i in range(1, cantidad + 1):
+        total_bytes += len(generar(**_datos(tipo, i)))
+    segundos = time.perf_counter() - t0
+    return {
+        "primero_ms": t_primero * 1000,
+        "ms": segundos / cantidad * 1000,
+        "por_segundo": cantidad / segundos,
+        "kb": total_bytes / cantidad / 1024,
+        "kb_primero": len(primero) / 1024,
+    }
+
+
+def _medir(tipo, cantidad, directorio=""):
+    cmd = [sys.executable, os.path.abspath(__file__), "--hijo", tipo, directorio,
+           "--cantidad", str(cantidad)]
+    proc = subprocess.run(cmd, capture_output=True, text=True, cwd=RAIZ)
+    for linea in reversed(proc.stdout.splitlines()):
+        if linea.startswith("{"):
+            return json.loads(linea)
+    print(proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else "   (sin salida)")
+    return None
+
+
+def ejecutar_benchmark(cantidad, con_anterior=True):
+    print("\n" + "="*72)
+    print("⏱️  BENCHMARK - RECIBOS Y CUPONES PDF")
+    print("="*72)
+
+    commit = _commit_anterior() if con_anterior else None
+    if con_anterior and not commit:
+        print("\n⚠️ No se encontró la versión anterior en git; sólo se mide la actual.")
+
+    print(f"\n{'Documento':<10} {'Versión':<9} {'1er PDF':>9} {'Por PDF':>9} {'PDFs/s':>8} {'Tamaño':>10}")
+    print("-"*72)
+    with tempfile.TemporaryDirectory() as directorio:
+        if commit:
+            _extraer_anterior(commit, directorio)
+        for tipo in MODULOS:
+            resultados = {}
+            versiones = [("anterior", directorio)] if commit else []
+            versiones.append(("actual", ""))
+            for version, ruta in versiones:
+                res = _medir(tipo, cantidad, ruta)
+                resultados[version] = res
+                if res is None:
+                    print(f"{tipo:<10} {version:<9} {'— falló':>9}")
+                    continue
+                print(f"{tipo:<10} {version:<9} {res['primero_ms']:>7.0f}ms {res['ms']:>7.1f}ms "
+                      f"{res['por_segundo']:>8.1f} {res['kb']:>7.1f} KB")
+            ant, act = resultados.get("anterior"), resultados.get("actual")
+            if ant and act:
+                print(f"{'':>20}→ {act['por_segundo']/ant['por_segundo']:.1f}x más PDFs/s, "
+                      f"{ant['kb']/act['kb']:.1f}x más chico")
+            print("-"*72)
+
+    print(f"\n1er PDF = primer documento del proceso (carga del logo); "
+          f"Por PDF y PDFs/s = promedio de los {cantidad} siguientes.\n")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark de recibos y cupones PDF")
+    parser.add_argument("--cantidad", type=int, default=CANTIDAD)
+    parser.add_argument("--sin-anterior", action="store_true",
+                        help="no medir la versión anterior tomada de git")
+    parser.add_argument("--hijo", nargs=2, metavar=("TIPO", "DIR"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.hijo:
+        print(json.dumps(_correr(args.hijo[0], args.cantidad, args.hijo[1])))
+    else:
+        ejecutar_benchmark(args.cantidad, con_anterior=not args.sin_anterior)
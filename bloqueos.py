@@ -2,6 +2,7 @@ from database import conectar
 from operadores import seleccionar_operador
 from datetime import datetime
 from hoteles import seleccionar_hotel
+from inventario_habitaciones import descontar_habitaciones
 
 
 def calcular_noches(fecha_inicio, fecha_fin):
@@ -170,33 +171,20 @@ def obtener_bloqueo_por_id(id_bloqueo):
     }
 
 
-def descontar_habitacion(id_bloqueo):
-    """Descuenta una habitación del inventario del bloqueo"""
+def descontar_habitacion(id_bloqueo, cursor=None):
+    """
+    Descuenta una habitación del inventario del bloqueo (sentencia condicional
+    de inventario_habitaciones; lo marca AGOTADO al llegar a 0).
+    Con `cursor`, dentro de la transacción de la venta. True si había habitación.
+    """
+    if cursor is not None:
+        return descontar_habitaciones(cursor, "bloqueo", id_bloqueo)
+
     conexion = conectar()
-    cursor = conexion.cursor()
-    
-    # Actualizar vendidas y disponibles
-    cursor.execute("""
-        UPDATE bloqueos
-        SET habitaciones_vendidas = habitaciones_vendidas + 1,
-            habitaciones_disponibles = habitaciones_disponibles - 1
-        WHERE id = ?
-    """, (id_bloqueo,))
-    
-    # Verificar si se agotó
-    cursor.execute("""
-        SELECT habitaciones_disponibles FROM bloqueos WHERE id = ?
-    """, (id_bloqueo,))
-    
-    disponibles = cursor.fetchone()[0]
-    
-    if disponibles == 0:
-        cursor.execute("""
-            UPDATE bloqueos SET estado = 'AGOTADO' WHERE id = ?
-        """, (id_bloqueo,))
-    
+    vendida = descontar_habitaciones(conexion.cursor(), "bloqueo", id_bloqueo)
     conexion.commit()
     conexion.close()
+    return vendida
 
 
 def editar_bloqueo():
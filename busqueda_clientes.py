@@ -0,0 +1,406 @@
+"""
+BÚSQUEDA DE CLIENTES - Sistema Agencia Riviera Maya
+Índice único para buscar clientes y pasajeros de todas las líneas de
+producto desde una sola caja: nombre del cliente o pasajero, celular y
+códigos de localizador / confirmación de Riviera Maya.
+
+La tabla busqueda_clientes tiene una fila por cliente, pasajero o trámite:
+
+    fuente        tabla de origen (ventas, pasajeros, clientes_nacionales, ...)
+    fila_id       id en la tabla de origen
+    producto      riviera | nacional | internacional | pasaporte | visa | vuelo
+    referencia_id venta, cliente o trámite que hay que abrir
+    nombre        cliente o pasajero, como se captura
+    detalle       dato corto para distinguir homónimos (destino, viaje, estado)
+    texto         lo que se busca: nombre, celular y códigos
+
+Se mantiene con triggers sobre cada tabla de origen, así que la llenan
+también los scripts de consola. Los UPDATE sólo disparan si cambian las
+columnas que se indexan (registrar un abono no toca el índice).
+
+    SQLite      FTS5 (tokenizer unicode61 sin acentos, índice de prefijos)
+                sobre busqueda_clientes como tabla de contenido externo.
+    PostgreSQL  GIN sobre to_tsvector('simple', unaccent(texto)) para
+                prefijos y GIN pg_trgm para tolerar errores de dedo.
+
+Para recalcular todo desde las tablas de origen:
+    python busqueda_clientes.py
+"""
+
+import os
+import re
+import sqlite3
+import unicodedata
+
+from transacciones import transaccion
+
+DB_NAME = "agencia.db"
+RESULTADOS_MAX = 20
+CANDIDATOS_MAX = 1000   # filas que se ordenan por relevancia en SQLite
+
+# tabla -> (producto, referencia, nombre, detalle, [columnas que se buscan]);
+# {f} es la fila (NEW, OLD o el alias de la tabla al cargar)
+FUENTES = {
+    "ventas": ("riviera", "{f}.id", "{f}.cliente",
+               "COALESCE({f}.destino, '') || ' · ' || COALESCE({f}.fecha_inicio, '')",
+               ["cliente", "celular_responsable", "no_localizador", "clave_confirmacion"]),
+    "pasajeros": ("riviera", "{f}.venta_id", "{f}.nombre",
+                  "'Pasajero de la venta #' || CAST({f}.venta_id AS TEXT)",
+                  ["nombre"]),
+    "clientes_nacionales": ("nacional", "{f}.id", "{f}.nombre_cliente",
+                            "'Viaje nacional #' || CAST({f}.viaje_id AS TEXT)",
+                            ["nombre_cliente", "celular_responsable"]),
+    "pasajeros_nacionales": ("nacional", "{f}.cliente_id", "{f}.nombre_completo",
+                             "'Pasajero del cliente #' || CAST({f}.cliente_id AS TEXT)",
+                             ["nombre_completo"]),
+    "clientes_internacionales": ("internacional", "{f}.id", "{f}.nombre_cliente",
+                                 "'Viaje internacional #' || CAST({f}.viaje_id AS TEXT)",
+                                 ["nombre_cliente", "celular_responsable"]),
+    "pasajeros_internacionales": ("internacional", "{f}.cliente_id", "{f}.nombre_completo",
+                                  "'Pasajero del cliente #' || CAST({f}.cliente_id AS TEXT)",
+                                  ["nombre_completo"]),
+    "pasaportes": ("pasaporte", "{f}.id", "{f}.cliente",
+                   "COALESCE({f}.tipo, '') || ' · ' || COALESCE({f}.estado, '')",
+                   ["cliente", "celular"]),
+    "visas": ("visa", "{f}.id", "{f}.cliente",
+              "COALESCE({f}.pais_destino, '') || ' · ' || COALESCE({f}.estado, '')",
+              ["cliente", "celular"]),
+    "vuelos": ("vuelo", "{f}.id", "{f}.pasajero",
+               "COALESCE({f}.origen, '') || ' → ' || COALESCE({f}.destino, '') || ' · ' "
+               "|| COALESCE(CAST({f}.fecha_vuelo AS TEXT), '')",
+               ["pasajero", "celular"]),
+}
+
+# Columnas del detalle que también deben refrescar el índice al cambiar
+_COLUMNAS_DETALLE = {
+    "ventas": ["destino", "fecha_inicio"],
+    "pasaportes": ["tipo", "estado"],
+    "visas": ["pais_destino", "estado"],
+    "vuelos": ["origen", "destino", "fecha_vuelo"],
+    "clientes_nacionales": ["viaje_id"],
+    "clientes_internacionales": ["viaje_id"],
+}
+
+_COLUMNAS_INDICE = "fuente, fila_id, producto, referencia_id, nombre, detalle, texto"
+
+_CREAR_TABLA_SQLITE = """
+    CREATE TABLE IF NOT EXISTS busqueda_clientes (
+        id INTEGER PRIMARY KEY,
+        fuente TEXT NOT NULL,
+        fila_id INTEGER NOT NULL,
+        producto TEXT NOT NULL,
+        referencia_id INTEGER,
+        nombre TEXT,
+        detalle TEXT,
+        texto TEXT NOT NULL DEFAULT '',
+        UNIQUE (fuente, fila_id)
+    )
+"""
+_CREAR_FTS = """
+    CREATE VIRTUAL TABLE IF NOT EXISTS busqueda_clientes_fts USING fts5(
+        texto, content='busqueda_clientes', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+    )
+"""
+# FTS5 con contenido externo: el índice sigue a busqueda_clientes
+_TRIGGERS_FTS = [
+    """CREATE TRIGGER IF NOT EXISTS trg_busqueda_fts_ins AFTER INSERT ON busqueda_clientes BEGIN
+           INSERT INTO busqueda_clientes_fts (rowid, texto) VALUES (NEW.id, NEW.texto);
+       END""",
+    """CREATE TRIGGER IF NOT EXISTS trg_busqueda_fts_del AFTER DELETE ON busqueda_clientes BEGIN
+           INSERT INTO busqueda_clientes_fts (busqueda_clientes_fts, rowid, texto) VALUES ('delete', OLD.id, OLD.texto);
+       END""",
+    """CREATE TRIGGER IF NOT EXISTS trg_busqueda_fts_upd AFTER UPDATE OF texto ON busqueda_clientes BEGIN
+           INSERT INTO busqueda_clientes_fts (busqueda_clientes_fts, rowid, texto) VALUES ('delete', OLD.id, OLD.texto);
+           INSERT INTO busqueda_clientes_fts (rowid, texto) VALUES (NEW.id, NEW.texto);
+       END""",
+]
+
+_CREAR_TABLA_PG = """
+    CREATE TABLE IF NOT EXISTS busqueda_clientes (
+        id SERIAL PRIMARY KEY,
+        fuente TEXT NOT NULL,
+        fila_id INTEGER NOT NULL,
+        producto TEXT NOT NULL,
+        referencia_id INTEGER,
+        nombre TEXT,
+        detalle TEXT,
+        texto TEXT NOT NULL DEFAULT '',
+        UNIQUE (fuente, fila_id)
+    )
+"""
+# unaccent() no es IMMUTABLE; el envoltorio con diccionario fijo sí se puede indexar
+_FUNCION_NORMALIZAR_PG = """
+    CREATE OR REPLACE FUNCTION busqueda_normalizar(texto TEXT) RETURNS TEXT AS $$
+        SELECT lower(unaccent('unaccent', COALESCE(texto, '')))
+    $$ LANGUAGE sql IMMUTABLE PARALLEL SAFE
+"""
+_INDICES_PG = [
+    "CREATE INDEX IF NOT EXISTS idx_busqueda_clientes_ts ON busqueda_clientes "
+    "USING gin (to_tsvector('simple', busqueda_normalizar(texto)))",
+    "CREATE INDEX IF NOT EXISTS idx_busqueda_clientes_trgm ON busqueda_clientes "
+    "USING gin (busqueda_normalizar(texto) gin_trgm_ops)",
+]
+
+
+# ─── ESQUEMA ─────────────────────────────────────────────────────────────────
+
+def _tablas(cursor, es_postgres):
+    if es_postgres:
+        cursor.execute("SELECT table_name FROM information_schema.tables WHERE table_schema = current_schema()")
+    else:
+        cursor.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+    return {r[0] for r in cursor.fetchall()}
+
+
+def _triggers(cursor, es_postgres):
+    if es_postgres:
+        cursor.execute("SELECT tgname FROM pg_trigger WHERE NOT tgisinternal")
+    else:
+        cursor.execute("SELECT name FROM sqlite_master WHERE type = 'trigger'")
+    return {r[0] for r in cursor.fetchall()}
+
+
+def _valores(tabla, fila):
+    """Columnas del índice para una fila de `tabla` (NEW, OLD o alias)."""
+    producto, referencia, nombre, detalle, buscadas = FUENTES[tabla]
+    texto = " || ' ' || ".join(f"COALESCE(CAST({fila}.{c} AS TEXT), '')" for c in buscadas)
+    return [f"'{tabla}'", f"{fila}.id", f"'{producto}'", referencia.format(f=fila),
+            nombre.format(f=fila), detalle.format(f=fila), texto]
+
+
+_ACTUALIZAR = """
+    ON CONFLICT (fuente, fila_id) DO UPDATE SET
+        referencia_id = excluded.referencia_id, nombre = excluded.nombre,
+        detalle = excluded.detalle, texto = excluded.texto"""
+
+
+def _upsert(tabla):
+    return (f"INSERT INTO busqueda_clientes ({_COLUMNAS_INDICE}) "
+            f"VALUES ({', '.join(_valores(tabla, 'NEW'))}) {_ACTUALIZAR};")
+
+
+def _borrar(tabla):
+    return f"DELETE FROM busqueda_clientes WHERE fuente = '{tabla}' AND fila_id = OLD.id;"
+
+
+def _columnas_vigiladas(tabla):
+    """Columnas cuyo cambio obliga a refrescar la fila del índice."""
+    producto, referencia, _, _, buscadas = FUENTES[tabla]
+    columnas = list(buscadas) + _COLUMNAS_DETALLE.get(tabla, [])
+    padre = re.match(r"\{f\}\.(\w+)$", referencia)
+    if padre and padre.group(1) != "id":
+        columnas.append(padre.group(1))
+    return ", ".join(dict.fromkeys(columnas))
+
+
+def _crear_triggers(cursor, tabla, es_postgres):
+    vigiladas = _columnas_vigiladas(tabla)
+    if es_postgres:
+        cursor.execute(f"""
+            CREATE OR REPLACE FUNCTION fn_busqueda_{tabla}() RETURNS trigger AS $$
+            BEGIN
+                IF TG_OP = 'DELETE' THEN
+                    {_borrar(tabla)}
+                ELSE
+                    {_upsert(tabla)}
+                END IF;
+                RETURN NULL;
+            END
+            $$ LANGUAGE plpgsql
+        """)
+        cursor.execute(f"""
+            CREATE TRIGGER trg_busqueda_{tabla}
+            AFTER INSERT OR UPDATE OF {vigiladas} OR DELETE ON {tabla}
+            FOR EACH ROW EXECUTE PROCEDURE fn_busqueda_{tabla}()
+        """)
+    else:
+        cursor.execute(f"CREATE TRIGGER IF NOT EXISTS trg_busqueda_{tabla}_ins AFTER INSERT ON {tabla} "
+                       f"BEGIN {_upsert(tabla)} END")
+        cursor.execute(f"CREATE TRIGGER IF NOT EXISTS trg_busqueda_{tabla}_upd AFTER UPDATE OF {vigiladas} "
+                       f"ON {tabla} BEGIN {_upsert(tabla)} END")
+        cursor.execute(f"CREATE TRIGGER IF NOT EXISTS trg_busqueda_{tabla}_del AFTER DELETE ON {tabla} "
+                       f"BEGIN {_borrar(tabla)} END")
+
+
+def _quitar_triggers(cursor, tabla, es_postgres):
+    if es_postgres:
+        cursor.execute(f"DROP TRIGGER IF EXISTS trg_busqueda_{tabla} ON {tabla}")
+    else:
+        for sufijo in ("ins", "upd", "del"):
+            cursor.execute(f"DROP TRIGGER IF EXISTS trg_busqueda_{tabla}_{sufijo}")
+
+
+def _cargar(cursor, tabla):
+    """Copia al índice las filas de `tabla` que aún no están."""
+    # El WHERE evita que SQLite lea el ON CONFLICT como parte de un JOIN
+    cursor.execute(f"""
+        INSERT INTO busqueda_clientes ({_COLUMNAS_INDICE})
+        SELECT {', '.join(_valores(tabla, 't'))} FROM {tabla} t WHERE 1 = 1
+        ON CONFLICT (fuente, fila_id) DO NOTHING
+    """)
+
+
+def _crear_esquema(cursor, es_postgres):
+    if es_postgres:
+        cursor.execute("CREATE EXTENSION IF NOT EXISTS unaccent")
+        cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        cursor.execute(_CREAR_TABLA_PG)
+        cursor.execute(_FUNCION_NORMALIZAR_PG)
+        for sql in _INDICES_PG:
+            cursor.execute(sql)
+    else:
+        cursor.execute(_CREAR_TABLA_SQLITE)
+        cursor.execute(_CREAR_FTS)
+        for sql in _TRIGGERS_FTS:
+            cursor.execute(sql)
+
+
+# ─── INSTALACIÓN Y RECONSTRUCCIÓN ────────────────────────────────────────────
+
+def instalar_busqueda_clientes(conn, es_postgres=False):
+    """
+    Crea el índice y los triggers de las tablas de origen que existen.
+    Carga las filas de cada tabla la primera vez que se le ponen triggers.
+    Devuelve las tablas que se cargaron.
+    """
+    cursor = conn.cursor()
+    _crear_esquema(cursor, es_postgres)
+    existentes = _tablas(cursor, es_postgres)
+    triggers = _triggers(cursor, es_postgres)
+    cargadas = []
+    for tabla in FUENTES:
+        if tabla not in existentes:
+            continue    # Módulo no instalado en esta base
+        nombre = f"trg_busqueda_{tabla}" + ("" if es_postgres else "_ins")
+        if nombre in triggers:
+            continue
+        # Triggers y carga juntos: si la carga falla, la próxima vez se reintenta
+        with transaccion(conn, es_postgres):
+            _crear_triggers(cursor, tabla, es_postgres)
+            _cargar(cursor, tabla)
+        cargadas.append(tabla)
+    conn.commit()
+    return cargadas
+
+
+def reconstruir_busqueda_clientes(conn, es_postgres=False):
+    """
+    Vuelve a crear los triggers y recarga el índice completo desde las
+    tablas de origen. Devuelve cuántas filas quedaron.
+    """
+    cursor = conn.cursor()
+    _crear_esquema(cursor, es_postgres)
+    existentes = _tablas(cursor, es_postgres)
+    with transaccion(conn, es_postgres):
+        cursor.execute("DELETE FROM busqueda_clientes")
+        if not es_postgres:
+            cursor.execute("INSERT INTO busqueda_clientes_fts (busqueda_clientes_fts) VALUES ('delete-all')")
+        for tabla in FUENTES:
+            if tabla not in existentes:
+                continue
+            _quitar_triggers(cursor, tabla, es_postgres)
+            _crear_triggers(cursor, tabla, es_postgres)
+            _cargar(cursor, tabla)
+        if not es_postgres:
+            cursor.execute("INSERT INTO busqueda_clientes_fts (busqueda_clientes_fts) VALUES ('optimize')")
+    cursor.execute("SELECT COUNT(*) FROM busqueda_clientes")
+    return cursor.fetchone()[0]
+
+
+# ─── BÚSQUEDA ────────────────────────────────────────────────────────────────
+
+def _terminos(texto):
+    """Palabras de la búsqueda en minúsculas y sin acentos (sólo letras y dígitos)."""
+    sin_acentos = unicodedata.normalize("NFKD", texto or "")
+    sin_acentos = "".join(c for c in sin_acentos if not unicodedata.combining(c))
+    return re.findall(r"\w+", sin_acentos.lower())
+
+
+def buscar_clientes(cursor, texto, es_postgres=False, limite=RESULTADOS_MAX):
+    """
+    Clientes, pasajeros y trámites cuyo nombre, celular o código empieza con
+    cada palabra de `texto` (sin importar acentos ni mayúsculas), los más
+    relevantes primero. Devuelve filas
+    (producto, fuente, referencia_id, nombre, detalle).
+
+    `cursor` es un cursor de conectar_db() (placeholders '?').
+    """
+    terminos = _terminos(texto)
+    if not terminos:
+        return []
+    if es_postgres:
+        consulta = " & ".join(f"{t}:*" for t in terminos)
+        cursor.execute("""
+            SELECT producto, fuente, referencia_id, nombre, detalle
+            FROM busqueda_clientes
+            WHERE to_tsvector('simple', busqueda_normalizar(texto)) @@ to_tsquery('simple', ?)
+            ORDER BY ts_rank(to_tsvector('simple', busqueda_normalizar(texto)),
+                             to_tsquery('simple', ?)) DESC, id DESC
+            LIMIT ?
+        """, (consulta, consulta, limite))
+        filas = cursor.fetchall()
+        if filas:
+            return filas
+        # Sin coincidencias por prefijo: parecido por trigramas (errores de dedo).
+        # %% es el operador % de pg_trgm escapado para psycopg2
+        cursor.execute("""
+            SELECT producto, fuente, referencia_id, nombre, detalle
+            FROM busqueda_clientes
+            WHERE busqueda_normalizar(texto) %% ?
+            ORDER BY similarity(busqueda_normalizar(texto), ?) DESC
+            LIMIT ?
+        """, (" ".join(terminos), " ".join(terminos), limite))
+        return cursor.fetchall()
+    # Un prefijo corto ("ro") coincide con media base: se ordenan por relevancia
+    # sólo las CANDIDATOS_MAX filas más recientes, que FTS5 recorre por rowid
+    consulta = " ".join(f'"{t}"*' for t in terminos)
+    cursor.execute("""
+        SELECT b.producto, b.fuente, b.referencia_id, b.nombre, b.detalle
+        FROM (
+            SELECT rowid, rank FROM busqueda_clientes_fts
+            WHERE busqueda_clientes_fts MATCH ?
+            ORDER BY rowid DESC
+            LIMIT ?
+        ) c
+        JOIN busqueda_clientes b ON b.id = c.rowid
+        ORDER BY c.rank, b.id DESC
+        LIMIT ?
+    """, (consulta, CANDIDATOS_MAX, limite))
+    return cursor.fetchall()
+
+
+def ejecutar_reconstruccion():
+    """Reconstruye el índice de búsqueda en PostgreSQL (DATABASE_URL) o agencia.db"""
+    print("\n" + "="*60)
+    print("🔎 BÚSQUEDA DE CLIENTES - RECONSTRUCCIÓN")
+    print("="*60)
+
+    database_url = os.environ.get("DATABASE_URL", "")
+    if database_url:
+        import psycopg2
+        conn = psycopg2.connect(database_url)
+        conn.autocommit = True
+        print("\n🐘 Base: PostgreSQL")
+    else:
+        conn = sqlite3.connect(DB_NAME)
+        print(f"\n🗄️ Base: {DB_NAME}")
+
+    es_postgres = bool(database_url)
+    try:
+        total = reconstruir_busqueda_clientes(conn, es_postgres)
+        cursor = conn.cursor()
+        cursor.execute("SELECT fuente, COUNT(*) FROM busqueda_clientes GROUP BY fuente ORDER BY fuente")
+        for fuente, cantidad in cursor.fetchall():
+            print(f"   🔎 {fuente:<26} {cantidad:>8}")
+        print(f"\n✅ ÍNDICE RECONSTRUIDO ({total} filas)\n")
+        return True
+    except Exception as e:
+        print(f"\n❌ ERROR: {e}\n")
+        return False
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    ejecutar_reconstruccion()
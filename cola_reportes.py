@@ -0,0 +1,178 @@
+"""
+COLA DE REPORTES - Sistema Agencia Riviera Maya
+Genera reportes (Excel, PDF o ZIP) en segundo plano para no bloquear la sesión de
+Streamlit mientras se arma un archivo grande.
+
+Cada trabajo corre en un hilo del ThreadPoolExecutor; el archivo terminado se
+guarda en DIRECTORIO_REPORTES y su estado en trabajos.json, así el usuario
+puede descargarlo después (incluso tras reiniciar la app) sin regenerarlo.
+
+Estados: EN COLA -> GENERANDO -> LISTO | ERROR
+
+La función del reporte recibe un argumento extra `progreso(fraccion, mensaje)`
+para informar su avance (0.0 a 1.0) y debe devolver los bytes del archivo.
+"""
+
+import os
+import json
+import uuid
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+DIRECTORIO_REPORTES = os.environ.get("REPORTES_DIR", "reportes_generados")
+REPORTES_WORKERS = int(os.environ.get("REPORTES_WORKERS", "2"))
+REPORTES_DIAS_RETENCION = int(os.environ.get("REPORTES_DIAS_RETENCION", "7"))
+
+EN_COLA = "EN COLA"
+GENERANDO = "GENERANDO"
+LISTO = "LISTO"
+ERROR = "ERROR"
+
+_FORMATO_FECHA = "%Y-%m-%d %H:%M:%S"
+
+
+class ColaReportes:
+    """Cola de trabajos de reportes con almacén de archivos en disco."""
+
+    def __init__(self, directorio=DIRECTORIO_REPORTES, workers=REPORTES_WORKERS):
+        self.directorio = directorio
+        os.makedirs(directorio, exist_ok=True)
+        self._indice = os.path.join(directorio, "trabajos.json")
+        self._lock = threading.Lock()
+        self._ejecutor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="reportes")
+        self._trabajos = self._cargar()
+        self.limpiar_antiguos()
+
+    # ─── Persistencia ────────────────────────────────────────────────────────
+
+    def _cargar(self):
+        try:
+            with open(self._indice, "r", encoding="utf-8") as f:
+                trabajos = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+        # Lo que estaba en curso cuando se detuvo la app ya no va a terminar
+        for t in trabajos.values():
+            if t["estado"] in (EN_COLA, GENERANDO):
+                t["estado"] = ERROR
+                t["error"] = "Interrumpido por reinicio del servidor"
+        return trabajos
+
+    def _guardar(self):
+        """Escribe el índice (llamar con el lock tomado)."""
+        tmp = self._indice + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self._trabajos, f, ensure_ascii=False, indent=1)
+        os.replace(tmp, self._indice)
+
+    def _actualizar(self, trabajo_id, persistir=True, **cambios):
+        with self._lock:
+            trabajo = self._trabajos.get(trabajo_id)
+            if trabajo is None:
+                return
+            trabajo.update(cambios)
+            if persistir:
+                self._guardar()
+
+    def _ruta(self, trabajo_id):
+        """Archivo del trabajo; conserva la extensión del nombre de descarga."""
+        with self._lock:
+            trabajo = self._trabajos.get(trabajo_id) or {}
+        extension = os.path.splitext(trabajo.get("nombre_archivo", ""))[1] or ".xlsx"
+        return os.path.join(self.directorio, f"{trabajo_id}{extension}")
+
+    # ─── Trabajos ────────────────────────────────────────────────────────────
+
+    def encolar(self, funcion, args=(), kwargs=None, descripcion="", nombre_archivo="reporte.xlsx",
+                usuario=None, clave=None):
+        """
+        Agrega un reporte a la cola y devuelve su id. Si ya hay un trabajo
+        pendiente con la misma `clave` (mismo reporte y filtros) se devuelve
+        ese en lugar de generar otro igual.
+        """
+        with self._lock:
+            if clave:
+                for t in self._trabajos.values():
+                    if t.get("clave") == clave and t["estado"] in (EN_COLA, GENERANDO):
+                        return t["id"]
+            trabajo_id = uuid.uuid4().hex[:12]
+            self._trabajos[trabajo_id] = {
+                "id": trabajo_id,
+                "clave": clave,
+                "descripcion": descripcion,
+                "nombre_archivo": nombre_archivo,
+                "usuario": usuario,
+                "estado": EN_COLA,
+                "progreso": 0.0,
+                "mensaje": "",
+                "error": None,
+                "tamano": 0,
+                "creado": datetime.now().strftime(_FORMATO_FECHA),
+                "terminado": None,
+            }
+            self._guardar()
+        self._ejecutor.submit(self._ejecutar, trabajo_id, funcion, args, kwargs or {})
+        return trabajo_id
+
+    def _ejecutar(self, trabajo_id, funcion, args, kwargs):
+        self._actualizar(trabajo_id, estado=GENERANDO, mensaje="Iniciando...")
+
+        def progreso(fraccion, mensaje=""):
+            # Sólo en memoria: el panel lo consulta, no hace falta escribir disco
+            self._actualizar(trabajo_id, persistir=False,
+                             progreso=round(min(max(fraccion, 0.0), 1.0), 2), mensaje=mensaje)
+
+        try:
+            datos = funcion(*args, progreso=progreso, **kwargs)
+            ruta = self._ruta(trabajo_id)
+            with open(ruta + ".tmp", "wb") as f:
+                f.write(datos)
+            os.replace(ruta + ".tmp", ruta)
+            self._actualizar(trabajo_id, estado=LISTO, progreso=1.0, mensaje="", tamano=len(datos),
+                             terminado=datetime.now().strftime(_FORMATO_FECHA))
+        except Exception as e:
+            self._actualizar(trabajo_id, estado=ERROR, error=str(e),
+                             terminado=datetime.now().strftime(_FORMATO_FECHA))
+
+    def trabajos(self, usuario=None):
+        """Copia de los trabajos (del usuario dado, o todos), más recientes primero."""
+        with self._lock:
+            lista = [dict(t) for t in self._trabajos.values()
+                     if usuario is None or t.get("usuario") == usuario]
+        return sorted(lista, key=lambda t: t["creado"], reverse=True)
+
+    def pendientes(self, usuario=None):
+        return sum(1 for t in self.trabajos(usuario) if t["estado"] in (EN_COLA, GENERANDO))
+
+    def leer(self, trabajo_id):
+        """Bytes del archivo generado (None si no está listo o ya se borró)."""
+        try:
+            with open(self._ruta(trabajo_id), "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def eliminar(self, trabajo_id):
+        ruta = self._ruta(trabajo_id)
+        with self._lock:
+            trabajo = self._trabajos.get(trabajo_id)
+            if trabajo is None or trabajo["estado"] in (EN_COLA, GENERANDO):
+                return False
+            del self._trabajos[trabajo_id]
+            self._guardar()
+        try:
+            os.remove(ruta)
+        except FileNotFoundError:
+            pass
+        return True
+
+    def limpiar_antiguos(self, dias=REPORTES_DIAS_RETENCION):
+        """Borra los trabajos terminados hace más de `dias` días y sus archivos."""
+        limite = (datetime.now() - timedelta(days=dias)).strftime(_FORMATO_FECHA)
+        with self._lock:
+            viejos = [t["id"] for t in self._trabajos.values()
+                      if t["estado"] in (LISTO, ERROR) and (t["terminado"] or t["creado"]) < limite]
+        for trabajo_id in viejos:
+            self.eliminar(trabajo_id)
+        return len(viejos)
@@ -0,0 +1,67 @@
+"""
+COMPONENTES PDF - Sistema Agencia Riviera Maya
+Botón de descarga del recibo de abono y generadores opcionales de recibos y
+cupones. reportlab se carga sólo cuando una página que imprime PDFs se abre.
+"""
+
+import streamlit as st
+
+from app_nucleo import LOGO_PATH, NINA_PATH, SELLO_PATH
+
+
+# ── Generador de recibos Turismar ─────────────────────────────────────────
+try:
+    from generar_recibo import generar_recibo_pdf
+    RECIBOS_DISPONIBLES = True
+except ImportError:
+    generar_recibo_pdf = None
+    RECIBOS_DISPONIBLES = False
+
+# ── Generador de cupones Turismar ─────────────────────────────────────────
+try:
+    from generar_cupon import generar_cupon_pdf
+    CUPONES_DISPONIBLES = True
+except ImportError:
+    generar_cupon_pdf = None
+    CUPONES_DISPONIBLES = False
+
+
+def boton_recibo(
+    numero, fecha_str, cliente, monto,
+    concepto, forma_pago, agente,
+    key_suffix="",
+    total_viaje=None, pagado_acumulado=None, nuevo_saldo=None,
+):
+    """
+    Muestra el botón de descarga del recibo PDF.
+    Llama a generar_recibo_pdf y crea el download_button de Streamlit.
+    """
+    if not RECIBOS_DISPONIBLES:
+        st.caption("⚠️ generar_recibo.py no encontrado junto a app_streamlit.py")
+        return
+    try:
+        pdf_bytes = generar_recibo_pdf(
+            numero           = numero,
+            fecha            = fecha_str,
+            recibide         = cliente,
+            cantidad         = monto,
+            concepto         = concepto,
+            forma_pago       = forma_pago,
+            agente           = agente,
+            logo_path        = LOGO_PATH,
+            nina_path        = NINA_PATH,
+            sello_path       = SELLO_PATH,
+            total_viaje      = total_viaje,
+            pagado_acumulado = pagado_acumulado,
+            nuevo_saldo      = nuevo_saldo,
+        )
+        st.download_button(
+            label    = f"🧾 Descargar Recibo No. {str(numero).zfill(3)}",
+            data     = pdf_bytes,
+            file_name= f"recibo_{str(numero).zfill(3)}_{cliente[:20].replace(' ','_')}.pdf",
+            mime     = "application/pdf",
+            key      = f"rec_{numero}_{key_suffix}",
+            use_container_width=True,
+        )
+    except Exception as e:
+        st.warning(f"⚠️ No se pudo generar el recibo: {e}")
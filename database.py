@@ -1,10 +1,16 @@
 import sqlite3
+from migracion_fechas_iso import aplicar_migracion_fechas_iso
+from migracion_indices import aplicar_migraciones_indices
+from movimientos_pagos import instalar_movimientos_pagos
+from sqlite_concurrencia import configurar_conexion
 
 DB_NAME = "agencia.db"
 
 def conectar():
-    """Establece conexión con la base de datos"""
-    return sqlite3.connect(DB_NAME)
+    """Establece conexión con la base de datos (modo WAL y busy_timeout de sqlite_concurrencia)"""
+    conexion = sqlite3.connect(DB_NAME)
+    configurar_conexion(conexion)
+    return conexion
 
 
 def crear_tablas():
@@ -333,6 +339,23 @@ def crear_tablas():
     except:
         pass  # La columna ya existe
 
+    # ===== AGREGAR COLUMNA vendedora_id A clientes_internacionales SI NO EXISTE =====
+    # (la app la agrega en sus migraciones; el libro de pagos la lee en sus triggers)
+    try:
+        cursor.execute("ALTER TABLE clientes_internacionales ADD COLUMN vendedora_id INTEGER DEFAULT 0")
+        conexion.commit()
+    except:
+        pass  # La columna ya existe
+
+    # ===== FECHAS ISO (fecha_inicio_iso, fecha_salida_iso, ...) =====
+    aplicar_migracion_fechas_iso(conexion)
+
+    # ===== ÍNDICES SECUNDARIOS (versionados) =====
+    aplicar_migraciones_indices(conexion)
+
+    # ===== LIBRO DE PAGOS (movimientos_pagos, con triggers) =====
+    instalar_movimientos_pagos(conexion)
+
     conexion.commit()
     conexion.close()
     print("✅ Base de datos creada correctamente.")
@@ -0,0 +1,157 @@
+"""
+Motor de reportes Excel en modo streaming (openpyxl write-only).
+
+Las filas se escriben directo al archivo conforme se generan (no se arma la
+hoja completa en memoria) y cada combinación de formato es un NamedStyle que
+se crea una sola vez por libro, en lugar de instanciar Font/PatternFill/
+Border/Alignment para cada celda.
+
+Uso:
+    libro = LibroExcel()
+    h = libro.hoja("Clientes", anchos=[6, 18, 22])
+    r = h.titulo("TURISMAR — Clientes", "Generado: ...")
+    h.encabezado(["ID", "Cliente", "Total"], bg="E91E8C")
+    for fila in cursor:
+        h.fila(fila, bg=h.bg_alterno("FFF0F7"), moneda=[3])
+    xls = libro.a_bytes()
+
+En modo write-only los anchos de columna y la altura de filas se fijan antes
+de escribir, y las hojas pueden llenarse en cualquier orden (cada una tiene su
+propio archivo temporal), así que una hoja de resumen se puede crear primero
+y llenar al final, cuando ya se recorrieron los datos.
+"""
+
+import io
+
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import NamedStyle, Font, PatternFill, Alignment, Border, Side
+from openpyxl.utils import get_column_letter
+
+FMT_MONEDA = "$#,##0.00"
+FMT_PCT = "0.0%"
+
+_LADO = Side(style="thin")
+_BORDE = Border(left=_LADO, right=_LADO, top=_LADO, bottom=_LADO)
+
+
+class LibroExcel:
+    """Libro write-only con cache de NamedStyles."""
+
+    def __init__(self):
+        self.wb = Workbook(write_only=True)
+        self._estilos = {}
+        self._plantillas = {}       # nombre de estilo -> StyleArray ya resuelto
+
+    def estilo(self, tipo, bg=None, fg="FFFFFF", bold=False, formato=None):
+        """
+        Nombre del NamedStyle para la combinación pedida (se registra la
+        primera vez). tipo: 'encabezado', 'fila', 'titulo', 'subtitulo'.
+        """
+        clave = (tipo, bg, fg if tipo == "encabezado" else None, bold, formato)
+        nombre = self._estilos.get(clave)
+        if nombre is not None:
+            return nombre
+
+        nombre = "_".join(str(p) for p in clave if p not in (None, False))
+        ns = NamedStyle(name=nombre)
+        if tipo == "encabezado":
+            ns.font = Font(bold=True, color=fg, size=11, name="Arial")
+            ns.alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
+            ns.border = _BORDE
+        elif tipo == "titulo":
+            ns.font = Font(bold=True, size=14, color="FFFFFF", name="Arial")
+            ns.alignment = Alignment(horizontal="center", vertical="center")
+        elif tipo == "subtitulo":
+            ns.font = Font(italic=True, size=10, color="333333", name="Arial")
+            ns.alignment = Alignment(horizontal="center")
+        else:
+            ns.font = Font(bold=bold, name="Arial", size=10)
+            ns.alignment = Alignment(vertical="center", wrap_text=True)
+            ns.border = _BORDE
+        if bg:
+            ns.fill = PatternFill("solid", fgColor=bg)
+        if formato:
+            ns.number_format = formato
+        self.wb.add_named_style(ns)
+        self._estilos[clave] = nombre
+        return nombre
+
+    def hoja(self, titulo, anchos=()):
+        return HojaExcel(self, titulo, anchos)
+
+    def a_bytes(self):
+        buf = io.BytesIO()
+        self.wb.save(buf)
+        return buf.getvalue()
+
+
+class HojaExcel:
+    """Hoja write-only: se escribe fila por fila llevando el número de fila."""
+
+    def __init__(self, libro, titulo, anchos=()):
+        self.libro = libro
+        self.ws = libro.wb.create_sheet(titulo)
+        self.siguiente = 1          # número de la próxima fila a escribir
+        for c, w in enumerate(anchos, 1):
+            self.ws.column_dimensions[get_column_letter(c)].width = w
+
+    def _celda(self, valor, estilo):
+        cell = WriteOnlyCell(self.ws, value=valor)
+        # Asignar el nombre del estilo busca el NamedStyle en el libro cada vez;
+        # se resuelve una sola vez y las demás celdas reusan el mismo StyleArray
+        plantilla = self.libro._plantillas.get(estilo)
+        if plantilla is None:
+            cell.style = estilo
+            self.libro._plantillas[estilo] = cell._style
+        else:
+            cell._style = plantilla
+        return cell
+
+    def _agregar(self, celdas):
+        self.ws.append(celdas)
+        self.siguiente += 1
+
+    def titulo(self, titulo, subtitulo=""):
+        """Título combinado A1:N1 (y subtítulo en A2:N2). Devuelve la próxima fila."""
+        self.ws.merged_cells.add(f"A{self.siguiente}:N{self.siguiente}")
+        self.ws.row_dimensions[self.siguiente].height = 28
+        self._agregar([self._celda(titulo, self.libro.estilo("titulo", bg="E91E8C"))])
+        if subtitulo:
+            self.ws.merged_cells.add(f"A{self.siguiente}:N{self.siguiente}")
+            self.ws.row_dimensions[self.siguiente].height = 18
+            self._agregar([self._celda(subtitulo, self.libro.estilo("subtitulo"))])
+        return self.siguiente
+
+    def encabezado(self, columnas, bg="1F4E79", fg="FFFFFF"):
+        estilo = self.libro.estilo("encabezado", bg=bg, fg=fg)
+        self._agregar([self._celda(h, estilo) for h in columnas])
+
+    def fila(self, valores, bg=None, bold=False, moneda=(), pct=()):
+        """Fila con borde; `moneda` y `pct` son columnas (base 1) con formato."""
+        base = self.libro.estilo("fila", bg=bg, bold=bold)
+        est_moneda = self.libro.estilo("fila", bg=bg, bold=bold, formato=FMT_MONEDA) if moneda else base
+        est_pct = self.libro.estilo("fila", bg=bg, bold=bold, formato=FMT_PCT) if pct else base
+        celdas = []
+        for c, valor in enumerate(valores, 1):
+            if c in moneda:
+                estilo = est_moneda
+            elif c in pct:
+                estilo = est_pct
+            else:
+                estilo = base
+            celdas.append(self._celda(valor, estilo))
+        self._agregar(celdas)
+
+    def texto(self, valor):
+        """Celda suelta sin formato (p. ej. 'Sin abonos registrados')."""
+        self._agregar([valor])
+
+    def bg_alterno(self, color, color_non="FFFFFF"):
+        """Color de fondo alternado según el número de la próxima fila."""
+        return color if self.siguiente % 2 == 0 else color_non
+
+    def suma(self, columna, desde, hasta):
+        """Fórmula =SUM para la columna (base 1) entre las filas dadas."""
+        col = get_column_letter(columna)
+        return f"=SUM({col}{desde}:{col}{hasta})"
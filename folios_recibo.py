@@ -0,0 +1,96 @@
+"""
+FOLIOS DE RECIBO - Sistema Agencia Riviera Maya
+Numeración correlativa de los recibos de abono sobre la base configurada
+(PostgreSQL si hay DATABASE_URL, SQLite si no).
+
+Cada número se entrega de forma atómica, así dos vendedoras que imprimen al
+mismo tiempo nunca reciben el mismo folio:
+    PostgreSQL  secuencia num_recibo_seq (nextval no bloquea ni se repite)
+    SQLite      UPDATE config_recibos ... RETURNING en una sola sentencia
+
+reservar(n) entrega n folios en un solo viaje a la base, para los lotes de
+recibos. En PostgreSQL pueden no ser consecutivos si otra sesión pide folios
+al mismo tiempo; en SQLite siempre lo son.
+
+config_recibos.valor guarda el siguiente folio. En PostgreSQL la secuencia
+arranca desde ese valor (y se adelanta si la tabla trae uno mayor, p. ej.
+tras volver a migrar desde SQLite).
+"""
+
+import sqlite3
+
+SECUENCIA = "num_recibo_seq"
+_CLAVE = "num_recibo"
+
+# UPDATE ... RETURNING existe desde SQLite 3.35
+_SQLITE_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+
+class FoliosRecibo:
+    """
+    Contador de folios de recibo. `conectar` es la función que abre la
+    conexión (conectar_db de la app).
+    """
+
+    def __init__(self, conectar, es_postgres=False):
+        self._conectar = conectar
+        self._es_postgres = es_postgres
+        self._preparar()
+
+    def _preparar(self):
+        conn = self._conectar()
+        try:
+            cursor = conn.cursor()
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS config_recibos (
+                    clave TEXT PRIMARY KEY,
+                    valor INTEGER DEFAULT 1
+                )
+            """)
+            cursor.execute("""
+                INSERT INTO config_recibos (clave, valor) VALUES (?, 1)
+                ON CONFLICT (clave) DO NOTHING
+            """, (_CLAVE,))
+            if self._es_postgres:
+                cursor.execute("SELECT valor FROM config_recibos WHERE clave = ?", (_CLAVE,))
+                valor = int(cursor.fetchone()[0] or 1)
+                cursor.execute(f"CREATE SEQUENCE IF NOT EXISTS {SECUENCIA} START WITH {valor}")
+                cursor.execute(f"SELECT last_value, is_called FROM {SECUENCIA}")
+                ultimo, usado = cursor.fetchone()
+                if valor > ultimo + (1 if usado else 0):
+                    cursor.execute(f"SELECT setval('{SECUENCIA}', ?, false)", (valor,))
+            conn.commit()
+        finally:
+            conn.close()
+
+    def siguiente(self):
+        """Siguiente folio."""
+        return self.reservar(1)[0]
+
+    def reservar(self, cantidad):
+        """Lista de `cantidad` folios nuevos, en un solo viaje a la base."""
+        if cantidad < 1:
+            return []
+        conn = self._conectar()
+        try:
+            cursor = conn.cursor()
+            if self._es_postgres:
+                cursor.execute(f"SELECT nextval('{SECUENCIA}') FROM generate_series(1, ?)", (cantidad,))
+                folios = [int(r[0]) for r in cursor.fetchall()]
+            else:
+                if _SQLITE_RETURNING:
+                    cursor.execute("""
+                        UPDATE config_recibos SET valor = valor + ? WHERE clave = ?
+                        RETURNING valor
+                    """, (cantidad, _CLAVE))
+                else:
+                    # Misma transacción: el UPDATE ya tomó el candado de escritura
+                    cursor.execute("UPDATE config_recibos SET valor = valor + ? WHERE clave = ?",
+                                   (cantidad, _CLAVE))
+                    cursor.execute("SELECT valor FROM config_recibos WHERE clave = ?", (_CLAVE,))
+                nuevo = int(cursor.fetchone()[0])
+                folios = list(range(nuevo - cantidad, nuevo))
+            conn.commit()
+        finally:
+            conn.close()
+        return folios
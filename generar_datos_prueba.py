@@ -0,0 +1,932 @@
+"""
+GENERADOR DE DATOS DE PRUEBA - Sistema Agencia Riviera Maya
+Llena una base nueva con datos sintéticos para medir la app con volúmenes
+reales: de 1k a 1M ventas de Riviera Maya, y el resto de las tablas en
+proporción (nacionales, internacionales, pasaportes, visas, vuelos,
+transferencias, gastos y comisiones).
+
+Los datos son coherentes entre sí:
+    - cada abono apunta a una venta/cliente existente y la suma de abonos
+      es lo que marca pagado/total_abonado;
+    - las ventas de bloqueo y de grupo descuentan habitaciones del inventario
+      (nunca se venden más de las que hay) y usan sus fechas y hotel;
+    - los viajes nacionales/internacionales no venden más cupos de los que
+      tienen;
+    - los ids crecen con la fecha de registro, como en la base real.
+
+Formatos de fecha iguales a los de la app: fechas de viaje en 'dd-mm-yyyy'
+(más sus columnas *_iso), registros y abonos en 'YYYY-MM-DD HH:MM:SS', y
+fechas de pasaportes, visas, vuelos, transferencias y gastos en 'YYYY-MM-DD'.
+
+El esquema sale de la base plantilla (agencia.db), de la que también se
+copian los catálogos (hoteles, operadores, categorías de gastos, comisiones,
+folios). Al terminar se aplican las mismas migraciones que la app corre al
+arrancar (fechas ISO, índices, resumen de ventas, libro de pagos, índice de
+búsqueda), así que la base queda lista para abrirse con la app.
+
+Uso:
+    python generar_datos_prueba.py --ventas 10k
+    python generar_datos_prueba.py --ventas 1m --destino prueba_1m.db
+    python generar_datos_prueba.py --ventas 100k --postgres postgresql://localhost/agencia_prueba
+
+Nunca escribe en agencia.db (la de junto a este archivo o la de --plantilla)
+ni en DATABASE_URL: el destino se indica siempre a mano, y si ya tiene datos
+hay que pedir --reemplazar. La plantilla se lee antes de tocar el destino, y
+si la generación falla el archivo SQLite a medias se borra.
+"""
+
+import argparse
+import bisect
+import csv
+import io
+import math
+import os
+import random
+import sqlite3
+import time
+from datetime import datetime, timedelta
+
+from migracion_fechas_iso import COLUMNAS_FECHA, aplicar_migracion_fechas_iso
+from busqueda_clientes import instalar_busqueda_clientes
+from migracion_indices import aplicar_migraciones_indices
+from movimientos_pagos import instalar_movimientos_pagos
+from resumen_ventas import instalar_resumen_ventas
+from sqlite_concurrencia import configurar_conexion
+
+PLANTILLA = os.path.join(os.path.dirname(os.path.abspath(__file__)), "agencia.db")
+LOTE = 10000          # filas por INSERT/COPY
+
+# Registros por cada venta de Riviera Maya
+PROPORCIONES = {
+    "clientes_nacionales": 0.40,
+    "clientes_internacionales": 0.10,
+    "pasaportes": 0.10,
+    "visas": 0.05,
+    "vuelos": 0.15,
+    "transferencias": 0.30,
+}
+PCT_BLOQUEO = 0.12    # ventas que toman habitación de un bloqueo
+PCT_GRUPO = 0.08      # ventas que toman habitación de un grupo
+
+# Catálogos que se copian tal cual de la plantilla
+CATALOGOS = ("usuarios", "operadores", "hoteles", "categorias_gastos",
+             "config_comisiones", "config_recibos")
+
+# Tablas que crean las migraciones de la app (no se copian de la plantilla)
+_DERIVADAS = {"resumen_ventas", "movimientos_pagos", "migraciones_indices", "busqueda_clientes",
+              "sqlite_sequence"}
+
+COLUMNAS = {
+    "vendedoras": ("id", "nombre", "activa", "fecha_registro"),
+    "bloqueos": ("id", "hotel", "fecha_inicio", "fecha_fin", "noches", "habitaciones_totales",
+                 "habitaciones_vendidas", "habitaciones_disponibles", "precio_noche_doble",
+                 "precio_noche_triple", "precio_noche_cuadruple", "precio_menor_doble",
+                 "precio_menor_triple", "precio_menor_cuadruple", "costo_real", "estado",
+                 "fecha_registro", "operador", "celular_responsable"),
+    "grupos": ("id", "nombre_grupo", "operador", "hotel", "fecha_inicio", "fecha_fin", "noches",
+               "habitaciones_totales", "habitaciones_vendidas", "habitaciones_disponibles",
+               "precio_noche_doble", "precio_noche_triple", "precio_noche_cuadruple",
+               "precio_menor_doble", "precio_menor_triple", "precio_menor_cuadruple", "costo_real",
+               "responsable", "celular_responsable", "estado", "fecha_registro"),
+    "ventas": ("id", "cliente", "tipo_venta", "destino", "fecha_inicio", "fecha_fin", "noches",
+               "adultos", "menores", "tipo_habitacion", "precio_adulto", "precio_menor",
+               "precio_total", "porcentaje_ganancia", "ganancia", "costo_mayorista", "pagado",
+               "saldo", "comision_vendedora", "comision_pagada", "estado", "vendedora_id",
+               "usuario_id", "es_bloqueo", "bloqueo_id", "fecha_registro", "fecha_pago_comision",
+               "operador", "celular_responsable", "es_grupo", "grupo_id", "no_localizador",
+               "clave_confirmacion", "plan_alimento", "requerimientos_especiales",
+               "edades_menores", "reserva_confirmada", "reserva_confirmada_por",
+               "reserva_confirmada_fecha", "fecha_inicio_iso", "fecha_fin_iso"),
+    "pasajeros": ("id", "venta_id", "nombre", "tipo"),
+    "abonos": ("id", "venta_id", "fecha", "monto", "metodo_pago"),
+    "historial_comisiones": ("id", "vendedora", "fecha", "tipo", "referencia_id", "monto",
+                             "metodo_pago", "nota", "vendedora_id"),
+    "cotizaciones_nacionales": ("id", "nombre_viaje", "destino", "fecha_salida", "fecha_regreso",
+                                "dias", "noches", "personas_proyectadas", "costo_vuelo_real",
+                                "precio_vuelo_venta", "costo_traslados_total",
+                                "precio_traslados_persona", "costo_entradas_real",
+                                "precio_entradas_venta", "precio_persona_doble",
+                                "precio_persona_triple", "inversion_total", "ganancia_proyectada",
+                                "estado", "fecha_registro"),
+    "hoteles_cotizacion": ("id", "cotizacion_id", "nombre_hotel", "noches", "costo_doble_real",
+                           "precio_doble_venta", "costo_triple_real", "precio_triple_venta"),
+    "viajes_nacionales": ("id", "cotizacion_id", "nombre_viaje", "destino", "fecha_salida",
+                          "fecha_regreso", "dias", "noches", "cupos_totales", "cupos_vendidos",
+                          "cupos_disponibles", "precio_persona_doble", "precio_persona_triple",
+                          "estado", "fecha_registro", "operador", "fecha_salida_iso",
+                          "fecha_regreso_iso"),
+    "clientes_nacionales": ("id", "viaje_id", "vendedora_id", "nombre_cliente", "adultos", "menores",
+                            "habitaciones_doble", "habitaciones_triple", "total_pagar",
+                            "total_abonado", "saldo", "estado", "fecha_registro",
+                            "celular_responsable", "ganancia"),
+    "pasajeros_nacionales": ("id", "cliente_id", "nombre_completo", "tipo", "habitacion_asignada"),
+    "abonos_nacionales": ("id", "cliente_id", "monto", "fecha", "vendedora_id", "metodo_pago"),
+    "viajes_internacionales": ("id", "destino", "fecha_salida", "fecha_regreso", "dias", "noches",
+                               "cupos_totales", "cupos_vendidos", "cupos_disponibles",
+                               "precio_adulto_doble_usd", "precio_adulto_triple_usd",
+                               "precio_menor_doble_usd", "precio_menor_triple_usd",
+                               "porcentaje_ganancia", "estado", "fecha_registro", "operador",
+                               "fecha_salida_iso", "fecha_regreso_iso"),
+    "clientes_internacionales": ("id", "viaje_id", "nombre_cliente", "adultos", "menores",
+                                 "habitaciones_doble", "habitaciones_triple", "total_usd",
+                                 "abonado_usd", "saldo_usd", "ganancia_usd", "estado",
+                                 "fecha_registro", "celular_responsable", "vendedora_id"),
+    "pasajeros_internacionales": ("id", "cliente_id", "nombre_completo", "tipo",
+                                  "habitacion_asignada"),
+    "abonos_internacionales": ("id", "cliente_id", "fecha", "moneda", "monto_original",
+                               "tipo_cambio", "monto_usd", "metodo_pago"),
+    "pasaportes": ("id", "vendedora_id", "cliente", "celular", "tipo", "fecha_cita",
+                   "fecha_entrega_est", "costo_oficial", "cargo_servicio", "total", "pagado",
+                   "saldo", "estado", "notas", "fecha_registro"),
+    "visas": ("id", "vendedora_id", "cliente", "celular", "pais_destino", "tipo_visa",
+              "es_familiar", "num_integrantes", "fecha_cita", "fecha_entrega_est", "costo_oficial",
+              "cargo_servicio", "total", "pagado", "saldo", "estado", "notas", "fecha_registro"),
+    "vuelos": ("id", "vendedora_id", "pasajero", "celular", "tipo", "aerolinea", "origen",
+               "destino", "fecha_vuelo", "hora_vuelo", "num_pasajeros", "costo_compra",
+               "cargo_servicio", "total", "pagado", "saldo", "estado", "notas", "fecha_registro"),
+    "abonos_pasaportes": ("id", "pasaporte_id", "monto", "fecha", "metodo_pago"),
+    "abonos_visas": ("id", "visa_id", "monto", "fecha", "metodo_pago"),
+    "abonos_vuelos": ("id", "vuelo_id", "monto", "fecha", "metodo_pago"),
+    "transferencias": ("id", "fecha", "nombre_envia", "cantidad", "estado", "aplicado_en",
+                       "fecha_aplicacion", "observaciones", "id_vendedora", "created_at",
+                       "empresa_mayorista"),
+    "gastos_operativos": ("id", "categoria", "subcategoria", "descripcion", "monto", "moneda",
+                          "fecha_gasto", "mes", "anio", "frecuencia", "recurrente", "comprobante",
+                          "metodo_pago", "proveedor", "notas", "fecha_registro",
+                          "usuario_registro"),
+    "sueldos_vendedoras": ("id", "vendedora_id", "mes", "anio", "sueldo_base", "comisiones",
+                           "bonos", "deducciones", "total_pagar", "fecha_pago", "estado", "notas",
+                           "fecha_registro"),
+}
+
+# ─── CATÁLOGOS DE NOMBRES ────────────────────────────────────────────────────
+
+NOMBRES = ["Juan", "María", "José", "Guadalupe", "Luis", "Ana", "Carlos", "Rocío", "Miguel",
+           "Valeria", "Jorge", "Fernanda", "Ricardo", "Daniela", "Alejandro", "Gabriela",
+           "Fernando", "Sofía", "Roberto", "Natalia", "Eduardo", "Mariana", "Arturo", "Paola",
+           "Héctor", "Alejandra", "Raúl", "Patricia", "Sergio", "Verónica", "Manuel", "Claudia",
+           "Francisco", "Adriana", "Javier", "Lucía", "Rolando", "Margely", "Ariel", "Zajhia",
+           "Nayeli", "Diego", "Ximena", "Andrés", "Regina", "Emilio", "Camila", "Óscar", "Itzel",
+           "Rubén"]
+APELLIDOS = ["García", "Hernández", "Martínez", "López", "González", "Pérez", "Rodríguez",
+             "Sánchez", "Ramírez", "Cruz", "Flores", "Gómez", "Morales", "Vázquez", "Reyes",
+             "Jiménez", "Torres", "Díaz", "Gutiérrez", "Ruiz", "Mendoza", "Aguilar", "Ortiz",
+             "Moreno", "Castillo", "Romero", "Álvarez", "Méndez", "Chávez", "Rivera", "Juárez",
+             "Ramos", "Domínguez", "Herrera", "Medina", "Castro", "Vargas", "Guzmán", "Velázquez",
+             "Muñoz", "Rojas", "Sosa", "Burgos", "Carrillo", "Vela", "Murillo", "Canul", "Pech",
+             "Chan", "May"]
+VIAJES_NACIONALES = [("Puebla mágica", "Puebla, Puebla"), ("Chiapas Inolvidable", "Chiapas, México"),
+                     ("Veracruz Inolvidable", "Veracruz, México"), ("Oaxaca de Colores", "Oaxaca, Oaxaca"),
+                     ("Barrancas del Cobre", "Chihuahua, México"), ("CDMX Cultural", "Ciudad de México"),
+                     ("Guanajuato Colonial", "Guanajuato, México"), ("Huasteca Potosina", "San Luis Potosí"),
+                     ("Los Cabos Express", "Baja California Sur"), ("Mazatlán Playero", "Sinaloa, México"),
+                     ("Pueblos Mágicos de Jalisco", "Jalisco, México"), ("Zacatecas Minero", "Zacatecas, México")]
+HOTELES_NACIONALES = ["Hotel Palenque", "Hotel Misión", "City Express", "Fiesta Inn", "Hotel Colonial",
+                      "One Hotels", "Holiday Inn", "Best Western"]
+VIAJES_INTERNACIONALES = ["Europa", "Perú Mágico", "Japón", "Tierra Santa", "Colombia", "Argentina y Chile",
+                          "Nueva York", "Canadá", "Turquía", "Egipto", "Cuba", "Italia Clásica"]
+PAISES_VISA = ["Estados Unidos", "Canadá", "Reino Unido", "Japón", "China", "India", "Australia"]
+TIPOS_VISA = ["Turista", "Turista", "Turista", "Negocios", "Estudiante", "Trabajo", "Tránsito"]
+AEROLINEAS = ["Volaris", "Aeroméxico", "Viva Aerobus", "American Airlines", "United", "Delta", "Copa Airlines"]
+CIUDADES = ["Cancún", "Mérida", "Ciudad de México", "Guadalajara", "Monterrey", "Tijuana", "Oaxaca",
+            "Puerto Vallarta", "Los Ángeles", "Houston", "Madrid", "Bogotá", "Lima", "Miami"]
+PLANES = ["Todo incluido"] * 8 + ["Solo desayuno", "Media pensión", "Solo alojamiento"]
+METODOS = ["Efectivo", "Efectivo", "Transferencia", "Transferencia", "Tarjeta"]
+EDADES = ["3 años", "5 años", "7 años", "9 años", "11 años", "4 y 8 años", "6 y 10 años"]
+TIPO_HABITACION = {2: "DOBLE", 3: "TRIPLE", 4: "CUÁDRUPLE"}
+GASTOS_FIJOS = [("Renta", "Renta del local", 9000), ("Servicios Públicos", "Luz, agua e internet", 1800),
+                ("Tecnología", "Sistema y telefonía", 650), ("Gastos Bancarios", "Comisiones bancarias", 350)]
+GASTOS_VARIABLES = [("Marketing", "Publicidad en redes", 500, 4000), ("Papelería y Oficina", "Papelería", 150, 900),
+                    ("Mantenimiento", "Mantenimiento del local", 300, 3000), ("Viáticos", "Viáticos de promoción", 400, 2500),
+                    ("Honorarios Profesionales", "Contador", 1500, 3500), ("Impuestos", "Pago provisional", 2000, 12000),
+                    ("Otros Gastos", "Varios", 100, 1500)]
+
+
+# ─── DESTINOS ────────────────────────────────────────────────────────────────
+
+def _tablas_plantilla(plantilla):
+    """{tabla: (sql CREATE de SQLite, [(columna, tipo, notnull, default, pk)])} de la plantilla."""
+    conn = sqlite3.connect(f"file:{plantilla}?mode=ro", uri=True)
+    try:
+        tablas = {}
+        for nombre, sql in conn.execute("SELECT name, sql FROM sqlite_master WHERE type = 'table' ORDER BY name"):
+            if nombre in _DERIVADAS or nombre.startswith("busqueda_clientes_fts"):
+                continue
+            columnas = [(c[1], c[2], c[3], c[4], c[5]) for c in conn.execute(f"PRAGMA table_info({nombre})")]
+            tablas[nombre] = (sql, columnas)
+        catalogos = {}
+        for tabla in CATALOGOS:
+            if tabla in tablas:
+                cur = conn.execute(f"SELECT * FROM {tabla}")
+                catalogos[tabla] = ([d[0] for d in cur.description], cur.fetchall())
+        return tablas, catalogos
+    finally:
+        conn.close()
+
+
+class DestinoSQLite:
+    """Base SQLite nueva; la carga va sin journal y se deja en WAL al final."""
+    es_postgres = False
+
+    def __init__(self, ruta, reemplazar, plantilla=PLANTILLA):
+        # El archivo no se toca hasta crear_esquema(), ya leída la plantilla
+        if os.path.exists(ruta):
+            for protegida in (plantilla, PLANTILLA):
+                if os.path.exists(protegida) and os.path.samefile(ruta, protegida):
+                    raise SystemExit(f"❌ El destino no puede ser {protegida}")
+            if not reemplazar:
+                raise SystemExit(f"❌ {ruta} ya existe; usa --reemplazar para sobrescribirla")
+        self.nombre = ruta
+        self.conn = None
+
+    def _borrar(self):
+        for sufijo in ("", "-wal", "-shm", "-journal"):
+            if os.path.exists(self.nombre + sufijo):
+                os.remove(self.nombre + sufijo)
+
+    def crear_esquema(self, tablas):
+        self._borrar()
+        self.conn = sqlite3.connect(self.nombre)
+        self.conn.execute("PRAGMA journal_mode = OFF")
+        self.conn.execute("PRAGMA synchronous = OFF")
+        for sql, _ in tablas.values():
+            self.conn.execute(sql)
+        self.conn.commit()
+
+    def insertar(self, tabla, columnas, filas):
+        marcas = ", ".join("?" * len(columnas))
+        self.conn.executemany(f"INSERT INTO {tabla} ({', '.join(columnas)}) VALUES ({marcas})", filas)
+
+    def confirmar(self):
+        self.conn.commit()
+
+    def terminar(self):
+        self.conn.commit()
+        configurar_conexion(self.conn)
+        self.conn.execute("ANALYZE")
+        self.conn.commit()
+        self.conn.close()
+
+    def descartar(self):
+        """Generación fallida: no deja un archivo a medias que pida --reemplazar."""
+        if self.conn is not None:
+            self.conn.close()
+            self._borrar()
+
+
+class DestinoPostgres:
+    """Base PostgreSQL (local, de pruebas); la carga va con COPY."""
+    es_postgres = True
+
+    def __init__(self, url, reemplazar):
+        import psycopg2
+        if url == os.environ.get("DATABASE_URL"):
+            raise SystemExit("❌ El destino no puede ser DATABASE_URL (la base de la app)")
+        self.nombre = url.rsplit("@", 1)[-1]
+        self.conn = psycopg2.connect(url)
+        self.conn.autocommit = True
+        self.reemplazar = reemplazar
+
+    @staticmethod
+    def _tipo(tipo_sqlite):
+        # Misma correspondencia que migrar_a_neon.py
+        t = (tipo_sqlite or "TEXT").upper()
+        if "INT" in t:
+            return "INTEGER"
+        if any(x in t for x in ("REAL", "FLOAT", "DOUBLE", "NUMERIC")):
+            return "REAL"
+        if "BLOB" in t:
+            return "BYTEA"
+        return "TEXT"
+
+    def crear_esquema(self, tablas):
+        cur = self.conn.cursor()
+        cur.execute("SELECT table_name FROM information_schema.tables WHERE table_schema = current_schema()")
+        existentes = {r[0] for r in cur.fetchall()} & (set(tablas) | _DERIVADAS)
+        if existentes and not self.reemplazar:
+            raise SystemExit(f"❌ La base ya tiene tablas ({', '.join(sorted(existentes))}); usa --reemplazar")
+        for tabla in existentes:
+            cur.execute(f"DROP TABLE IF EXISTS {tabla} CASCADE")
+        for tabla, (_, columnas) in tablas.items():
+            iso = {c for _, c in COLUMNAS_FECHA.get(tabla, [])}  # las crea la migración, como DATE
+            definiciones = []
+            for nombre, tipo, notnull, default, pk in columnas:
+                if nombre in iso:
+                    continue
+                tipo_pg = self._tipo(tipo)
+                if pk and tipo_pg == "INTEGER":
+                    definiciones.append(f"{nombre} SERIAL PRIMARY KEY")
+                    continue
+                d = f"{nombre} {tipo_pg}"
+                if pk:
+                    d += " PRIMARY KEY"
+                if notnull:
+                    d += " NOT NULL"
+                if default is not None:
+                    d += f" DEFAULT {default}"
+                definiciones.append(d)
+            cur.execute(f"CREATE TABLE {tabla} ({', '.join(definiciones)})")
+
+    def insertar(self, tabla, columnas, filas):
+        buf = io.StringIO()
+        csv.writer(buf).writerows(filas)
+        buf.seek(0)
+        self.conn.cursor().copy_expert(
+            f"COPY {tabla} ({', '.join(columnas)}) FROM STDIN WITH (FORMAT csv)", buf)
+
+    def confirmar(self):
+        pass
+
+    def terminar(self):
+        cur = self.conn.cursor()
+        # Los ids se cargaron explícitos: las secuencias siguen desde el máximo
+        cur.execute("""
+            SELECT table_name FROM information_schema.columns
+            WHERE table_schema = current_schema() AND column_name = 'id'
+              AND column_default LIKE 'nextval%%'
+        """)
+        for (tabla,) in cur.fetchall():
+            cur.execute(f"SELECT setval(pg_get_serial_sequence('{tabla}', 'id'), "
+                        f"COALESCE((SELECT MAX(id) FROM {tabla}), 0) + 1, false)")
+        cur.execute("ANALYZE")
+        self.conn.close()
+
+    def descartar(self):
+        self.conn.close()
+
+
+# ─── CARGA ───────────────────────────────────────────────────────────────────
+
+class Cargador:
+    """Junta filas por tabla y las manda al destino en lotes de LOTE."""
+
+    def __init__(self, destino):
+        self.destino = destino
+        self._pendientes = {}
+        self.totales = {}
+
+    def agregar(self, tabla, fila):
+        pendientes = self._pendientes.setdefault(tabla, [])
+        pendientes.append(fila)
+        if len(pendientes) >= LOTE:
+            self._vaciar(tabla)
+
+    def _vaciar(self, tabla):
+        filas = self._pendientes.get(tabla)
+        if filas:
+            self.destino.insertar(tabla, COLUMNAS[tabla], filas)
+            self.totales[tabla] = self.totales.get(tabla, 0) + len(filas)
+            self._pendientes[tabla] = []
+
+    def terminar(self):
+        for tabla in list(self._pendientes):
+            self._vaciar(tabla)
+        self.destino.confirmar()
+
+
+# ─── GENERACIÓN ──────────────────────────────────────────────────────────────
+
+class Generador:
+    """Genera todas las tablas para `n_ventas` ventas entre `desde` y `hasta`."""
+
+    def __init__(self, carga, catalogos, n_ventas, hasta, anios, semilla):
+        self.carga = carga
+        self.rnd = random.Random(semilla)
+        self.n_ventas = n_ventas
+        self.hasta = hasta
+        self.desde = hasta - timedelta(days=int(365 * anios))
+        self.hoteles = [f[1] for f in catalogos.get("hoteles", ([], []))[1]] or ["Hotel Xcaret Arte"]
+        self.operadores = [f[1] for f in catalogos.get("operadores", ([], []))[1] if f[1] != "Otro"] or [None]
+        self.vendedoras = []
+        self._ids = {}
+
+    # ── utilidades ──────────────────────────────────────────
+    def _id(self, tabla):
+        self._ids[tabla] = self._ids.get(tabla, 0) + 1
+        return self._ids[tabla]
+
+    def _nombre(self):
+        r = self.rnd
+        return f"{r.choice(NOMBRES)} {r.choice(APELLIDOS)} {r.choice(APELLIDOS)}"
+
+    def _celular(self):
+        return f"99{self.rnd.randint(10000000, 99999999)}"
+
+    def _momento(self, inicio, fin):
+        """datetime al azar entre inicio y fin (fin >= inicio)."""
+        segundos = max(0, int((fin - inicio).total_seconds()))
+        return inicio + timedelta(seconds=self.rnd.randint(0, segundos))
+
+    @staticmethod
+    def _ts(momento):
+        return momento.strftime("%Y-%m-%d %H:%M:%S")
+
+    def _pagos(self, total, desde, hasta, max_pagos=4, pagado=None):
+        """Abonos [(datetime, monto)] que suman `pagado` (o el total), entre desde y hasta."""
+        if pagado is None:
+            pagado = total
+        if pagado <= 0:
+            return []
+        n = self.rnd.randint(1, max_pagos)
+        # Cortes redondeados sobre lo acumulado: los abonos suman exacto `pagado`
+        cortes = sorted(min(pagado, round(pagado * self.rnd.random(), -1)) for _ in range(n - 1))
+        acumulado = [0.0] + cortes + [pagado]
+        partes = [round(b - a, 2) for a, b in zip(acumulado, acumulado[1:])]
+        fechas = sorted(self._momento(desde, max(desde, hasta)) for _ in partes)
+        return [(f, m) for f, m in zip(fechas, partes) if m > 0]
+
+    # ── vendedoras ──────────────────────────────────────────
+    def vendedoras_(self, plantilla):
+        """Las de la plantilla (coinciden con usuarios.json) y más según la escala."""
+        n = max(len(plantilla), min(50, 3 + self.n_ventas // 25000))
+        for fila in plantilla:
+            self.vendedoras.append((fila[0], fila[1]))
+            self.carga.agregar("vendedoras", fila)
+        while len(self.vendedoras) < n:
+            vid = len(self.vendedoras) + 1
+            nombre = f"{self.rnd.choice(NOMBRES)} {self.rnd.choice(APELLIDOS)}"
+            self.vendedoras.append((vid, nombre))
+            self.carga.agregar("vendedoras", (vid, nombre, 1, self._ts(self.desde)))
+        self._ids["vendedoras"] = len(self.vendedoras)
+
+    # ── Riviera Maya ────────────────────────────────────────
+    def _inventario(self, tabla, n):
+        """Bloqueos o grupos: habitaciones en un hotel y fechas fijas."""
+        r = self.rnd
+        inventario = []
+        for _ in range(n):
+            inicio = self.desde + timedelta(days=r.randint(14, (self.hasta - self.desde).days + 240))
+            noches = r.randint(2, 5)
+            doble = r.randint(14, 40) * 100
+            inventario.append({
+                "id": self._id(tabla), "hotel": r.choice(self.hoteles), "inicio": inicio, "noches": noches,
+                "totales": r.randint(10, 40), "vendidas": 0, "operador": r.choice(self.operadores),
+                "doble": doble, "triple": round(doble * 0.9), "cuadruple": round(doble * 0.85),
+                "menor": round(doble * 0.5),
+                "registro": min(datetime.combine(inicio, datetime.min.time()) - timedelta(days=r.randint(120, 240)),
+                                datetime.combine(self.hasta, datetime.min.time()) - timedelta(days=1)),
+            })
+        inventario.sort(key=lambda b: b["inicio"])
+        return inventario, [b["inicio"] for b in inventario]
+
+    def _tomar_habitacion(self, inventario, inicios, registro):
+        """Un bloqueo/grupo con habitaciones libres que salga 7 a 150 días después del registro."""
+        lo = bisect.bisect_left(inicios, (registro + timedelta(days=7)).date())
+        hi = bisect.bisect_right(inicios, (registro + timedelta(days=150)).date())
+        for _ in range(3 if hi > lo else 0):
+            b = inventario[self.rnd.randrange(lo, hi)]
+            if b["vendidas"] < b["totales"]:
+                b["vendidas"] += 1
+                return b
+        return None
+
+    def _guardar_inventario(self, tabla, inventario):
+        for b in inventario:
+            fin = b["inicio"] + timedelta(days=b["noches"])
+            disponibles = b["totales"] - b["vendidas"]
+            estado = "AGOTADO" if disponibles == 0 else "ACTIVO"
+            comunes = (b["hotel"], b["inicio"].strftime("%d-%m-%Y"), fin.strftime("%d-%m-%Y"), b["noches"],
+                       b["totales"], b["vendidas"], disponibles, b["doble"], b["triple"], b["cuadruple"],
+                       b["menor"], b["menor"], b["menor"], round(b["doble"] * 0.8))
+            if tabla == "bloqueos":
+                self.carga.agregar(tabla, (b["id"], *comunes, estado, self._ts(b["registro"]),
+                                           b["operador"], self._celular()))
+            else:
+                nombre = f"{self.rnd.choice(['Boda', 'Graduación', 'Aniversario', 'Congreso', 'Viaje'])} {self.rnd.choice(APELLIDOS)} {b['inicio'].year}"
+                self.carga.agregar(tabla, (b["id"], nombre, b["operador"], *comunes[:13], comunes[13],
+                                           "TURISMAR", self._celular(), estado, self._ts(b["registro"])))
+
+    def riviera(self):
+        r, n = self.rnd, self.n_ventas
+        bloqueos, inicios_b = self._inventario("bloqueos", max(1, int(n * PCT_BLOQUEO / 8)))
+        grupos, inicios_g = self._inventario("grupos", max(1, int(n * PCT_GRUPO / 8)))
+
+        # Registros en orden: los ids crecen con la fecha como en la base real
+        inicio_rango = datetime.combine(self.desde, datetime.min.time())
+        fin_rango = datetime.combine(self.hasta, datetime.min.time())
+        segundos = int((fin_rango - inicio_rango).total_seconds())
+        registros = sorted(r.randint(0, segundos) for _ in range(n))
+        hoy = fin_rango
+
+        for s in registros:
+            registro = inicio_rango + timedelta(seconds=s)
+            venta_id = self._id("ventas")
+            vendedora_id, vendedora = r.choice(self.vendedoras)
+            adultos = r.choice((2, 2, 2, 2, 3, 3, 4))
+            menores = r.choice((0, 0, 0, 0, 1, 1, 2)) if adultos < 4 else 0
+            tipo_hab = TIPO_HABITACION[adultos]
+
+            x = r.random()
+            inv = self._tomar_habitacion(bloqueos, inicios_b, registro) if x < PCT_BLOQUEO else None
+            grp = (self._tomar_habitacion(grupos, inicios_g, registro)
+                   if PCT_BLOQUEO <= x < PCT_BLOQUEO + PCT_GRUPO else None)
+            base = inv or grp
+            if base:
+                hotel, inicio, noches, operador = base["hotel"], base["inicio"], base["noches"], base["operador"]
+                por_noche = base[{2: "doble", 3: "triple", 4: "cuadruple"}[adultos]]
+                precio_menor = base["menor"] * noches
+            else:
+                hotel, operador = r.choice(self.hoteles), r.choice(self.operadores)
+                inicio = (registro + timedelta(days=r.randint(7, 180))).date()
+                noches = r.randint(2, 7)
+                por_noche = r.randint(12, 45) * 100
+                precio_menor = round(por_noche * 0.5) * noches
+            fin = inicio + timedelta(days=noches)
+            precio_adulto = por_noche * noches
+            total = adultos * precio_adulto + menores * precio_menor
+            pct = r.choice((10, 12, 15, 15, 18, 20))
+            ganancia = round(total * pct / 100, 2)
+
+            # Lo que ya viajó está pagado; lo futuro, a veces a medias
+            inicio_dt = datetime.combine(inicio, datetime.min.time())
+            if inicio_dt <= hoy or r.random() < 0.3:
+                pagado = total
+            else:
+                pagado = 0 if r.random() < 0.05 else round(total * r.uniform(0.1, 0.9), -2)
+            saldo = round(total - pagado, 2)
+            liquidado = saldo <= 0
+            comision = round(ganancia * 0.10, 2) if liquidado else 0
+            cerrado = liquidado and fin < (hoy - timedelta(days=15)).date() and r.random() < 0.8
+            estado = "CERRADO" if cerrado else ("LIQUIDADO" if liquidado else "ACTIVO")
+            fecha_pago_comision = None
+            if cerrado:
+                pago_comision = min(hoy, datetime.combine(fin, datetime.min.time()) + timedelta(days=r.randint(3, 15), hours=r.randint(9, 19)))
+                fecha_pago_comision = self._ts(pago_comision)
+                self.carga.agregar("historial_comisiones", (
+                    self._id("historial_comisiones"), vendedora, fecha_pago_comision, "Riviera Maya",
+                    venta_id, comision, r.choice(METODOS), None, vendedora_id))
+            confirmada = liquidado and r.random() < 0.7
+            localizador = f"{r.randint(100000, 999999)}" if liquidado or r.random() < 0.5 else None
+
+            self.carga.agregar("ventas", (
+                venta_id, self._nombre(), "Bloqueo" if inv else ("Grupo" if grp else "General"), hotel,
+                inicio.strftime("%d-%m-%Y"), fin.strftime("%d-%m-%Y"), noches, adultos, menores, tipo_hab,
+                precio_adulto, precio_menor, total, pct, ganancia, round(total - ganancia, 2),
+                pagado, saldo, comision, 1 if cerrado else 0, estado, vendedora_id, vendedora_id,
+                1 if inv else 0, inv["id"] if inv else None, self._ts(registro), fecha_pago_comision,
+                operador, self._celular(), 1 if grp else 0, grp["id"] if grp else None, localizador,
+                f"{r.randint(10, 99)}-{r.randint(1000000, 9999999)}" if liquidado else None,
+                r.choice(PLANES), None, r.choice(EDADES) if menores else None,
+                1 if confirmada else 0, "Administrador" if confirmada else None,
+                self._ts(min(hoy, registro + timedelta(days=r.randint(1, 20)))) if confirmada else None,
+                inicio.isoformat(), fin.isoformat()))
+
+            for _ in range(adultos):
+                self.carga.agregar("pasajeros", (self._id("pasajeros"), venta_id, self._nombre(), "ADULTO"))
+            for _ in range(menores):
+                self.carga.agregar("pasajeros", (self._id("pasajeros"), venta_id, self._nombre(), "MENOR"))
+            for momento, monto in self._pagos(total, registro, min(inicio_dt, hoy), pagado=pagado):
+                self.carga.agregar("abonos", (self._id("abonos"), venta_id, self._ts(momento), monto, r.choice(METODOS)))
+
+        self._guardar_inventario("bloqueos", bloqueos)
+        self._guardar_inventario("grupos", grupos)
+
+    # ── Viajes nacionales e internacionales ─────────────────
+    def _viajes(self, objetivo_clientes, dias_min, dias_max):
+        """Salidas de viaje (fecha, noches, cupos, fecha de registro) para acomodar a los clientes."""
+        r, viajes, capacidad = self.rnd, [], 0
+        hoy = datetime.combine(self.hasta, datetime.min.time())
+        inicio_rango = datetime.combine(self.desde, datetime.min.time()) + timedelta(days=30)
+        while capacidad < objetivo_clientes:
+            salida = self._momento(inicio_rango, hoy + timedelta(days=200)).replace(hour=0, minute=0, second=0)
+            dias = r.randint(dias_min, dias_max)
+            cupos = r.randint(20, 45)
+            registro = min(salida - timedelta(days=r.randint(90, 200)), hoy - timedelta(days=r.randint(1, 30)))
+            # Los que ya salieron se llenaron; los futuros van en proporción al tiempo de venta
+            avance = min(1.0, max(0.05, (hoy - registro) / max(salida - registro, timedelta(days=1))))
+            ocupacion = r.uniform(0.6, 1.0) * avance
+            viajes.append((salida, dias, cupos, registro, ocupacion))
+            capacidad += max(1, int(cupos * ocupacion / 2.6))
+        viajes.sort()
+        return viajes
+
+    def _grupo_familiar(self):
+        adultos = self.rnd.choice((1, 2, 2, 2, 2, 3, 4))
+        menores = self.rnd.choice((0, 0, 0, 1, 2)) if adultos < 4 else 0
+        return adultos, menores
+
+    def nacionales(self):
+        r = self.rnd
+        hoy = datetime.combine(self.hasta, datetime.min.time())
+        objetivo = int(self.n_ventas * PROPORCIONES["clientes_nacionales"])
+        for salida, dias, cupos, registro_viaje, ocupacion in self._viajes(objetivo, 3, 8):
+            viaje_id = self._id("viajes_nacionales")
+            nombre_viaje, destino = r.choice(VIAJES_NACIONALES)
+            noches = dias - 1
+            regreso = salida + timedelta(days=noches)
+            doble = r.randint(60, 180) * 100
+            triple = round(doble * 1.03, -1)
+            cotizacion_id = None
+            if r.random() < 0.5:
+                cotizacion_id = self._id("cotizaciones_nacionales")
+                costo_vuelo = r.randint(12, 40) * 100
+                self.carga.agregar("cotizaciones_nacionales", (
+                    cotizacion_id, nombre_viaje, destino, salida.strftime("%d-%m-%Y"), regreso.strftime("%d-%m-%Y"),
+                    dias, noches, cupos, costo_vuelo, round(costo_vuelo * 1.2), 5000, 250, 400, 600,
+                    doble, triple, round(doble * cupos * 0.7, 2), round(doble * cupos * 0.3, 2),
+                    "APROBADA", self._ts(registro_viaje - timedelta(days=r.randint(1, 20)))))
+                for _ in range(r.randint(1, 2)):
+                    costo = r.randint(20, 60) * 100
+                    self.carga.agregar("hoteles_cotizacion", (
+                        self._id("hoteles_cotizacion"), cotizacion_id, r.choice(HOTELES_NACIONALES), noches,
+                        costo, round(costo * 1.4), round(costo * 1.15), round(costo * 1.5)))
+
+            vendidos, limite = 0, int(cupos * ocupacion)
+            fin_venta = min(salida - timedelta(days=3), hoy)
+            while True:
+                adultos, menores = self._grupo_familiar()
+                if vendidos + adultos + menores > limite:
+                    break
+                vendidos += adultos + menores
+                self._cliente_nacional(viaje_id, salida, registro_viaje, fin_venta, adultos, menores, doble, triple)
+
+            disponibles = cupos - vendidos
+            estado = "CERRADO" if regreso < hoy else ("AGOTADO" if disponibles == 0 else "ACTIVO")
+            self.carga.agregar("viajes_nacionales", (
+                viaje_id, cotizacion_id, nombre_viaje, destino, salida.strftime("%d-%m-%Y"),
+                regreso.strftime("%d-%m-%Y"), dias, noches, cupos, vendidos, disponibles, doble, triple,
+                estado, self._ts(registro_viaje), r.choice(self.operadores),
+                salida.date().isoformat(), regreso.date().isoformat()))
+
+    def _cliente_nacional(self, viaje_id, salida, desde, hasta, adultos, menores, doble, triple):
+        r = self.rnd
+        cliente_id = self._id("clientes_nacionales")
+        vendedora_id, _ = r.choice(self.vendedoras)
+        registro = self._momento(desde, max(desde, hasta))
+        triples = 1 if adultos + menores == 3 else 0
+        dobles = max(1, math.ceil((adultos + menores - 3 * triples) / 2)) if adultos + menores != 3 else 0
+        total = adultos * (triple if triples else doble) + menores * round(doble * 0.8, -1)
+        pagado = total if salida <= datetime.combine(self.hasta, datetime.min.time()) or r.random() < 0.3 \
+            else round(total * r.uniform(0.2, 0.9), -2)
+        abonos = self._pagos(total, registro, max(registro, hasta), max_pagos=3, pagado=pagado)
+        abonado = round(sum(m for _, m in abonos), 2)
+        saldo = round(total - abonado, 2)
+        nombre = self._nombre()
+        self.carga.agregar("clientes_nacionales", (
+            cliente_id, viaje_id, vendedora_id, nombre, adultos, menores, dobles, triples, total, abonado,
+            saldo, "LIQUIDADO" if saldo <= 0 else "ADEUDO", self._ts(registro), self._celular(), 0))
+        for i in range(adultos + menores):
+            self.carga.agregar("pasajeros_nacionales", (
+                self._id("pasajeros_nacionales"), cliente_id, nombre if i == 0 else self._nombre(),
+                "ADULTO" if i < adultos else "MENOR", f"{'Triple' if triples else 'Doble'} {i // 2 + 1}"))
+        for momento, monto in abonos:
+            self.carga.agregar("abonos_nacionales", (
+                self._id("abonos_nacionales"), cliente_id, monto, self._ts(momento), vendedora_id, r.choice(METODOS)))
+
+    def internacionales(self):
+        r = self.rnd
+        hoy = datetime.combine(self.hasta, datetime.min.time())
+        objetivo = int(self.n_ventas * PROPORCIONES["clientes_internacionales"])
+        for salida, dias, cupos, registro_viaje, ocupacion in self._viajes(objetivo, 8, 16):
+            viaje_id = self._id("viajes_internacionales")
+            noches = dias - 1
+            regreso = salida + timedelta(days=noches)
+            doble = r.randint(12, 40) * 100
+            triple, menor = round(doble * 0.92), round(doble * 0.75)
+            pct = r.choice((12, 15, 18))
+            vendidos, limite = 0, int(cupos * ocupacion)
+            fin_venta = min(salida - timedelta(days=15), hoy)
+            while True:
+                adultos, menores = self._grupo_familiar()
+                if vendidos + adultos + menores > limite:
+                    break
+                vendidos += adultos + menores
+                self._cliente_internacional(viaje_id, salida, registro_viaje, fin_venta, adultos, menores,
+                                            doble, triple, menor, pct)
+            disponibles = cupos - vendidos
+            estado = "CERRADO" if regreso < hoy else ("AGOTADO" if disponibles == 0 else "ACTIVO")
+            self.carga.agregar("viajes_internacionales", (
+                viaje_id, f"{r.choice(VIAJES_INTERNACIONALES)} {salida.year}", salida.strftime("%d-%m-%Y"),
+                regreso.strftime("%d-%m-%Y"), dias, noches, cupos, vendidos, disponibles, doble, triple,
+                menor, round(menor * 0.95), pct, estado, self._ts(registro_viaje), r.choice(self.operadores),
+                salida.date().isoformat(), regreso.date().isoformat()))
+
+    def _cliente_internacional(self, viaje_id, salida, desde, hasta, adultos, menores, doble, triple, menor, pct):
+        r = self.rnd
+        cliente_id = self._id("clientes_internacionales")
+        vendedora_id, _ = r.choice(self.vendedoras)
+        registro = self._momento(desde, max(desde, hasta))
+        triples = 1 if adultos + menores == 3 else 0
+        dobles = 0 if triples else max(1, math.ceil((adultos + menores) / 2))
+        total = float(adultos * (triple if triples else doble) + menores * menor)
+        pagado = total if salida <= datetime.combine(self.hasta, datetime.min.time()) or r.random() < 0.3 \
+            else round(total * r.uniform(0.2, 0.9))
+        abonado = 0.0
+        for momento, usd in self._pagos(total, registro, max(registro, hasta), max_pagos=5, pagado=pagado):
+            if r.random() < 0.7:
+                tc = round(r.uniform(16.8, 20.5), 2)
+                original, moneda = round(usd * tc, -1), "MXN"
+                usd = original / tc
+            else:
+                tc, original, moneda = 1.0, usd, "USD"
+            abonado += usd
+            self.carga.agregar("abonos_internacionales", (
+                self._id("abonos_internacionales"), cliente_id, self._ts(momento), moneda, original, tc, usd,
+                r.choice(METODOS)))
+        saldo = total - abonado
+        nombre = self._nombre()
+        self.carga.agregar("clientes_internacionales", (
+            cliente_id, viaje_id, nombre, adultos, menores, dobles, triples, total, abonado, saldo,
+            round(total * pct / 100, 2), "LIQUIDADO" if saldo < 0.01 else "ADEUDO", self._ts(registro),
+            self._celular(), vendedora_id))
+        for i in range(adultos + menores):
+            self.carga.agregar("pasajeros_internacionales", (
+                self._id("pasajeros_internacionales"), cliente_id, nombre if i == 0 else self._nombre(),
+                "ADULTO" if i < adultos else "MENOR", f"{'Triple' if triples else 'Doble'} {i // 2 + 1}"))
+
+    # ── Pasaportes, visas y vuelos ──────────────────────────
+    def _tramite(self, tabla, tabla_abonos, n, fila):
+        """Genera n trámites; `fila(registro, total, pagado, saldo)` arma la fila sin id."""
+        r = self.rnd
+        desde = datetime.combine(self.desde, datetime.min.time())
+        hoy = datetime.combine(self.hasta, datetime.min.time())
+        registros = sorted(self._momento(desde, hoy) for _ in range(n))
+        for registro in registros:
+            tramite_id = self._id(tabla)
+            costo, servicio = r.randint(8, 60) * 100, r.randint(3, 10) * 100
+            total = costo + servicio
+            pagado = total if r.random() < 0.7 else (0 if r.random() < 0.3 else round(total * r.uniform(0.3, 0.8), -2))
+            for momento, monto in self._pagos(total, registro, min(hoy, registro + timedelta(days=60)),
+                                              max_pagos=2, pagado=pagado):
+                self.carga.agregar(tabla_abonos, (self._id(tabla_abonos), tramite_id, monto,
+                                                  momento.date().isoformat(), r.choice(METODOS)))
+            self.carga.agregar(tabla, (tramite_id, *fila(registro, costo, servicio, total, pagado)))
+
+    def otros(self):
+        r = self.rnd
+        hoy = datetime.combine(self.hasta, datetime.min.time())
+
+        def cita(registro, dias_min, dias_max):
+            c = (registro + timedelta(days=r.randint(dias_min, dias_max))).date()
+            return c.isoformat(), (c + timedelta(days=r.randint(7, 30))).isoformat()
+
+        def estado_tramite(registro, estados, final):
+            return final if registro < hoy - timedelta(days=60) else r.choice(estados)
+
+        def pasaporte(registro, costo, servicio, total, pagado):
+            fecha_cita, entrega = cita(registro, 5, 40)
+            return (r.choice(self.vendedoras)[0], self._nombre(), self._celular(), r.choice(("Nuevo", "Renovación")),
+                    fecha_cita, entrega, costo, servicio, total, pagado, total - pagado,
+                    estado_tramite(registro, ("En trámite", "Cita agendada", "Listo"), "Entregado"), None,
+                    registro.strftime("%Y-%m-%d %H:%M"))
+
+        def visa(registro, costo, servicio, total, pagado):
+            fecha_cita, entrega = cita(registro, 30, 300)
+            integrantes = r.choice((1, 1, 1, 2, 3, 4))
+            return (r.choice(self.vendedoras)[0], self._nombre(), self._celular(), r.choice(PAISES_VISA),
+                    r.choice(TIPOS_VISA), 1 if integrantes > 1 else 0, integrantes, fecha_cita, entrega,
+                    costo, servicio, total, pagado, total - pagado,
+                    estado_tramite(registro, ("En trámite", "Cita agendada"),
+                                   r.choice(("Aprobada", "Aprobada", "Entregada", "Rechazada"))), None,
+                    registro.strftime("%Y-%m-%d %H:%M"))
+
+        def vuelo(registro, costo, servicio, total, pagado):
+            tipo = r.choice(("Nacional", "Nacional", "Internacional"))
+            origen, destino = r.sample(CIUDADES, 2)
+            fecha = (registro + timedelta(days=r.randint(3, 120))).date()
+            return (r.choice(self.vendedoras)[0], self._nombre(), self._celular(), tipo, r.choice(AEROLINEAS),
+                    origen, destino, fecha.isoformat(), f"{r.randint(6, 22):02d}:{r.choice((0, 15, 30, 45)):02d}",
+                    r.randint(1, 4), costo, servicio, total, pagado, total - pagado,
+                    "Emitido" if pagado >= total else r.choice(("Cotizado", "Confirmado", "Cancelado")), None,
+                    registro.strftime("%Y-%m-%d %H:%M"))
+
+        self._tramite("pasaportes", "abonos_pasaportes", int(self.n_ventas * PROPORCIONES["pasaportes"]), pasaporte)
+        self._tramite("visas", "abonos_visas", int(self.n_ventas * PROPORCIONES["visas"]), visa)
+        self._tramite("vuelos", "abonos_vuelos", int(self.n_ventas * PROPORCIONES["vuelos"]), vuelo)
+
+    # ── Transferencias y gastos ─────────────────────────────
+    def transferencias(self):
+        r = self.rnd
+        desde = datetime.combine(self.desde, datetime.min.time())
+        hoy = datetime.combine(self.hasta, datetime.min.time())
+        n = int(self.n_ventas * PROPORCIONES["transferencias"])
+        for momento in sorted(self._momento(desde, hoy) for _ in range(n)):
+            aplicada = momento < hoy - timedelta(days=7) or r.random() < 0.5
+            fecha_aplicacion = min(hoy, momento + timedelta(days=r.randint(0, 3))).date().isoformat() if aplicada else None
+            self.carga.agregar("transferencias", (
+                self._id("transferencias"), momento.date().isoformat(), self._nombre(),
+                float(r.randint(5, 300) * 100), "APLICADO" if aplicada else "PENDIENTE",
+                f"ABC{r.randint(100000, 999999)}" if aplicada else None, fecha_aplicacion, None,
+                r.choice(self.vendedoras)[0], self._ts(momento), r.choice(self.operadores) if r.random() < 0.4 else None))
+
+    def gastos(self):
+        """Gastos fijos y sueldos de cada mes, más gastos variables según el volumen de ventas."""
+        r = self.rnd
+        hoy = datetime.combine(self.hasta, datetime.min.time())
+        variables_por_mes = max(2, self.n_ventas // 600)
+        mes = self.desde.replace(day=1)
+        while mes <= self.hasta:
+            siguiente = (mes + timedelta(days=32)).replace(day=1)
+            ultimo = min(siguiente - timedelta(days=1), self.hasta)
+            cargos = [(cat, desc, float(monto), mes.replace(day=min(5, ultimo.day)), "MENSUAL", 1)
+                      for cat, desc, monto in GASTOS_FIJOS]
+            for vid, nombre in self.vendedoras:
+                sueldo = float(r.choice((2500, 3000, 3500)))
+                cargos.append(("Sueldos y Nómina", f"Sueldo {nombre}", sueldo, ultimo, "MENSUAL", 1))
+                self.carga.agregar("sueldos_vendedoras", (
+                    self._id("sueldos_vendedoras"), vid, mes.month, mes.year, sueldo, 0, 0, 0, sueldo,
+                    ultimo.isoformat(), "PAGADO" if ultimo < self.hasta else "PENDIENTE", None,
+                    self._ts(datetime.combine(ultimo, datetime.min.time()))))
+            for _ in range(variables_por_mes):
+                cat, desc, minimo, maximo = r.choice(GASTOS_VARIABLES)
+                dia = mes + timedelta(days=r.randint(0, (ultimo - mes).days))
+                cargos.append((cat, desc, float(r.randint(minimo // 10, maximo // 10) * 10), dia, "UNICO", 0))
+            for cat, desc, monto, dia, frecuencia, recurrente in sorted(cargos, key=lambda c: c[3]):
+                registro = min(hoy, datetime.combine(dia, datetime.min.time()) + timedelta(hours=r.randint(9, 19)))
+                self.carga.agregar("gastos_operativos", (
+                    self._id("gastos_operativos"), cat, None, desc, monto, "MXN", dia.isoformat(), dia.month,
+                    dia.year, frecuencia, recurrente, None, r.choice(("Efectivo", "Transferencia", "Tarjeta Débito")),
+                    None, None, self._ts(registro), "Administrador"))
+            mes = siguiente
+
+
+# ─── PRINCIPAL ───────────────────────────────────────────────────────────────
+
+def _escala(texto):
+    """'10k' -> 10000, '1m' -> 1000000, '2500' -> 2500"""
+    texto = texto.strip().lower()
+    factor = {"k": 1000, "m": 1000000}.get(texto[-1:], 1)
+    return int(float(texto[:-1] if factor > 1 else texto) * factor)
+
+
+def generar(n_ventas, destino, plantilla=PLANTILLA, anios=3, hasta=None, semilla=2026):
+    """Genera la base completa en `destino` (DestinoSQLite o DestinoPostgres). Devuelve {tabla: filas}."""
+    tablas, catalogos = _tablas_plantilla(plantilla)
+    faltan = [t for t in COLUMNAS if t not in tablas]
+    if faltan:
+        raise SystemExit(f"❌ La plantilla no tiene las tablas: {', '.join(faltan)}")
+
+    try:
+        destino.crear_esquema(tablas)
+        # Columnas ISO, sus índices y triggers antes de cargar: los datos ya las traen
+        aplicar_migracion_fechas_iso(destino.conn, es_postgres=destino.es_postgres)
+
+        carga = Cargador(destino)
+        for tabla, (columnas, filas) in catalogos.items():
+            if filas:
+                destino.insertar(tabla, columnas, filas)
+                carga.totales[tabla] = len(filas)
+
+        gen = Generador(carga, catalogos, n_ventas, hasta or datetime.now().date(), anios, semilla)
+        plantilla_vendedoras = sqlite3.connect(f"file:{plantilla}?mode=ro", uri=True)
+        try:
+            gen.vendedoras_(plantilla_vendedoras.execute(
+                "SELECT id, nombre, activa, fecha_registro FROM vendedoras ORDER BY id").fetchall())
+        finally:
+            plantilla_vendedoras.close()
+
+        for paso in (gen.riviera, gen.nacionales, gen.internacionales, gen.otros, gen.transferencias, gen.gastos):
+            inicio = time.perf_counter()
+            paso()
+            carga.terminar()
+            print(f"   ✅ {paso.__name__:<16} {time.perf_counter() - inicio:7.1f}s")
+
+        # Lo mismo que la app aplica al arrancar (app_nucleo.migraciones_al_arranque)
+        inicio = time.perf_counter()
+        aplicar_migraciones_indices(destino.conn, es_postgres=destino.es_postgres)
+        instalar_resumen_ventas(destino.conn, es_postgres=destino.es_postgres)
+        instalar_movimientos_pagos(destino.conn, es_postgres=destino.es_postgres)
+        instalar_busqueda_clientes(destino.conn, es_postgres=destino.es_postgres)
+        destino.terminar()
+        print(f"   ✅ {'migraciones':<16} {time.perf_counter() - inicio:7.1f}s")
+    except BaseException:
+        destino.descartar()
+        raise
+    return carga.totales
+
+
+def ejecutar_generador(args):
+    print("\n" + "="*60)
+    print("🧪 GENERADOR DE DATOS DE PRUEBA")
+    print("="*60)
+
+    n_ventas = _escala(args.ventas)
+    if args.postgres:
+        destino = DestinoPostgres(args.postgres, args.reemplazar)
+    else:
+        ruta = args.destino or f"datos_prueba_{args.ventas.lower()}.db"
+        destino = DestinoSQLite(ruta, args.reemplazar, args.plantilla)
+    hasta = datetime.strptime(args.hasta, "%Y-%m-%d").date() if args.hasta else None
+
+    print(f"\n{'🐘' if destino.es_postgres else '🗄️'} Destino: {destino.nombre}")
+    print(f"📐 {n_ventas:,} ventas · {args.anios} años · semilla {args.semilla}\n")
+    inicio = time.perf_counter()
+    totales = generar(n_ventas, destino, args.plantilla, args.anios, hasta, args.semilla)
+
+    print("\n📊 Filas por tabla:")
+    for tabla, filas in sorted(totales.items(), key=lambda t: -t[1]):
+        print(f"   {tabla:<28} {filas:>12,}")
+    print(f"\n✅ LISTO en {time.perf_counter() - inicio:.1f}s\n")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Genera una base de prueba con datos sintéticos")
+    parser.add_argument("--ventas", default="10k", help="ventas de Riviera Maya: 1k, 10k, 100k, 1m o un número")
+    parser.add_argument("--destino", help="archivo SQLite (default datos_prueba_<ventas>.db)")
+    parser.add_argument("--postgres", metavar="URL", help="cargar en PostgreSQL en lugar de SQLite")
+    parser.add_argument("--plantilla", default=PLANTILLA, help="base de la que se copian esquema y catálogos")
+    parser.add_argument("--anios", type=float, default=3, help="años de historia hasta --hasta")
+    parser.add_argument("--hasta", help="última fecha de registro YYYY-MM-DD (default hoy)")
+    parser.add_argument("--semilla", type=int, default=2026)
+    parser.add_argument("--reemplazar", action="store_true", help="sobrescribir el destino si ya tiene datos")
+    ejecutar_generador(parser.parse_args())
@@ -4,6 +4,7 @@ generar_recibo.py  –  Turismar Agencia de Viajes  (v2 – Rediseño 2026)
 Coloca este archivo en la MISMA carpeta que app_streamlit.py junto con:
   - logo_turismar_clean.png   (logo principal)
   - sello_abono.jpg           (sello opcional – ya no se usa nina)
+  - pdf_assets.py             (cache del logo y plantilla de la página)
 
 Uso:
     from generar_recibo import generar_recibo_pdf
@@ -17,13 +18,12 @@ Uso:
 """
 
 import io
-import os
-import math
+import hashlib
 from reportlab.lib.pagesizes import A4
 from reportlab.lib import colors
 from reportlab.lib.units import mm
-from reportlab.pdfgen import canvas
-from reportlab.lib.utils import ImageReader
+
+from pdf_assets import CanvasPDF, PlantillaPDF, dibujar_imagen
 
 # ── Paleta de colores Turismar ─────────────────────────────────────────────
 PINK        = colors.HexColor("#E91E8C")
@@ -126,53 +126,80 @@ def _draw_separator_line(c, x1, x2, y, color=None, dashed=False):
     c.setDash()
 
 
-# ── Función principal ──────────────────────────────────────────────────────
-def generar_recibo_pdf(
-    numero,
-    fecha,
-    recibide,
-    cantidad,
-    concepto,
-    forma_pago,
-    agente,
-    logo_path="logo_turismar_clean.png",
-    nina_path=None,         # ya no se usa, se mantiene por compatibilidad
-    sello_path=None,        # ya no se usa como imagen, se dibuja nativamente
-    total_viaje=None,
-    pagado_acumulado=None,
-    nuevo_saldo=None,
-) -> bytes:
-    """
-    Genera el recibo de abono en PDF y devuelve los bytes.
-
-    Parámetros
-    ----------
-    numero            : int  – número de recibo (4 dígitos con ceros)
-    fecha             : str  – fecha formateada, p.ej. "21-febrero-2026"
-    recibide          : str  – nombre del responsable del viaje
-    cantidad          : float – monto del abono
-    concepto          : str  – descripción del viaje / concepto
-    forma_pago        : str  – "Efectivo", "Transferencia", etc.
-    agente            : str  – nombre del agente / vendedora
-    logo_path         : str  – ruta al logo PNG
-    nina_path         : ignorado (compatibilidad)
-    sello_path        : ignorado (compatibilidad)
-    total_viaje       : float|None
-    pagado_acumulado  : float|None
-    nuevo_saldo       : float|None
-    """
-
-    buf = io.BytesIO()
-    W, H = A4          # 595.28 x 841.89 pts
-    cv   = canvas.Canvas(buf, pagesize=A4)
-
-    num_str    = str(int(numero)).zfill(4)
-    cantidad_f = float(cantidad)
-    en_letras  = _cantidad_en_letras(cantidad_f)
-    pago_acum  = pagado_acumulado if pagado_acumulado is not None else cantidad_f
-
-    MARGIN = 14 * mm
-    BODY_W = W - 2 * MARGIN
+# ── Geometría fija de la página ────────────────────────────────────────────
+W, H = A4          # 595.28 x 841.89 pts
+
+MARGIN = 14 * mm
+BODY_W = W - 2 * MARGIN
+
+# Header en 3 zonas: [ORILLA ROSA] [LOGO | INFO AGENCIA (fondo blanco)] [FOLIO AZUL]
+HEADER_H   = 76 * mm
+ORILLA_W   = 10 * mm          # franja rosa izquierda
+FOLIO_W    = 58 * mm          # zona azul derecha con número
+WHITE_W    = W - ORILLA_W - FOLIO_W   # zona central blanca
+FOLIO_X    = W - FOLIO_W
+
+LOGO_SIZE  = 48 * mm
+LOGO_X     = ORILLA_W + 4 * mm
+LOGO_Y     = H - HEADER_H + (HEADER_H - LOGO_SIZE) / 2 + 1.5*mm
+
+INFO_X     = LOGO_X + LOGO_SIZE + 5 * mm
+INFO_MAX_X = FOLIO_X - 4 * mm
+INFO_CX    = (INFO_X + INFO_MAX_X) / 2   # centro del bloque de texto
+
+NUM_CX = FOLIO_X + FOLIO_W / 2
+NUM_CY = H - HEADER_H / 2
+
+# Tarjeta principal
+CARD_TOP    = H - HEADER_H - 4 * mm
+CARD_BOTTOM = 55 * mm
+CARD_H      = CARD_TOP - CARD_BOTTOM
+CARD_X      = MARGIN - 2 * mm
+CARD_W      = W - 2 * (MARGIN - 2 * mm)
+INNER_X     = CARD_X + 6 * mm
+INNER_W     = CARD_W - 12 * mm
+
+# Campos del abono: (etiqueta, resaltado, multilínea)
+CAMPOS = [
+    ("FECHA",                False, False),
+    ("RECIBÍ DE",            False, False),
+    ("CANTIDAD",             True,  False),
+    ("SON (EN LETRAS)",      False, True),
+    ("CONCEPTO",             False, True),
+    ("FORMA DE PAGO",        False, False),
+    ("AGENTE / VENDEDOR(A)", False, False),
+]
+ROW_H     = 8.5 * mm
+LABEL_W   = 56 * mm
+GAP_CAMPO = 2 * mm
+VAL_X     = INNER_X + LABEL_W + GAP_CAMPO
+VAL_W     = INNER_W - LABEL_W - GAP_CAMPO
+CAMPOS_Y0 = CARD_TOP - 8 * mm - 10 * mm          # bajo el título de sección
+CAMPO_PASO = ROW_H + 1.8 * mm
+
+# Desglose de pagos (3 tarjetas horizontales)
+TILES_H  = 30 * mm
+GAP_TILE = 3 * mm
+TILE_W   = (INNER_W - GAP_TILE * 2) / 3
+TILES_Y  = CAMPOS_Y0 - len(CAMPOS) * CAMPO_PASO - 5 * mm
+TILES = [
+    # (etiqueta, fondo, acento, color del valor, ícono)
+    ("TOTAL DEL VIAJE", BLUE_LIGHT,                  BLUE_DARK,  BLUE_DARK,  "TOTAL"),
+    ("ABONADO HOY",     colors.HexColor("#E8FFF3"),  GREEN_DARK, GREEN_DARK, "ABONO"),
+    ("SALDO RESTANTE",  PINK_XLIGHT,                 PINK_MID,   PINK,       "SALDO"),
+]
+
+# Banda de verificación
+VERIF_Y  = CARD_BOTTOM + 5 * mm
+VERIF_H  = 18 * mm
+VERIF_X  = INNER_X
+VERIF_W  = INNER_W
+
+FOOTER_H = 22 * mm
+
+
+def _dibujar_plantilla(cv):
+    """Todo lo que no cambia entre recibos (un Form por documento, ver pdf_assets)."""
 
     # ══════════════════════════════════════════════════════════════════════
     # 1. FONDO GENERAL
@@ -181,16 +208,8 @@ def generar_recibo_pdf(
     cv.rect(0, 0, W, H, fill=1, stroke=0)
 
     # ══════════════════════════════════════════════════════════════════════
-    # 2. HEADER  –  Layout en 3 zonas:
-    #    [ORILLA ROSA] [LOGO | INFO AGENCIA (fondo blanco)] [FOLIO AZUL]
+    # 2. HEADER
     # ══════════════════════════════════════════════════════════════════════
-    HEADER_H   = 76 * mm
-
-    # Zonas horizontales (en puntos)
-    ORILLA_W   = 10 * mm          # franja rosa izquierda
-    FOLIO_W    = 58 * mm          # zona azul derecha con número
-    WHITE_W    = W - ORILLA_W - FOLIO_W   # zona central blanca
-
     # ── 2a. Fondo blanco completo del header ──────────────────────────
     cv.setFillColor(WHITE)
     cv.rect(0, H - HEADER_H, W, HEADER_H, fill=1, stroke=0)
@@ -205,7 +224,6 @@ def generar_recibo_pdf(
         cv.circle(ORILLA_W / 2, dot_y, 1.5, fill=1, stroke=0)
 
     # ── 2c. Zona azul del folio (derecha) ─────────────────────────────
-    FOLIO_X = W - FOLIO_W
     cv.setFillColor(BLUE_DARK)
     cv.rect(FOLIO_X, H - HEADER_H, FOLIO_W, HEADER_H, fill=1, stroke=0)
 
@@ -213,14 +231,7 @@ def generar_recibo_pdf(
     cv.setFillColor(BLUE)
     cv.rect(FOLIO_X, H - HEADER_H, 2.5, HEADER_H, fill=1, stroke=0)
 
-    # Burbujas decorativas en zona azul
-    cv.saveState()
-    cv.setFillColor(WHITE)
-    cv.setFillAlpha(0.07)
-    cv.circle(W - 12*mm, H - 10*mm, 30*mm, fill=1, stroke=0)
-    cv.circle(W - 20*mm, H - 65*mm, 20*mm, fill=1, stroke=0)
-    cv.setFillAlpha(1)
-    cv.restoreState()
+    # (las burbujas translúcidas van en _dibujar_translucidos)
 
     # ── 2d. Franja amarilla en la parte inferior del header ───────────
     cv.setFillColor(YELLOW)
@@ -231,25 +242,7 @@ def generar_recibo_pdf(
     cv.setLineWidth(0.5)
     cv.line(FOLIO_X, H - HEADER_H + 6*mm, FOLIO_X, H - 6*mm)
 
-    # ── 2f. Logo (zona blanca, lado izquierdo) ────────────────────────
-    LOGO_SIZE  = 48 * mm
-    LOGO_X     = ORILLA_W + 4 * mm
-    LOGO_Y     = H - HEADER_H + (HEADER_H - LOGO_SIZE) / 2 + 1.5*mm
-
-    if os.path.exists(logo_path):
-        try:
-            img = ImageReader(logo_path)
-            cv.drawImage(img, LOGO_X, LOGO_Y,
-                         width=LOGO_SIZE, height=LOGO_SIZE,
-                         preserveAspectRatio=True, mask="auto")
-        except Exception:
-            pass
-
     # ── 2g. Información de la agencia (zona blanca, lado derecho del logo) ─
-    INFO_X     = LOGO_X + LOGO_SIZE + 5 * mm
-    INFO_MAX_X = FOLIO_X - 4 * mm
-    INFO_CX    = (INFO_X + INFO_MAX_X) / 2   # centro del bloque de texto
-
     # Nombre de la agencia – "TURISMAR" en rosa y "Agencia de Viajes" en azul
     cv.setFillColor(PINK)
     cv.setFont("Helvetica-Bold", 22)
@@ -289,10 +282,7 @@ def generar_recibo_pdf(
     cv.drawCentredString(INFO_CX, H - 65 * mm,
                          "Facebook: Turismar Agencia de Viajes")
 
-    # ── 2h. Folio / Número de recibo (zona azul derecha) ──────────────
-    NUM_CX = FOLIO_X + FOLIO_W / 2
-    NUM_CY = H - HEADER_H / 2
-
+    # ── 2h. Folio (zona azul derecha) – el número y la fecha van aparte ─
     cv.setFillColor(colors.HexColor("#CCE8F4"))
     cv.setFont("Helvetica-Bold", 6.5)
     cv.drawCentredString(NUM_CX, H - 12 * mm, "RECIBO DE ABONO")
@@ -302,16 +292,6 @@ def generar_recibo_pdf(
     cv.setLineWidth(0.8)
     cv.line(FOLIO_X + 6*mm, H - 14.5*mm, W - 6*mm, H - 14.5*mm)
 
-    # Número en grande
-    cv.setFillColor(YELLOW)
-    cv.setFont("Helvetica-Bold", 28)
-    cv.drawCentredString(NUM_CX, NUM_CY + 2 * mm, f"# {num_str}")
-
-    # Fecha
-    cv.setFillColor(colors.HexColor("#CCE8F4"))
-    cv.setFont("Helvetica", 6.5)
-    cv.drawCentredString(NUM_CX, NUM_CY - 8 * mm, fecha)
-
     # Pequeño ícono de avión decorativo
     cv.setFillColor(colors.HexColor("#5BC8E8"))
     cv.setFont("Helvetica-Bold", 16)
@@ -320,12 +300,6 @@ def generar_recibo_pdf(
     # ══════════════════════════════════════════════════════════════════════
     # 3. TARJETA PRINCIPAL (cuerpo blanco con sombra)
     # ══════════════════════════════════════════════════════════════════════
-    CARD_TOP    = H - HEADER_H - 4 * mm
-    CARD_BOTTOM = 55 * mm
-    CARD_H      = CARD_TOP - CARD_BOTTOM
-    CARD_X      = MARGIN - 2 * mm
-    CARD_W      = W - 2 * (MARGIN - 2 * mm)
-
     # Sombra
     cv.setFillColor(colors.HexColor("#C8D8E8"))
     cv.roundRect(CARD_X + 1.5, CARD_BOTTOM - 1.5, CARD_W, CARD_H, 6, fill=1, stroke=0)
@@ -334,117 +308,37 @@ def generar_recibo_pdf(
     _draw_rounded_rect_fill(cv, CARD_X, CARD_BOTTOM, CARD_W, CARD_H, 6, WHITE,
                             stroke_color=GRAY_LIGHT, line_width=0.5)
 
-    # ── Sección "DATOS DEL ABONO" ──────────────────────────────────────
-    INNER_X = CARD_X + 6 * mm
-    INNER_W = CARD_W - 12 * mm
+    # Título de sección "DATOS DEL ABONO"
     y = CARD_TOP - 8 * mm
-
-    # Título de sección
     _draw_rounded_rect_fill(cv, INNER_X, y - 6 * mm, INNER_W, 7.5 * mm, 3, PINK_LIGHT)
     cv.setFillColor(PINK_MID)
     cv.setFont("Helvetica-Bold", 8)
     cv.drawString(INNER_X + 3 * mm, y - 1.5 * mm, "  DATOS DEL ABONO")
-    y -= 10 * mm
-
-    # ── Función interna para campos ────────────────────────────────────
-    def draw_field(label, value, y_pos, highlight=False, value_color=None, multiline=False):
-        ROW_H   = 8.5 * mm
-        LABEL_W = 56 * mm
-        GAP     = 2 * mm
 
+    # Etiquetas y fondos de los campos
+    y = CAMPOS_Y0
+    for label, highlight, _ in CAMPOS:
         # Fondo etiqueta
         lbl_color = PINK_LIGHT if not highlight else colors.HexColor("#E8F5E9")
-        _draw_rounded_rect_fill(cv, INNER_X, y_pos - ROW_H, LABEL_W, ROW_H, 2, lbl_color)
+        _draw_rounded_rect_fill(cv, INNER_X, y - ROW_H, LABEL_W, ROW_H, 2, lbl_color)
 
         # Texto etiqueta
         lbl_text_color = PINK_MID if not highlight else GREEN_DARK
         cv.setFillColor(lbl_text_color)
         cv.setFont("Helvetica-Bold", 6.8)
-        cv.drawString(INNER_X + 2.5 * mm, y_pos - ROW_H / 2 - 1.5, label)
+        cv.drawString(INNER_X + 2.5 * mm, y - ROW_H / 2 - 1.5, label)
 
         # Fondo valor
-        val_x = INNER_X + LABEL_W + GAP
-        val_w = INNER_W - LABEL_W - GAP
-        _draw_rounded_rect_fill(cv, val_x, y_pos - ROW_H, val_w, ROW_H, 2,
+        _draw_rounded_rect_fill(cv, VAL_X, y - ROW_H, VAL_W, ROW_H, 2,
                                 GRAY_XLIGHT, stroke_color=GRAY_LIGHT, line_width=0.4)
-
-        # Texto valor
-        draw_color = value_color if value_color else DARK
-        cv.setFillColor(draw_color)
-
-        if multiline:
-            # Para texto largo: máximo 2 líneas
-            text  = str(value)
-            words = text.split()
-            lines, line = [], ""
-            max_chars = 68
-            for w in words:
-                if len(line) + len(w) + 1 <= max_chars:
-                    line = (line + " " + w).strip()
-                else:
-                    lines.append(line); line = w
-            if line:
-                lines.append(line)
-            cv.setFont("Helvetica", 7.5)
-            for i, ln in enumerate(lines[:2]):
-                cv.drawString(val_x + 2.5 * mm, y_pos - 3.5 * mm - i * 5, ln)
-        else:
-            cv.setFont("Helvetica-Bold" if highlight else "Helvetica", 8.2)
-            cv.drawString(val_x + 2.5 * mm, y_pos - ROW_H / 2 - 1.5, str(value))
-
-        return y_pos - ROW_H - 1.8 * mm
-
-    # Campos
-    y = draw_field("FECHA",                   fecha,        y)
-    y = draw_field("RECIBÍ DE",               recibide,     y)
-    y = draw_field("CANTIDAD",
-                   f"$ {cantidad_f:,.2f}",    y,
-                   highlight=True,
-                   value_color=GREEN_DARK)
-    y = draw_field("SON (EN LETRAS)",         en_letras,    y, multiline=True)
-    y = draw_field("CONCEPTO",                concepto,     y, multiline=True)
-    y = draw_field("FORMA DE PAGO",           forma_pago,   y)
-    y = draw_field("AGENTE / VENDEDOR(A)",    agente,       y)
-
-    y -= 5 * mm
+        y -= CAMPO_PASO
 
     # ══════════════════════════════════════════════════════════════════════
-    # 4. DESGLOSE DE PAGOS  (3 tarjetas horizontales)
+    # 4. DESGLOSE DE PAGOS  (3 tarjetas; los montos van aparte)
     # ══════════════════════════════════════════════════════════════════════
-    TILES_H  = 30 * mm
-    GAP_TILE = 3 * mm
-    TILE_W   = (INNER_W - GAP_TILE * 2) / 3
-
-    tile_configs = [
-        {
-            "label": "TOTAL DEL VIAJE",
-            "value": _fmt_monto(total_viaje),
-            "bg":    BLUE_LIGHT,
-            "accent": BLUE_DARK,
-            "val_color": BLUE_DARK,
-            "icon":  "TOTAL",
-        },
-        {
-            "label": "ABONADO HOY",
-            "value": _fmt_monto(pago_acum),
-            "bg":    colors.HexColor("#E8FFF3"),
-            "accent": GREEN_DARK,
-            "val_color": GREEN_DARK,
-            "icon":  "ABONO",
-        },
-        {
-            "label": "SALDO RESTANTE",
-            "value": _fmt_monto(nuevo_saldo),
-            "bg":    PINK_XLIGHT,
-            "accent": PINK_MID,
-            "val_color": PINK,
-            "icon":  "SALDO",
-        },
-    ]
-
-    for i, tile in enumerate(tile_configs):
+    ty = TILES_Y
+    for i, (label, bg, accent, _, icon) in enumerate(TILES):
         tx = INNER_X + i * (TILE_W + GAP_TILE)
-        ty = y
 
         # Sombra
         cv.setFillColor(GRAY_LIGHT)
@@ -452,55 +346,20 @@ def generar_recibo_pdf(
 
         # Fondo tarjeta
         _draw_rounded_rect_fill(cv, tx, ty - TILES_H, TILE_W, TILES_H, 5,
-                                tile["bg"], stroke_color=tile["accent"], line_width=0.7)
+                                bg, stroke_color=accent, line_width=0.7)
 
         # Barra de acento superior
-        path_bar = cv.beginPath()
-        path_bar.moveTo(tx + 5,          ty)
-        path_bar.lineTo(tx + TILE_W - 5, ty)
-        path_bar.arcTo(tx + TILE_W - 10, ty - 10, tx + TILE_W, ty, 0, 90)
-        path_bar.lineTo(tx + 5,          ty - 5)
-        cv.setFillColor(tile["accent"])
+        cv.setFillColor(accent)
         cv.roundRect(tx, ty - 4 * mm, TILE_W, 4 * mm, 4, fill=1, stroke=0)
 
         # Etiqueta
         cv.setFillColor(WHITE)
         cv.setFont("Helvetica-Bold", 6)
-        cv.drawCentredString(tx + TILE_W / 2, ty - 2.5 * mm, tile["label"])
-
-        # Valor
-        cv.setFillColor(tile["val_color"])
-        val_text = tile["value"]
-        font_size = 14 if len(val_text) <= 12 else 11
-        cv.setFont("Helvetica-Bold", font_size)
-        cv.drawCentredString(tx + TILE_W / 2, ty - 16 * mm, val_text)
-
-        # Ícono textual pequeño
-        cv.setFillColor(tile["accent"])
-        cv.setFont("Helvetica", 6.5)
-        cv.setFillAlpha(0.4)
-        cv.drawCentredString(tx + TILE_W / 2, ty - 24 * mm, tile["icon"])
-        cv.setFillAlpha(1)
-
-    y -= TILES_H + 6 * mm
+        cv.drawCentredString(tx + TILE_W / 2, ty - 2.5 * mm, label)
 
     # ══════════════════════════════════════════════════════════════════════
-    # 5. CÓDIGO DE VERIFICACIÓN ÚNICO
+    # 5. BANDA DE VERIFICACIÓN (el código va aparte)
     # ══════════════════════════════════════════════════════════════════════
-    import hashlib
-
-    # Generar código: TUR-AÑO-NUMERO-HASH4
-    año_str  = str(fecha).split("-")[-1] if "-" in str(fecha) else "2026"
-    raw      = f"{numero}-{fecha}-{cantidad_f}-{recibide}"
-    hash4    = hashlib.md5(raw.encode()).hexdigest()[:4].upper()
-    cod_ver  = f"TUR-{año_str}-{str(int(numero)).zfill(4)}-{hash4}"
-
-    VERIF_Y  = CARD_BOTTOM + 5 * mm
-    VERIF_H  = 18 * mm
-    VERIF_X  = INNER_X
-    VERIF_W  = INNER_W
-
-    # Fondo de la banda de verificación
     _draw_rounded_rect_fill(cv, VERIF_X, VERIF_Y, VERIF_W, VERIF_H, 4,
                             colors.HexColor("#F0FFF8"),
                             stroke_color=GREEN_DARK, line_width=0.8)
@@ -527,11 +386,6 @@ def generar_recibo_pdf(
     cv.drawString(VERIF_X + 18 * mm, VERIF_Y + VERIF_H - 5.5 * mm,
                   "ABONO REGISTRADO DIGITALMENTE")
 
-    # Código en grande y monoespaciado (simulado con Courier)
-    cv.setFillColor(DARK)
-    cv.setFont("Courier-Bold", 12)
-    cv.drawString(VERIF_X + 18 * mm, VERIF_Y + 4 * mm, cod_ver)
-
     # Leyenda derecha
     cv.setFillColor(GRAY_MID)
     cv.setFont("Helvetica", 6)
@@ -546,8 +400,6 @@ def generar_recibo_pdf(
     # ══════════════════════════════════════════════════════════════════════
     # 6. FOOTER
     # ══════════════════════════════════════════════════════════════════════
-    FOOTER_H = 22 * mm
-
     # Fondo degradado simulado (dos rectángulos)
     cv.setFillColor(PINK_MID)
     cv.rect(0, 0, W, FOOTER_H, fill=1, stroke=0)
@@ -579,7 +431,169 @@ def generar_recibo_pdf(
     cv.drawCentredString(W / 2, FOOTER_H - 17 * mm,
                          "¡Gracias por viajar con Turismar!  ✈  @agencia_turismar")
 
-    # ══════════════════════════════════════════════════════════════════════
+
+PLANTILLA = PlantillaPDF("plantilla_recibo", _dibujar_plantilla)
+
+
+def _dibujar_translucidos(cv):
+    """Partes fijas con transparencia: van en la página, no en la plantilla (ver pdf_assets)."""
+    cv.saveState()
+
+    # Burbujas decorativas en zona azul
+    cv.setFillColor(WHITE)
+    cv.setFillAlpha(0.07)
+    cv.circle(W - 12*mm, H - 10*mm, 30*mm, fill=1, stroke=0)
+    cv.circle(W - 20*mm, H - 65*mm, 20*mm, fill=1, stroke=0)
+
+    # Ícono textual pequeño de cada tarjeta del desglose
+    cv.setFont("Helvetica", 6.5)
+    cv.setFillAlpha(0.4)
+    for i, (_, _, accent, _, icon) in enumerate(TILES):
+        tx = INNER_X + i * (TILE_W + GAP_TILE)
+        cv.setFillColor(accent)
+        cv.drawCentredString(tx + TILE_W / 2, TILES_Y - 24 * mm, icon)
+
+    cv.restoreState()
+
+
+def _codigo_verificacion(numero, fecha, cantidad_f, recibide):
+    """Código único del recibo: TUR-AÑO-NUMERO-HASH4"""
+    año_str  = str(fecha).split("-")[-1] if "-" in str(fecha) else "2026"
+    raw      = f"{numero}-{fecha}-{cantidad_f}-{recibide}"
+    hash4    = hashlib.md5(raw.encode()).hexdigest()[:4].upper()
+    return f"TUR-{año_str}-{str(int(numero)).zfill(4)}-{hash4}"
+
+
+# ── Función principal ──────────────────────────────────────────────────────
+def dibujar_recibo(
+    cv,
+    numero,
+    fecha,
+    recibide,
+    cantidad,
+    concepto,
+    forma_pago,
+    agente,
+    logo_path="logo_turismar_clean.png",
+    total_viaje=None,
+    pagado_acumulado=None,
+    nuevo_saldo=None,
+):
+    """Dibuja un recibo en la página actual del canvas (sin cerrar la página)."""
+    num_str    = str(int(numero)).zfill(4)
+    cantidad_f = float(cantidad)
+    en_letras  = _cantidad_en_letras(cantidad_f)
+    pago_acum  = pagado_acumulado if pagado_acumulado is not None else cantidad_f
+
+    PLANTILLA.colocar(cv)
+    _dibujar_translucidos(cv)
+
+    # ── Logo (zona blanca, lado izquierdo) ────────────────────────────
+    try:
+        dibujar_imagen(cv, logo_path, LOGO_X, LOGO_Y, LOGO_SIZE, LOGO_SIZE)
+    except Exception:
+        pass
+
+    # ── Número de recibo y fecha en el folio ──────────────────────────
+    cv.setFillColor(YELLOW)
+    cv.setFont("Helvetica-Bold", 28)
+    cv.drawCentredString(NUM_CX, NUM_CY + 2 * mm, f"# {num_str}")
+
+    cv.setFillColor(colors.HexColor("#CCE8F4"))
+    cv.setFont("Helvetica", 6.5)
+    cv.drawCentredString(NUM_CX, NUM_CY - 8 * mm, fecha)
+
+    # ── Valores de los campos ─────────────────────────────────────────
+    valores = [
+        (fecha,                   None),
+        (recibide,                None),
+        (f"$ {cantidad_f:,.2f}",  GREEN_DARK),
+        (en_letras,               None),
+        (concepto,                None),
+        (forma_pago,              None),
+        (agente,                  None),
+    ]
+    y_pos = CAMPOS_Y0
+    for (_, highlight, multiline), (value, value_color) in zip(CAMPOS, valores):
+        cv.setFillColor(value_color if value_color else DARK)
+        if multiline:
+            # Para texto largo: máximo 2 líneas
+            text  = str(value)
+            words = text.split()
+            lines, line = [], ""
+            max_chars = 68
+            for w in words:
+                if len(line) + len(w) + 1 <= max_chars:
+                    line = (line + " " + w).strip()
+                else:
+                    lines.append(line); line = w
+            if line:
+                lines.append(line)
+            cv.setFont("Helvetica", 7.5)
+            for i, ln in enumerate(lines[:2]):
+                cv.drawString(VAL_X + 2.5 * mm, y_pos - 3.5 * mm - i * 5, ln)
+        else:
+            cv.setFont("Helvetica-Bold" if highlight else "Helvetica", 8.2)
+            cv.drawString(VAL_X + 2.5 * mm, y_pos - ROW_H / 2 - 1.5, str(value))
+        y_pos -= CAMPO_PASO
+
+    # ── Montos del desglose ───────────────────────────────────────────
+    montos = [_fmt_monto(total_viaje), _fmt_monto(pago_acum), _fmt_monto(nuevo_saldo)]
+    for i, ((_, _, _, val_color, _), val_text) in enumerate(zip(TILES, montos)):
+        tx = INNER_X + i * (TILE_W + GAP_TILE)
+        cv.setFillColor(val_color)
+        font_size = 14 if len(val_text) <= 12 else 11
+        cv.setFont("Helvetica-Bold", font_size)
+        cv.drawCentredString(tx + TILE_W / 2, TILES_Y - 16 * mm, val_text)
+
+    # ── Código de verificación (monoespaciado, simulado con Courier) ──
+    cv.setFillColor(DARK)
+    cv.setFont("Courier-Bold", 12)
+    cv.drawString(VERIF_X + 18 * mm, VERIF_Y + 4 * mm,
+                  _codigo_verificacion(numero, fecha, cantidad_f, recibide))
+
+
+def generar_recibo_pdf(
+    numero,
+    fecha,
+    recibide,
+    cantidad,
+    concepto,
+    forma_pago,
+    agente,
+    logo_path="logo_turismar_clean.png",
+    nina_path=None,         # ya no se usa, se mantiene por compatibilidad
+    sello_path=None,        # ya no se usa como imagen, se dibuja nativamente
+    total_viaje=None,
+    pagado_acumulado=None,
+    nuevo_saldo=None,
+) -> bytes:
+    """
+    Genera el recibo de abono en PDF y devuelve los bytes.
+
+    Parámetros
+    ----------
+    numero            : int  – número de recibo (4 dígitos con ceros)
+    fecha             : str  – fecha formateada, p.ej. "21-febrero-2026"
+    recibide          : str  – nombre del responsable del viaje
+    cantidad          : float – monto del abono
+    concepto          : str  – descripción del viaje / concepto
+    forma_pago        : str  – "Efectivo", "Transferencia", etc.
+    agente            : str  – nombre del agente / vendedora
+    logo_path         : str  – ruta al logo PNG
+    nina_path         : ignorado (compatibilidad)
+    sello_path        : ignorado (compatibilidad)
+    total_viaje       : float|None
+    pagado_acumulado  : float|None
+    nuevo_saldo       : float|None
+    """
+    buf = io.BytesIO()
+    cv  = CanvasPDF(buf, pagesize=A4)
+    dibujar_recibo(
+        cv, numero, fecha, recibide, cantidad, concepto, forma_pago, agente,
+        logo_path=logo_path, total_viaje=total_viaje,
+        pagado_acumulado=pagado_acumulado, nuevo_saldo=nuevo_saldo,
+    )
     cv.save()
     buf.seek(0)
     return buf.read()
@@ -0,0 +1,149 @@
+"""
+GRILLA DE VENTAS - Sistema Agencia Riviera Maya
+Consultas de la pestaña "Ver Ventas" de Riviera Maya: filtros de estado,
+vendedora y búsqueda resueltos en SQL, páginas por keyset (id descendente
+con cursor) y totales del encabezado en una sola consulta agregada.
+
+Cada rerun lee una página (PAGINA_VENTAS filas) y unas cuantas filas de
+totales, así que el costo no crece con el número de ventas registradas.
+Sin filtros, los totales salen de resumen_ventas (mantenida por triggers).
+La grilla une vendedoras con LEFT JOIN para que cuente las mismas ventas que
+el resumen, aunque la venta no tenga vendedora o ésta se haya borrado.
+"""
+
+from app_nucleo import ES_POSTGRES, PSYCOPG2_DISPONIBLE, conectar_db, consulta_cacheada, read_sql_query
+
+PAGINA_VENTAS = 50
+
+_COLUMNAS = """
+    v.id, v.cliente, v.celular_responsable, v.destino,
+    v.operador, v.tipo_habitacion, v.adultos, v.menores,
+    v.fecha_inicio, v.fecha_fin, v.noches,
+    v.precio_total, v.pagado, v.saldo,
+    v.porcentaje_ganancia, v.ganancia,
+    v.estado, COALESCE(vd.nombre, '—') AS vendedora, v.tipo_venta
+"""
+
+# Encabezados de la grilla, en el orden de _COLUMNAS
+ENCABEZADOS = ['ID', 'Cliente', 'Celular', 'Destino', 'Operador',
+               'Habitación', 'Adultos', 'Menores',
+               'Salida', 'Regreso', 'Noches',
+               'Total', 'Pagado', 'Saldo',
+               '% Ganancia', 'Ganancia',
+               'Estado', 'Vendedora', 'Tipo']
+
+
+def _filtros(estado=None, vendedora_id=None, buscar=None):
+    """WHERE de las ventas no cerradas con los filtros de la pestaña, y sus parámetros."""
+    condiciones, params = ["v.estado != 'CERRADO'"], []
+    if estado:
+        condiciones.append("v.estado = ?")
+        params.append(estado)
+    if vendedora_id:
+        condiciones.append("v.vendedora_id = ?")
+        params.append(int(vendedora_id))
+    buscar = (buscar or "").strip()
+    if buscar:
+        like = "ILIKE" if ES_POSTGRES and PSYCOPG2_DISPONIBLE else "LIKE"
+        condiciones.append(f"(v.cliente {like} ? OR v.destino {like} ?)")
+        patron = f"%{buscar}%"
+        params += [patron, patron]
+    return " AND ".join(condiciones), params
+
+
+def totales_ventas(estado=None, vendedora_id=None, buscar=None):
+    """{'ventas', 'total', 'pagado', 'saldo'} de las ventas no cerradas que pasan los filtros."""
+    conn = conectar_db()
+    try:
+        if not (estado or vendedora_id or (buscar or "").strip()):
+            sql, params = """
+                SELECT COALESCE(SUM(cantidad), 0), COALESCE(SUM(vendido), 0),
+                       COALESCE(SUM(cobrado), 0), COALESCE(SUM(saldo), 0)
+                FROM resumen_ventas
+                WHERE estado != 'CERRADO'
+            """, []
+        else:
+            where, params = _filtros(estado, vendedora_id, buscar)
+            sql = f"""
+                SELECT COUNT(*), COALESCE(SUM(v.precio_total), 0),
+                       COALESCE(SUM(v.pagado), 0), COALESCE(SUM(v.saldo), 0)
+                FROM ventas v
+                WHERE {where}
+            """
+        fila = read_sql_query(sql, conn, params=params).iloc[0]
+    finally:
+        conn.close()
+    return {"ventas": int(fila.iloc[0]), "total": float(fila.iloc[1]),
+            "pagado": float(fila.iloc[2]), "saldo": float(fila.iloc[3])}
+
+
+def pagina_ventas(estado=None, vendedora_id=None, buscar=None, antes_de=None, limite=PAGINA_VENTAS):
+    """
+    Una página de ventas (id descendente) con id menor que `antes_de`.
+    Devuelve (DataFrame con ENCABEZADOS, cursor de la página siguiente o None).
+    """
+    where, params = _filtros(estado, vendedora_id, buscar)
+    if antes_de is not None:
+        where += " AND v.id < ?"
+        params.append(int(antes_de))
+    conn = conectar_db()
+    try:
+        df = read_sql_query(f"""
+            SELECT {_COLUMNAS}
+            FROM ventas v
+            LEFT JOIN vendedoras vd ON v.vendedora_id = vd.id
+            WHERE {where}
+            ORDER BY v.id DESC
+            LIMIT ?
+        """, conn, params=params + [limite + 1])
+    finally:
+        conn.close()
+    df.columns = ENCABEZADOS
+    siguiente = None
+    if len(df) > limite:
+        df = df.iloc[:limite]
+        siguiente = int(df['ID'].iloc[-1])
+    return df, siguiente
+
+
+def ventas_filtradas(estado=None, vendedora_id=None, buscar=None):
+    """Todas las ventas que pasan los filtros (para el CSV; se pide sólo al descargar)."""
+    where, params = _filtros(estado, vendedora_id, buscar)
+    conn = conectar_db()
+    try:
+        df = read_sql_query(f"""
+            SELECT {_COLUMNAS}
+            FROM ventas v
+            LEFT JOIN vendedoras vd ON v.vendedora_id = vd.id
+            WHERE {where}
+            ORDER BY v.id DESC
+        """, conn, params=params)
+    finally:
+        conn.close()
+    df.columns = ENCABEZADOS
+    return df
+
+
+def estados_activos():
+    """Estados distintos de CERRADO que tienen ventas (para el filtro)."""
+    conn = conectar_db()
+    try:
+        df = read_sql_query("""
+            SELECT DISTINCT estado FROM resumen_ventas
+            WHERE estado != 'CERRADO' AND cantidad > 0
+            ORDER BY estado
+        """, conn)
+    finally:
+        conn.close()
+    return df['estado'].tolist()
+
+
+def vendedoras_con_ventas():
+    """[(id, nombre)] de las vendedoras con ventas no cerradas, activas o no (para el filtro)."""
+    return consulta_cacheada("""
+        SELECT vd.id, vd.nombre
+        FROM vendedoras vd
+        WHERE EXISTS (SELECT 1 FROM ventas v
+                      WHERE v.vendedora_id = vd.id AND v.estado != 'CERRADO')
+        ORDER BY vd.nombre
+    """)
@@ -1,6 +1,7 @@
 from database import conectar
 from datetime import datetime
 from operadores import seleccionar_operador
+from inventario_habitaciones import descontar_habitaciones
 
 
 def registrar_grupo():
@@ -278,23 +279,20 @@ def cambiar_estado_grupo():
     print(f"\n✅ Grupo {accion}.")
 
 
-def descontar_habitacion_grupo(grupo_id, cantidad=1):
-    """Descuenta habitaciones disponibles de un grupo"""
+def descontar_habitacion_grupo(grupo_id, cantidad=1, cursor=None):
+    """
+    Descuenta habitaciones disponibles de un grupo (sentencia condicional de
+    inventario_habitaciones; lo marca AGOTADO al llegar a 0).
+    Con `cursor`, dentro de la transacción de la venta. True si alcanzaban.
+    """
+    if cursor is not None:
+        return descontar_habitaciones(cursor, "grupo", grupo_id, cantidad)
+
     conexion = conectar()
-    cursor = conexion.cursor()
-    
-    cursor.execute("""
-        UPDATE grupos
-        SET habitaciones_vendidas = habitaciones_vendidas + ?,
-            habitaciones_disponibles = habitaciones_disponibles - ?
-        WHERE id = ? AND habitaciones_disponibles >= ?
-    """, (cantidad, cantidad, grupo_id, cantidad))
-    
-    affected = cursor.rowcount
+    vendidas = descontar_habitaciones(conexion.cursor(), "grupo", grupo_id, cantidad)
     conexion.commit()
     conexion.close()
-    
-    return affected > 0
+    return vendidas
 
 
 def reporte_grupos():
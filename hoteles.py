@@ -1,5 +1,6 @@
 from database import conectar
 from datetime import datetime
+from indice_hoteles import IndiceHoteles
 
 
 # Lista inicial de hoteles All-Inclusive de Riviera Maya
@@ -96,24 +97,21 @@ def cargar_hoteles_iniciales():
     conexion.close()
 
 
+_indice = None
+
+
+def indice_hoteles():
+    """Índice en memoria del catálogo (se carga la primera vez que se busca)"""
+    global _indice
+    if _indice is None:
+        _indice = IndiceHoteles(conectar)
+    return _indice
+
+
 def buscar_hoteles(texto_busqueda, limite=5):
-    """Busca hoteles que coincidan con el texto ingresado"""
-    conexion = conectar()
-    cursor = conexion.cursor()
-    
-    # Buscar hoteles activos que contengan el texto
-    cursor.execute("""
-        SELECT id, nombre, veces_usado
-        FROM hoteles
-        WHERE activo = 1 AND nombre LIKE ?
-        ORDER BY veces_usado DESC, nombre ASC
-        LIMIT ?
-    """, (f"%{texto_busqueda}%", limite))
-    
-    resultados = cursor.fetchall()
-    conexion.close()
-    
-    return resultados
+    """Busca hoteles que coincidan con el texto ingresado (sin acentos y con errores de dedo)"""
+    return [(h["id"], h["nombre"], h["veces_usado"])
+            for h in indice_hoteles().buscar(texto_busqueda, limite)]
 
 
 def seleccionar_hotel():
@@ -205,6 +203,7 @@ def agregar_hotel_automatico(nombre_hotel):
         conexion.commit()
     
     conexion.close()
+    indice_hoteles().refrescar(nombre=nombre_hotel)
 
 
 def incrementar_uso(id_hotel):
@@ -220,6 +219,7 @@ def incrementar_uso(id_hotel):
     
     conexion.commit()
     conexion.close()
+    indice_hoteles().registrar_uso(id_hotel)
 
 
 def ver_hoteles():
@@ -286,6 +286,7 @@ def editar_hotel():
     
     conexion.commit()
     conexion.close()
+    indice_hoteles().refrescar(id_hotel)
     
     print("✅ Hotel actualizado.")
 
@@ -321,6 +322,7 @@ def cambiar_estado_hotel():
     
     conexion.commit()
     conexion.close()
+    indice_hoteles().refrescar(id_hotel)
     
     estado_texto = "ACTIVO" if nuevo_estado == 1 else "INACTIVO"
     print(f"✅ Hotel ahora está {estado_texto}")
@@ -352,3 +354,4 @@ def agregar_hotel_manual():
         print("❌ Ya existe un hotel con ese nombre.")
     
     conexion.close()
+    indice_hoteles().refrescar(nombre=nombre)
@@ -0,0 +1,249 @@
+"""
+ÍNDICE DE HOTELES - Sistema Agencia Riviera Maya
+Catálogo de hoteles en memoria para el autocompletado: se carga una vez y
+se busca por prefijo de palabra y por trigramas, sin tocar la base en cada
+tecla.
+
+    - Sin acentos ni mayúsculas: "barcelo" encuentra "Barceló Maya Palace".
+    - Tolera errores de dedo por trigramas: "barselo", "xcatet".
+    - Todas las palabras buscadas deben coincidir con alguna del hotel.
+    - A igual coincidencia gana el hotel más usado (veces_usado).
+
+Los cambios se aplican por fila: refrescar(id) relee sólo ese hotel y
+registrar_uso(id) suma el uso en memoria. marcar_pendiente() deja que la
+siguiente lectura compare el catálogo con la base y reindexe sólo las filas
+que cambiaron.
+
+`conectar` es la función que abre la conexión (conectar_db de la app o
+database.conectar en consola), como en ServicioTipoCambio.
+"""
+
+import math
+import re
+import threading
+import time
+import unicodedata
+from collections import defaultdict
+
+SIMILITUD_MIN = 0.45     # coeficiente de Dice entre trigramas para aceptar un error de dedo
+PESO_USO = 0.15          # cuánto empuja veces_usado (escala logarítmica)
+REFRESCO_S = 300         # seg; acota los cambios hechos por fuera del proceso
+
+_RE_PALABRA = re.compile(r"\w+")
+
+_COLUMNAS = ("id", "nombre", "veces_usado", "activo", "direccion", "telefono", "estrellas")
+_SQL_COMPLETO = """
+    SELECT id, nombre, COALESCE(veces_usado, 0), COALESCE(activo, 1),
+           COALESCE(direccion, ''), COALESCE(telefono, ''), COALESCE(estrellas, 4)
+    FROM hoteles
+"""
+# Bases viejas sin las columnas del cupón
+_SQL_BASICO = """
+    SELECT id, nombre, COALESCE(veces_usado, 0), COALESCE(activo, 1), '', '', 4
+    FROM hoteles
+"""
+
+
+def normalizar(texto):
+    """Minúsculas, sin acentos y sólo letras/números separados por un espacio."""
+    texto = unicodedata.normalize("NFKD", str(texto or "").lower())
+    texto = "".join(c for c in texto if not unicodedata.combining(c))
+    return " ".join(_RE_PALABRA.findall(texto))
+
+
+def _trigramas(palabra):
+    relleno = f"  {palabra} "
+    return {relleno[i:i + 3] for i in range(len(relleno) - 2)}
+
+
+def _dice(a, b):
+    return 2 * len(a & b) / (len(a) + len(b)) if a and b else 0.0
+
+
+class IndiceHoteles:
+    """Hoteles por prefijo de palabra y por trigrama, ordenados por uso."""
+
+    def __init__(self, conectar, refresco=REFRESCO_S):
+        self._conectar = conectar
+        self._refresco = refresco
+        self._lock = threading.RLock()
+        self._hoteles = {}                     # id -> dict con _COLUMNAS
+        self._palabras = {}                    # id -> [palabras normalizadas]
+        self._prefijos = defaultdict(set)      # prefijo de palabra -> {ids}
+        self._por_trigrama = defaultdict(set)  # trigrama -> {ids}
+        self._trigramas_palabra = {}           # palabra -> trigramas (memo)
+        self._por_nombre = {}                  # nombre exacto -> id
+        self._ranking = None                   # ids activos por uso (se arma al pedirlo)
+        self._pendiente = True
+        self._cargado_en = 0.0
+
+    # ── Carga y sincronización ────────────────────────────
+    def _leer(self, where="", params=()):
+        conn = self._conectar()
+        try:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(_SQL_COMPLETO + where, params)
+            except Exception:
+                conn.rollback()
+                cursor = conn.cursor()
+                cursor.execute(_SQL_BASICO + where, params)
+            return [dict(zip(_COLUMNAS, fila)) for fila in cursor.fetchall()]
+        finally:
+            conn.close()
+
+    def marcar_pendiente(self):
+        """La siguiente lectura compara el catálogo con la base."""
+        self._pendiente = True
+
+    def sincronizar(self):
+        """Relee la tabla y reindexa sólo los hoteles nuevos, cambiados o borrados."""
+        filas = {f["id"]: f for f in self._leer()}
+        with self._lock:
+            for id_hotel in set(self._hoteles) - set(filas):
+                self._quitar(id_hotel)
+            for id_hotel, fila in filas.items():
+                if self._hoteles.get(id_hotel) != fila:
+                    self._poner(fila)
+            self._pendiente = False
+            self._cargado_en = time.monotonic()
+
+    def _vigente(self):
+        if self._pendiente or time.monotonic() - self._cargado_en > self._refresco:
+            self.sincronizar()
+
+    def refrescar(self, id_hotel=None, nombre=None):
+        """Relee un hotel (por id o por nombre) después de escribirlo en la base."""
+        if self._pendiente:
+            return       # aún sin cargar: la próxima lectura trae el catálogo completo
+        if id_hotel is not None:
+            filas = self._leer(" WHERE id = ?", (id_hotel,))
+        else:
+            filas = self._leer(" WHERE nombre = ?", (nombre,))
+        with self._lock:
+            if id_hotel is not None and not filas:
+                self._quitar(id_hotel)
+            for fila in filas:
+                self._poner(fila)
+
+    def registrar_uso(self, id_hotel):
+        """Suma un uso en memoria (la base ya se actualizó)."""
+        with self._lock:
+            hotel = self._hoteles.get(id_hotel)
+            if hotel is not None:
+                hotel["veces_usado"] += 1
+                self._ranking = None
+
+    # ── Mantenimiento de los mapas ────────────────────────
+    def _quitar(self, id_hotel):
+        hotel = self._hoteles.pop(id_hotel, None)
+        if hotel is None:
+            return
+        if self._por_nombre.get(hotel["nombre"]) == id_hotel:
+            del self._por_nombre[hotel["nombre"]]
+        for palabra in self._palabras.pop(id_hotel, ()):
+            for i in range(1, len(palabra) + 1):
+                self._descartar(self._prefijos, palabra[:i], id_hotel)
+            for trigrama in self._trigramas_de(palabra):
+                self._descartar(self._por_trigrama, trigrama, id_hotel)
+        self._ranking = None
+
+    def _poner(self, fila):
+        self._quitar(fila["id"])
+        fila = dict(fila)
+        palabras = normalizar(fila["nombre"]).split()
+        self._hoteles[fila["id"]] = fila
+        self._palabras[fila["id"]] = palabras
+        self._por_nombre[fila["nombre"]] = fila["id"]
+        for palabra in palabras:
+            for i in range(1, len(palabra) + 1):
+                self._prefijos[palabra[:i]].add(fila["id"])
+            for trigrama in self._trigramas_de(palabra):
+                self._por_trigrama[trigrama].add(fila["id"])
+        self._ranking = None
+
+    @staticmethod
+    def _descartar(mapa, clave, id_hotel):
+        ids = mapa.get(clave)
+        if ids is not None:
+            ids.discard(id_hotel)
+            if not ids:
+                del mapa[clave]
+
+    def _trigramas_de(self, palabra):
+        trigramas = self._trigramas_palabra.get(palabra)
+        if trigramas is None:
+            trigramas = self._trigramas_palabra[palabra] = _trigramas(palabra)
+        return trigramas
+
+    # ── Búsqueda ──────────────────────────────────────────
+    def _candidatos(self, palabra):
+        """{id: puntaje} de los hoteles con alguna palabra parecida a `palabra`."""
+        puntajes = dict.fromkeys(self._prefijos.get(palabra, ()), 1.0)
+        if len(palabra) < 3:
+            return puntajes      # muy corta para trigramas: sólo prefijo
+        trigramas = _trigramas(palabra)
+        vistos = set()
+        for trigrama in trigramas:
+            vistos |= self._por_trigrama.get(trigrama, set())
+        for id_hotel in vistos - puntajes.keys():
+            mejor = max(_dice(trigramas, self._trigramas_de(p)) for p in self._palabras[id_hotel])
+            if mejor >= SIMILITUD_MIN:
+                puntajes[id_hotel] = 0.9 * mejor
+        return puntajes
+
+    def buscar(self, texto, limite=10, incluir_inactivos=False):
+        """
+        Hoteles que coinciden con `texto`, mejor coincidencia primero.
+        Lista de dicts (id, nombre, veces_usado, activo, direccion, telefono, estrellas).
+        """
+        palabras = normalizar(texto).split()
+        if not palabras:
+            return []
+        self._vigente()
+        with self._lock:
+            total = None
+            for palabra in palabras:
+                puntajes = self._candidatos(palabra)
+                if total is None:
+                    total = puntajes
+                else:
+                    total = {i: total[i] + p for i, p in puntajes.items() if i in total}
+                if not total:
+                    return []
+            resultado = []
+            for id_hotel, puntaje in total.items():
+                hotel = self._hoteles[id_hotel]
+                if not incluir_inactivos and not hotel["activo"]:
+                    continue
+                peso = puntaje / len(palabras) * (1 + PESO_USO * math.log1p(hotel["veces_usado"]))
+                resultado.append((-peso, -hotel["veces_usado"], hotel["nombre"], id_hotel))
+            resultado.sort()
+            return [dict(self._hoteles[r[3]]) for r in resultado[:limite]]
+
+    # ── Catálogo ──────────────────────────────────────────
+    def _activos(self):
+        if self._ranking is None:
+            activos = [h for h in self._hoteles.values() if h["activo"]]
+            activos.sort(key=lambda h: (-h["veces_usado"], h["nombre"]))
+            self._ranking = [h["id"] for h in activos]
+        return self._ranking
+
+    def activos(self):
+        """Hoteles activos, del más usado al menos usado (dicts)."""
+        self._vigente()
+        with self._lock:
+            return [dict(self._hoteles[i]) for i in self._activos()]
+
+    def nombres(self):
+        """Nombres de los hoteles activos, del más usado al menos usado."""
+        self._vigente()
+        with self._lock:
+            return [self._hoteles[i]["nombre"] for i in self._activos()]
+
+    def por_nombre(self, nombre):
+        """El hotel con ese nombre exacto (dict) o None."""
+        self._vigente()
+        with self._lock:
+            id_hotel = self._por_nombre.get(nombre)
+            return dict(self._hoteles[id_hotel]) if id_hotel is not None else None
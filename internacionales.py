@@ -1,81 +1,21 @@
 from database import conectar
 from datetime import datetime, timedelta
-import urllib.request
-import json
-import re
-
-
-def obtener_tipo_cambio_megatravel():
-    """
-    Obtiene el tipo de cambio USD/MXN desde Megatravel
-    Si es sábado, usa el del viernes (restar 1 día)
-    Si es domingo, usa el del viernes (restar 2 días)
-    """
-    try:
-        # Verificar si es fin de semana
-        hoy = datetime.now()
-        dia_semana = hoy.weekday()  # 0=Lunes, 5=Sábado, 6=Domingo
-        
-        url = "https://www.megatravel.com.mx/"
-        
-        # Crear request con headers para simular navegador
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        
-        req = urllib.request.Request(url, headers=headers)
-        
-        with urllib.request.urlopen(req, timeout=10) as response:
-            html = response.read().decode('utf-8')
-            
-            # Buscar el tipo de cambio en el HTML
-            # Patrón: "Tipo de\n\nCambio\n\n17.29" o similar
-            patron = r'Tipo de\s+Cambio\s+([\d.]+)'
-            match = re.search(patron, html)
-            
-            if match:
-                tipo_cambio = float(match.group(1))
-                
-                # Mostrar mensaje si es fin de semana
-                if dia_semana == 5:  # Sábado
-                    print(f"\n📅 Hoy es sábado. Usando tipo de cambio del viernes.")
-                elif dia_semana == 6:  # Domingo
-                    print(f"\n📅 Hoy es domingo. Usando tipo de cambio del viernes.")
-                
-                print(f"💱 Tipo de cambio Megatravel: $1 USD = ${tipo_cambio:.2f} MXN")
-                return tipo_cambio
-            else:
-                print("⚠️ No se pudo extraer el tipo de cambio de Megatravel.")
-                return None
-                
-    except Exception as e:
-        print(f"⚠️ Error al obtener tipo de cambio de Megatravel: {e}")
-        return None
+from tipo_cambio import ServicioTipoCambio
 
 
 def obtener_tipo_cambio():
     """
-    Obtiene el tipo de cambio USD/MXN
-    Primero intenta desde Megatravel, luego API de respaldo
+    Obtiene el tipo de cambio USD/MXN del día (tabla tipos_cambio).
+    Si aún no está guardado lo consulta (Megatravel, luego API de respaldo).
+    Sábado y domingo usan el del viernes.
     """
-    # Intentar obtener de Megatravel primero
-    tipo_cambio = obtener_tipo_cambio_megatravel()
-    
+    print("\n💱 Consultando tipo de cambio...")
+    tipo_cambio, fuente = ServicioTipoCambio(conectar).obtener(esperar=15)
     if tipo_cambio:
-        return tipo_cambio
-    
-    # Si falla, intentar API de respaldo
-    try:
-        print("\n⚠️ Intentando API de respaldo...")
-        url = "https://api.exchangerate-api.com/v4/latest/USD"
-        with urllib.request.urlopen(url, timeout=5) as response:
-            data = json.loads(response.read().decode())
-            tipo_cambio = data['rates']['MXN']
-            print(f"💱 Tipo de cambio (API respaldo): $1 USD = ${tipo_cambio:.2f} MXN")
-            return tipo_cambio
-    except:
-        # Si todo falla, permitir ingreso manual
-        return None
+        print(f"💱 Tipo de cambio {fuente}: $1 USD = ${tipo_cambio:.2f} MXN")
+    else:
+        print("⚠️ No se pudo obtener el tipo de cambio.")
+    return tipo_cambio
 
 
 def registrar_viaje_internacional():
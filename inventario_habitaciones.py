@@ -0,0 +1,182 @@
+"""
+INVENTARIO DE HABITACIONES - Sistema Agencia Riviera Maya
+Venta y apartado de habitaciones de bloqueos y grupos sin sobreventa, en
+SQLite y PostgreSQL.
+
+Cada venta descuenta con una sola sentencia condicional:
+
+    UPDATE bloqueos SET ... habitaciones_disponibles = habitaciones_disponibles - n
+    WHERE id = ? AND estado = 'ACTIVO' AND habitaciones_disponibles >= n
+
+Si dos vendedoras cierran las últimas habitaciones al mismo tiempo, la
+segunda actualiza 0 filas y recibe False: nunca se lee la disponibilidad en
+un paso y se escribe en otro. SQLite admite un solo escritor a la vez y
+PostgreSQL vuelve a evaluar el WHERE sobre la fila ya bloqueada, así que la
+condición se cumple en los dos motores. Al llegar a 0 el inventario queda
+AGOTADO en la misma sentencia.
+
+Apartados: mientras una vendedora captura pasajeros puede apartar las
+habitaciones por APARTADO_MINUTOS. El apartado las descuenta de
+disponibles (con la misma condición) y queda en apartados_habitaciones con
+su vencimiento; el inventario sigue ACTIVO mientras tanto. Al registrar la
+venta se confirma (pasan a vendidas y, si ya no queda ninguna, AGOTADO) y
+si vence o se libera vuelven a disponibles. Los vencidos se devuelven al
+apartar y al listar inventario; no hace falta un proceso aparte.
+
+Las funciones reciben el cursor de la transacción de la venta: el descuento
+y el INSERT de la venta se confirman o se descartan juntos.
+
+Prueba de concurrencia:
+    python prueba_inventario.py
+"""
+
+import os
+import uuid
+from datetime import datetime, timedelta
+
+APARTADO_MINUTOS = float(os.environ.get("APARTADO_MINUTOS", "15"))
+
+# tipo de inventario -> tabla (ambas con habitaciones_vendidas / _disponibles y estado)
+INVENTARIOS = {"bloqueo": "bloqueos", "grupo": "grupos"}
+
+_CREAR_TABLA = """
+    CREATE TABLE IF NOT EXISTS apartados_habitaciones (
+        clave TEXT PRIMARY KEY,
+        tipo TEXT NOT NULL,
+        inventario_id INTEGER NOT NULL,
+        cantidad INTEGER NOT NULL,
+        apartado_por TEXT,
+        fecha TEXT NOT NULL,
+        expira TEXT NOT NULL
+    )
+"""
+_CREAR_INDICE = """
+    CREATE INDEX IF NOT EXISTS idx_apartados_habitaciones_expira
+    ON apartados_habitaciones (expira)
+"""
+
+
+def _tabla(tipo):
+    if tipo not in INVENTARIOS:
+        raise ValueError(f"Tipo de inventario desconocido: {tipo}")
+    return INVENTARIOS[tipo]
+
+
+def _ahora():
+    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+
+def instalar_apartados(conn):
+    """Crea la tabla de apartados (idempotente)."""
+    cursor = conn.cursor()
+    cursor.execute(_CREAR_TABLA)
+    cursor.execute(_CREAR_INDICE)
+    conn.commit()
+
+
+# ── Venta ─────────────────────────────────────────────────────────────────
+
+def descontar_habitaciones(cursor, tipo, inventario_id, cantidad=1):
+    """
+    Vende `cantidad` habitaciones del bloqueo o grupo en una sola sentencia.
+    True si alcanzaban; False si no (otra venta se las llevó o ya no está ACTIVO).
+    """
+    cursor.execute(f"""
+        UPDATE {_tabla(tipo)}
+        SET habitaciones_vendidas    = habitaciones_vendidas + ?,
+            habitaciones_disponibles = habitaciones_disponibles - ?,
+            estado = CASE WHEN habitaciones_disponibles = ? THEN 'AGOTADO' ELSE estado END
+        WHERE id = ? AND estado = 'ACTIVO' AND habitaciones_disponibles >= ?
+    """, (cantidad, cantidad, cantidad, inventario_id, cantidad))
+    return cursor.rowcount == 1
+
+
+# ── Apartados ─────────────────────────────────────────────────────────────
+
+def apartar_habitaciones(cursor, tipo, inventario_id, cantidad=1, apartado_por=None,
+                         minutos=APARTADO_MINUTOS):
+    """
+    Aparta `cantidad` habitaciones por `minutos`. Devuelve la clave del
+    apartado, o None si no alcanzan.
+    """
+    liberar_apartados_vencidos(cursor)
+    cursor.execute(f"""
+        UPDATE {_tabla(tipo)}
+        SET habitaciones_disponibles = habitaciones_disponibles - ?
+        WHERE id = ? AND estado = 'ACTIVO' AND habitaciones_disponibles >= ?
+    """, (cantidad, inventario_id, cantidad))
+    if cursor.rowcount != 1:
+        return None
+    ahora = datetime.now()
+    clave = uuid.uuid4().hex
+    cursor.execute("""
+        INSERT INTO apartados_habitaciones
+            (clave, tipo, inventario_id, cantidad, apartado_por, fecha, expira)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    """, (clave, tipo, inventario_id, cantidad, apartado_por,
+          ahora.strftime("%Y-%m-%d %H:%M:%S"),
+          (ahora + timedelta(minutes=minutos)).strftime("%Y-%m-%d %H:%M:%S")))
+    return clave
+
+
+def consultar_apartado(cursor, clave):
+    """{'tipo', 'inventario_id', 'cantidad', 'expira'} del apartado vigente, o None."""
+    cursor.execute("""
+        SELECT tipo, inventario_id, cantidad, expira FROM apartados_habitaciones
+        WHERE clave = ? AND expira > ?
+    """, (clave, _ahora()))
+    fila = cursor.fetchone()
+    return dict(zip(("tipo", "inventario_id", "cantidad", "expira"), fila)) if fila else None
+
+
+def confirmar_apartado(cursor, clave):
+    """
+    Convierte el apartado en venta (sus habitaciones pasan a vendidas).
+    False si ya venció o se liberó: la venta debe intentar descontar_habitaciones.
+    """
+    apartado = consultar_apartado(cursor, clave)
+    if apartado is None:
+        return False
+    # El DELETE decide: si otra sesión lo liberó entre la lectura y aquí, borra 0 filas
+    cursor.execute("DELETE FROM apartados_habitaciones WHERE clave = ?", (clave,))
+    if cursor.rowcount != 1:
+        return False
+    cursor.execute(f"""
+        UPDATE {_tabla(apartado['tipo'])}
+        SET habitaciones_vendidas = habitaciones_vendidas + ?,
+            estado = CASE WHEN habitaciones_disponibles = 0 AND estado = 'ACTIVO'
+                          THEN 'AGOTADO' ELSE estado END
+        WHERE id = ?
+    """, (apartado["cantidad"], apartado["inventario_id"]))
+    return True
+
+
+def _devolver(cursor, clave, tipo, inventario_id, cantidad):
+    cursor.execute("DELETE FROM apartados_habitaciones WHERE clave = ?", (clave,))
+    if cursor.rowcount != 1:
+        return False
+    cursor.execute(f"""
+        UPDATE {_tabla(tipo)}
+        SET habitaciones_disponibles = habitaciones_disponibles + ?,
+            estado = CASE WHEN estado = 'AGOTADO' THEN 'ACTIVO' ELSE estado END
+        WHERE id = ?
+    """, (cantidad, inventario_id))
+    return True
+
+
+def liberar_apartado(cursor, clave):
+    """Devuelve a disponibles las habitaciones del apartado. False si ya no existía."""
+    cursor.execute("""
+        SELECT tipo, inventario_id, cantidad FROM apartados_habitaciones WHERE clave = ?
+    """, (clave,))
+    fila = cursor.fetchone()
+    return bool(fila) and _devolver(cursor, clave, *fila)
+
+
+def liberar_apartados_vencidos(cursor):
+    """Devuelve a disponibles los apartados vencidos. Regresa cuántos liberó."""
+    cursor.execute("""
+        SELECT clave, tipo, inventario_id, cantidad FROM apartados_habitaciones
+        WHERE expira <= ?
+    """, (_ahora(),))
+    return sum(_devolver(cursor, *fila) for fila in cursor.fetchall())
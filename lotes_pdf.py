@@ -0,0 +1,224 @@
+"""
+LOTES PDF - Sistema Agencia Riviera Maya
+Genera de una vez todos los recibos o cupones de un bloqueo, un grupo o un
+viaje nacional, en lugar de imprimirlos uno por uno desde el historial de
+abonos.
+
+Formatos:
+    pdf  un solo PDF con una página por documento (la plantilla de la página
+         va una sola vez en el archivo)
+    zip  un PDF por documento; se reparten entre varios procesos
+
+Los datos se leen de la base en el proceso de la app; a los procesos sólo
+viajan los argumentos de generar_recibo_pdf / generar_cupon_pdf.
+"""
+
+import io
+import os
+import zipfile
+import multiprocessing
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+LOTES_PDF_PROCESOS = int(os.environ.get("LOTES_PDF_PROCESOS", str(min(4, os.cpu_count() or 1))))
+LOTE_MINIMO_PARALELO = 200    # arrancar cada proceso (spawn + importar reportlab) cuesta ~1 s
+
+ORIGENES = {
+    "bloqueo": "Bloqueo",
+    "grupo":   "Grupo",
+    "viaje":   "Viaje nacional",
+}
+DOCUMENTOS = {
+    "recibo": "Recibos",
+    "cupon":  "Cupones",
+}
+FORMATOS = {
+    "pdf": "PDF único",
+    "zip": "ZIP (un PDF por documento)",
+}
+
+_MESES = ["", "enero", "febrero", "marzo", "abril", "mayo", "junio", "julio",
+          "agosto", "septiembre", "octubre", "noviembre", "diciembre"]
+
+_FILTRO_VENTAS = {"bloqueo": "v.bloqueo_id = ?", "grupo": "v.grupo_id = ?"}
+
+
+def fecha_recibo(fecha=None):
+    """Fecha como la imprimen los recibos: 21-febrero-2026"""
+    fecha = fecha or datetime.now()
+    return f"{fecha.day:02d}-{_MESES[fecha.month]}-{fecha.year}"
+
+
+def _validar(origen, documento):
+    if origen not in ORIGENES:
+        raise ValueError(f"Origen desconocido: {origen}")
+    if documento not in DOCUMENTOS:
+        raise ValueError(f"Documento desconocido: {documento}")
+    if documento == "cupon" and origen == "viaje":
+        raise ValueError("Los cupones de hotel sólo aplican a bloqueos y grupos de Riviera Maya")
+
+
+# ─── DATOS ───────────────────────────────────────────────────────────────────
+
+def _filas(conn, sql, params):
+    cursor = conn.cursor()
+    cursor.execute(sql, params)
+    return cursor.fetchall()
+
+
+def _abonos(conn, origen, origen_id):
+    """(abono_id, cliente, monto, metodo, concepto, total, pagado, saldo) del origen."""
+    if origen == "viaje":
+        return _filas(conn, """
+            SELECT an.id, cn.nombre_cliente, an.monto, an.metodo_pago, 'Abono - Viaje Nacional',
+                   cn.total_pagar, cn.total_abonado, cn.saldo
+            FROM abonos_nacionales an
+            JOIN clientes_nacionales cn ON cn.id = an.cliente_id
+            WHERE cn.viaje_id = ?
+            ORDER BY cn.nombre_cliente, an.fecha, an.id
+        """, (origen_id,))
+    return _filas(conn, f"""
+        SELECT a.id, v.cliente, a.monto, a.metodo_pago, 'Abono - ' || v.destino,
+               v.precio_total, v.pagado, v.saldo
+        FROM abonos a
+        JOIN ventas v ON v.id = a.venta_id
+        WHERE {_FILTRO_VENTAS[origen]}
+        ORDER BY v.cliente, a.fecha, a.id
+    """, (origen_id,))
+
+
+def _ventas_cupon(conn, origen, origen_id):
+    return _filas(conn, f"""
+        SELECT v.id, v.cliente, v.destino, v.tipo_habitacion, v.fecha_inicio, v.fecha_fin,
+               v.adultos, v.menores, v.clave_confirmacion, v.plan_alimento,
+               v.edades_menores, v.requerimientos_especiales
+        FROM ventas v
+        WHERE {_FILTRO_VENTAS[origen]}
+        ORDER BY v.cliente, v.id
+    """, (origen_id,))
+
+
+def contar_lote(conn, origen, origen_id, documento):
+    """(documentos a generar, ventas omitidas por no tener clave de confirmación)."""
+    _validar(origen, documento)
+    if documento == "recibo":
+        return len(_abonos(conn, origen, origen_id)), 0
+    ventas = _ventas_cupon(conn, origen, origen_id)
+    con_clave = sum(1 for v in ventas if (v[8] or "").strip())
+    return con_clave, len(ventas) - con_clave
+
+
+def tareas_lote(conn, origen, origen_id, documento, agente, reservar_folios, logo_path):
+    """
+    Lista de (documento, nombre_archivo, kwargs) listos para generar.
+    `reservar_folios(n)` da n números de recibo nuevos (sólo se usa para recibos).
+    """
+    _validar(origen, documento)
+    tareas = []
+    if documento == "recibo":
+        fecha = fecha_recibo()
+        abonos = _abonos(conn, origen, origen_id)
+        folios = reservar_folios(len(abonos)) if abonos else []
+        for numero, (abono_id, cliente, monto, metodo, concepto, total, pagado, saldo) in zip(folios, abonos):
+            tareas.append(("recibo", f"recibo_{str(numero).zfill(4)}_{_nombre_archivo(cliente)}.pdf", dict(
+                numero=numero, fecha=fecha, recibide=cliente, cantidad=monto,
+                concepto=concepto, forma_pago=metodo or "Efectivo", agente=agente,
+                logo_path=logo_path, total_viaje=total, pagado_acumulado=pagado, nuevo_saldo=saldo,
+            )))
+        return tareas
+
+    hoteles = {r[0]: r for r in _filas(conn, """
+        SELECT nombre, COALESCE(direccion, ''), COALESCE(telefono, ''), COALESCE(estrellas, 4)
+        FROM hoteles
+    """, ())}
+    for (venta_id, cliente, destino, habitacion, entrada, salida, adultos, menores,
+         clave, plan, edades, requerimientos) in _ventas_cupon(conn, origen, origen_id):
+        if not (clave or "").strip():
+            continue
+        _, direccion, telefono, estrellas = hoteles.get(destino, (destino, "", "", 4))
+        tareas.append(("cupon", f"cupon_{venta_id}_{_nombre_archivo(cliente)}.pdf", dict(
+            titular=cliente, clave_confirm=clave.strip(), hotel_nombre=destino,
+            hotel_direccion=direccion, hotel_telefono=telefono, hotel_estrellas=estrellas,
+            tipo_habitacion=habitacion or "", plan_alimento=plan or "Todo incluido",
+            fecha_entrada=entrada, fecha_salida=salida, adultos=int(adultos), menores=int(menores),
+            edades_menores=edades or "", requerimientos=requerimientos or "", logo_path=logo_path,
+        )))
+    return tareas
+
+
+def _nombre_archivo(texto):
+    return "".join(c if c.isalnum() else "_" for c in str(texto))[:20]
+
+
+# ─── GENERACIÓN ──────────────────────────────────────────────────────────────
+
+def _generar_bloque(tareas):
+    """En el proceso hijo: [(nombre_archivo, bytes)] de un bloque de tareas."""
+    from generar_recibo import generar_recibo_pdf
+    from generar_cupon import generar_cupon_pdf
+    generadores = {"recibo": generar_recibo_pdf, "cupon": generar_cupon_pdf}
+    return [(nombre, generadores[documento](**datos)) for documento, nombre, datos in tareas]
+
+
+def _pdf_unico(tareas, progreso):
+    from reportlab.lib.pagesizes import A4
+    from pdf_assets import CanvasPDF
+    from generar_recibo import dibujar_recibo
+    from generar_cupon import dibujar_cupon
+
+    buf = io.BytesIO()
+    cv = CanvasPDF(buf, pagesize=A4)
+    for i, (documento, _, datos) in enumerate(tareas, 1):
+        if documento == "recibo":
+            dibujar_recibo(cv, **datos)
+        else:
+            dibujar_cupon(cv, **datos)
+        cv.showPage()
+        if i % 10 == 0:
+            progreso(0.1 + 0.85 * i / len(tareas), f"{i} de {len(tareas)} páginas")
+    cv.save()
+    return buf.getvalue()
+
+
+def _zip(tareas, progreso, procesos):
+    archivos = []
+    if procesos > 1 and len(tareas) >= LOTE_MINIMO_PARALELO:
+        # Bloques chicos para ir reportando avance; 'spawn' porque el servidor
+        # de Streamlit tiene hilos y hacer fork con hilos vivos puede colgarse
+        tam = max(1, len(tareas) // (procesos * 4))
+        bloques = [tareas[i:i + tam] for i in range(0, len(tareas), tam)]
+        contexto = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=procesos, mp_context=contexto) as ejecutor:
+            futuros = {ejecutor.submit(_generar_bloque, b): i for i, b in enumerate(bloques)}
+            resultados = [None] * len(bloques)
+            for hechos, futuro in enumerate(as_completed(futuros), 1):
+                resultados[futuros[futuro]] = futuro.result()
+                progreso(0.1 + 0.8 * hechos / len(bloques),
+                         f"{min(hechos * tam, len(tareas))} de {len(tareas)} documentos")
+        for r in resultados:
+            archivos.extend(r)
+    else:
+        for i, tarea in enumerate(tareas, 1):
+            archivos.extend(_generar_bloque([tarea]))
+            if i % 10 == 0:
+                progreso(0.1 + 0.8 * i / len(tareas), f"{i} de {len(tareas)} documentos")
+
+    progreso(0.95, "Comprimiendo...")
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
+        for nombre, datos in archivos:
+            zf.writestr(nombre, datos)
+    return buf.getvalue()
+
+
+def generar_lote(tareas, formato="pdf", progreso=None, procesos=LOTES_PDF_PROCESOS):
+    """Bytes del PDF único o del ZIP con los documentos de `tareas`."""
+    progreso = progreso or (lambda fraccion, mensaje="": None)
+    if not tareas:
+        raise ValueError("No hay documentos para generar")
+    if formato not in FORMATOS:
+        raise ValueError(f"Formato desconocido: {formato}")
+    progreso(0.1, f"{len(tareas)} documentos")
+    if formato == "pdf":
+        return _pdf_unico(tareas, progreso)
+    return _zip(tareas, progreso, procesos)
@@ -0,0 +1,187 @@
+"""
+MIGRACIÓN FECHAS ISO - Sistema Agencia Riviera Maya
+Agrega columnas de fecha normalizadas (YYYY-MM-DD) junto a las fechas de viaje
+que se guardan como texto 'dd-mm-yyyy', para poder filtrar por rango con índice:
+
+    ventas                  fecha_inicio  -> fecha_inicio_iso
+                            fecha_fin     -> fecha_fin_iso
+    viajes_nacionales       fecha_salida  -> fecha_salida_iso
+                            fecha_regreso -> fecha_regreso_iso
+    viajes_internacionales  fecha_salida  -> fecha_salida_iso
+                            fecha_regreso -> fecha_regreso_iso
+
+La app escribe ambas columnas al registrar; los triggers cubren a los módulos
+de consola (viajes.py, nacionales.py, internacionales.py...) que sólo
+escriben la fecha en texto. Es idempotente: se puede correr varias veces.
+"""
+
+import os
+import sqlite3
+from datetime import datetime
+
+DB_NAME = "agencia.db"
+
+# tabla -> [(columna_texto, columna_iso)]
+COLUMNAS_FECHA = {
+    "ventas": [("fecha_inicio", "fecha_inicio_iso"), ("fecha_fin", "fecha_fin_iso")],
+    "viajes_nacionales": [("fecha_salida", "fecha_salida_iso"), ("fecha_regreso", "fecha_regreso_iso")],
+    "viajes_internacionales": [("fecha_salida", "fecha_salida_iso"), ("fecha_regreso", "fecha_regreso_iso")],
+}
+
+_FORMATOS = ("%d-%m-%Y", "%d/%m/%Y", "%Y-%m-%d", "%Y/%m/%d")
+
+
+def fecha_a_iso(valor):
+    """
+    Convierte una fecha de viaje a texto ISO 'YYYY-MM-DD'.
+    Acepta date/datetime o texto 'dd-mm-yyyy' (también con '/', o ya en ISO).
+    Devuelve None si no se puede interpretar.
+    """
+    if valor is None:
+        return None
+    if hasattr(valor, "strftime"):
+        return valor.strftime("%Y-%m-%d")
+    texto = str(valor).strip()[:10]
+    for formato in _FORMATOS:
+        try:
+            return datetime.strptime(texto, formato).strftime("%Y-%m-%d")
+        except ValueError:
+            continue
+    return None
+
+
+def _columnas_existentes(cursor, tabla, es_postgres):
+    if es_postgres:
+        cursor.execute(
+            "SELECT column_name FROM information_schema.columns WHERE table_name = '%s'" % tabla)
+        return {r[0] for r in cursor.fetchall()}
+    cursor.execute(f"PRAGMA table_info({tabla})")
+    return {r[1] for r in cursor.fetchall()}
+
+
+def _crear_triggers_sqlite(cursor, tabla, pares):
+    """Mantiene las columnas ISO cuando otro módulo escribe sólo la fecha en texto."""
+    for col_txt, col_iso in pares:
+        # 'dd-mm-yyyy' -> 'yyyy-mm-dd'; si ya viene en ISO se deja igual
+        expr = (f"CASE WHEN NEW.{col_txt} GLOB '[0-9][0-9]-[0-9][0-9]-[0-9][0-9][0-9][0-9]' "
+                f"THEN substr(NEW.{col_txt},7,4)||'-'||substr(NEW.{col_txt},4,2)||'-'||substr(NEW.{col_txt},1,2) "
+                f"WHEN NEW.{col_txt} GLOB '[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9]*' "
+                f"THEN substr(NEW.{col_txt},1,10) END")
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS trg_{tabla}_{col_iso}_ins
+            AFTER INSERT ON {tabla}
+            WHEN NEW.{col_iso} IS NULL AND NEW.{col_txt} IS NOT NULL
+            BEGIN
+                UPDATE {tabla} SET {col_iso} = {expr} WHERE id = NEW.id;
+            END
+        """)
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS trg_{tabla}_{col_iso}_upd
+            AFTER UPDATE OF {col_txt} ON {tabla}
+            WHEN NEW.{col_txt} IS NOT OLD.{col_txt}
+            BEGIN
+                UPDATE {tabla} SET {col_iso} = {expr} WHERE id = NEW.id;
+            END
+        """)
+
+
+def _crear_triggers_postgres(cursor, tabla, pares):
+    asignaciones = "\n".join(
+        f"""        IF NEW.{col_txt} IS NOT NULL AND (TG_OP = 'INSERT' AND NEW.{col_iso} IS NULL
+              OR TG_OP = 'UPDATE' AND NEW.{col_txt} IS DISTINCT FROM OLD.{col_txt}) THEN
+            IF NEW.{col_txt} ~ '^\\d{{2}}-\\d{{2}}-\\d{{4}}$' THEN
+                NEW.{col_iso} := to_date(NEW.{col_txt}, 'DD-MM-YYYY');
+            ELSIF NEW.{col_txt} ~ '^\\d{{4}}-\\d{{2}}-\\d{{2}}' THEN
+                NEW.{col_iso} := substr(NEW.{col_txt}, 1, 10)::date;
+            END IF;
+        END IF;"""
+        for col_txt, col_iso in pares)
+    cursor.execute(f"""
+        CREATE OR REPLACE FUNCTION fn_{tabla}_fechas_iso() RETURNS trigger AS $$
+        BEGIN
+{asignaciones}
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    cursor.execute(f"DROP TRIGGER IF EXISTS trg_{tabla}_fechas_iso ON {tabla}")
+    cursor.execute(f"""
+        CREATE TRIGGER trg_{tabla}_fechas_iso
+        BEFORE INSERT OR UPDATE ON {tabla}
+        FOR EACH ROW EXECUTE FUNCTION fn_{tabla}_fechas_iso()
+    """)
+
+
+def aplicar_migracion_fechas_iso(conn, es_postgres=False):
+    """
+    Agrega, rellena e indexa las columnas ISO en la conexión dada.
+    Devuelve un dict {tabla: filas_rellenadas}.
+    """
+    cursor = conn.cursor()
+    ph = "%s" if es_postgres else "?"
+    tipo = "DATE" if es_postgres else "TEXT"
+    rellenadas = {}
+
+    for tabla, pares in COLUMNAS_FECHA.items():
+        existentes = _columnas_existentes(cursor, tabla, es_postgres)
+        if not existentes:
+            continue  # La tabla no existe en esta base
+
+        for _, col_iso in pares:
+            if col_iso not in existentes:
+                cursor.execute(f"ALTER TABLE {tabla} ADD COLUMN {col_iso} {tipo}")
+
+        # Rellenar sólo lo que falta (en corridas posteriores no hay nada que hacer)
+        cols_txt = ", ".join(c for c, _ in pares)
+        faltantes = " OR ".join(f"({i} IS NULL AND {t} IS NOT NULL)" for t, i in pares)
+        cursor.execute(f"SELECT id, {cols_txt} FROM {tabla} WHERE {faltantes}")
+        filas = cursor.fetchall()
+        sets = ", ".join(f"{i} = {ph}" for _, i in pares)
+        for fila in filas:
+            valores = [fecha_a_iso(v) for v in fila[1:]]
+            cursor.execute(f"UPDATE {tabla} SET {sets} WHERE id = {ph}", (*valores, fila[0]))
+        rellenadas[tabla] = len(filas)
+
+        for _, col_iso in pares:
+            cursor.execute(f"CREATE INDEX IF NOT EXISTS idx_{tabla}_{col_iso} ON {tabla} ({col_iso})")
+
+        if es_postgres:
+            _crear_triggers_postgres(cursor, tabla, pares)
+        else:
+            _crear_triggers_sqlite(cursor, tabla, pares)
+
+    conn.commit()
+    return rellenadas
+
+
+def ejecutar_migracion():
+    """Corre la migración contra PostgreSQL (DATABASE_URL) o agencia.db"""
+    print("\n" + "="*60)
+    print("🔧 MIGRACIÓN - FECHAS ISO E ÍNDICES DE FECHA")
+    print("="*60)
+
+    database_url = os.environ.get("DATABASE_URL", "")
+    if database_url:
+        import psycopg2
+        conn = psycopg2.connect(database_url)
+        print("\n🐘 Base: PostgreSQL")
+    else:
+        conn = sqlite3.connect(DB_NAME)
+        print(f"\n🗄️ Base: {DB_NAME}")
+
+    try:
+        rellenadas = aplicar_migracion_fechas_iso(conn, es_postgres=bool(database_url))
+        for tabla, n in rellenadas.items():
+            print(f"   ✅ {tabla}: {n} filas rellenadas, índices y triggers listos")
+        print("\n✅ MIGRACIÓN COMPLETADA\n")
+        return True
+    except Exception as e:
+        conn.rollback()
+        print(f"\n❌ ERROR EN MIGRACIÓN: {e}\n")
+        return False
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    ejecutar_migracion()
@@ -0,0 +1,182 @@
+"""
+MIGRACIÓN ÍNDICES SECUNDARIOS - Sistema Agencia Riviera Maya
+Índices para las llaves foráneas y columnas de filtro que usan las páginas
+(paneles de detalle por venta/cliente, filtros por estado y vendedora).
+
+Las migraciones son versionadas. Cada corrida crea los índices esperados que
+faltan en las tablas existentes (una tabla que aparece después, p. ej.
+gastos_operativos con migracion_gastos.py, recibe sus índices en la
+siguiente corrida). La tabla migraciones_indices es sólo el historial: una
+versión se registra cuando todas sus tablas existen y sus índices quedaron
+creados. verificar_indices() compara lo esperado contra lo que realmente
+existe en la base.
+"""
+
+import os
+import sqlite3
+from datetime import datetime
+
+DB_NAME = "agencia.db"
+
+# (version, descripción, [(nombre_indice, tabla, columnas)])
+MIGRACIONES_INDICES = [
+    (1, "Índices de llaves foráneas y filtros frecuentes", [
+        ("idx_abonos_venta_fecha",             "abonos",                   "venta_id, fecha"),
+        ("idx_pasajeros_venta",                "pasajeros",                "venta_id"),
+        ("idx_abonos_nacionales_cliente_fecha", "abonos_nacionales",       "cliente_id, fecha"),
+        ("idx_pasajeros_nacionales_cliente",   "pasajeros_nacionales",     "cliente_id"),
+        ("idx_clientes_nacionales_viaje",      "clientes_nacionales",      "viaje_id"),
+        ("idx_abonos_internacionales_cliente_fecha", "abonos_internacionales", "cliente_id, fecha"),
+        ("idx_pasajeros_internacionales_cliente", "pasajeros_internacionales", "cliente_id"),
+        ("idx_clientes_internacionales_viaje", "clientes_internacionales", "viaje_id"),
+        ("idx_ventas_estado",                  "ventas",                   "estado"),
+        ("idx_ventas_vendedora",               "ventas",                   "vendedora_id"),
+        ("idx_ventas_usuario",                 "ventas",                   "usuario_id"),
+        ("idx_transferencias_estado",          "transferencias",           "estado"),
+    ]),
+    (2, "Índices de fecha para el reporte por periodo", [
+        ("idx_ventas_fecha_registro",          "ventas",                   "fecha_registro"),
+        ("idx_abonos_fecha",                   "abonos",                   "fecha"),
+        ("idx_clientes_nacionales_fecha_registro", "clientes_nacionales",  "fecha_registro"),
+        ("idx_abonos_nacionales_fecha",        "abonos_nacionales",        "fecha"),
+        ("idx_clientes_internacionales_fecha_registro", "clientes_internacionales", "fecha_registro"),
+        ("idx_abonos_internacionales_fecha",   "abonos_internacionales",   "fecha"),
+        ("idx_gastos_operativos_fecha",        "gastos_operativos",        "fecha_gasto"),
+        ("idx_historial_comisiones_fecha",     "historial_comisiones",     "fecha"),
+    ]),
+]
+
+
+def _tablas_existentes(cursor, es_postgres):
+    if es_postgres:
+        cursor.execute("SELECT table_name FROM information_schema.tables WHERE table_schema = current_schema()")
+    else:
+        cursor.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+    return {r[0] for r in cursor.fetchall()}
+
+
+def _indices_existentes(cursor, es_postgres):
+    """Nombres de índices válidos en la base."""
+    if es_postgres:
+        # Un CREATE INDEX CONCURRENTLY que falló deja el índice marcado como inválido
+        cursor.execute("""
+            SELECT c.relname
+            FROM pg_index i
+            JOIN pg_class c ON c.oid = i.indexrelid
+            JOIN pg_namespace n ON n.oid = c.relnamespace
+            WHERE n.nspname = current_schema() AND i.indisvalid
+        """)
+    else:
+        cursor.execute("SELECT name FROM sqlite_master WHERE type = 'index'")
+    return {r[0] for r in cursor.fetchall()}
+
+
+def _versiones_aplicadas(cursor):
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS migraciones_indices (
+            version INTEGER PRIMARY KEY,
+            descripcion TEXT,
+            fecha_aplicada TEXT
+        )
+    """)
+    cursor.execute("SELECT version FROM migraciones_indices")
+    return {r[0] for r in cursor.fetchall()}
+
+
+def aplicar_migraciones_indices(conn, es_postgres=False):
+    """
+    Crea los índices que faltan en las tablas existentes y registra en el
+    historial las versiones que quedaron completas. En PostgreSQL crea los
+    índices con CONCURRENTLY para no bloquear escrituras (requiere
+    autocommit, como la conexión de la app). Devuelve las versiones en las
+    que se creó algún índice.
+    """
+    cursor = conn.cursor()
+    aplicadas = _versiones_aplicadas(cursor)
+    tablas = _tablas_existentes(cursor, es_postgres)
+    existentes = _indices_existentes(cursor, es_postgres)
+    ph = "%s" if es_postgres else "?"
+    concurrente = "CONCURRENTLY " if es_postgres and getattr(conn, "autocommit", False) else ""
+    nuevas = []
+
+    for version, descripcion, indices in MIGRACIONES_INDICES:
+        creados = False
+        for nombre, tabla, columnas in indices:
+            if tabla not in tablas or nombre in existentes:
+                continue  # Módulo no instalado en esta base, o índice ya creado
+            if es_postgres:
+                # Un intento previo fallido pudo dejar el índice inválido
+                cursor.execute(f"DROP INDEX {concurrente}IF EXISTS {nombre}")
+            cursor.execute(f"CREATE INDEX {concurrente}IF NOT EXISTS {nombre} ON {tabla} ({columnas})")
+            creados = True
+        if version not in aplicadas and all(tabla in tablas for _, tabla, _ in indices):
+            cursor.execute(
+                f"INSERT INTO migraciones_indices (version, descripcion, fecha_aplicada) VALUES ({ph}, {ph}, {ph})",
+                (version, descripcion, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
+        conn.commit()
+        if creados:
+            nuevas.append(version)
+
+    return nuevas
+
+
+def verificar_indices(conn, es_postgres=False):
+    """
+    Devuelve [(nombre_indice, tabla, columnas)] de los índices esperados que
+    no existen (sólo para tablas presentes en la base).
+    """
+    cursor = conn.cursor()
+    tablas = _tablas_existentes(cursor, es_postgres)
+    existentes = _indices_existentes(cursor, es_postgres)
+    return [
+        (nombre, tabla, columnas)
+        for _, _, indices in MIGRACIONES_INDICES
+        for nombre, tabla, columnas in indices
+        if tabla in tablas and nombre not in existentes
+    ]
+
+
+def ejecutar_migracion():
+    """Corre las migraciones de índices contra PostgreSQL (DATABASE_URL) o agencia.db"""
+    print("\n" + "="*60)
+    print("🔧 MIGRACIÓN - ÍNDICES SECUNDARIOS")
+    print("="*60)
+
+    database_url = os.environ.get("DATABASE_URL", "")
+    if database_url:
+        import psycopg2
+        conn = psycopg2.connect(database_url)
+        conn.autocommit = True
+        print("\n🐘 Base: PostgreSQL")
+    else:
+        conn = sqlite3.connect(DB_NAME)
+        print(f"\n🗄️ Base: {DB_NAME}")
+
+    es_postgres = bool(database_url)
+    try:
+        nuevas = aplicar_migraciones_indices(conn, es_postgres)
+        if nuevas:
+            print(f"   ✅ Índices creados de las versiones: {', '.join(str(v) for v in nuevas)}")
+        else:
+            print("   ✅ No faltaba ningún índice en las tablas existentes")
+
+        faltantes = verificar_indices(conn, es_postgres)
+        if faltantes:
+            print("\n⚠️ Índices faltantes:")
+            for nombre, tabla, columnas in faltantes:
+                print(f"   ❌ {nombre} ON {tabla} ({columnas})")
+        else:
+            print("   ✅ Todos los índices esperados existen")
+        print("\n✅ MIGRACIÓN COMPLETADA\n")
+        return True
+    except Exception as e:
+        if not es_postgres:
+            conn.rollback()
+        print(f"\n❌ ERROR EN MIGRACIÓN: {e}\n")
+        return False
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    ejecutar_migracion()
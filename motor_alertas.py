@@ -0,0 +1,233 @@
+"""
+MOTOR DE ALERTAS - Sistema Agencia Riviera Maya
+Alertas del dashboard y de Riviera Maya materializadas en una sola tabla,
+listas para mostrarse sin volver a calcular ventanas de fechas en cada rerun.
+
+    tipo          adeudo  (Riviera con saldo, viaje en DIAS_ADEUDO días)
+                  proximo (Riviera sin reserva confirmada, viaje en DIAS_PROXIMOS días)
+                  cita    (pasaporte o visa con cita en DIAS_CITAS días)
+    producto      riviera | pasaporte | visa
+    referencia_id venta o trámite de origen
+    vendedora_id  quién la ve si no es ADMIN (en Riviera, ventas.usuario_id,
+                  el mismo filtro que usaban las alertas)
+    fecha_iso     fecha del viaje o de la cita, para ordenar y contar días
+    ...           columnas de la tarjeta (cliente, destino, saldo, operador...)
+
+refrescar_alertas() vuelve a llenar la tabla en una transacción: borra y
+corre un INSERT ... SELECT por tipo sobre fecha_inicio_iso / fecha_cita.
+MotorAlertas decide cuándo: al escribir en ventas, vendedoras, pasaportes o
+visas (la app lo marca pendiente), al cambiar el día y, como cota para lo
+que escriben los scripts de consola, cada `refresco` segundos.
+
+Para recalcular a mano:
+    python motor_alertas.py
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from datetime import date, datetime, timedelta
+
+from transacciones import transaccion
+
+DB_NAME = "agencia.db"
+
+DIAS_ADEUDO = 45      # el mayorista exige liquidar 30 días antes
+DIAS_PROXIMOS = 10
+DIAS_CITAS = 7
+REFRESCO_S = 300
+
+# Tablas cuyas escrituras cambian las alertas
+TABLAS_FUENTE = ("ventas", "vendedoras", "pasaportes", "visas")
+
+_CREAR_TABLA = """
+    CREATE TABLE IF NOT EXISTS alertas (
+        tipo TEXT NOT NULL,
+        producto TEXT NOT NULL,
+        referencia_id INTEGER NOT NULL,
+        vendedora_id INTEGER,
+        fecha_iso TEXT NOT NULL,
+        fecha TEXT,
+        cliente TEXT,
+        celular TEXT,
+        destino TEXT,
+        vendedora TEXT,
+        tipo_venta TEXT,
+        estado TEXT,
+        total REAL DEFAULT 0,
+        pagado REAL DEFAULT 0,
+        saldo REAL DEFAULT 0,
+        tipo_habitacion TEXT,
+        adultos INTEGER,
+        menores INTEGER,
+        operador TEXT,
+        fecha_fin TEXT,
+        noches INTEGER,
+        PRIMARY KEY (tipo, producto, referencia_id)
+    )
+"""
+_CREAR_INDICE = "CREATE INDEX IF NOT EXISTS idx_alertas_tipo_fecha ON alertas (tipo, fecha_iso)"
+
+_COLUMNAS = """tipo, producto, referencia_id, vendedora_id, fecha_iso, fecha, cliente, celular,
+               destino, vendedora, tipo_venta, estado, total, pagado, saldo,
+               tipo_habitacion, adultos, menores, operador, fecha_fin, noches"""
+
+# {tipo} y {condicion} los pone refrescar_alertas; las fechas son ISO de date()
+_SQL_RIVIERA = """
+    INSERT INTO alertas ({columnas})
+    SELECT '{tipo}', 'riviera', v.id, v.usuario_id, v.fecha_inicio_iso, v.fecha_inicio,
+           v.cliente, v.celular_responsable, v.destino, COALESCE(vd.nombre, '—'),
+           COALESCE(v.tipo_venta, 'General'), v.estado,
+           COALESCE(v.precio_total, 0), COALESCE(v.pagado, 0), COALESCE(v.saldo, 0),
+           v.tipo_habitacion, COALESCE(v.adultos, 0), COALESCE(v.menores, 0), v.operador,
+           v.fecha_fin, COALESCE(v.noches, 0)
+    FROM ventas v
+    LEFT JOIN vendedoras vd ON v.vendedora_id = vd.id
+    WHERE v.fecha_inicio_iso BETWEEN '{desde}' AND '{hasta}'
+      AND {condicion}
+"""
+_CONDICIONES_RIVIERA = {
+    "adeudo":  "v.estado NOT IN ('CERRADO', 'LIQUIDADO') AND COALESCE(v.saldo, 0) > 0",
+    "proximo": "v.estado != 'CERRADO' AND COALESCE(v.reserva_confirmada, 0) = 0",
+}
+
+_SQL_CITAS = """
+    INSERT INTO alertas ({columnas})
+    SELECT 'cita', '{producto}', t.id, t.vendedora_id, SUBSTR(t.fecha_cita, 1, 10), t.fecha_cita,
+           t.cliente, t.celular, {destino}, COALESCE(vd.nombre, '—'),
+           '{etiqueta}', t.estado,
+           COALESCE(t.total, 0), COALESCE(t.pagado, 0), COALESCE(t.saldo, 0),
+           NULL, NULL, NULL, NULL, NULL, NULL
+    FROM {tabla} t
+    LEFT JOIN vendedoras vd ON t.vendedora_id = vd.id
+    WHERE t.fecha_cita IS NOT NULL
+      AND SUBSTR(t.fecha_cita, 1, 10) BETWEEN '{desde}' AND '{hasta}'
+      AND t.estado NOT IN ('{entregado}')
+"""
+# tabla -> (producto, etiqueta, destino, estado final)
+_CITAS = {
+    "pasaportes": ("pasaporte", "Pasaporte", "NULL", "Entregado"),
+    "visas":      ("visa", "Visa", "t.pais_destino", "Entregada"),
+}
+
+
+def _tablas(cursor, es_postgres):
+    if es_postgres:
+        cursor.execute("SELECT table_name FROM information_schema.tables WHERE table_schema = current_schema()")
+    else:
+        cursor.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+    return {r[0] for r in cursor.fetchall()}
+
+
+def instalar_alertas(conn):
+    """Crea la tabla de alertas y su índice (idempotente)."""
+    cursor = conn.cursor()
+    cursor.execute(_CREAR_TABLA)
+    cursor.execute(_CREAR_INDICE)
+    conn.commit()
+
+
+def refrescar_alertas(conn, es_postgres=False, hoy=None):
+    """
+    Recalcula todas las alertas para `hoy` (date) en una sola transacción.
+    Devuelve cuántas quedaron.
+    """
+    hoy = hoy or date.today()
+    cursor = conn.cursor()
+    existentes = _tablas(cursor, es_postgres)
+    with transaccion(conn, es_postgres):
+        cursor.execute("DELETE FROM alertas")
+        for tipo, dias in (("adeudo", DIAS_ADEUDO), ("proximo", DIAS_PROXIMOS)):
+            cursor.execute(_SQL_RIVIERA.format(
+                columnas=_COLUMNAS, tipo=tipo, condicion=_CONDICIONES_RIVIERA[tipo],
+                desde=hoy.isoformat(), hasta=(hoy + timedelta(days=dias)).isoformat()))
+        for tabla, (producto, etiqueta, destino, entregado) in _CITAS.items():
+            if tabla not in existentes:
+                continue    # Módulo de otros servicios no instalado en esta base
+            cursor.execute(_SQL_CITAS.format(
+                columnas=_COLUMNAS, tabla=tabla, producto=producto, etiqueta=etiqueta,
+                destino=destino, entregado=entregado, desde=hoy.isoformat(),
+                hasta=(hoy + timedelta(days=DIAS_CITAS)).isoformat()))
+    cursor.execute("SELECT COUNT(*) FROM alertas")
+    return cursor.fetchone()[0]
+
+
+class MotorAlertas:
+    """Mantiene vigente la tabla de alertas; uno por proceso."""
+
+    def __init__(self, conectar, es_postgres=False, refresco=REFRESCO_S):
+        self._conectar = conectar
+        self._es_postgres = es_postgres
+        self._refresco = refresco
+        self._lock = threading.Lock()
+        self._pendiente = True
+        self._dia = None
+        self._refrescado_en = 0.0
+
+    def marcar_pendiente(self):
+        """La siguiente lectura recalcula las alertas."""
+        self._pendiente = True
+
+    def _vencida(self):
+        return (self._pendiente or self._dia != date.today()
+                or time.monotonic() - self._refrescado_en > self._refresco)
+
+    def vigente(self):
+        """Recalcula si hubo escrituras, cambió el día o pasó el tiempo de refresco."""
+        if not self._vencida():
+            return
+        with self._lock:
+            if not self._vencida():
+                return      # otra sesión acaba de recalcular
+            # Se baja antes de leer: una escritura durante el refresco lo vuelve a subir
+            self._pendiente = False
+            hoy = date.today()
+            conn = self._conectar()
+            try:
+                refrescar_alertas(conn, self._es_postgres, hoy)
+            except Exception as e:
+                self._pendiente = True
+                print(f"⚠️ No se pudieron recalcular las alertas: {e}")
+                return
+            finally:
+                conn.close()
+            self._dia = hoy
+            self._refrescado_en = time.monotonic()
+
+
+def ejecutar_refresco():
+    """Recalcula las alertas en PostgreSQL (DATABASE_URL) o agencia.db"""
+    print("\n" + "="*60)
+    print("🚨 MOTOR DE ALERTAS - RECÁLCULO")
+    print("="*60)
+
+    database_url = os.environ.get("DATABASE_URL", "")
+    if database_url:
+        import psycopg2
+        conn = psycopg2.connect(database_url)
+        print("\n🐘 Base: PostgreSQL")
+    else:
+        conn = sqlite3.connect(DB_NAME)
+        print(f"\n🗄️ Base: {DB_NAME}")
+
+    try:
+        instalar_alertas(conn)
+        inicio = time.perf_counter()
+        total = refrescar_alertas(conn, es_postgres=bool(database_url))
+        ms = (time.perf_counter() - inicio) * 1000
+        cursor = conn.cursor()
+        cursor.execute("SELECT tipo, COUNT(*) FROM alertas GROUP BY tipo ORDER BY tipo")
+        for tipo, cantidad in cursor.fetchall():
+            print(f"   🔔 {tipo:<8} {cantidad:>6}")
+        print(f"\n✅ ALERTAS RECALCULADAS ({total} en {ms:.1f} ms) - {datetime.now():%Y-%m-%d %H:%M}\n")
+        return True
+    except Exception as e:
+        print(f"\n❌ ERROR: {e}\n")
+        return False
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    ejecutar_refresco()
@@ -0,0 +1,265 @@
+"""
+MOVIMIENTOS DE PAGOS - Sistema Agencia Riviera Maya
+Libro único de pagos recibidos: una fila por abono de cualquier producto
+(Riviera Maya, nacionales, internacionales, pasaportes, visas y vuelos) con
+las mismas columnas para todos, indexado por fecha. Un flujo de caja de
+cualquier rango es un solo recorrido del índice en lugar de unir seis
+tablas con nombres y monedas distintos.
+
+    fecha         fecha del abono (texto 'YYYY-MM-DD HH:MM:SS')
+    producto      riviera | nacional | internacional | pasaporte | visa | vuelo
+    abono_id      id en la tabla de abonos de origen
+    referencia_id venta, cliente o trámite al que se abonó
+    vendedora_id  vendedora de esa venta / cliente / trámite
+    monto_mxn     pesos recibidos (internacionales: el monto original si se
+                  pagó en MXN, monto_usd * tipo_cambio si se pagó en USD con
+                  tipo de cambio registrado, 0 si no se conoce)
+    monto_usd     dólares acreditados (sólo internacionales; 0 en los demás)
+    metodo_pago
+
+La tabla se mantiene con triggers sobre cada tabla de abonos (INSERT,
+UPDATE y DELETE), así también la llenan los scripts de consola. Si una
+tabla de abonos aparece después (módulo de otros servicios), sus triggers
+se crean y sus abonos se cargan la siguiente vez que arranca la app.
+
+Para recalcular todo desde las tablas de abonos:
+    python movimientos_pagos.py
+"""
+
+import os
+import sqlite3
+
+from transacciones import transaccion
+
+DB_NAME = "agencia.db"
+
+# tabla de abonos -> (producto, referencia, vendedora, monto_mxn, monto_usd);
+# {f} es la fila (NEW, OLD o el alias de la tabla al cargar)
+FUENTES = {
+    "abonos": ("riviera", "{f}.venta_id",
+               "(SELECT vendedora_id FROM ventas WHERE id = {f}.venta_id)",
+               "{f}.monto", "0"),
+    "abonos_nacionales": ("nacional", "{f}.cliente_id",
+                          "(SELECT vendedora_id FROM clientes_nacionales WHERE id = {f}.cliente_id)",
+                          "{f}.monto", "0"),
+    "abonos_internacionales": ("internacional", "{f}.cliente_id",
+                               "(SELECT vendedora_id FROM clientes_internacionales WHERE id = {f}.cliente_id)",
+                               "CASE WHEN {f}.moneda = 'MXN' THEN {f}.monto_original "
+                               "WHEN {f}.tipo_cambio > 1 THEN {f}.monto_usd * {f}.tipo_cambio ELSE 0 END",
+                               "{f}.monto_usd"),
+    "abonos_pasaportes": ("pasaporte", "{f}.pasaporte_id",
+                          "(SELECT vendedora_id FROM pasaportes WHERE id = {f}.pasaporte_id)",
+                          "{f}.monto", "0"),
+    "abonos_visas": ("visa", "{f}.visa_id",
+                     "(SELECT vendedora_id FROM visas WHERE id = {f}.visa_id)",
+                     "{f}.monto", "0"),
+    "abonos_vuelos": ("vuelo", "{f}.vuelo_id",
+                      "(SELECT vendedora_id FROM vuelos WHERE id = {f}.vuelo_id)",
+                      "{f}.monto", "0"),
+}
+
+_CREAR_TABLA = """
+    CREATE TABLE IF NOT EXISTS movimientos_pagos (
+        producto TEXT NOT NULL,
+        abono_id INTEGER NOT NULL,
+        referencia_id INTEGER,
+        fecha TEXT NOT NULL,
+        vendedora_id INTEGER,
+        monto_mxn NUMERIC(14,2) NOT NULL DEFAULT 0,
+        monto_usd NUMERIC(14,2) NOT NULL DEFAULT 0,
+        metodo_pago TEXT,
+        PRIMARY KEY (producto, abono_id)
+    )
+"""
+_CREAR_INDICE = "CREATE INDEX IF NOT EXISTS idx_movimientos_pagos_fecha ON movimientos_pagos (fecha)"
+
+
+# ─── ESQUEMA ─────────────────────────────────────────────────────────────────
+
+def _tablas(cursor, es_postgres):
+    if es_postgres:
+        cursor.execute("SELECT table_name FROM information_schema.tables WHERE table_schema = current_schema()")
+    else:
+        cursor.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+    return {r[0] for r in cursor.fetchall()}
+
+
+def _columnas(cursor, tabla, es_postgres):
+    if es_postgres:
+        # %s: el script usa psycopg2 directo (el cursor de la app acepta los dos)
+        cursor.execute("SELECT column_name FROM information_schema.columns "
+                       "WHERE table_schema = current_schema() AND table_name = %s", (tabla,))
+        return {r[0] for r in cursor.fetchall()}
+    cursor.execute(f"PRAGMA table_info({tabla})")
+    return {r[1] for r in cursor.fetchall()}
+
+
+def _triggers(cursor, es_postgres):
+    if es_postgres:
+        cursor.execute("SELECT tgname FROM pg_trigger WHERE NOT tgisinternal")
+    else:
+        cursor.execute("SELECT name FROM sqlite_master WHERE type = 'trigger'")
+    return {r[0] for r in cursor.fetchall()}
+
+
+def _valores(tabla, fila, metodo_pago):
+    """Columnas normalizadas de una fila de `tabla` (NEW, OLD o alias)."""
+    producto, referencia, vendedora, mxn, usd = FUENTES[tabla]
+    metodo = f"{fila}.metodo_pago" if metodo_pago else "'Efectivo'"
+    return [f"'{producto}'", f"{fila}.id", referencia.format(f=fila), f"CAST({fila}.fecha AS TEXT)",
+            vendedora.format(f=fila), f"COALESCE({mxn.format(f=fila)}, 0)",
+            f"COALESCE({usd.format(f=fila)}, 0)", metodo]
+
+
+_COLUMNAS_LIBRO = "producto, abono_id, referencia_id, fecha, vendedora_id, monto_mxn, monto_usd, metodo_pago"
+_ACTUALIZAR = """
+    ON CONFLICT (producto, abono_id) DO UPDATE SET
+        referencia_id = excluded.referencia_id, fecha = excluded.fecha,
+        vendedora_id = excluded.vendedora_id, monto_mxn = excluded.monto_mxn,
+        monto_usd = excluded.monto_usd, metodo_pago = excluded.metodo_pago"""
+
+
+def _upsert(tabla, metodo_pago):
+    return (f"INSERT INTO movimientos_pagos ({_COLUMNAS_LIBRO}) "
+            f"VALUES ({', '.join(_valores(tabla, 'NEW', metodo_pago))}) {_ACTUALIZAR};")
+
+
+def _borrar(tabla):
+    return f"DELETE FROM movimientos_pagos WHERE producto = '{FUENTES[tabla][0]}' AND abono_id = OLD.id;"
+
+
+def _crear_triggers(cursor, tabla, metodo_pago, es_postgres):
+    if es_postgres:
+        cursor.execute(f"""
+            CREATE OR REPLACE FUNCTION fn_movimientos_{tabla}() RETURNS trigger AS $$
+            BEGIN
+                IF TG_OP = 'DELETE' THEN
+                    {_borrar(tabla)}
+                ELSE
+                    {_upsert(tabla, metodo_pago)}
+                END IF;
+                RETURN NULL;
+            END
+            $$ LANGUAGE plpgsql
+        """)
+        cursor.execute(f"""
+            CREATE TRIGGER trg_movimientos_{tabla}
+            AFTER INSERT OR UPDATE OR DELETE ON {tabla}
+            FOR EACH ROW EXECUTE PROCEDURE fn_movimientos_{tabla}()
+        """)
+    else:
+        cursor.execute(f"CREATE TRIGGER IF NOT EXISTS trg_movimientos_{tabla}_ins AFTER INSERT ON {tabla} "
+                       f"BEGIN {_upsert(tabla, metodo_pago)} END")
+        cursor.execute(f"CREATE TRIGGER IF NOT EXISTS trg_movimientos_{tabla}_upd AFTER UPDATE ON {tabla} "
+                       f"BEGIN {_upsert(tabla, metodo_pago)} END")
+        cursor.execute(f"CREATE TRIGGER IF NOT EXISTS trg_movimientos_{tabla}_del AFTER DELETE ON {tabla} "
+                       f"BEGIN {_borrar(tabla)} END")
+
+
+def _quitar_triggers(cursor, tabla, es_postgres):
+    if es_postgres:
+        cursor.execute(f"DROP TRIGGER IF EXISTS trg_movimientos_{tabla} ON {tabla}")
+    else:
+        for sufijo in ("ins", "upd", "del"):
+            cursor.execute(f"DROP TRIGGER IF EXISTS trg_movimientos_{tabla}_{sufijo}")
+
+
+def _cargar(cursor, tabla, metodo_pago):
+    """Copia al libro los abonos de `tabla` que aún no están."""
+    # El WHERE evita que SQLite lea el ON CONFLICT como parte de un JOIN
+    cursor.execute(f"""
+        INSERT INTO movimientos_pagos ({_COLUMNAS_LIBRO})
+        SELECT {', '.join(_valores(tabla, 't', metodo_pago))} FROM {tabla} t WHERE 1 = 1
+        ON CONFLICT (producto, abono_id) DO NOTHING
+    """)
+
+
+# ─── INSTALACIÓN Y RECONSTRUCCIÓN ────────────────────────────────────────────
+
+def instalar_movimientos_pagos(conn, es_postgres=False):
+    """
+    Crea la tabla, su índice y los triggers de las tablas de abonos que
+    existen. Carga los abonos de cada tabla la primera vez que se le ponen
+    triggers. Devuelve las tablas de abonos que se cargaron.
+    """
+    cursor = conn.cursor()
+    cursor.execute(_CREAR_TABLA)
+    cursor.execute(_CREAR_INDICE)
+    existentes = _tablas(cursor, es_postgres)
+    triggers = _triggers(cursor, es_postgres)
+    cargadas = []
+    for tabla in FUENTES:
+        if tabla not in existentes:
+            continue    # Módulo no instalado en esta base
+        nombre = f"trg_movimientos_{tabla}" + ("" if es_postgres else "_ins")
+        if nombre in triggers:
+            continue
+        metodo_pago = "metodo_pago" in _columnas(cursor, tabla, es_postgres)
+        # Triggers y carga juntos: si la carga falla, la próxima vez se reintenta
+        with transaccion(conn, es_postgres):
+            _crear_triggers(cursor, tabla, metodo_pago, es_postgres)
+            _cargar(cursor, tabla, metodo_pago)
+        cargadas.append(tabla)
+    conn.commit()
+    return cargadas
+
+
+def reconstruir_movimientos_pagos(conn, es_postgres=False):
+    """
+    Vuelve a crear los triggers y recarga el libro completo desde las tablas
+    de abonos. Devuelve cuántos movimientos quedaron.
+    """
+    cursor = conn.cursor()
+    cursor.execute(_CREAR_TABLA)
+    cursor.execute(_CREAR_INDICE)
+    existentes = _tablas(cursor, es_postgres)
+    with transaccion(conn, es_postgres):
+        cursor.execute("DELETE FROM movimientos_pagos")
+        for tabla in FUENTES:
+            if tabla not in existentes:
+                continue
+            metodo_pago = "metodo_pago" in _columnas(cursor, tabla, es_postgres)
+            _quitar_triggers(cursor, tabla, es_postgres)
+            _crear_triggers(cursor, tabla, metodo_pago, es_postgres)
+            _cargar(cursor, tabla, metodo_pago)
+    cursor.execute("SELECT COUNT(*) FROM movimientos_pagos")
+    return cursor.fetchone()[0]
+
+
+def ejecutar_reconstruccion():
+    """Reconstruye el libro de pagos en PostgreSQL (DATABASE_URL) o agencia.db"""
+    print("\n" + "="*60)
+    print("💳 MOVIMIENTOS DE PAGOS - RECONSTRUCCIÓN")
+    print("="*60)
+
+    database_url = os.environ.get("DATABASE_URL", "")
+    if database_url:
+        import psycopg2
+        conn = psycopg2.connect(database_url)
+        conn.autocommit = True
+        print("\n🐘 Base: PostgreSQL")
+    else:
+        conn = sqlite3.connect(DB_NAME)
+        print(f"\n🗄️ Base: {DB_NAME}")
+
+    es_postgres = bool(database_url)
+    try:
+        total = reconstruir_movimientos_pagos(conn, es_postgres)
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT producto, COUNT(*), SUM(monto_mxn), SUM(monto_usd)
+            FROM movimientos_pagos GROUP BY producto ORDER BY producto
+        """)
+        for producto, cantidad, mxn, usd in cursor.fetchall():
+            print(f"   💵 {producto:<14} {cantidad:>6} abonos · ${float(mxn):,.2f} MXN · ${float(usd):,.2f} USD")
+        print(f"\n✅ LIBRO RECONSTRUIDO ({total} movimientos)\n")
+        return True
+    except Exception as e:
+        print(f"\n❌ ERROR: {e}\n")
+        return False
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    ejecutar_reconstruccion()
@@ -0,0 +1,1121 @@
+"""
+PÁGINA CONFIGURACIÓN - Sistema Agencia Riviera Maya
+Comisiones, vendedoras, usuarios, hoteles, operadores, bloqueos y grupos
+(sólo ADMIN).
+"""
+
+from datetime import datetime
+
+import streamlit as st
+import pandas as pd
+
+from app_nucleo import conectar_db, obtener_hoteles, read_sql_query
+
+
+def pagina_configuracion():
+    """Página de configuración y comisiones — solo ADMIN"""
+    st.title("⚙️ Configuración")
+
+    tabs = st.tabs([
+        "💰 Comisiones",
+        "👩‍💼 Vendedoras",
+        "🏨 Hoteles / Catálogos",
+        "🏢 Mayoristas",
+        "📦 Bloqueos",
+        "👥 Grupos"
+    ])
+
+    # ══════════════════════════════════════════════════════
+    # TAB 0 — COMISIONES
+    # ══════════════════════════════════════════════════════
+    with tabs[0]:
+        st.subheader("💰 Gestión de Comisiones")
+        st.info("💡 **Flujo:** Venta **ACTIVO** → se liquida → **LIQUIDADO** → se paga comisión → **CERRADO** (historial)")
+
+        subtabs_com = st.tabs([
+            "📋 Pendientes de Pago",
+            "✅ Historial (Cerradas)",
+            "⚙️ Configurar %"
+        ])
+
+        # ── Pendientes ────────────────────────────────────
+        with subtabs_com[0]:
+            st.markdown("#### 💸 Comisiones Pendientes de Pago")
+            st.markdown("Ventas en estado **LIQUIDADO** cuya comisión aún no se ha pagado. Al pagar → pasan a **CERRADO**.")
+
+            conn = conectar_db()
+
+            # ── Riviera Maya: usa comision_vendedora ya calculada (10% ganancia) ──
+            try:
+                df_riv = read_sql_query("""
+                    SELECT
+                        vd.nombre        AS vendedora,
+                        v.id,
+                        v.cliente,
+                        v.destino,
+                        v.ganancia,
+                        COALESCE(v.comision_vendedora, ROUND(v.ganancia * 0.10, 2)) AS comision,
+                        v.fecha_registro
+                    FROM ventas v
+                    JOIN vendedoras vd ON v.vendedora_id = vd.id
+                    WHERE v.estado = 'LIQUIDADO'
+                      AND COALESCE(v.comision_pagada, 0) = 0
+                    ORDER BY vd.nombre, v.id
+                """, conn)
+            except Exception as e:
+                df_riv = pd.DataFrame()
+
+            # ── Nacionales: % configurable sobre ganancia ──
+            try:
+                df_nac = read_sql_query("""
+                    SELECT
+                        vd.nombre           AS vendedora,
+                        cn.id,
+                        cn.nombre_cliente   AS cliente,
+                        vj.nombre_viaje     AS destino,
+                        COALESCE(cn.ganancia, cn.costo_neto, 0)  AS ganancia,
+                        ROUND(COALESCE(cn.ganancia, cn.costo_neto, 0)
+                              * COALESCE(cfg.porcentaje_comision, 10) / 100.0, 2) AS comision
+                    FROM clientes_nacionales cn
+                    JOIN vendedoras vd ON cn.vendedora_id = vd.id
+                    JOIN viajes_nacionales vj ON cn.viaje_id = vj.id
+                    LEFT JOIN config_comisiones cfg ON cfg.tipo = 'nacionales'
+                    WHERE cn.estado = 'LIQUIDADO'
+                      AND COALESCE(cn.comision_pagada, 0) = 0
+                    ORDER BY vd.nombre, cn.id
+                """, conn)
+            except Exception as e:
+                df_nac = pd.DataFrame()
+
+            # ── Internacionales: % configurable sobre ganancia_usd ──
+            try:
+                df_int = read_sql_query("""
+                    SELECT
+                        'Sin asignar'    AS vendedora,
+                        ci.id,
+                        ci.nombre_cliente AS cliente,
+                        vi.destino,
+                        COALESCE(ci.ganancia_usd, 0)  AS ganancia,
+                        ROUND(COALESCE(ci.ganancia_usd, 0)
+                              * COALESCE(cfg.porcentaje_comision, 10) / 100.0, 2) AS comision
+                    FROM clientes_internacionales ci
+                    JOIN viajes_internacionales vi ON ci.viaje_id = vi.id
+                    LEFT JOIN config_comisiones cfg ON cfg.tipo = 'internacionales'
+                    WHERE ci.estado = 'LIQUIDADO'
+                      AND COALESCE(ci.comision_pagada, 0) = 0
+                    ORDER BY ci.id
+                """, conn)
+            except Exception as e:
+                df_int = pd.DataFrame()
+
+            conn.close()
+
+            # ── Resumen pivot por vendedora ───────────────────────────────────
+            frames_sum = []
+            if not df_riv.empty:
+                tmp = df_riv[["vendedora","comision"]].copy(); tmp["tipo"] = "Riviera"
+                frames_sum.append(tmp)
+            if not df_nac.empty:
+                tmp = df_nac[["vendedora","comision"]].copy(); tmp["tipo"] = "Nacional"
+                frames_sum.append(tmp)
+            if not df_int.empty:
+                tmp = df_int[["vendedora","comision"]].copy(); tmp["tipo"] = "Internacional"
+                frames_sum.append(tmp)
+
+            if frames_sum:
+                df_res = pd.concat(frames_sum, ignore_index=True)
+                df_piv = df_res.groupby(["vendedora","tipo"])["comision"].sum().unstack(fill_value=0)
+                df_piv["TOTAL"] = df_piv.sum(axis=1)
+                df_piv = df_piv.reset_index()
+                total_global = df_piv["TOTAL"].sum()
+                col1, col2 = st.columns([3,1])
+                col1.dataframe(
+                    df_piv.style.format({c: "${:,.2f}" for c in df_piv.columns if c != "vendedora"}),
+                    use_container_width=True, hide_index=True)
+                col2.metric("💰 Total global pendiente", f"${total_global:,.2f}")
+            else:
+                st.success("✅ No hay comisiones pendientes de pago.")
+
+            st.divider()
+
+            # ── Selección de tipo y pago individual por venta ────────────────
+            tipo_com = st.radio("Trabajar con:", ["🏖️ Riviera Maya", "🎫 Nacionales", "🌎 Internacionales"],
+                                horizontal=True, key="com_tipo_radio")
+
+            if "Riviera" in tipo_com:
+                df_det  = df_riv.copy()
+                tabla   = "ventas"
+                moneda  = "$"
+                nota_tc = "Comisión = 10% de la ganancia (fijo, según pagos.py)"
+            elif "Nacionales" in tipo_com:
+                df_det  = df_nac.copy()
+                tabla   = "clientes_nacionales"
+                moneda  = "$"
+                nota_tc = "Comisión = % configurable sobre la ganancia"
+            else:
+                df_det  = df_int.copy()
+                tabla   = "clientes_internacionales"
+                moneda  = "USD $"
+                nota_tc = "Comisión = % configurable sobre ganancia_usd"
+
+            st.caption(f"ℹ️ {nota_tc}")
+
+            if df_det.empty:
+                st.info(f"No hay comisiones pendientes en {tipo_com}.")
+            else:
+                # Tabla detalle
+                df_det_show = df_det.copy()
+                df_det_show["ganancia"] = df_det_show["ganancia"].apply(lambda x: f"{moneda}{x:,.2f}")
+                df_det_show["comision"] = df_det_show["comision"].apply(lambda x: f"{moneda}{x:,.2f}")
+                st.dataframe(
+                    df_det_show[["vendedora","id","cliente","destino","ganancia","comision"]],
+                    use_container_width=True, hide_index=True)
+
+                st.divider()
+                st.markdown("##### 💸 Pagar comisión — selecciona venta(s)")
+
+                # Seleccionar vendedora y ver sus ventas pendientes
+                vendedoras_disp = sorted(df_det["vendedora"].unique().tolist())
+                col1, col2 = st.columns(2)
+                with col1:
+                    vend_sel_com = st.selectbox("Vendedora:", vendedoras_disp, key=f"com_vend_{tipo_com}")
+                
+                df_vend_com = df_det[df_det["vendedora"] == vend_sel_com].copy()
+
+                # Checkboxes para seleccionar qué ventas pagar
+                st.markdown(f"**Ventas liquidadas de {vend_sel_com}:**")
+                ids_seleccionados = []
+                monto_seleccionado = 0.0
+
+                for _, row_com in df_vend_com.iterrows():
+                    check = st.checkbox(
+                        f"ID {int(row_com['id'])} | {row_com['cliente']} — {row_com['destino']} | Comisión: {moneda}{row_com['comision']:,.2f}",
+                        value=True,
+                        key=f"com_chk_{tipo_com}_{int(row_com['id'])}"
+                    )
+                    if check:
+                        ids_seleccionados.append(int(row_com["id"]))
+                        monto_seleccionado += row_com["comision"]
+
+                if ids_seleccionados:
+                    col1, col2, col3 = st.columns(3)
+                    col1.metric("Ventas seleccionadas", len(ids_seleccionados))
+                    col2.metric("Total a pagar", f"{moneda}{monto_seleccionado:,.2f}")
+                    col3.metric("Vendedora", vend_sel_com)
+
+                    col1, col2 = st.columns(2)
+                    with col1:
+                        metodo_com = st.selectbox("Método de pago:",
+                            ["Efectivo","Transferencia","Tarjeta de débito","Otro"],
+                            key=f"com_metodo_{tipo_com}")
+                    with col2:
+                        nota_com = st.text_input("Nota (opcional):", key=f"com_nota_{tipo_com}")
+
+                    if st.button(
+                        f"💸 Pagar {moneda}{monto_seleccionado:,.2f} a {vend_sel_com} → ventas pasan a CERRADO",
+                        type="primary", use_container_width=True, key=f"com_btn_pagar_{tipo_com}"
+                    ):
+                        try:
+                            conn = conectar_db()
+                            cursor = conn.cursor()
+                            fecha_pago_com = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+                            vend_id_com = 0
+                            try:
+                                _cur = conn.cursor()
+                                _cur.execute("SELECT id FROM vendedoras WHERE nombre = ?", (vend_sel_com,))
+                                _row = _cur.fetchone()
+                                if _row: vend_id_com = _row[0]
+                            except: pass
+
+                            for vid in ids_seleccionados:
+                                comision_vid = float(df_vend_com[df_vend_com["id"]==vid]["comision"].values[0])
+
+                                # Marcar comision_pagada = 1 y pasar a CERRADO
+                                if "Riviera" in tipo_com:
+                                    cursor.execute("""
+                                        UPDATE ventas
+                                        SET comision_pagada = 1,
+                                            estado = 'CERRADO',
+                                            fecha_pago_comision = ?
+                                        WHERE id = ?
+                                    """, (fecha_pago_com, vid))
+                                else:
+                                    try:
+                                        cursor.execute(f"""
+                                            UPDATE {tabla}
+                                            SET comision_pagada = 1,
+                                                estado = 'CERRADO'
+                                            WHERE id = ?
+                                        """, (vid,))
+                                    except:
+                                        cursor.execute(f"""
+                                            UPDATE {tabla}
+                                            SET comision_pagada = 1
+                                            WHERE id = ?
+                                        """, (vid,))
+
+                                # Registrar en historial
+                                cursor.execute("""CREATE TABLE IF NOT EXISTS historial_comisiones (
+                                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                                    vendedora TEXT, vendedora_id INTEGER DEFAULT 0,
+                                    fecha TEXT, tipo TEXT, referencia_id INTEGER,
+                                    monto REAL, metodo_pago TEXT, nota TEXT)""")
+                                try: cursor.execute("ALTER TABLE historial_comisiones ADD COLUMN vendedora_id INTEGER DEFAULT 0")
+                                except: pass
+                                cursor.execute("""INSERT INTO historial_comisiones
+                                    (tipo, referencia_id, vendedora, vendedora_id, monto, metodo_pago, nota, fecha)
+                                    VALUES (?,?,?,?,?,?,?,?)""",
+                                    (tipo_com.replace("🏖️ ","").replace("🎫 ","").replace("🌎 ",""),
+                                     vid, vend_sel_com, vend_id_com, comision_vid,
+                                     metodo_com, nota_com, fecha_pago_com))
+
+                            conn.commit()
+                            conn.close()
+                            st.success(f"✅ Comisión de {moneda}{monto_seleccionado:,.2f} pagada a **{vend_sel_com}**. Las ventas ahora están en **CERRADO**.")
+                            st.balloons()
+                            st.rerun()
+
+                        except Exception as e:
+                            st.error(f"❌ Error: {e}")
+                            st.caption("💡 Asegúrate de que existan: columna `comision_pagada` (INTEGER) y `fecha_pago_comision` (TEXT) en `ventas`, y tabla `historial_comisiones`.")
+
+        # ── Historial pagadas ─────────────────────────────
+        with subtabs_com[1]:
+            st.markdown("#### ✅ Historial de Comisiones Pagadas")
+
+            conn = conectar_db()
+            try:
+                df_hist = read_sql_query("""
+                    SELECT fecha, vendedora, tipo, referencia_id,
+                           monto, metodo_pago, nota
+                    FROM historial_comisiones
+                    ORDER BY fecha DESC
+                """, conn)
+            except:
+                df_hist = pd.DataFrame()
+            conn.close()
+
+            if df_hist.empty:
+                st.info("No hay comisiones pagadas registradas aún.")
+            else:
+                # Filtros
+                col1, col2 = st.columns(2)
+                with col1:
+                    filtro_vend_h = st.selectbox("Filtrar por vendedora:",
+                        ["Todas"] + sorted(df_hist["vendedora"].unique().tolist()),
+                        key="hist_vend")
+                with col2:
+                    filtro_tipo_h = st.selectbox("Filtrar por tipo:",
+                        ["Todos"] + sorted(df_hist["tipo"].unique().tolist()),
+                        key="hist_tipo")
+
+                df_hf = df_hist.copy()
+                if filtro_vend_h != "Todas":
+                    df_hf = df_hf[df_hf["vendedora"] == filtro_vend_h]
+                if filtro_tipo_h != "Todos":
+                    df_hf = df_hf[df_hf["tipo"] == filtro_tipo_h]
+
+                total_hist = df_hf["monto"].sum()
+                col1, col2 = st.columns(2)
+                col1.metric("Registros", len(df_hf))
+                col2.metric("Total pagado", f"${total_hist:,.2f}")
+
+                df_hf_show = df_hf.copy()
+                df_hf_show["monto"] = df_hf_show["monto"].apply(lambda x: f"${x:,.2f}")
+                df_hf_show.columns = ["Fecha","Vendedora","Tipo","ID Ref.","Monto","Método","Nota"]
+                st.dataframe(df_hf_show, use_container_width=True, hide_index=True)
+
+                csv_hist = df_hf_show.to_csv(index=False).encode("utf-8")
+                st.download_button("📥 Descargar historial",
+                    csv_hist, file_name=f"historial_comisiones_{datetime.now().strftime('%Y%m%d')}.csv",
+                    mime="text/csv")
+
+        # ── Configurar porcentaje ─────────────────────────
+        with subtabs_com[2]:
+            st.markdown("#### ⚙️ Porcentaje de Comisión por Tipo")
+            st.info("💡 Este porcentaje se aplica **sobre la ganancia** de cada venta liquidada.")
+
+            conn = conectar_db()
+            try:
+                df_cfg = read_sql_query(
+                    "SELECT tipo, porcentaje_comision FROM config_comisiones", conn)
+                cfg_dict = dict(zip(df_cfg["tipo"], df_cfg["porcentaje_comision"]))
+            except:
+                cfg_dict = {}
+            conn.close()
+
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                pct_riv = st.number_input("Riviera Maya (%)",
+                    min_value=1, max_value=100,
+                    value=int(cfg_dict.get("riviera", 30)),
+                    key="cfg_pct_riv")
+            with col2:
+                pct_nac = st.number_input("Nacionales (%)",
+                    min_value=1, max_value=100,
+                    value=int(cfg_dict.get("nacionales", 30)),
+                    key="cfg_pct_nac")
+            with col3:
+                pct_int = st.number_input("Internacionales (%)",
+                    min_value=1, max_value=100,
+                    value=int(cfg_dict.get("internacionales", 30)),
+                    key="cfg_pct_int")
+
+            st.markdown("")
+            st.markdown("**Ejemplo con 30%:** Si una venta tuvo $1,000 de ganancia → comisión = $300")
+
+            if st.button("💾 Guardar Porcentajes", type="primary", key="cfg_guardar_pct"):
+                try:
+                    conn = conectar_db()
+                    cursor = conn.cursor()
+                    for tipo, pct in [("riviera", pct_riv), ("nacionales", pct_nac), ("internacionales", pct_int)]:
+                        cursor.execute("""
+                            INSERT INTO config_comisiones (tipo, porcentaje_comision)
+                            VALUES (?, ?)
+                            ON CONFLICT(tipo) DO UPDATE SET porcentaje_comision = excluded.porcentaje_comision
+                        """, (tipo, pct))
+                    conn.commit()
+                    conn.close()
+                    st.success("✅ Porcentajes guardados correctamente.")
+                    st.rerun()
+                except Exception as e:
+                    st.error(f"❌ Error: {e}")
+                    st.caption("💡 Asegúrate de que exista la tabla `config_comisiones` con columnas `tipo` (UNIQUE) y `porcentaje_comision`.")
+
+    # ══════════════════════════════════════════════════════
+    # TAB 1 — VENDEDORAS
+    # ══════════════════════════════════════════════════════
+    with tabs[1]:
+        st.subheader("👩‍💼 Gestión de Vendedoras")
+        subtabs_vend = st.tabs(["➕ Nueva Vendedora", "✏️ Editar / Activar"])
+
+        with subtabs_vend[0]:
+            st.markdown("#### Registrar Nueva Vendedora")
+            nv_nombre = st.text_input("Nombre completo *", key="nv_nombre")
+            if st.button("💾 Registrar Vendedora", type="primary", key="nv_guardar"):
+                if not nv_nombre.strip():
+                    st.error("❌ El nombre es obligatorio.")
+                else:
+                    try:
+                        conn = conectar_db()
+                        cursor = conn.cursor()
+                        cursor.execute(
+                            "INSERT INTO vendedoras (nombre, activa, fecha_registro) VALUES (?, 1, ?)",
+                            (nv_nombre.strip(), datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+                        )
+                        conn.commit()
+                        conn.close()
+                        st.success(f"✅ Vendedora **{nv_nombre}** registrada.")
+                        st.rerun()
+                    except Exception as e:
+                        st.error(f"❌ Error: {e}")
+
+        with subtabs_vend[1]:
+            st.markdown("#### Editar o cambiar estado de vendedora")
+            conn = conectar_db()
+            try:
+                df_vends = read_sql_query(
+                    "SELECT id, nombre, activa FROM vendedoras ORDER BY nombre", conn)
+            except:
+                df_vends = pd.DataFrame()
+            conn.close()
+
+            if df_vends.empty:
+                st.info("No hay vendedoras registradas.")
+            else:
+                vend_opts = {
+                    f"ID {row['id']} | {row['nombre']} ({'ACTIVA' if row['activa'] else 'INACTIVA'})": row
+                    for _, row in df_vends.iterrows()
+                }
+                vend_edit_label = st.selectbox("Selecciona vendedora:", list(vend_opts.keys()), key="vend_edit_sel")
+                vend_edit = vend_opts[vend_edit_label]
+
+                col1, col2 = st.columns(2)
+                with col1:
+                    nuevo_nombre_v = st.text_input("Nombre", value=vend_edit["nombre"], key="vend_edit_nom")
+                with col2:
+                    nuevo_estado_v = st.selectbox("Estado",
+                        ["ACTIVA", "INACTIVA"],
+                        index=0 if vend_edit["activa"] else 1,
+                        key="vend_edit_est")
+
+                if st.button("💾 Guardar Cambios", type="primary", key="vend_edit_guardar"):
+                    try:
+                        conn = conectar_db()
+                        cursor = conn.cursor()
+                        cursor.execute(
+                            "UPDATE vendedoras SET nombre = ?, activa = ? WHERE id = ?",
+                            (nuevo_nombre_v.strip(), 1 if nuevo_estado_v == "ACTIVA" else 0, int(vend_edit["id"]))
+                        )
+                        conn.commit()
+                        conn.close()
+                        st.success("✅ Vendedora actualizada.")
+                        st.rerun()
+                    except Exception as e:
+                        st.error(f"❌ Error: {e}")
+
+    # ══════════════════════════════════════════════════════
+    # TAB 2 — HOTELES / CATÁLOGOS
+    # ══════════════════════════════════════════════════════
+    with tabs[2]:
+        st.subheader("🏨 Catálogo de Hoteles")
+        subtabs_hot = st.tabs(["➕ Nuevo Hotel", "📋 Ver Hoteles"])
+
+        with subtabs_hot[0]:
+            st.markdown("#### ➕ Registrar Nuevo Hotel")
+            col1, col2 = st.columns(2)
+            with col1:
+                nh_nombre = st.text_input("Nombre del hotel *",
+                    placeholder="Ej: Barceló Maya Grand", key="nh_nombre")
+            with col2:
+                nh_estrellas = st.selectbox("Estrellas", [3, 4, 5], index=1, key="nh_estrellas")
+
+            nh_direccion = st.text_input("Dirección",
+                placeholder="Ej: Carr. Cancún-Tulum Km. 266,3, Xpu Ha, Q.R.",
+                key="nh_direccion")
+            nh_telefono = st.text_input("Teléfono",
+                placeholder="Ej: 984 875 1500", key="nh_telefono")
+
+            if st.button("💾 Agregar Hotel", type="primary",
+                         use_container_width=True, key="nh_guardar"):
+                if not nh_nombre.strip():
+                    st.error("❌ El nombre es obligatorio.")
+                else:
+                    try:
+                        conn = conectar_db()
+                        cursor = conn.cursor()
+                        try:
+                            cursor.execute(
+                                """INSERT INTO hoteles
+                                   (nombre, direccion, telefono, estrellas, activo, veces_usado)
+                                   VALUES (?, ?, ?, ?, 1, 0)""",
+                                (nh_nombre.strip(),
+                                 nh_direccion.strip() or None,
+                                 nh_telefono.strip() or None,
+                                 nh_estrellas)
+                            )
+                        except Exception:
+                            cursor.execute(
+                                "INSERT INTO hoteles (nombre, activo, veces_usado) VALUES (?, 1, 0)",
+                                (nh_nombre.strip(),)
+                            )
+                        conn.commit()
+                        conn.close()
+                        st.success(f"✅ Hotel **{nh_nombre}** agregado.")
+                        st.rerun()
+                    except Exception as e:
+                        st.error(f"❌ Error: {e}")
+
+        with subtabs_hot[1]:
+            conn = conectar_db()
+            try:
+                df_hoteles = read_sql_query(
+                    """SELECT id, nombre,
+                              COALESCE(estrellas, 4) as estrellas,
+                              COALESCE(direccion, '—') as direccion,
+                              COALESCE(telefono, '—') as telefono,
+                              activo, veces_usado
+                       FROM hoteles ORDER BY nombre""", conn)
+            except Exception:
+                df_hoteles = pd.DataFrame()
+            conn.close()
+
+            if df_hoteles.empty:
+                st.info("No hay hoteles en el catálogo.")
+            else:
+                df_hoteles["activo"]    = df_hoteles["activo"].apply(lambda x: "✅ Activo" if x else "❌ Inactivo")
+                df_hoteles["estrellas"] = df_hoteles["estrellas"].apply(lambda x: "★" * int(x) if x else "")
+                df_hoteles.columns = ["ID","Hotel","Estrellas","Dirección","Teléfono","Estado","Veces usado"]
+                st.dataframe(df_hoteles, use_container_width=True, hide_index=True)
+
+    # ══════════════════════════════════════════════════════
+    # TAB 3 — MAYORISTAS / OPERADORES
+    # ══════════════════════════════════════════════════════
+    with tabs[3]:
+        st.subheader("🏢 Mayoristas / Operadores")
+        st.info("💡 Los mayoristas aparecen en el selector **Operador** al registrar una Venta General en Riviera Maya.")
+
+        subtabs_may = st.tabs(["➕ Nuevo Mayorista", "📋 Ver / Editar"])
+
+        # ── Nuevo Mayorista ───────────────────────────────
+        with subtabs_may[0]:
+            st.markdown("#### Registrar Nuevo Mayorista")
+            col1, col2 = st.columns(2)
+            with col1:
+                may_nombre = st.text_input("Nombre del mayorista / operador *",
+                    placeholder="Ej: Amstar, Despegar, Apple Leisure", key="may_nombre")
+            with col2:
+                may_contacto = st.text_input("Contacto / teléfono (opcional)", key="may_contacto")
+            may_notas = st.text_area("Notas (opcional)", height=80, key="may_notas")
+
+            if st.button("💾 Agregar Mayorista", type="primary", use_container_width=True, key="may_guardar"):
+                if not may_nombre.strip():
+                    st.error("❌ El nombre es obligatorio.")
+                else:
+                    try:
+                        conn = conectar_db()
+                        cursor = conn.cursor()
+                        # Intentar con columnas extra, si no existen usar solo nombre y activo
+                        try:
+                            cursor.execute(
+                                "INSERT INTO operadores (nombre, contacto, notas, activo) VALUES (?, ?, ?, 1)",
+                                (may_nombre.strip(), may_contacto.strip() or None, may_notas.strip() or None)
+                            )
+                        except Exception:
+                            cursor.execute(
+                                "INSERT INTO operadores (nombre, activo) VALUES (?, 1)",
+                                (may_nombre.strip(),)
+                            )
+                        conn.commit()
+                        conn.close()
+                        st.success(f"✅ Mayorista **{may_nombre}** agregado correctamente.")
+                        st.rerun()
+                    except Exception as e:
+                        st.error(f"❌ Error: {e}")
+
+        # ── Ver / Editar Mayoristas ───────────────────────
+        with subtabs_may[1]:
+            st.markdown("#### 📋 Mayoristas Registrados")
+            conn = conectar_db()
+            try:
+                df_may = read_sql_query(
+                    "SELECT id, nombre, activo FROM operadores ORDER BY nombre", conn)
+            except Exception:
+                df_may = pd.DataFrame()
+            conn.close()
+
+            if df_may.empty:
+                st.info("No hay mayoristas registrados. Agrégalos en la pestaña ➕ Nuevo Mayorista.")
+            else:
+                # Métricas
+                activos_may = df_may[df_may['activo'] == 1]
+                col1, col2 = st.columns(2)
+                col1.metric("Total mayoristas", len(df_may))
+                col2.metric("Activos", len(activos_may))
+
+                st.divider()
+
+                # Tabla con estado legible
+                df_may_show = df_may.copy()
+                df_may_show['activo'] = df_may_show['activo'].apply(
+                    lambda x: "✅ Activo" if x else "❌ Inactivo")
+                df_may_show.columns = ["ID", "Mayorista / Operador", "Estado"]
+                st.dataframe(df_may_show, use_container_width=True, hide_index=True)
+
+                st.divider()
+                st.markdown("##### ✏️ Editar un mayorista")
+
+                may_opts = {
+                    f"ID {row['id']} | {row['nombre']} ({'Activo' if row['activo'] == 1 else 'Inactivo'})": row
+                    for _, row in df_may.iterrows()
+                }
+                may_sel_label = st.selectbox("Selecciona:", list(may_opts.keys()), key="may_ed_sel")
+                may_sel = may_opts[may_sel_label]
+
+                col1, col2 = st.columns(2)
+                with col1:
+                    may_ed_nombre = st.text_input("Nombre", value=may_sel['nombre'], key="may_ed_nombre")
+                with col2:
+                    may_ed_estado = st.selectbox("Estado",
+                        ["ACTIVO", "INACTIVO"],
+                        index=0 if may_sel['activo'] == 1 else 1,
+                        key="may_ed_estado")
+
+                col_btn1, col_btn2 = st.columns(2)
+                with col_btn1:
+                    if st.button("💾 Guardar cambios", type="primary", key="may_ed_guardar"):
+                        if not may_ed_nombre.strip():
+                            st.error("❌ El nombre no puede estar vacío.")
+                        else:
+                            try:
+                                conn = conectar_db()
+                                cursor = conn.cursor()
+                                cursor.execute(
+                                    "UPDATE operadores SET nombre = ?, activo = ? WHERE id = ?",
+                                    (may_ed_nombre.strip(),
+                                     1 if may_ed_estado == "ACTIVO" else 0,
+                                     int(may_sel['id']))
+                                )
+                                conn.commit()
+                                conn.close()
+                                st.success(f"✅ Mayorista actualizado → **{may_ed_nombre}** ({may_ed_estado})")
+                                st.rerun()
+                            except Exception as e:
+                                st.error(f"❌ Error: {e}")
+                with col_btn2:
+                    if st.button("🗑️ Eliminar mayorista", key="may_ed_borrar"):
+                        try:
+                            conn = conectar_db()
+                            cursor = conn.cursor()
+                            cursor.execute("DELETE FROM operadores WHERE id = ?", (int(may_sel['id']),))
+                            conn.commit()
+                            conn.close()
+                            st.success(f"✅ Mayorista **{may_sel['nombre']}** eliminado.")
+                            st.rerun()
+                        except Exception as e:
+                            st.error(f"❌ Error al eliminar: {e}")
+
+    # ══════════════════════════════════════════════════════
+    # TAB 4 — BLOQUEOS
+    # ══════════════════════════════════════════════════════
+    with tabs[4]:
+        st.subheader("📦 Gestión de Bloqueos")
+        st.info("💡 Un **bloqueo** es un lote de habitaciones pre-compradas al mayorista. Al registrar una venta de tipo Bloqueo, se descuenta automáticamente del inventario.")
+
+        subtabs_bl = st.tabs(["➕ Nuevo Bloqueo", "📋 Ver Bloqueos", "✏️ Editar Bloqueo"])
+
+        # ── Nuevo Bloqueo ─────────────────────────────────
+        with subtabs_bl[0]:
+            st.markdown("#### Registrar Nuevo Bloqueo")
+
+            col1, col2 = st.columns(2)
+            with col1:
+                hoteles_cat = obtener_hoteles()
+                if hoteles_cat:
+                    bl_hotel = st.selectbox("Hotel *", hoteles_cat, key="bl_hotel")
+                else:
+                    bl_hotel = st.text_input("Hotel *", key="bl_hotel_txt")
+                bl_operador    = st.text_input("Operador mayorista (opcional)", key="bl_operador")
+                bl_responsable = st.text_input("Celular del responsable", key="bl_responsable")
+            with col2:
+                bl_fecha_ini = st.date_input("Fecha de inicio *", key="bl_fi")
+                bl_fecha_fin = st.date_input("Fecha de fin *",    key="bl_ff")
+                bl_hab       = st.number_input("Habitaciones compradas *", min_value=1, value=10, key="bl_hab")
+
+            if bl_fecha_fin > bl_fecha_ini:
+                bl_noches = (bl_fecha_fin - bl_fecha_ini).days
+                st.success(f"✅ {bl_noches} noches")
+            else:
+                bl_noches = 0
+                st.error("❌ Fecha de fin debe ser posterior a la de inicio")
+
+            st.divider()
+            st.markdown("##### 💵 Precios por noche — Adultos")
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                bl_p_doble   = st.number_input("Doble/noche *",    min_value=0.0, step=50.0, format="%.2f", key="bl_pd")
+            with col2:
+                bl_p_triple  = st.number_input("Triple/noche *",   min_value=0.0, step=50.0, format="%.2f", key="bl_pt")
+            with col3:
+                bl_p_cuad    = st.number_input("Cuádruple/noche *",min_value=0.0, step=50.0, format="%.2f", key="bl_pc")
+
+            st.markdown("##### 👶 Precios por noche — Menores")
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                bl_mn_doble  = st.number_input("Menor Doble/noche",   min_value=0.0, step=50.0, format="%.2f", key="bl_md")
+            with col2:
+                bl_mn_triple = st.number_input("Menor Triple/noche",  min_value=0.0, step=50.0, format="%.2f", key="bl_mt")
+            with col3:
+                bl_mn_cuad   = st.number_input("Menor Cuádruple/noche",min_value=0.0, step=50.0, format="%.2f", key="bl_mc")
+
+            bl_costo_real = st.number_input("Costo real por habitación (referencia interna)", min_value=0.0, step=100.0, format="%.2f", key="bl_costo")
+
+            # Preview rápido
+            if bl_noches > 0 and bl_p_doble > 0:
+                st.markdown("**📊 Vista previa (habitación doble × estancia completa):**")
+                col1, col2, col3 = st.columns(3)
+                col1.metric("Total doble", f"${bl_p_doble * bl_noches:,.2f}")
+                col2.metric("Total triple", f"${bl_p_triple * bl_noches:,.2f}")
+                col3.metric("Total cuádruple", f"${bl_p_cuad * bl_noches:,.2f}")
+
+            if st.button("💾 Registrar Bloqueo", type="primary", use_container_width=True, key="bl_guardar"):
+                errores_bl = []
+                if not bl_hotel: errores_bl.append("El hotel es obligatorio.")
+                if bl_noches <= 0: errores_bl.append("Las fechas no son válidas.")
+                if bl_p_doble <= 0: errores_bl.append("El precio doble es obligatorio.")
+
+                if errores_bl:
+                    for e in errores_bl: st.error(f"❌ {e}")
+                else:
+                    try:
+                        conn = conectar_db()
+                        cursor = conn.cursor()
+                        cursor.execute("""
+                            INSERT INTO bloqueos (
+                                hotel, operador, celular_responsable, fecha_inicio, fecha_fin, noches,
+                                habitaciones_totales, habitaciones_vendidas, habitaciones_disponibles,
+                                precio_noche_doble, precio_noche_triple, precio_noche_cuadruple,
+                                precio_menor_doble, precio_menor_triple, precio_menor_cuadruple,
+                                costo_real, estado, fecha_registro
+                            ) VALUES (?,?,?,?,?,?,?,0,?,?,?,?,?,?,?,?,'ACTIVO',?)
+                        """, (
+                            bl_hotel, bl_operador or None, bl_responsable,
+                            bl_fecha_ini.strftime("%d-%m-%Y"), bl_fecha_fin.strftime("%d-%m-%Y"), bl_noches,
+                            bl_hab, bl_hab,
+                            bl_p_doble, bl_p_triple, bl_p_cuad,
+                            bl_mn_doble, bl_mn_triple, bl_mn_cuad,
+                            bl_costo_real, datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                        ))
+                        conn.commit()
+                        conn.close()
+                        st.success(f"✅ Bloqueo en **{bl_hotel}** registrado con {bl_hab} habitaciones.")
+                        st.rerun()
+                    except Exception as e:
+                        st.error(f"❌ Error: {e}")
+
+        # ── Ver Bloqueos ──────────────────────────────────
+        with subtabs_bl[1]:
+            st.markdown("#### 📋 Todos los Bloqueos")
+            conn = conectar_db()
+            try:
+                df_bl = read_sql_query("""
+                    SELECT id, hotel, fecha_inicio, fecha_fin, noches,
+                           habitaciones_totales, habitaciones_vendidas, habitaciones_disponibles,
+                           precio_noche_doble, precio_noche_triple, precio_noche_cuadruple,
+                           costo_real, estado
+                    FROM bloqueos ORDER BY fecha_inicio DESC
+                """, conn)
+            except:
+                df_bl = pd.DataFrame()
+            conn.close()
+
+            if df_bl.empty:
+                st.info("No hay bloqueos registrados aún.")
+            else:
+                # Métricas resumen
+                col1, col2, col3, col4 = st.columns(4)
+                activos_bl = df_bl[df_bl['estado'] == 'ACTIVO']
+                col1.metric("Total bloqueos", len(df_bl))
+                col2.metric("Activos", len(activos_bl))
+                col3.metric("Hab. disponibles", int(df_bl['habitaciones_disponibles'].sum()))
+                col4.metric("Hab. vendidas",    int(df_bl['habitaciones_vendidas'].sum()))
+
+                st.divider()
+                filtro_est_bl = st.selectbox("Filtrar por estado:",
+                    ["Todos"] + sorted(df_bl['estado'].unique().tolist()), key="bl_filtro_est")
+                df_blf = df_bl if filtro_est_bl == "Todos" else df_bl[df_bl['estado'] == filtro_est_bl]
+
+                df_bl_show = df_blf.copy()
+                df_bl_show['precio_noche_doble']   = df_bl_show['precio_noche_doble'].apply(lambda x: f"${x:,.2f}")
+                df_bl_show['precio_noche_triple']  = df_bl_show['precio_noche_triple'].apply(lambda x: f"${x:,.2f}")
+                df_bl_show['precio_noche_cuadruple']= df_bl_show['precio_noche_cuadruple'].apply(lambda x: f"${x:,.2f}")
+                df_bl_show['costo_real']           = df_bl_show['costo_real'].apply(lambda x: f"${x:,.2f}")
+                df_bl_show.columns = ['ID','Hotel','Inicio','Fin','Noches',
+                                       'Total','Vendidas','Disponibles',
+                                       'P. Doble/n','P. Triple/n','P. Cuád/n','Costo/hab','Estado']
+                st.dataframe(df_bl_show, use_container_width=True, hide_index=True)
+
+                # Cambiar estado
+                st.divider()
+                st.markdown("##### 🔄 Cambiar estado de un bloqueo")
+                bl_ids = df_blf['id'].tolist()
+                if bl_ids:
+                    id_bl_cambio = st.selectbox("ID del bloqueo:", bl_ids, key="bl_cambio_id")
+                    row_bl = df_blf[df_blf['id'] == id_bl_cambio].iloc[0]
+                    nuevo_est_bl = "CERRADO" if row_bl['estado'] == "ACTIVO" else "ACTIVO"
+                    if st.button(f"{'🔒 Cerrar' if nuevo_est_bl == 'CERRADO' else '🔓 Reactivar'} bloqueo ID {id_bl_cambio}",
+                                 key="bl_cambio_btn"):
+                        try:
+                            conn = conectar_db()
+                            cursor = conn.cursor()
+                            cursor.execute("UPDATE bloqueos SET estado = ? WHERE id = ?", (nuevo_est_bl, int(id_bl_cambio)))
+                            conn.commit()
+                            conn.close()
+                            st.success(f"✅ Bloqueo ID {id_bl_cambio} → {nuevo_est_bl}")
+                            st.rerun()
+                        except Exception as e:
+                            st.error(f"❌ Error: {e}")
+
+        # ── Editar Bloqueo ────────────────────────────────
+        with subtabs_bl[2]:
+            st.markdown("#### ✏️ Editar Bloqueo")
+            conn = conectar_db()
+            try:
+                df_bl_ed = read_sql_query(
+                    "SELECT id, hotel, habitaciones_totales, habitaciones_disponibles, habitaciones_vendidas, "
+                    "precio_noche_doble, precio_noche_triple, precio_noche_cuadruple, costo_real, estado "
+                    "FROM bloqueos ORDER BY id DESC", conn)
+            except:
+                df_bl_ed = pd.DataFrame()
+            conn.close()
+
+            if df_bl_ed.empty:
+                st.info("No hay bloqueos para editar.")
+            else:
+                bl_ed_opts = {
+                    f"ID {row['id']} | {row['hotel']} | {row['estado']}": row
+                    for _, row in df_bl_ed.iterrows()
+                }
+                bl_ed_label = st.selectbox("Selecciona bloqueo:", list(bl_ed_opts.keys()), key="bl_ed_sel")
+                bl_ed = bl_ed_opts[bl_ed_label]
+
+                col1, col2 = st.columns(2)
+                with col1:
+                    hoteles_cat2 = obtener_hoteles()
+                    if hoteles_cat2 and bl_ed['hotel'] in hoteles_cat2:
+                        bl_ed_hotel = st.selectbox("Hotel", hoteles_cat2,
+                            index=hoteles_cat2.index(bl_ed['hotel']), key="bl_ed_hotel")
+                    else:
+                        bl_ed_hotel = st.text_input("Hotel", value=bl_ed['hotel'], key="bl_ed_hotel_txt")
+                    bl_ed_hab    = st.number_input("Habitaciones totales",
+                        min_value=int(bl_ed['habitaciones_vendidas']), value=int(bl_ed['habitaciones_totales']),
+                        key="bl_ed_hab")
+                with col2:
+                    bl_ed_pd  = st.number_input("Precio doble/noche",    min_value=0.0, value=float(bl_ed['precio_noche_doble']),   step=50.0, format="%.2f", key="bl_ed_pd")
+                    bl_ed_pt  = st.number_input("Precio triple/noche",   min_value=0.0, value=float(bl_ed['precio_noche_triple']),  step=50.0, format="%.2f", key="bl_ed_pt")
+                    bl_ed_pc  = st.number_input("Precio cuádruple/noche",min_value=0.0, value=float(bl_ed['precio_noche_cuadruple']),step=50.0, format="%.2f", key="bl_ed_pc")
+                    bl_ed_costo = st.number_input("Costo real/hab", min_value=0.0, value=float(bl_ed['costo_real']), step=100.0, format="%.2f", key="bl_ed_costo")
+
+                nuevas_disp_bl = bl_ed_hab - int(bl_ed['habitaciones_vendidas'])
+                st.caption(f"Nuevas disponibles calculadas: {nuevas_disp_bl}")
+
+                if st.button("💾 Guardar Cambios en Bloqueo", type="primary", key="bl_ed_guardar"):
+                    try:
+                        conn = conectar_db()
+                        cursor = conn.cursor()
+                        cursor.execute("""
+                            UPDATE bloqueos
+                            SET hotel = ?, habitaciones_totales = ?, habitaciones_disponibles = ?,
+                                precio_noche_doble = ?, precio_noche_triple = ?, precio_noche_cuadruple = ?,
+                                costo_real = ?
+                            WHERE id = ?
+                        """, (bl_ed_hotel, bl_ed_hab, max(0, nuevas_disp_bl),
+                              bl_ed_pd, bl_ed_pt, bl_ed_pc, bl_ed_costo, int(bl_ed['id'])))
+                        conn.commit()
+                        conn.close()
+                        st.success("✅ Bloqueo actualizado correctamente.")
+                        st.rerun()
+                    except Exception as e:
+                        st.error(f"❌ Error: {e}")
+
+    # ══════════════════════════════════════════════════════
+    # TAB 5 — GRUPOS
+    # ══════════════════════════════════════════════════════
+    with tabs[5]:
+        st.subheader("👥 Gestión de Grupos")
+        st.info("💡 Un **grupo** es una compra en bloque para un conjunto de personas (ej. viaje de empresa, excursión familiar). Al registrar una venta de tipo Grupo, se descuenta automáticamente del inventario de habitaciones.")
+
+        subtabs_gr = st.tabs(["➕ Nuevo Grupo", "📋 Ver Grupos", "✏️ Editar / Cerrar"])
+
+        # ── Nuevo Grupo ───────────────────────────────────
+        with subtabs_gr[0]:
+            st.markdown("#### Registrar Nuevo Grupo")
+
+            col1, col2 = st.columns(2)
+            with col1:
+                gr_nombre    = st.text_input("Nombre del grupo *", placeholder="Ej: Familia García Verano 2025", key="gr_nombre")
+                hoteles_cat3 = obtener_hoteles()
+                if hoteles_cat3:
+                    gr_hotel = st.selectbox("Hotel *", hoteles_cat3, key="gr_hotel")
+                else:
+                    gr_hotel = st.text_input("Hotel *", key="gr_hotel_txt")
+                gr_operador  = st.text_input("Operador mayorista (opcional)", key="gr_operador")
+            with col2:
+                gr_fecha_ini  = st.date_input("Fecha de inicio *", key="gr_fi")
+                gr_fecha_fin  = st.date_input("Fecha de fin *",    key="gr_ff")
+                gr_hab        = st.number_input("Habitaciones totales *", min_value=1, value=5, key="gr_hab")
+
+            if gr_fecha_fin > gr_fecha_ini:
+                gr_noches = (gr_fecha_fin - gr_fecha_ini).days
+                st.success(f"✅ {gr_noches} noches")
+            else:
+                gr_noches = 0
+                st.error("❌ Fecha de fin debe ser posterior a la de inicio")
+
+            st.divider()
+            st.markdown("##### 💵 Precios por noche — Adultos")
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                gr_p_doble   = st.number_input("Doble/noche *",    min_value=0.0, step=50.0, format="%.2f", key="gr_pd")
+            with col2:
+                gr_p_triple  = st.number_input("Triple/noche",     min_value=0.0, step=50.0, format="%.2f", key="gr_pt")
+            with col3:
+                gr_p_cuad    = st.number_input("Cuádruple/noche",  min_value=0.0, step=50.0, format="%.2f", key="gr_pc")
+
+            st.markdown("##### 👶 Precios por noche — Menores")
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                gr_mn_doble  = st.number_input("Menor Doble/noche",    min_value=0.0, step=50.0, format="%.2f", key="gr_md")
+            with col2:
+                gr_mn_triple = st.number_input("Menor Triple/noche",   min_value=0.0, step=50.0, format="%.2f", key="gr_mt")
+            with col3:
+                gr_mn_cuad   = st.number_input("Menor Cuádruple/noche",min_value=0.0, step=50.0, format="%.2f", key="gr_mc")
+
+            gr_costo_real = st.number_input("Costo real total del grupo ($)", min_value=0.0, step=500.0, format="%.2f", key="gr_costo")
+
+            st.divider()
+            st.markdown("##### 👤 Responsable del grupo")
+            col1, col2 = st.columns(2)
+            with col1:
+                gr_responsable = st.text_input("Nombre del responsable", value="Mamá", key="gr_resp")
+            with col2:
+                gr_celular_resp = st.text_input("Celular del responsable", key="gr_cel_resp")
+
+            # Preview
+            if gr_noches > 0 and gr_p_doble > 0:
+                st.markdown("**📊 Vista previa (habitación doble × estancia completa):**")
+                col1, col2, col3 = st.columns(3)
+                col1.metric("Total doble", f"${gr_p_doble * gr_noches:,.2f}")
+                col2.metric("Total triple", f"${gr_p_triple * gr_noches:,.2f}")
+                col3.metric("Total cuádruple", f"${gr_p_cuad * gr_noches:,.2f}")
+
+            if st.button("💾 Registrar Grupo", type="primary", use_container_width=True, key="gr_guardar"):
+                errores_gr = []
+                if not gr_nombre.strip(): errores_gr.append("El nombre del grupo es obligatorio.")
+                if not gr_hotel:          errores_gr.append("El hotel es obligatorio.")
+                if gr_noches <= 0:        errores_gr.append("Las fechas no son válidas.")
+                if gr_p_doble <= 0:       errores_gr.append("El precio doble es obligatorio.")
+
+                if errores_gr:
+                    for e in errores_gr: st.error(f"❌ {e}")
+                else:
+                    try:
+                        conn = conectar_db()
+                        cursor = conn.cursor()
+                        cursor.execute("""
+                            INSERT INTO grupos (
+                                nombre_grupo, operador, hotel, fecha_inicio, fecha_fin, noches,
+                                habitaciones_totales, habitaciones_vendidas, habitaciones_disponibles,
+                                precio_noche_doble, precio_noche_triple, precio_noche_cuadruple,
+                                precio_menor_doble, precio_menor_triple, precio_menor_cuadruple,
+                                costo_real, responsable, celular_responsable, estado, fecha_registro
+                            ) VALUES (?,?,?,?,?,?,?,0,?,?,?,?,?,?,?,?,?,?,'ACTIVO',?)
+                        """, (
+                            gr_nombre.strip(), gr_operador or None, gr_hotel,
+                            gr_fecha_ini.strftime("%d-%m-%Y"), gr_fecha_fin.strftime("%d-%m-%Y"), gr_noches,
+                            gr_hab, gr_hab,
+                            gr_p_doble, gr_p_triple, gr_p_cuad,
+                            gr_mn_doble, gr_mn_triple, gr_mn_cuad,
+                            gr_costo_real, gr_responsable, gr_celular_resp,
+                            datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                        ))
+                        conn.commit()
+                        conn.close()
+                        st.success(f"✅ Grupo **{gr_nombre}** registrado con {gr_hab} habitaciones.")
+                        st.rerun()
+                    except Exception as e:
+                        st.error(f"❌ Error: {e}")
+                        st.caption("💡 Asegúrate de que exista la tabla `grupos` en la base de datos.")
+
+        # ── Ver Grupos ────────────────────────────────────
+        with subtabs_gr[1]:
+            st.markdown("#### 📋 Todos los Grupos")
+            conn = conectar_db()
+            try:
+                df_gr = read_sql_query("""
+                    SELECT id, nombre_grupo, operador, hotel,
+                           fecha_inicio, fecha_fin, noches,
+                           habitaciones_totales, habitaciones_vendidas, habitaciones_disponibles,
+                           precio_noche_doble, costo_real, responsable, estado
+                    FROM grupos ORDER BY fecha_inicio DESC
+                """, conn)
+            except:
+                df_gr = pd.DataFrame()
+            conn.close()
+
+            if df_gr.empty:
+                st.info("No hay grupos registrados aún.")
+            else:
+                col1, col2, col3, col4 = st.columns(4)
+                activos_gr = df_gr[df_gr['estado'] == 'ACTIVO']
+                col1.metric("Total grupos",        len(df_gr))
+                col2.metric("Activos",             len(activos_gr))
+                col3.metric("Hab. disponibles",    int(df_gr['habitaciones_disponibles'].sum()))
+                col4.metric("Hab. vendidas",        int(df_gr['habitaciones_vendidas'].sum()))
+
+                st.divider()
+                filtro_est_gr = st.selectbox("Filtrar por estado:",
+                    ["Todos"] + sorted(df_gr['estado'].unique().tolist()), key="gr_filtro_est")
+                df_grf = df_gr if filtro_est_gr == "Todos" else df_gr[df_gr['estado'] == filtro_est_gr]
+
+                for _, row_gr in df_grf.iterrows():
+                    ocupacion_gr = (row_gr['habitaciones_vendidas'] / row_gr['habitaciones_totales'] * 100) \
+                                   if row_gr['habitaciones_totales'] > 0 else 0
+                    estado_icon_gr = "✅" if row_gr['estado'] == "ACTIVO" else ("🔒" if row_gr['estado'] == "CERRADO" else "📭")
+                    with st.expander(
+                        f"{estado_icon_gr} ID {int(row_gr['id'])} | {row_gr['nombre_grupo']} — {row_gr['hotel']} | {row_gr['habitaciones_disponibles']} disp.",
+                        expanded=False):
+                        c1, c2, c3, c4 = st.columns(4)
+                        c1.metric("Hotel",       row_gr['hotel'])
+                        c2.metric("Noches",      row_gr['noches'])
+                        c3.metric("Hab. Vendidas",f"{int(row_gr['habitaciones_vendidas'])}/{int(row_gr['habitaciones_totales'])}")
+                        c4.metric("Ocupación",   f"{ocupacion_gr:.0f}%")
+
+                        c1b, c2b, c3b = st.columns(3)
+                        c1b.write(f"**Fechas:** {row_gr['fecha_inicio']} → {row_gr['fecha_fin']}")
+                        c2b.write(f"**Operador:** {row_gr['operador'] or '—'}")
+                        c3b.write(f"**Responsable:** {row_gr['responsable']}")
+
+                        c1c, c2c, c3c = st.columns(3)
+                        c1c.metric("Precio doble/noche",   f"${row_gr['precio_noche_doble']:,.2f}")
+                        c2c.metric("Costo real total",     f"${row_gr['costo_real']:,.2f}")
+                        c3c.metric("Estado",               row_gr['estado'])
+
+                        if row_gr['habitaciones_totales'] > 0:
+                            st.progress(min(ocupacion_gr / 100, 1.0))
+
+                csv_gr = df_grf.to_csv(index=False).encode('utf-8')
+                st.download_button("📥 Descargar CSV de grupos", csv_gr,
+                    file_name=f"grupos_{datetime.now().strftime('%Y%m%d')}.csv", mime="text/csv", key="gr_csv")
+
+        # ── Editar / Cerrar Grupo ─────────────────────────
+        with subtabs_gr[2]:
+            st.markdown("#### ✏️ Editar o Cerrar un Grupo")
+            conn = conectar_db()
+            try:
+                df_gr_ed = read_sql_query("""
+                    SELECT id, nombre_grupo, hotel, habitaciones_totales, habitaciones_vendidas,
+                           habitaciones_disponibles, precio_noche_doble, precio_noche_triple,
+                           precio_noche_cuadruple, costo_real, estado
+                    FROM grupos ORDER BY id DESC
+                """, conn)
+            except:
+                df_gr_ed = pd.DataFrame()
+            conn.close()
+
+            if df_gr_ed.empty:
+                st.info("No hay grupos para editar.")
+            else:
+                gr_ed_opts = {
+                    f"ID {row['id']} | {row['nombre_grupo']} | {row['hotel']} | {row['estado']}": row
+                    for _, row in df_gr_ed.iterrows()
+                }
+                gr_ed_label = st.selectbox("Selecciona grupo:", list(gr_ed_opts.keys()), key="gr_ed_sel")
+                gr_ed = gr_ed_opts[gr_ed_label]
+
+                col1, col2 = st.columns(2)
+                with col1:
+                    gr_ed_nombre = st.text_input("Nombre del grupo", value=gr_ed['nombre_grupo'], key="gr_ed_nom")
+                    hoteles_cat4 = obtener_hoteles()
+                    if hoteles_cat4 and gr_ed['hotel'] in hoteles_cat4:
+                        gr_ed_hotel = st.selectbox("Hotel", hoteles_cat4,
+                            index=hoteles_cat4.index(gr_ed['hotel']), key="gr_ed_hotel")
+                    else:
+                        gr_ed_hotel = st.text_input("Hotel", value=gr_ed['hotel'], key="gr_ed_hotel_txt")
+                    gr_ed_hab  = st.number_input("Habitaciones totales",
+                        min_value=int(gr_ed['habitaciones_vendidas']), value=int(gr_ed['habitaciones_totales']),
+                        key="gr_ed_hab")
+                    gr_ed_estado = st.selectbox("Estado", ["ACTIVO","CERRADO","AGOTADO"],
+                        index=["ACTIVO","CERRADO","AGOTADO"].index(gr_ed['estado'])
+                              if gr_ed['estado'] in ["ACTIVO","CERRADO","AGOTADO"] else 0,
+                        key="gr_ed_estado")
+                with col2:
+                    gr_ed_pd    = st.number_input("Precio doble/noche",    min_value=0.0, value=float(gr_ed['precio_noche_doble']),   step=50.0, format="%.2f", key="gr_ed_pd")
+                    gr_ed_pt    = st.number_input("Precio triple/noche",   min_value=0.0, value=float(gr_ed['precio_noche_triple']),  step=50.0, format="%.2f", key="gr_ed_pt")
+                    gr_ed_pc    = st.number_input("Precio cuádruple/noche",min_value=0.0, value=float(gr_ed['precio_noche_cuadruple']),step=50.0, format="%.2f", key="gr_ed_pc")
+                    gr_ed_costo = st.number_input("Costo real total",      min_value=0.0, value=float(gr_ed['costo_real']),           step=500.0, format="%.2f", key="gr_ed_costo")
+
+                nuevas_disp_gr = max(0, gr_ed_hab - int(gr_ed['habitaciones_vendidas']))
+                st.caption(f"Habitaciones disponibles resultantes: {nuevas_disp_gr}")
+
+                if st.button("💾 Guardar Cambios en Grupo", type="primary", key="gr_ed_guardar"):
+                    try:
+                        conn = conectar_db()
+                        cursor = conn.cursor()
+                        cursor.execute("""
+                            UPDATE grupos
+                            SET nombre_grupo = ?, hotel = ?,
+                                habitaciones_totales = ?, habitaciones_disponibles = ?,
+                                precio_noche_doble = ?, precio_noche_triple = ?, precio_noche_cuadruple = ?,
+                                costo_real = ?, estado = ?
+                            WHERE id = ?
+                        """, (gr_ed_nombre.strip(), gr_ed_hotel, gr_ed_hab, nuevas_disp_gr,
+                              gr_ed_pd, gr_ed_pt, gr_ed_pc, gr_ed_costo, gr_ed_estado,
+                              int(gr_ed['id'])))
+                        conn.commit()
+                        conn.close()
+                        st.success(f"✅ Grupo **{gr_ed_nombre}** actualizado → {gr_ed_estado}")
+                        st.rerun()
+                    except Exception as e:
+                        st.error(f"❌ Error: {e}")
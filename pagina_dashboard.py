@@ -0,0 +1,167 @@
+"""
+PÁGINA DASHBOARD - Sistema Agencia Riviera Maya
+Métricas de ventas (desde resumen_ventas), alertas y gráficas de cobranza.
+"""
+
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+
+from app_nucleo import consulta_cacheada
+from alertas import alertas_otros, alertas_riviera
+
+
+# Función para obtener métricas del dashboard
+def obtener_metricas_dashboard(usuario_actual):
+    """Obtiene métricas generales para el dashboard"""
+    if usuario_actual["rol"] == "VENDEDORA":
+        filtro = "AND usuario_id = ?"
+        params = (usuario_actual['id_vendedora'],)
+    else:
+        filtro = ""
+        params = None
+
+    # Ventas activas Riviera y comisiones pendientes (totales mantenidos por
+    # triggers en resumen_ventas: unas filas por vendedora, no toda la tabla ventas)
+    riviera = consulta_cacheada(f"""
+        SELECT
+            SUM(CASE WHEN estado != 'CERRADO' THEN cantidad END) as total_ventas,
+            SUM(CASE WHEN estado != 'CERRADO' THEN vendido END) as total_vendido,
+            SUM(CASE WHEN estado != 'CERRADO' THEN cobrado END) as total_cobrado,
+            SUM(CASE WHEN estado != 'CERRADO' THEN saldo END) as total_saldo,
+            SUM(CASE WHEN estado != 'CERRADO' THEN ganancia END) as ganancia_total,
+            SUM(CASE WHEN estado = 'LIQUIDADO' THEN comisiones END) as comisiones
+        FROM resumen_ventas
+        WHERE 1=1 {filtro}
+    """, params)[0]
+
+    # Viajes nacionales
+    nacionales = consulta_cacheada("""
+        SELECT COUNT(*) FROM viajes_nacionales WHERE estado = 'ACTIVO'
+    """)[0][0]
+
+    # Viajes internacionales
+    internacionales = consulta_cacheada("""
+        SELECT COUNT(*) FROM viajes_internacionales WHERE estado = 'ACTIVO'
+    """)[0][0]
+
+    # Los totales se acumulan con sumas y restas: se redondea para no mostrar -0.00
+    dinero = lambda x: round(float(x or 0), 2) + 0.0
+    return {
+        "riviera_ventas": int(riviera[0] or 0),
+        "riviera_vendido": dinero(riviera[1]),
+        "riviera_cobrado": dinero(riviera[2]),
+        "riviera_saldo": dinero(riviera[3]),
+        "riviera_ganancia": dinero(riviera[4]),
+        "nacionales": nacionales,
+        "internacionales": internacionales,
+        "comisiones": dinero(riviera[5])
+    }
+
+
+def mostrar_dashboard():
+    """Muestra el dashboard principal"""
+    st.title("🏖️ Dashboard - Agencia Riviera Maya")
+    
+    usuario = st.session_state.usuario_actual
+    
+    st.markdown(f"### Bienvenido, **{usuario['nombre']}** 👋")
+    st.markdown(f"**Rol:** {usuario['rol']}")
+    
+    st.divider()
+
+    # Alertas al tope del dashboard
+    alertas_riviera()
+    alertas_otros()
+
+    # Obtener métricas
+    metricas = obtener_metricas_dashboard(usuario)
+    
+    # Métricas principales
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric(
+            label="💰 Total Vendido (Riviera)",
+            value=f"${metricas['riviera_vendido']:,.2f}",
+            delta=f"{metricas['riviera_ventas']} ventas activas"
+        )
+    
+    with col2:
+        porcentaje = (metricas['riviera_cobrado'] / metricas['riviera_vendido'] * 100) if metricas['riviera_vendido'] > 0 else 0
+        st.metric(
+            label="✅ Total Cobrado",
+            value=f"${metricas['riviera_cobrado']:,.2f}",
+            delta=f"{porcentaje:.1f}% cobrado"
+        )
+    
+    with col3:
+        st.metric(
+            label="⏳ Saldo Pendiente",
+            value=f"${metricas['riviera_saldo']:,.2f}",
+            delta="Por cobrar"
+        )
+    
+    with col4:
+        st.metric(
+            label="📈 Ganancia",
+            value=f"${metricas['riviera_ganancia']:,.2f}",
+            delta=f"Margen: {(metricas['riviera_ganancia']/metricas['riviera_vendido']*100):.1f}%" if metricas['riviera_vendido'] > 0 else "0%"
+        )
+    
+    st.divider()
+    
+    # Segunda fila de métricas
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.metric(
+            label="🎫 Viajes Nacionales",
+            value=metricas['nacionales'],
+            delta="Activos"
+        )
+    
+    with col2:
+        st.metric(
+            label="🌎 Viajes Internacionales",
+            value=metricas['internacionales'],
+            delta="Activos"
+        )
+    
+    with col3:
+        st.metric(
+            label="💵 Comisiones Pendientes",
+            value=f"${metricas['comisiones']:,.2f}",
+            delta="Por pagar"
+        )
+    
+    # Gráficas
+    st.divider()
+    st.subheader("📊 Análisis Visual")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        # Gráfica de ventas por estado
+        df_estados = pd.DataFrame(consulta_cacheada("""
+            SELECT estado, SUM(cantidad) as cantidad, SUM(saldo) as saldo_total
+            FROM resumen_ventas
+            WHERE estado != 'CERRADO'
+            GROUP BY estado
+            HAVING SUM(cantidad) > 0
+        """), columns=["estado", "cantidad", "saldo_total"])
+        
+        if not df_estados.empty:
+            fig = px.pie(df_estados, values='cantidad', names='estado', 
+                        title='Ventas por Estado')
+            st.plotly_chart(fig, use_container_width=True)
+    
+    with col2:
+        # Gráfica de cobrado vs pendiente
+        labels = ['Cobrado', 'Pendiente']
+        values = [metricas['riviera_cobrado'], metricas['riviera_saldo']]
+        
+        fig = go.Figure(data=[go.Pie(labels=labels, values=values, hole=.3)])
+        fig.update_layout(title_text="Estado de Cobranza")
+        st.plotly_chart(fig, use_container_width=True)
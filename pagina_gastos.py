@@ -0,0 +1,220 @@
+"""
+PÁGINA GASTOS - Sistema Agencia Riviera Maya
+Registro y consulta de gastos operativos.
+"""
+
+from datetime import datetime
+
+import streamlit as st
+import pandas as pd
+
+from app_nucleo import conectar_db
+
+
+# ════════════════════════════════════════════════════════════════════════════
+#  PÁGINA DE GASTOS OPERATIVOS
+# ════════════════════════════════════════════════════════════════════════════
+
+def pagina_gastos():
+    """Página para registrar y visualizar gastos operativos"""
+    st.title("💰 Gastos Operativos")
+
+    usuario = st.session_state.usuario_actual
+    es_admin = usuario.get("rol") == "ADMIN"
+
+    conn = conectar_db()
+    cursor = conn.cursor()
+
+    # Verificar si las tablas existen
+    tablas_existen = True
+    try:
+        cursor.execute("SELECT COUNT(*) FROM categorias_gastos")
+        cursor.execute("SELECT COUNT(*) FROM gastos_operativos")
+    except:
+        tablas_existen = False
+        st.warning("⚠️ Las tablas de gastos no están configuradas. Ejecuta primero la migración de gastos.")
+
+    if not tablas_existen:
+        conn.close()
+        return
+
+    # Tabs para las secciones
+    tabs = st.tabs(["📝 Registrar Gasto", "📋 Lista de Gastos", "📊 Resumen"])
+
+    # ===== TAB 1: REGISTRAR GASTO =====
+    with tabs[0]:
+        st.subheader("📝 Registrar Nuevo Gasto")
+
+        with st.form("form_gasto"):
+            col1, col2 = st.columns(2)
+
+            with col1:
+                # Categoría
+                cursor.execute("SELECT id, nombre, icono FROM categorias_gastos WHERE activa = 1 ORDER BY nombre")
+                categorias = cursor.fetchall()
+
+                opciones_cat = {f"{c[2]} {c[1]}": c[0] for c in categorias}
+                cat_seleccionada = st.selectbox("Categoría", list(opciones_cat.keys()), placeholder="Selecciona categoría")
+
+                # Descripción
+                descripcion = st.text_area("Descripción", placeholder="Describe el gasto...")
+
+                # Monto
+                monto = st.number_input("Monto ($)", min_value=0.0, value=0.0, step=100.0)
+
+            with col2:
+                # Fecha del gasto
+                fecha_gasto = st.date_input("Fecha del Gasto", value=datetime.now().date())
+
+                # Método de pago
+                metodo_pago = st.selectbox("Método de Pago", ["Efectivo", "Transferencia", "Tarjeta Débito", "Tarjeta Crédito", "Cheque", "Otro"])
+
+                # Proveedor
+                proveedor = st.text_input("Proveedor (opcional)", placeholder="Nombre del proveedor...")
+
+            # Notas adicionales
+            notas = st.text_area("Notas adicionales (opcional)")
+
+            submitted = st.form_submit_button("💾 Registrar Gasto", type="primary", use_container_width=True)
+
+            if submitted:
+                if cat_seleccionada and monto > 0:
+                    try:
+                        cursor.execute("""
+                            INSERT INTO gastos_operativos (
+                                categoria, descripcion, monto, fecha_gasto, mes, anio,
+                                metodo_pago, proveedor, notas, fecha_registro, usuario_registro
+                            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                        """, (
+                            opciones_cat[cat_seleccionada],
+                            descripcion,
+                            monto,
+                            fecha_gasto.strftime("%Y-%m-%d"),
+                            fecha_gasto.month,
+                            fecha_gasto.year,
+                            metodo_pago,
+                            proveedor,
+                            notas,
+                            datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                            usuario.get("nombre", "Admin")
+                        ))
+                        conn.commit()
+                        st.success("✅ Gasto registrado correctamente")
+                    except Exception as e:
+                        st.error(f"❌ Error al registrar: {e}")
+                else:
+                    st.warning("⚠️ Por favor selecciona una categoría y monto válido")
+
+    # ===== TAB 2: LISTA DE GASTOS =====
+    with tabs[1]:
+        st.subheader("📋 Lista de Gastos")
+
+        # Filtros
+        col_f1, col_f2, col_f3 = st.columns(3)
+
+        with col_f1:
+            # Filtro por mes
+            mes_actual = datetime.now().month
+            anio_actual = datetime.now().year
+            mes_sel = st.selectbox("Mes",
+                ["Todos", "Enero", "Febrero", "Marzo", "Abril", "Mayo", "Junio",
+                 "Julio", "Agosto", "Septiembre", "Octubre", "Noviembre", "Diciembre"],
+                index=mes_actual)
+
+        with col_f2:
+            anio_sel = st.selectbox("Año", list(range(anio_actual, anio_actual-5, -1)))
+
+        with col_f3:
+            # Filtro por categoría
+            cursor.execute("SELECT nombre FROM categorias_gastos ORDER BY nombre")
+            cats = [c[0] for c in cursor.fetchall()]
+            cat_todas = ["Todas"] + cats
+            cat_filtro = st.selectbox("Categoría", cat_todas)
+
+        # Construir query
+        query = "SELECT id, categoria, descripcion, monto, fecha_gasto, metodo_pago, proveedor FROM gastos_operativos WHERE 1=1"
+        params = []
+
+        if mes_sel != "Todos":
+            mes_num = ["Enero", "Febrero", "Marzo", "Abril", "Mayo", "Junio",
+                      "Julio", "Agosto", "Septiembre", "Octubre", "Noviembre", "Diciembre"].index(mes_sel) + 1
+            query += " AND mes = ?"
+            params.append(mes_num)
+
+        query += " AND anio = ?"
+        params.append(anio_sel)
+
+        if cat_filtro != "Todas":
+            query += " AND categoria = ?"
+            params.append(cat_filtro)
+
+        query += " ORDER BY fecha_gasto DESC"
+
+        cursor.execute(query, params)
+        gastos = cursor.fetchall()
+
+        if gastos:
+            df_gastos = pd.DataFrame(gastos, columns=["ID", "Categoría", "Descripción", "Monto", "Fecha", "Método", "Proveedor"])
+            st.dataframe(df_gastos, use_container_width=True, hide_index=True)
+
+            # Total
+            total = df_gastos["Monto"].sum()
+            st.metric("💵 Total del período", f"${total:,.2f}")
+        else:
+            st.info("No hay gastos registrados para los filtros seleccionados.")
+
+    # ===== TAB 3: RESUMEN =====
+    with tabs[2]:
+        st.subheader("📊 Resumen por Categoría")
+
+        col_r1, col_r2 = st.columns(2)
+
+        with col_r1:
+            # Resumen del mes actual
+            cursor.execute("""
+                SELECT categoria, SUM(monto) as total
+                FROM gastos_operativos
+                WHERE mes = ? AND anio = ?
+                GROUP BY categoria
+                ORDER BY total DESC
+            """, (mes_actual, anio_actual))
+
+            resumen = cursor.fetchall()
+
+            st.markdown(f"**{['Enero', 'Febrero', 'Marzo', 'Abril', 'Mayo', 'Junio', 'Julio', 'Agosto', 'Septiembre', 'Octubre', 'Noviembre', 'Diciembre'][mes_actual-1]} {anio_actual}**")
+
+            if resumen:
+                total_mes = 0
+                for cat, total in resumen:
+                    st.write(f"**{cat}**: ${total:,.2f}")
+                    total_mes += total
+                st.markdown("---")
+                st.metric("💵 Total del Mes", f"${total_mes:,.2f}")
+            else:
+                st.info("Sin gastos este mes")
+
+        with col_r2:
+            # Resumen del año
+            cursor.execute("""
+                SELECT categoria, SUM(monto) as total
+                FROM gastos_operativos
+                WHERE anio = ?
+                GROUP BY categoria
+                ORDER BY total DESC
+            """, (anio_actual,))
+
+            resumen_anio = cursor.fetchall()
+
+            st.markdown(f"**Año {anio_actual}**")
+
+            if resumen_anio:
+                total_anio = 0
+                for cat, total in resumen_anio:
+                    st.write(f"**{cat}**: ${total:,.2f}")
+                    total_anio += total
+                st.markdown("---")
+                st.metric("💵 Total del Año", f"${total_anio:,.2f}")
+            else:
+                st.info("Sin gastos este año")
+
+    conn.close()
@@ -0,0 +1,391 @@
+"""
+PÁGINA MI HISTORIAL - Sistema Agencia Riviera Maya
+Historial personal de ventas y comisiones de la vendedora.
+"""
+
+from datetime import datetime
+
+import streamlit as st
+import pandas as pd
+
+from app_nucleo import conectar_db, read_sql_query
+
+
+def pagina_mi_historial():
+    """Historial personal de ventas y comisiones — solo VENDEDORA"""
+    usuario = st.session_state.usuario_actual
+    id_vend = usuario["id_vendedora"]
+
+    st.title(f"📂 Mi Historial — {usuario['nombre']}")
+
+    tabs = st.tabs([
+        "🏖️ Ventas Riviera",
+        "🎫 Viajes Nacionales",
+        "🌎 Viajes Internacionales",
+        "💰 Mis Comisiones"
+    ])
+
+    # ── TAB 0: Riviera ────────────────────────────────────────────────────
+    with tabs[0]:
+        st.subheader("🏖️ Mis Ventas — Riviera Maya")
+        conn = conectar_db()
+        try:
+            df_rv = read_sql_query(f"""
+                SELECT v.id, v.cliente, v.destino, v.tipo_habitacion,
+                       v.fecha_inicio, v.fecha_fin, v.noches,
+                       v.adultos, v.menores,
+                       v.precio_total, v.pagado, v.saldo,
+                       v.ganancia,
+                       COALESCE(v.comision_vendedora, ROUND(v.ganancia*0.10,2)) AS comision,
+                       v.estado,
+                       CASE v.comision_pagada WHEN 1 THEN '✅ Pagada' ELSE '⏳ Pendiente' END AS estado_comision,
+                       v.fecha_registro
+                FROM ventas v
+                LEFT JOIN vendedoras vd ON v.vendedora_id = vd.id
+                WHERE v.vendedora_id = {id_vend}
+                ORDER BY v.id DESC
+            """, conn)
+        except Exception as e:
+            df_rv = pd.DataFrame()
+            st.caption(f"⚠️ {e}")
+        conn.close()
+
+        if df_rv.empty:
+            st.info("No tienes ventas de Riviera Maya registradas.")
+        else:
+            # Métricas resumen
+            col1, col2, col3, col4, col5 = st.columns(5)
+            col1.metric("Total ventas",    len(df_rv))
+            col2.metric("Total vendido",   f"${df_rv['precio_total'].sum():,.2f}")
+            col3.metric("Total cobrado",   f"${df_rv['pagado'].sum():,.2f}")
+            col4.metric("Saldo pendiente", f"${df_rv['saldo'].sum():,.2f}")
+            col5.metric("Mis ganancias",   f"${df_rv['ganancia'].sum():,.2f}")
+
+            st.divider()
+
+            # Filtro por estado
+            col1, col2 = st.columns(2)
+            with col1:
+                filtro_rv = st.selectbox("Filtrar por estado:",
+                    ["Todos"] + sorted(df_rv["estado"].unique().tolist()), key="mh_rv_estado")
+            with col2:
+                buscar_rv = st.text_input("🔍 Buscar cliente o destino", key="mh_rv_buscar")
+
+            df_rvf = df_rv.copy()
+            if filtro_rv != "Todos":
+                df_rvf = df_rvf[df_rvf["estado"] == filtro_rv]
+            if buscar_rv:
+                mask = (df_rvf["cliente"].str.contains(buscar_rv, case=False, na=False) |
+                        df_rvf["destino"].str.contains(buscar_rv, case=False, na=False))
+                df_rvf = df_rvf[mask]
+
+            df_rv_show = df_rvf.copy()
+            for col in ["precio_total","pagado","saldo","ganancia","comision"]:
+                df_rv_show[col] = df_rv_show[col].apply(lambda x: f"${x:,.2f}")
+            df_rv_show.columns = ["ID","Cliente","Destino","Habitación","Salida","Regreso","Noches",
+                                   "Adultos","Menores","Total","Pagado","Saldo","Ganancia",
+                                   "Mi Comisión","Estado","Estado Comisión","Registro"]
+            st.dataframe(df_rv_show, use_container_width=True, hide_index=True)
+
+            # Detalle expandible
+            st.divider()
+            ids_rv = df_rvf["id"].tolist()
+            if ids_rv:
+                id_rv_sel = st.selectbox("Ver detalle:", ids_rv, key="mh_rv_det")
+                row_rv = df_rvf[df_rvf["id"] == id_rv_sel].iloc[0]
+                with st.expander(f"📄 {row_rv['cliente']} | {row_rv['destino']}", expanded=True):
+                    c1, c2, c3 = st.columns(3)
+                    c1.write(f"**Cliente:** {row_rv['cliente']}")
+                    c1.write(f"**Salida:** {row_rv['fecha_inicio']} → {row_rv['fecha_fin']}")
+                    c1.write(f"**Noches:** {row_rv['noches']}")
+                    c2.metric("Total",   f"${row_rv['precio_total']:,.2f}")
+                    c2.metric("Pagado",  f"${row_rv['pagado']:,.2f}")
+                    c3.metric("Saldo",   f"${row_rv['saldo']:,.2f}")
+                    c3.metric("Mi comisión", f"${row_rv['comision']:,.2f} ({row_rv['estado_comision']})")
+
+                    conn2 = conectar_db()
+                    try:
+                        df_pas_rv = read_sql_query(
+                            "SELECT nombre, tipo FROM pasajeros WHERE venta_id = ?",
+                            conn2, params=(id_rv_sel,))
+                        df_ab_rv = read_sql_query(
+                            "SELECT fecha, monto FROM abonos WHERE venta_id = ? ORDER BY fecha",
+                            conn2, params=(id_rv_sel,))
+                    except:
+                        df_pas_rv = pd.DataFrame()
+                        df_ab_rv = pd.DataFrame()
+                    conn2.close()
+
+                    c1, c2 = st.columns(2)
+                    with c1:
+                        st.markdown("**👥 Pasajeros:**")
+                        if not df_pas_rv.empty:
+                            st.dataframe(df_pas_rv, hide_index=True, use_container_width=True)
+                        else:
+                            st.caption("Sin pasajeros")
+                    with c2:
+                        st.markdown("**💳 Abonos:**")
+                        if not df_ab_rv.empty:
+                            df_ab_rv["monto"] = df_ab_rv["monto"].apply(lambda x: f"${x:,.2f}")
+                            st.dataframe(df_ab_rv, hide_index=True, use_container_width=True)
+                        else:
+                            st.caption("Sin abonos")
+
+            csv_rv = df_rv_show.to_csv(index=False).encode("utf-8")
+            st.download_button("📥 Descargar CSV", csv_rv,
+                file_name=f"mis_ventas_riviera_{datetime.now().strftime('%Y%m%d')}.csv",
+                mime="text/csv")
+
+    # ── TAB 1: Nacionales ─────────────────────────────────────────────────
+    with tabs[1]:
+        st.subheader("🎫 Mis Clientes — Viajes Nacionales")
+        conn = conectar_db()
+        try:
+            df_nv = read_sql_query(f"""
+                SELECT cn.id, cn.nombre_cliente, vj.nombre_viaje, vj.destino,
+                       vj.fecha_salida, vj.fecha_regreso,
+                       cn.adultos, cn.menores,
+                       cn.habitaciones_doble, cn.habitaciones_triple,
+                       cn.total_pagar, cn.total_abonado, cn.saldo,
+                       COALESCE(cn.ganancia, cn.costo_neto, 0) AS ganancia,
+                       cn.estado,
+                       CASE cn.comision_pagada WHEN 1 THEN '✅ Pagada' ELSE '⏳ Pendiente' END AS estado_comision,
+                       cn.fecha_registro
+                FROM clientes_nacionales cn
+                JOIN viajes_nacionales vj ON cn.viaje_id = vj.id
+                WHERE cn.vendedora_id = {id_vend}
+                ORDER BY cn.id DESC
+            """, conn)
+        except Exception as e:
+            df_nv = pd.DataFrame()
+            st.caption(f"⚠️ {e}")
+        conn.close()
+
+        if df_nv.empty:
+            st.info("No tienes clientes de viajes nacionales registrados.")
+        else:
+            col1, col2, col3, col4 = st.columns(4)
+            col1.metric("Clientes",      len(df_nv))
+            col2.metric("Total cobrar",  f"${df_nv['total_pagar'].sum():,.2f}")
+            col3.metric("Total cobrado", f"${df_nv['total_abonado'].sum():,.2f}")
+            col4.metric("Saldo pend.",   f"${df_nv['saldo'].sum():,.2f}")
+
+            st.divider()
+
+            col1, col2 = st.columns(2)
+            with col1:
+                filtro_nv = st.selectbox("Filtrar por estado:",
+                    ["Todos"] + sorted(df_nv["estado"].unique().tolist()), key="mh_nv_estado")
+            with col2:
+                buscar_nv = st.text_input("🔍 Buscar cliente o viaje", key="mh_nv_buscar")
+
+            df_nvf = df_nv.copy()
+            if filtro_nv != "Todos":
+                df_nvf = df_nvf[df_nvf["estado"] == filtro_nv]
+            if buscar_nv:
+                mask = (df_nvf["nombre_cliente"].str.contains(buscar_nv, case=False, na=False) |
+                        df_nvf["nombre_viaje"].str.contains(buscar_nv, case=False, na=False))
+                df_nvf = df_nvf[mask]
+
+            df_nv_show = df_nvf.copy()
+            for col in ["total_pagar","total_abonado","saldo","ganancia"]:
+                df_nv_show[col] = df_nv_show[col].apply(lambda x: f"${x:,.2f}")
+            df_nv_show.columns = ["ID","Cliente","Viaje","Destino","Salida","Regreso",
+                                   "Adultos","Menores","Hab.Doble","Hab.Triple",
+                                   "Total","Abonado","Saldo","Ganancia",
+                                   "Estado","Estado Comisión","Registro"]
+            st.dataframe(df_nv_show, use_container_width=True, hide_index=True)
+
+            # Detalle
+            st.divider()
+            ids_nv = df_nvf["id"].tolist()
+            if ids_nv:
+                id_nv_sel = st.selectbox("Ver detalle:", ids_nv, key="mh_nv_det")
+                row_nv = df_nvf[df_nvf["id"] == id_nv_sel].iloc[0]
+                with st.expander(f"📄 {row_nv['nombre_cliente']} | {row_nv['nombre_viaje']}", expanded=True):
+                    c1, c2, c3 = st.columns(3)
+                    c1.write(f"**Cliente:** {row_nv['nombre_cliente']}")
+                    c1.write(f"**Viaje:** {row_nv['nombre_viaje']}")
+                    c1.write(f"**Salida:** {row_nv['fecha_salida']} → {row_nv['fecha_regreso']}")
+                    c2.metric("Total",   f"${row_nv['total_pagar']:,.2f}")
+                    c2.metric("Abonado", f"${row_nv['total_abonado']:,.2f}")
+                    c3.metric("Saldo",   f"${row_nv['saldo']:,.2f}")
+                    c3.write(f"**Comisión:** {row_nv['estado_comision']}")
+
+                    conn2 = conectar_db()
+                    try:
+                        df_pas_nv = read_sql_query(
+                            "SELECT nombre_completo, tipo, habitacion_asignada FROM pasajeros_nacionales WHERE cliente_id = ?",
+                            conn2, params=(id_nv_sel,))
+                        df_ab_nv = read_sql_query(
+                            "SELECT fecha, monto FROM abonos_nacionales WHERE cliente_id = ? ORDER BY fecha",
+                            conn2, params=(id_nv_sel,))
+                    except:
+                        df_pas_nv = pd.DataFrame()
+                        df_ab_nv = pd.DataFrame()
+                    conn2.close()
+
+                    c1, c2 = st.columns(2)
+                    with c1:
+                        st.markdown("**🧳 Pasajeros:**")
+                        if not df_pas_nv.empty:
+                            df_pas_nv.columns = ["Nombre","Tipo","Habitación"]
+                            st.dataframe(df_pas_nv, hide_index=True, use_container_width=True)
+                        else:
+                            st.caption("Sin pasajeros")
+                    with c2:
+                        st.markdown("**💳 Abonos:**")
+                        if not df_ab_nv.empty:
+                            df_ab_nv["monto"] = df_ab_nv["monto"].apply(lambda x: f"${x:,.2f}")
+                            st.dataframe(df_ab_nv, hide_index=True, use_container_width=True)
+                        else:
+                            st.caption("Sin abonos")
+
+            csv_nv = df_nv_show.to_csv(index=False).encode("utf-8")
+            st.download_button("📥 Descargar CSV", csv_nv,
+                file_name=f"mis_clientes_nacionales_{datetime.now().strftime('%Y%m%d')}.csv",
+                mime="text/csv")
+
+    # ── TAB 2: Internacionales ────────────────────────────────────────────
+    with tabs[2]:
+        st.subheader("🌎 Mis Clientes — Viajes Internacionales")
+        st.info("ℹ️ Los viajes internacionales no tienen vendedora asignada directamente. Muestra todos los clientes para tu referencia.")
+        conn = conectar_db()
+        try:
+            df_iv = read_sql_query("""
+                SELECT ci.id, ci.nombre_cliente, vi.destino,
+                       vi.fecha_salida, vi.fecha_regreso,
+                       ci.adultos, ci.menores,
+                       ci.total_usd, ci.abonado_usd, ci.saldo_usd,
+                       ci.ganancia_usd,
+                       ci.estado,
+                       CASE ci.comision_pagada WHEN 1 THEN '✅ Pagada' ELSE '⏳ Pendiente' END AS estado_comision
+                FROM clientes_internacionales ci
+                JOIN viajes_internacionales vi ON ci.viaje_id = vi.id
+                WHERE ci.estado != 'CERRADO'
+                ORDER BY ci.id DESC
+            """, conn)
+        except Exception as e:
+            df_iv = pd.DataFrame()
+            st.caption(f"⚠️ {e}")
+        conn.close()
+
+        if df_iv.empty:
+            st.info("No hay clientes internacionales activos.")
+        else:
+            col1, col2, col3 = st.columns(3)
+            col1.metric("Clientes",    len(df_iv))
+            col2.metric("Total USD",   f"${df_iv['total_usd'].sum():,.2f}")
+            col3.metric("Saldo USD",   f"${df_iv['saldo_usd'].sum():,.2f}")
+
+            df_iv_show = df_iv.copy()
+            for col in ["total_usd","abonado_usd","saldo_usd","ganancia_usd"]:
+                df_iv_show[col] = df_iv_show[col].apply(lambda x: f"${x:,.2f} USD")
+            df_iv_show.columns = ["ID","Cliente","Destino","Salida","Regreso",
+                                   "Adultos","Menores","Total","Abonado","Saldo",
+                                   "Ganancia","Estado","Estado Comisión"]
+            st.dataframe(df_iv_show, use_container_width=True, hide_index=True)
+
+    # ── TAB 3: Mis Comisiones ─────────────────────────────────────────────
+    with tabs[3]:
+        st.subheader("💰 Mis Comisiones")
+
+        conn = conectar_db()
+
+        # Comisiones pagadas (historial)
+        try:
+            df_com_pag = read_sql_query(f"""
+                SELECT h.fecha, h.tipo, h.referencia_id, h.monto,
+                       h.metodo_pago, h.nota
+                FROM historial_comisiones h
+                WHERE h.vendedora_id = {id_vend}
+                   OR h.vendedora = '{usuario["nombre"]}'
+                ORDER BY h.fecha DESC
+            """, conn)
+        except:
+            df_com_pag = pd.DataFrame()
+
+        # Comisiones pendientes Riviera
+        try:
+            df_com_pen_rv = read_sql_query(f"""
+                SELECT v.id, v.cliente, v.destino, v.ganancia,
+                       COALESCE(v.comision_vendedora, ROUND(v.ganancia*0.10,2)) AS comision
+                FROM ventas v
+                WHERE v.usuario_id = {id_vend}
+                  AND v.estado = 'LIQUIDADO'
+                  AND COALESCE(v.comision_pagada, 0) = 0
+            """, conn)
+        except:
+            df_com_pen_rv = pd.DataFrame()
+
+        # Comisiones pendientes Nacionales
+        try:
+            df_com_pen_nac = read_sql_query(f"""
+                SELECT cn.id, cn.nombre_cliente AS cliente,
+                       vj.nombre_viaje AS destino,
+                       COALESCE(cn.ganancia, 0) AS ganancia,
+                       ROUND(COALESCE(cn.ganancia,0) * COALESCE(cfg.porcentaje_comision,10) / 100.0, 2) AS comision
+                FROM clientes_nacionales cn
+                JOIN viajes_nacionales vj ON cn.viaje_id = vj.id
+                LEFT JOIN config_comisiones cfg ON cfg.tipo = 'nacionales'
+                WHERE cn.vendedora_id = {id_vend}
+                  AND cn.estado = 'LIQUIDADO'
+                  AND COALESCE(cn.comision_pagada, 0) = 0
+            """, conn)
+        except:
+            df_com_pen_nac = pd.DataFrame()
+
+        conn.close()
+
+        # ── Resumen de comisiones ─────────────────────────────────────────
+        total_pagado_com  = df_com_pag["monto"].sum() if not df_com_pag.empty else 0
+        total_pen_rv      = df_com_pen_rv["comision"].sum() if not df_com_pen_rv.empty else 0
+        total_pen_nac     = df_com_pen_nac["comision"].sum() if not df_com_pen_nac.empty else 0
+        total_pendiente   = total_pen_rv + total_pen_nac
+
+        col1, col2, col3 = st.columns(3)
+        col1.metric("💵 Comisiones cobradas",  f"${total_pagado_com:,.2f}",
+                    help="Total histórico de comisiones ya pagadas")
+        col2.metric("⏳ Comisiones pendientes", f"${total_pendiente:,.2f}",
+                    help="Ventas liquidadas cuya comisión aún no se ha pagado")
+        col3.metric("📊 Total acumulado",       f"${total_pagado_com + total_pendiente:,.2f}")
+
+        st.divider()
+
+        # ── Pendientes detalle ────────────────────────────────────────────
+        st.markdown("#### ⏳ Comisiones Pendientes de Cobro")
+        if df_com_pen_rv.empty and df_com_pen_nac.empty:
+            st.success("✅ No tienes comisiones pendientes. ¡Todo cobrado!")
+        else:
+            if not df_com_pen_rv.empty:
+                st.markdown("**🏖️ Riviera Maya** (10% de ganancia)")
+                df_pen_rv_show = df_com_pen_rv.copy()
+                df_pen_rv_show["ganancia"] = df_pen_rv_show["ganancia"].apply(lambda x: f"${x:,.2f}")
+                df_pen_rv_show["comision"] = df_pen_rv_show["comision"].apply(lambda x: f"${x:,.2f}")
+                df_pen_rv_show.columns = ["ID","Cliente","Destino","Ganancia","Mi Comisión"]
+                st.dataframe(df_pen_rv_show, use_container_width=True, hide_index=True)
+
+            if not df_com_pen_nac.empty:
+                st.markdown("**🎫 Nacionales**")
+                df_pen_nac_show = df_com_pen_nac.copy()
+                df_pen_nac_show["ganancia"] = df_pen_nac_show["ganancia"].apply(lambda x: f"${x:,.2f}")
+                df_pen_nac_show["comision"] = df_pen_nac_show["comision"].apply(lambda x: f"${x:,.2f}")
+                df_pen_nac_show.columns = ["ID","Cliente","Destino","Ganancia","Mi Comisión"]
+                st.dataframe(df_pen_nac_show, use_container_width=True, hide_index=True)
+
+        st.divider()
+
+        # ── Historial pagadas ─────────────────────────────────────────────
+        st.markdown("#### ✅ Historial de Comisiones Cobradas")
+        if df_com_pag.empty:
+            st.info("Aún no tienes comisiones cobradas en el historial.")
+        else:
+            df_com_pag_show = df_com_pag.copy()
+            df_com_pag_show["monto"] = df_com_pag_show["monto"].apply(lambda x: f"${x:,.2f}")
+            df_com_pag_show.columns = ["Fecha","Tipo","ID Ref.","Monto","Método","Nota"]
+            st.dataframe(df_com_pag_show, use_container_width=True, hide_index=True)
+
+            csv_com = df_com_pag_show.to_csv(index=False).encode("utf-8")
+            st.download_button("📥 Descargar historial",
+                csv_com, file_name=f"mis_comisiones_{datetime.now().strftime('%Y%m%d')}.csv",
+                mime="text/csv")
@@ -0,0 +1,860 @@
+"""
+PÁGINA VIAJES INTERNACIONALES - Sistema Agencia Riviera Maya
+Viajes internacionales en USD, clientes y abonos con tipo de cambio.
+"""
+
+from datetime import datetime
+
+import streamlit as st
+import pandas as pd
+
+from app_nucleo import conectar_db, obtener_tipo_cambio, read_sql_query, siguiente_num_recibo
+from componentes_pdf import boton_recibo
+from migracion_fechas_iso import fecha_a_iso
+
+
+def pagina_viajes_internacionales():
+    """Página completa de viajes internacionales"""
+    st.title("🌎 Viajes Internacionales")
+    usuario = st.session_state.usuario_actual
+
+    tabs_labels = ["📋 Ver Viajes", "👥 Ver Clientes", "➕ Registrar Cliente", "💰 Registrar Pago"]
+    if usuario["rol"] == "ADMIN":
+        tabs_labels.append("⚙️ Gestionar Viajes")
+
+    tabs = st.tabs(tabs_labels)
+
+    # ── TAB 0: VER VIAJES ──────────────────────────────────────────────────
+    with tabs[0]:
+        st.subheader("Viajes Internacionales")
+        conn = conectar_db()
+        try:
+            df_vi = read_sql_query("""
+                SELECT id, destino, fecha_salida, fecha_regreso, dias, noches,
+                       cupos_totales, cupos_vendidos, cupos_disponibles,
+                       precio_adulto_doble_usd, precio_adulto_triple_usd,
+                       precio_menor_doble_usd, precio_menor_triple_usd,
+                       porcentaje_ganancia, estado
+                FROM viajes_internacionales
+                ORDER BY fecha_salida
+            """, conn)
+        except:
+            df_vi = pd.DataFrame()
+        conn.close()
+
+        if df_vi.empty:
+            st.info("ℹ️ No hay viajes internacionales registrados aún.")
+        else:
+            activos = df_vi[df_vi["estado"] == "ACTIVO"]
+            col1, col2, col3 = st.columns(3)
+            col1.metric("Viajes activos", len(activos))
+            col2.metric("Cupos disponibles", int(activos["cupos_disponibles"].sum()) if not activos.empty else 0)
+            col3.metric("Total viajes", len(df_vi))
+
+            st.divider()
+            filtro_vi = st.selectbox("Filtrar por estado:",
+                ["Todos"] + sorted(df_vi["estado"].unique().tolist()), key="vi_filtro")
+            df_vif = df_vi if filtro_vi == "Todos" else df_vi[df_vi["estado"] == filtro_vi]
+
+            df_vi_show = df_vif.copy()
+            for col in ["precio_adulto_doble_usd","precio_adulto_triple_usd",
+                        "precio_menor_doble_usd","precio_menor_triple_usd"]:
+                df_vi_show[col] = df_vi_show[col].apply(lambda x: f"${x:,.2f}")
+            df_vi_show.columns = ["ID","Destino","Salida","Regreso","Días","Noches",
+                                   "Cupos Total","Vendidos","Disponibles",
+                                   "Ad. Doble","Ad. Triple","Men. Doble","Men. Triple",
+                                   "% Gan.","Estado"]
+            st.dataframe(df_vi_show, use_container_width=True, hide_index=True)
+
+            # Detalle
+            st.divider()
+            st.markdown("#### 🔍 Detalle de un viaje")
+            vi_ids = df_vif["id"].tolist()
+            if vi_ids:
+                id_vi_sel = st.selectbox("Selecciona ID:", vi_ids, key="vi_det_id")
+                row_vi = df_vif[df_vif["id"] == id_vi_sel].iloc[0]
+                with st.expander(f"📄 {row_vi['destino']}", expanded=True):
+                    c1, c2, c3 = st.columns(3)
+                    c1.write(f"**Destino:** {row_vi['destino']}")
+                    c1.write(f"**Salida:** {row_vi['fecha_salida']}  →  **Regreso:** {row_vi['fecha_regreso']}")
+                    c1.write(f"**Duración:** {row_vi['dias']} días / {row_vi['noches']} noches")
+                    c2.metric("Cupos totales",     row_vi["cupos_totales"])
+                    c2.metric("Cupos vendidos",    row_vi["cupos_vendidos"])
+                    c3.metric("Cupos disponibles", row_vi["cupos_disponibles"])
+                    c3.metric("% Ganancia",        f"{row_vi['porcentaje_ganancia']}%")
+
+                    st.markdown("**💵 Precios (USD):**")
+                    pc1, pc2, pc3, pc4 = st.columns(4)
+                    pc1.metric("Adulto Doble",  f"${row_vi['precio_adulto_doble_usd']:,.2f}")
+                    pc2.metric("Adulto Triple", f"${row_vi['precio_adulto_triple_usd']:,.2f}")
+                    pc3.metric("Menor Doble",   f"${row_vi['precio_menor_doble_usd']:,.2f}")
+                    pc4.metric("Menor Triple",  f"${row_vi['precio_menor_triple_usd']:,.2f}")
+
+                    if row_vi["cupos_totales"] > 0:
+                        pct_vi = row_vi["cupos_vendidos"] / row_vi["cupos_totales"]
+                        st.markdown(f"**Ocupación: {pct_vi*100:.0f}%**")
+                        st.progress(pct_vi)
+
+    # ── TAB 1: VER CLIENTES ────────────────────────────────────────────────
+    with tabs[1]:
+        st.subheader("Clientes de Viajes Internacionales")
+        conn = conectar_db()
+        try:
+            if usuario["rol"] == "VENDEDORA":
+                query_ci = f"""
+                    SELECT ci.id, ci.nombre_cliente,
+                           vi.destino, vi.fecha_salida, vi.fecha_regreso,
+                           ci.adultos, ci.menores,
+                           ci.habitaciones_doble, ci.habitaciones_triple,
+                           ci.total_usd, ci.abonado_usd, ci.saldo_usd,
+                           ci.ganancia_usd, ci.estado
+                    FROM clientes_internacionales ci
+                    JOIN viajes_internacionales vi ON ci.viaje_id = vi.id
+                    WHERE ci.estado != 'CERRADO'
+                    ORDER BY ci.id DESC
+                """
+            else:
+                query_ci = """
+                    SELECT ci.id, ci.nombre_cliente,
+                           vi.destino, vi.fecha_salida, vi.fecha_regreso,
+                           ci.adultos, ci.menores,
+                           ci.habitaciones_doble, ci.habitaciones_triple,
+                           ci.total_usd, ci.abonado_usd, ci.saldo_usd,
+                           ci.ganancia_usd, ci.estado
+                    FROM clientes_internacionales ci
+                    JOIN viajes_internacionales vi ON ci.viaje_id = vi.id
+                    WHERE ci.estado != 'CERRADO'
+                    ORDER BY ci.id DESC
+                """
+            df_ci = read_sql_query(query_ci, conn)
+        except Exception as e:
+            df_ci = pd.DataFrame()
+            st.caption(f"⚠️ {e}")
+        conn.close()
+
+        if df_ci.empty:
+            st.info("No hay clientes de viajes internacionales registrados.")
+        else:
+            df_ci.columns = ["ID","Cliente","Destino","Salida","Regreso",
+                              "Adultos","Menores","Hab.Doble","Hab.Triple",
+                              "Total USD","Abonado USD","Saldo USD","Ganancia USD","Estado"]
+
+            col1, col2, col3, col4 = st.columns(4)
+            col1.metric("Clientes",           len(df_ci))
+            col2.metric("Total a cobrar",     f"${df_ci['Total USD'].sum():,.2f} USD")
+            col3.metric("Total cobrado",      f"${df_ci['Abonado USD'].sum():,.2f} USD")
+            col4.metric("Saldo pendiente",    f"${df_ci['Saldo USD'].sum():,.2f} USD")
+
+            st.divider()
+            col1, col2 = st.columns(2)
+            with col1:
+                filtro_ci_dest = st.selectbox("Filtrar por destino",
+                    ["Todos"] + sorted(df_ci["Destino"].unique().tolist()), key="ci_dest")
+            with col2:
+                filtro_ci_buscar = st.text_input("🔍 Buscar cliente", key="ci_buscar")
+
+            df_cif = df_ci.copy()
+            if filtro_ci_dest != "Todos":
+                df_cif = df_cif[df_cif["Destino"] == filtro_ci_dest]
+            if filtro_ci_buscar:
+                df_cif = df_cif[df_cif["Cliente"].str.contains(filtro_ci_buscar, case=False, na=False)]
+
+            df_ci_show = df_cif.copy()
+            for col in ["Total USD","Abonado USD","Saldo USD","Ganancia USD"]:
+                df_ci_show[col] = df_ci_show[col].apply(lambda x: f"${x:,.2f}")
+            st.dataframe(df_ci_show, use_container_width=True, hide_index=True)
+
+            # Detalle expandible
+            st.divider()
+            st.markdown("#### 🔍 Ver detalle de cliente")
+            ci_ids = df_cif["ID"].tolist()
+            if ci_ids:
+                id_ci_sel = st.selectbox("Selecciona ID cliente:", ci_ids, key="ci_det")
+                row_ci = df_cif[df_cif["ID"] == id_ci_sel].iloc[0]
+                with st.expander(f"📄 {row_ci['Cliente']} | {row_ci['Destino']}", expanded=True):
+                    c1, c2, c3 = st.columns(3)
+                    c1.write(f"**Cliente:** {row_ci['Cliente']}")
+                    c1.write(f"**Destino:** {row_ci['Destino']}")
+                    c1.write(f"**Salida:** {row_ci['Salida']} → {row_ci['Regreso']}")
+                    c2.write(f"**Adultos:** {row_ci['Adultos']}  |  **Menores:** {row_ci['Menores']}")
+                    c2.write(f"**Hab. Dobles:** {row_ci['Hab.Doble']}  |  **Hab. Triples:** {row_ci['Hab.Triple']}")
+                    c3.write(f"**Estado:** {row_ci['Estado']}")
+
+                    st.divider()
+                    c1, c2, c3, c4 = st.columns(4)
+                    c1.metric("Total",    f"${df_cif[df_cif['ID']==id_ci_sel]['Total USD'].values[0]:,.2f} USD")
+                    c2.metric("Abonado",  f"${df_cif[df_cif['ID']==id_ci_sel]['Abonado USD'].values[0]:,.2f} USD")
+                    c3.metric("Saldo",    f"${df_cif[df_cif['ID']==id_ci_sel]['Saldo USD'].values[0]:,.2f} USD")
+                    c4.metric("Ganancia", f"${df_cif[df_cif['ID']==id_ci_sel]['Ganancia USD'].values[0]:,.2f} USD")
+
+                    conn2 = conectar_db()
+                    try:
+                        df_pas_i = read_sql_query(
+                            "SELECT nombre_completo, tipo, habitacion_asignada FROM pasajeros_internacionales WHERE cliente_id = ?",
+                            conn2, params=(id_ci_sel,))
+                        df_abonos_i = read_sql_query(
+                            "SELECT id, fecha, moneda, monto_original, tipo_cambio, monto_usd FROM abonos_internacionales WHERE cliente_id = ? ORDER BY fecha",
+                            conn2, params=(id_ci_sel,))
+                    except:
+                        df_pas_i = pd.DataFrame()
+                        df_abonos_i = pd.DataFrame()
+                    conn2.close()
+
+                    c1, c2 = st.columns(2)
+                    with c1:
+                        st.markdown("**🧳 Pasajeros:**")
+                        if not df_pas_i.empty:
+                            df_pas_i.columns = ["Nombre","Tipo","Habitación"]
+                            st.dataframe(df_pas_i, hide_index=True, use_container_width=True)
+                        else:
+                            st.caption("Sin pasajeros registrados")
+                    with c2:
+                        st.markdown("**💳 Historial de abonos:**")
+                        if not df_abonos_i.empty:
+                            # Botones de reimprimir para cada abono
+                            for idx, row in df_abonos_i.iterrows():
+                                col_a, col_b = st.columns([3, 1])
+                                monto_str = f"${row['monto_usd']:,.2f} USD" if row['moneda'] == 'USD' else f"${row['monto_original']:,.2f} MXN"
+                                with col_a:
+                                    st.text(f"{row['fecha']}: {monto_str}")
+                                with col_b:
+                                    if st.button(f"🖨️", key=f"reimp_abono_int_{row['id']}"):
+                                        # Obtener datos del cliente
+                                        conn_cli = conectar_db()
+                                        df_cliente_int = read_sql_query(
+                                            "SELECT nombre_cliente, total_usd, abonado_usd, saldo_usd FROM clientes_internacionales WHERE id = ?",
+                                            conn_cli, params=(id_ci_sel,))
+                                        conn_cli.close()
+
+                                        if not df_cliente_int.empty:
+                                            cliente_int_row = df_cliente_int.iloc[0]
+                                            num_rec = siguiente_num_recibo()
+                                            fecha_rec = datetime.now().strftime("%d-%B-%Y").replace(
+                                                "January","enero").replace("February","febrero").replace(
+                                                "March","marzo").replace("April","abril").replace(
+                                                "May","mayo").replace("June","junio").replace(
+                                                "July","julio").replace("August","agosto").replace(
+                                                "September","septiembre").replace("October","octubre").replace(
+                                                "November","noviembre").replace("December","diciembre")
+                                            boton_recibo(
+                                                numero     = num_rec,
+                                                fecha_str  = fecha_rec,
+                                                cliente    = cliente_int_row['nombre_cliente'],
+                                                monto      = row['monto_usd'],
+                                                concepto   = f"Abono - Viaje Internacional",
+                                                forma_pago = row.get('metodo_pago', 'Efectivo'),
+                                                agente     = usuario.get("nombre", "Agente"),
+                                                key_suffix = f"reimp_int_{row['id']}",
+                                                total_viaje      = cliente_int_row['total_usd'],
+                                                pagado_acumulado = cliente_int_row['abonado_usd'],
+                                                nuevo_saldo      = cliente_int_row['saldo_usd'],
+                                            )
+                        else:
+                            st.caption("Sin abonos registrados")
+
+            csv_ci = df_ci_show.to_csv(index=False).encode("utf-8")
+            st.download_button("📥 Descargar CSV", csv_ci,
+                file_name=f"clientes_internacionales_{datetime.now().strftime('%Y%m%d')}.csv",
+                mime="text/csv")
+
+    # ── TAB 2: REGISTRAR CLIENTE ───────────────────────────────────────────
+    with tabs[2]:
+        st.subheader("➕ Registrar Cliente en Viaje Internacional")
+
+        conn = conectar_db()
+        try:
+            viajes_int = read_sql_query("""
+                SELECT id, destino, fecha_salida, fecha_regreso, cupos_disponibles,
+                       precio_adulto_doble_usd, precio_adulto_triple_usd,
+                       precio_menor_doble_usd, precio_menor_triple_usd,
+                       porcentaje_ganancia
+                FROM viajes_internacionales
+                WHERE estado = 'ACTIVO' AND cupos_disponibles > 0
+                ORDER BY fecha_salida
+            """, conn)
+        except:
+            viajes_int = pd.DataFrame()
+        conn.close()
+
+        if viajes_int.empty:
+            st.warning("⚠️ No hay viajes internacionales activos con cupos disponibles.")
+        else:
+            # Selección de viaje
+            st.markdown("#### 🌎 Selecciona el Viaje")
+            viajes_int_dict = {
+                f"{row['destino']} | {row['fecha_salida']} → {row['fecha_regreso']} | Disp: {row['cupos_disponibles']}": row
+                for _, row in viajes_int.iterrows()
+            }
+            vi_label = st.selectbox("Viaje disponible:", list(viajes_int_dict.keys()), key="ri_viaje")
+            vi_sel = viajes_int_dict[vi_label]
+
+            col1, col2, col3, col4, col5 = st.columns(5)
+            col1.metric("Cupos disp.", vi_sel["cupos_disponibles"])
+            col2.metric("Ad. Doble",   f"${vi_sel['precio_adulto_doble_usd']:,.2f}")
+            col3.metric("Ad. Triple",  f"${vi_sel['precio_adulto_triple_usd']:,.2f}")
+            col4.metric("Men. Doble",  f"${vi_sel['precio_menor_doble_usd']:,.2f}")
+            col5.metric("Men. Triple", f"${vi_sel['precio_menor_triple_usd']:,.2f}")
+
+            st.divider()
+
+            # Datos del cliente
+            st.markdown("#### 👤 Datos del Cliente")
+            nombre_cliente_i = st.text_input("Nombre del cliente *", key="ri_nombre")
+
+            st.divider()
+
+            # Habitaciones
+            st.markdown("#### 🛏️ Distribución de Habitaciones")
+            col1, col2 = st.columns(2)
+            with col1:
+                ri_hab_dobles = st.number_input(
+                    f"Habitaciones dobles (2 adultos × ${vi_sel['precio_adulto_doble_usd']:,.2f} USD)",
+                    min_value=0, value=1, step=1, key="ri_dobles")
+            with col2:
+                ri_hab_triples = st.number_input(
+                    f"Habitaciones triples (3 adultos × ${vi_sel['precio_adulto_triple_usd']:,.2f} USD)",
+                    min_value=0, value=0, step=1, key="ri_triples")
+
+            adultos_doble_n  = ri_hab_dobles * 2
+            adultos_triple_n = ri_hab_triples * 3
+            ri_adultos       = adultos_doble_n + adultos_triple_n
+
+            if ri_adultos > vi_sel["cupos_disponibles"]:
+                st.error(f"❌ Solo hay {vi_sel['cupos_disponibles']} cupos. Reduce las habitaciones.")
+                st.stop()
+
+            ri_menores = st.number_input("Número de menores", min_value=0, value=0, step=1, key="ri_menores")
+
+            # Distribución de menores si hay
+            ri_menores_doble  = 0
+            ri_menores_triple = 0
+            if ri_menores > 0:
+                st.markdown("**👶 Distribución de menores por tipo de habitación:**")
+                col1, col2 = st.columns(2)
+                with col1:
+                    ri_menores_doble = st.number_input(
+                        f"Menores en hab. dobles (× ${vi_sel['precio_menor_doble_usd']:,.2f} USD)",
+                        min_value=0, max_value=ri_menores, value=ri_menores, step=1, key="ri_md")
+                with col2:
+                    ri_menores_triple = st.number_input(
+                        f"Menores en hab. triples (× ${vi_sel['precio_menor_triple_usd']:,.2f} USD)",
+                        min_value=0, max_value=ri_menores, value=0, step=1, key="ri_mt")
+
+                if ri_menores_doble + ri_menores_triple != ri_menores:
+                    st.error(f"❌ La suma de menores ({ri_menores_doble + ri_menores_triple}) debe ser {ri_menores}.")
+
+            st.divider()
+
+            # Cálculo de precios USD
+            st.markdown("#### 💵 Resumen de Precios (USD)")
+            total_ad_doble  = adultos_doble_n  * vi_sel["precio_adulto_doble_usd"]
+            total_ad_triple = adultos_triple_n * vi_sel["precio_adulto_triple_usd"]
+            total_men_doble  = ri_menores_doble  * vi_sel["precio_menor_doble_usd"]
+            total_men_triple = ri_menores_triple * vi_sel["precio_menor_triple_usd"]
+            total_usd_ri = total_ad_doble + total_ad_triple + total_men_doble + total_men_triple
+            ganancia_usd_ri = total_usd_ri * (vi_sel["porcentaje_ganancia"] / 100)
+
+            if ri_hab_dobles > 0:
+                col1, col2 = st.columns(2)
+                col1.metric(f"{adultos_doble_n} adultos doble × ${vi_sel['precio_adulto_doble_usd']:,.2f}",
+                            f"${total_ad_doble:,.2f}")
+                if ri_menores_doble > 0:
+                    col2.metric(f"{ri_menores_doble} menores doble × ${vi_sel['precio_menor_doble_usd']:,.2f}",
+                                f"${total_men_doble:,.2f}")
+            if ri_hab_triples > 0:
+                col1, col2 = st.columns(2)
+                col1.metric(f"{adultos_triple_n} adultos triple × ${vi_sel['precio_adulto_triple_usd']:,.2f}",
+                            f"${total_ad_triple:,.2f}")
+                if ri_menores_triple > 0:
+                    col2.metric(f"{ri_menores_triple} menores triple × ${vi_sel['precio_menor_triple_usd']:,.2f}",
+                                f"${total_men_triple:,.2f}")
+
+            col1, col2 = st.columns(2)
+            col1.metric("💵 TOTAL (USD)", f"${total_usd_ri:,.2f}")
+            col2.metric(f"📈 Ganancia ({vi_sel['porcentaje_ganancia']}%)", f"${ganancia_usd_ri:,.2f} USD")
+
+            st.divider()
+
+            # Abono inicial con moneda
+            st.markdown("#### 💳 Abono Inicial")
+            col1, col2 = st.columns(2)
+            with col1:
+                ri_moneda = st.radio("Moneda del abono:", ["USD", "MXN"], horizontal=True, key="ri_moneda")
+            with col2:
+                ri_metodo = st.selectbox("Método de pago *",
+                    ["Efectivo","Transferencia","Tarjeta de crédito",
+                     "Tarjeta de débito","Depósito bancario","Otro"], key="ri_metodo")
+
+            ri_tipo_cambio = 1.0
+            ri_monto_original = 0.0
+            ri_abono_usd = 0.0
+
+            if ri_moneda == "USD":
+                ri_abono_usd = st.number_input("Monto del abono (USD) *",
+                    min_value=0.0, max_value=float(total_usd_ri),
+                    step=50.0, format="%.2f", key="ri_abono_usd")
+                ri_monto_original = ri_abono_usd
+                ri_tipo_cambio = 1.0
+            else:
+                # Obtener tipo de cambio automático
+                if "tc_megatravel" not in st.session_state:
+                    st.session_state.tc_megatravel = None
+                    st.session_state.tc_fuente = None
+
+                col_tc1, col_tc2 = st.columns([2, 1])
+                with col_tc2:
+                    if st.button("🔄 Obtener TC de Megatravel", key="ri_btn_tc"):
+                        with st.spinner("Consultando tipo de cambio..."):
+                            tc_auto, fuente_auto = obtener_tipo_cambio()
+                            if tc_auto:
+                                st.session_state.tc_megatravel = tc_auto
+                                st.session_state.tc_fuente = fuente_auto
+                            else:
+                                st.session_state.tc_megatravel = None
+                                st.session_state.tc_fuente = "No disponible"
+
+                with col_tc1:
+                    tc_default = st.session_state.tc_megatravel if st.session_state.tc_megatravel else 17.0
+                    ri_tipo_cambio = st.number_input("Tipo de cambio (MXN/USD) *",
+                        min_value=1.0, value=float(tc_default), step=0.01, format="%.2f", key="ri_tc")
+
+                if st.session_state.tc_fuente:
+                    if st.session_state.tc_megatravel:
+                        st.success(f"💱 TC obtenido de: **{st.session_state.tc_fuente}** — ${st.session_state.tc_megatravel:.2f} MXN/USD")
+                    else:
+                        st.warning(f"⚠️ {st.session_state.tc_fuente}. Ingresa el tipo de cambio manualmente.")
+
+                ri_monto_original = st.number_input("Monto del abono (MXN) *",
+                    min_value=0.0, step=100.0, format="%.2f", key="ri_abono_mxn")
+                ri_abono_usd = ri_monto_original / ri_tipo_cambio if ri_tipo_cambio > 0 else 0
+                if ri_monto_original > 0:
+                    st.info(f"💱 ${ri_monto_original:,.2f} MXN ÷ {ri_tipo_cambio:.2f} = **${ri_abono_usd:,.2f} USD**")
+
+            ri_saldo_usd = total_usd_ri - ri_abono_usd
+            ri_liquidado = ri_saldo_usd <= 0.01
+
+            col1, col2 = st.columns(2)
+            col1.metric("Abono inicial", f"${ri_abono_usd:,.2f} USD")
+            col2.metric("Saldo restante", f"${ri_saldo_usd:,.2f} USD")
+            if ri_liquidado:
+                st.success("🎉 ¡Este cliente liquidará el viaje con el abono inicial!")
+
+            st.divider()
+
+            # Pasajeros por habitación
+            st.markdown("#### 🧳 Pasajeros por Habitación")
+            pasajeros_i = []
+
+            for i in range(ri_hab_dobles):
+                st.markdown(f"**🛏️ Habitación Doble {i+1}**")
+                cols_d = st.columns(2)
+                for j in range(2):
+                    with cols_d[j]:
+                        n = st.text_input(f"Pasajero {j+1}", key=f"ri_d{i}_{j}")
+                        pasajeros_i.append({"nombre": n, "tipo": "ADULTO", "habitacion": f"Doble {i+1}"})
+
+            for i in range(ri_hab_triples):
+                st.markdown(f"**🛏️ Habitación Triple {i+1}**")
+                cols_t = st.columns(3)
+                for j in range(3):
+                    with cols_t[j]:
+                        n = st.text_input(f"Pasajero {j+1}", key=f"ri_t{i}_{j}")
+                        pasajeros_i.append({"nombre": n, "tipo": "ADULTO", "habitacion": f"Triple {i+1}"})
+
+            if ri_menores > 0:
+                st.markdown(f"**👶 Menores ({ri_menores})**")
+                hab_opciones_i = ([f"Doble {j+1}" for j in range(ri_hab_dobles)] +
+                                  [f"Triple {j+1}" for j in range(ri_hab_triples)])
+                cols_m = st.columns(2)
+                for i in range(ri_menores):
+                    with cols_m[i % 2]:
+                        n_m = st.text_input(f"Menor {i+1}", key=f"ri_m{i}")
+                        h_m = st.selectbox(f"Habitación menor {i+1}",
+                            hab_opciones_i, key=f"ri_mh{i}")
+                        pasajeros_i.append({"nombre": n_m, "tipo": "MENOR", "habitacion": h_m})
+
+            st.divider()
+
+            if st.button("💾 Registrar Cliente Internacional", type="primary", use_container_width=True):
+                errores_ri = []
+                if not nombre_cliente_i.strip():
+                    errores_ri.append("El nombre del cliente es obligatorio.")
+                if ri_adultos == 0:
+                    errores_ri.append("Debes seleccionar al menos una habitación.")
+                if total_usd_ri <= 0:
+                    errores_ri.append("El total debe ser mayor a 0.")
+                if ri_menores > 0 and ri_menores_doble + ri_menores_triple != ri_menores:
+                    errores_ri.append("La distribución de menores no cuadra con el total.")
+                if any(p["nombre"].strip() == "" for p in pasajeros_i):
+                    errores_ri.append("Todos los nombres de pasajeros son obligatorios.")
+
+                if errores_ri:
+                    for e in errores_ri:
+                        st.error(f"❌ {e}")
+                else:
+                    try:
+                        conn = conectar_db()
+                        cursor = conn.cursor()
+                        fecha_reg_i = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                        estado_ci = "LIQUIDADO" if ri_liquidado else "ADEUDO"
+
+                        cursor.execute("""
+                            INSERT INTO clientes_internacionales (
+                                viaje_id, nombre_cliente, adultos, menores,
+                                habitaciones_doble, habitaciones_triple,
+                                total_usd, abonado_usd, saldo_usd, ganancia_usd,
+                                estado, fecha_registro
+                            ) VALUES (?,?,?,?,?,?,?,?,?,?,?,?)
+                        """, (
+                            int(vi_sel["id"]), nombre_cliente_i.strip(),
+                            ri_adultos, ri_menores,
+                            ri_hab_dobles, ri_hab_triples,
+                            total_usd_ri, ri_abono_usd, ri_saldo_usd, ganancia_usd_ri,
+                            estado_ci, fecha_reg_i
+                        ))
+                        ci_id = cursor.lastrowid
+
+                        # Abono inicial
+                        cursor.execute("""
+                            INSERT INTO abonos_internacionales
+                                (cliente_id, fecha, moneda, monto_original, tipo_cambio, monto_usd)
+                            VALUES (?,?,?,?,?,?)
+                        """, (ci_id, fecha_reg_i, ri_moneda,
+                              ri_monto_original, ri_tipo_cambio, ri_abono_usd))
+
+                        # Pasajeros
+                        for p in pasajeros_i:
+                            cursor.execute("""
+                                INSERT INTO pasajeros_internacionales
+                                    (cliente_id, nombre_completo, tipo, habitacion_asignada)
+                                VALUES (?,?,?,?)
+                            """, (ci_id, p["nombre"].strip(), p["tipo"], p["habitacion"]))
+
+                        # Actualizar cupos
+                        cursor.execute("""
+                            UPDATE viajes_internacionales
+                            SET cupos_vendidos = cupos_vendidos + ?,
+                                cupos_disponibles = cupos_disponibles - ?
+                            WHERE id = ?
+                        """, (ri_adultos, ri_adultos, int(vi_sel["id"])))
+
+                        cursor.execute("""
+                            UPDATE viajes_internacionales SET estado = 'AGOTADO'
+                            WHERE id = ? AND cupos_disponibles <= 0
+                        """, (int(vi_sel["id"]),))
+
+                        conn.commit()
+                        conn.close()
+                        st.success(f"✅ **{nombre_cliente_i}** registrado en **{vi_sel['destino']}** — Total: ${total_usd_ri:,.2f} USD | Saldo: ${ri_saldo_usd:,.2f} USD")
+                        if ri_liquidado:
+                            st.balloons()
+                        st.rerun()
+
+                    except Exception as e:
+                        st.error(f"❌ Error al guardar: {e}")
+
+    # ── TAB 3: REGISTRAR PAGO ─────────────────────────────────────────────
+    with tabs[3]:
+        st.subheader("💰 Registrar Pago - Viajes Internacionales")
+
+        conn = conectar_db()
+        try:
+            query_pi = """
+                SELECT ci.id, ci.nombre_cliente, vi.destino,
+                       ci.total_usd, ci.abonado_usd, ci.saldo_usd
+                FROM clientes_internacionales ci
+                JOIN viajes_internacionales vi ON ci.viaje_id = vi.id
+                WHERE ci.estado NOT IN ('CERRADO','LIQUIDADO')
+                ORDER BY ci.id DESC
+            """
+            df_pi = read_sql_query(query_pi, conn)
+        except Exception as e:
+            df_pi = pd.DataFrame()
+            st.caption(f"⚠️ {e}")
+        conn.close()
+
+        if df_pi.empty:
+            st.info("No hay clientes internacionales con saldo pendiente.")
+        else:
+            df_pi.columns = ["id","cliente","destino","total_usd","abonado_usd","saldo_usd"]
+            opts_pi = {
+                f"ID {row['id']} | {row['cliente']} — {row['destino']} | Saldo: ${row['saldo_usd']:,.2f} USD": row
+                for _, row in df_pi.iterrows()
+            }
+            pi_label = st.selectbox("Selecciona el cliente:", list(opts_pi.keys()), key="pi_sel")
+            pi_sel = opts_pi[pi_label]
+
+            col1, col2, col3 = st.columns(3)
+            col1.metric("Total",           f"${pi_sel['total_usd']:,.2f} USD")
+            col2.metric("Ya abonado",      f"${pi_sel['abonado_usd']:,.2f} USD")
+            col3.metric("Saldo pendiente", f"${pi_sel['saldo_usd']:,.2f} USD")
+
+            st.divider()
+            st.markdown("#### 💳 Datos del Abono")
+
+            col1, col2 = st.columns(2)
+            with col1:
+                pi_moneda = st.radio("Moneda:", ["USD", "MXN"], horizontal=True, key="pi_moneda")
+            with col2:
+                pi_metodo = st.selectbox("Método de pago",
+                    ["Efectivo","Transferencia","Tarjeta de crédito",
+                     "Tarjeta de débito","Depósito bancario","Otro"], key="pi_metodo")
+
+            pi_tipo_cambio   = 1.0
+            pi_monto_original = 0.0
+            pi_monto_usd     = 0.0
+
+            if pi_moneda == "USD":
+                pi_monto_usd = st.number_input("Monto del abono (USD) *",
+                    min_value=0.01, max_value=float(pi_sel["saldo_usd"]),
+                    step=50.0, format="%.2f", key="pi_monto_usd")
+                pi_monto_original = pi_monto_usd
+                pi_tipo_cambio = 1.0
+            else:
+                # Reusar TC de session_state si ya fue cargado, o cargar nuevo
+                if "tc_megatravel" not in st.session_state:
+                    st.session_state.tc_megatravel = None
+                    st.session_state.tc_fuente = None
+
+                col_tc1, col_tc2 = st.columns([2, 1])
+                with col_tc2:
+                    if st.button("🔄 Obtener TC de Megatravel", key="pi_btn_tc"):
+                        with st.spinner("Consultando tipo de cambio..."):
+                            tc_auto, fuente_auto = obtener_tipo_cambio()
+                            if tc_auto:
+                                st.session_state.tc_megatravel = tc_auto
+                                st.session_state.tc_fuente = fuente_auto
+                            else:
+                                st.session_state.tc_megatravel = None
+                                st.session_state.tc_fuente = "No disponible"
+
+                with col_tc1:
+                    tc_default = st.session_state.tc_megatravel if st.session_state.tc_megatravel else 17.0
+                    pi_tipo_cambio = st.number_input("Tipo de cambio (MXN/USD) *",
+                        min_value=1.0, value=float(tc_default), step=0.01, format="%.2f", key="pi_tc")
+
+                if st.session_state.tc_fuente:
+                    if st.session_state.tc_megatravel:
+                        st.success(f"💱 TC obtenido de: **{st.session_state.tc_fuente}** — ${st.session_state.tc_megatravel:.2f} MXN/USD")
+                    else:
+                        st.warning(f"⚠️ {st.session_state.tc_fuente}. Ingresa el tipo de cambio manualmente.")
+
+                pi_monto_original = st.number_input("Monto del abono (MXN) *",
+                    min_value=0.0, step=100.0, format="%.2f", key="pi_monto_mxn")
+                pi_monto_usd = pi_monto_original / pi_tipo_cambio if pi_tipo_cambio > 0 else 0
+                if pi_monto_original > 0:
+                    st.info(f"💱 ${pi_monto_original:,.2f} MXN ÷ {pi_tipo_cambio:.2f} = **${pi_monto_usd:,.2f} USD**")
+
+            if pi_monto_usd > 0:
+                nuevo_abonado_i = pi_sel["abonado_usd"] + pi_monto_usd
+                nuevo_saldo_i   = pi_sel["saldo_usd"]   - pi_monto_usd
+                liquidado_i     = nuevo_saldo_i <= 0.01
+
+                col1, col2 = st.columns(2)
+                col1.metric("Nuevo total abonado", f"${nuevo_abonado_i:,.2f} USD", delta=f"+${pi_monto_usd:,.2f}")
+                col2.metric("Nuevo saldo",         f"${nuevo_saldo_i:,.2f} USD",   delta=f"-${pi_monto_usd:,.2f}")
+
+                if liquidado_i:
+                    st.success("🎉 ¡Con este pago el cliente quedará **LIQUIDADO**!")
+                else:
+                    pct_i = (nuevo_abonado_i / pi_sel["total_usd"]) * 100
+                    st.info(f"📊 Avance: **{pct_i:.1f}%** cobrado")
+
+                st.divider()
+                if st.button("💾 Registrar Abono Internacional", type="primary", use_container_width=True):
+                    try:
+                        conn = conectar_db()
+                        cursor = conn.cursor()
+                        fecha_pi = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+                        cursor.execute("""
+                            INSERT INTO abonos_internacionales
+                                (cliente_id, fecha, moneda, monto_original, tipo_cambio, monto_usd)
+                            VALUES (?,?,?,?,?,?)
+                        """, (int(pi_sel["id"]), fecha_pi, pi_moneda,
+                              pi_monto_original, pi_tipo_cambio, pi_monto_usd))
+
+                        nuevo_estado_i = "LIQUIDADO" if liquidado_i else "ADEUDO"
+                        cursor.execute("""
+                            UPDATE clientes_internacionales
+                            SET abonado_usd = abonado_usd + ?,
+                                saldo_usd   = saldo_usd   - ?,
+                                estado = ?
+                            WHERE id = ?
+                        """, (pi_monto_usd, pi_monto_usd, nuevo_estado_i, int(pi_sel["id"])))
+
+                        conn.commit()
+                        conn.close()
+
+                        # ── Recibo ─────────────────────────────────────────
+                        num_rec_i   = siguiente_num_recibo()
+                        fecha_rec_i = datetime.now().strftime("%d-%B-%Y").replace(
+                            "January","enero").replace("February","febrero").replace(
+                            "March","marzo").replace("April","abril").replace(
+                            "May","mayo").replace("June","junio").replace(
+                            "July","julio").replace("August","agosto").replace(
+                            "September","septiembre").replace("October","octubre").replace(
+                            "November","noviembre").replace("December","diciembre")
+                        vend_i     = usuario.get("nombre", "Agente")
+                        concepto_i = f"{'Liquidación' if liquidado_i else 'Abono'} - {pi_sel.get('destino','Viaje Internacional')}"
+
+                        if liquidado_i:
+                            st.success(f"✅ ¡**{pi_sel['cliente']}** ha LIQUIDADO su viaje! 🎉")
+                            st.balloons()
+                        else:
+                            st.success(f"✅ Abono de ${pi_monto_usd:,.2f} USD registrado. Saldo: ${nuevo_saldo_i:,.2f} USD")
+
+                        st.divider()
+                        st.markdown("#### 🧾 Recibo de Pago")
+                        boton_recibo(
+                            numero     = num_rec_i,
+                            fecha_str  = fecha_rec_i,
+                            cliente    = pi_sel['cliente'],
+                            monto      = pi_monto_usd,
+                            concepto   = concepto_i,
+                            forma_pago = pi_metodo,
+                            agente     = vend_i,
+                            key_suffix = f"int_{pi_sel['id']}",
+                        )
+
+                    except Exception as e:
+                        st.error(f"❌ Error: {e}")
+
+    # ── TAB 4: GESTIONAR VIAJES (solo ADMIN) ──────────────────────────────
+    if usuario["rol"] == "ADMIN":
+        with tabs[4]:
+            st.subheader("⚙️ Gestionar Viajes Internacionales")
+            subtab_gi = st.tabs(["➕ Nuevo Viaje", "✏️ Editar / Cerrar Viaje"])
+
+            with subtab_gi[0]:
+                st.markdown("#### 🌎 Registrar Nuevo Viaje Internacional")
+                col1, col2 = st.columns(2)
+                with col1:
+                    gi_destino = st.text_input("Destino *", key="gi_dest", placeholder="Ej: Europa 10 días")
+                    gi_salida  = st.date_input("Fecha de salida *", key="gi_sal")
+                    gi_regreso = st.date_input("Fecha de regreso *", key="gi_reg")
+                    gi_cupos   = st.number_input("Pasajeros proyectados *", min_value=1, value=20, key="gi_cupos")
+                with col2:
+                    st.markdown("**💵 Precios en USD:**")
+                    gi_p_ad_doble  = st.number_input("Adulto base doble",  min_value=0.0, step=50.0, format="%.2f", key="gi_pad")
+                    gi_p_ad_triple = st.number_input("Adulto base triple", min_value=0.0, step=50.0, format="%.2f", key="gi_pat")
+                    gi_p_men_doble  = st.number_input("Menor base doble",  min_value=0.0, step=50.0, format="%.2f", key="gi_pmd")
+                    gi_p_men_triple = st.number_input("Menor base triple", min_value=0.0, step=50.0, format="%.2f", key="gi_pmt")
+                    gi_ganancia = st.slider("Porcentaje de ganancia (%)", 1, 50, 15, key="gi_gan")
+
+                if gi_regreso > gi_salida:
+                    gi_dias   = (gi_regreso - gi_salida).days + 1
+                    gi_noches = gi_dias - 1
+                    st.info(f"📅 {gi_dias} días / {gi_noches} noches")
+
+                if st.button("💾 Registrar Viaje Internacional", type="primary", use_container_width=True, key="gi_reg_btn"):
+                    errores_gi = []
+                    if not gi_destino.strip():  errores_gi.append("El destino es obligatorio.")
+                    if gi_regreso <= gi_salida: errores_gi.append("La fecha de regreso debe ser posterior.")
+                    if gi_p_ad_doble <= 0:      errores_gi.append("El precio adulto doble debe ser mayor a 0.")
+
+                    if errores_gi:
+                        for e in errores_gi:
+                            st.error(f"❌ {e}")
+                    else:
+                        try:
+                            gi_dias   = (gi_regreso - gi_salida).days + 1
+                            gi_noches = gi_dias - 1
+                            conn = conectar_db()
+                            cursor = conn.cursor()
+                            cursor.execute("""
+                                INSERT INTO viajes_internacionales (
+                                    destino, fecha_salida, fecha_regreso, dias, noches,
+                                    cupos_totales, cupos_vendidos, cupos_disponibles,
+                                    precio_adulto_doble_usd, precio_adulto_triple_usd,
+                                    precio_menor_doble_usd, precio_menor_triple_usd,
+                                    porcentaje_ganancia, estado, fecha_registro,
+                                    fecha_salida_iso, fecha_regreso_iso
+                                ) VALUES (?,?,?,?,?,?,0,?,?,?,?,?,?,'ACTIVO',?,?,?)
+                            """, (
+                                gi_destino.strip(),
+                                gi_salida.strftime("%d-%m-%Y"), gi_regreso.strftime("%d-%m-%Y"),
+                                gi_dias, gi_noches,
+                                gi_cupos, gi_cupos,
+                                gi_p_ad_doble, gi_p_ad_triple,
+                                gi_p_men_doble, gi_p_men_triple,
+                                gi_ganancia,
+                                datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                                fecha_a_iso(gi_salida), fecha_a_iso(gi_regreso)
+                            ))
+                            conn.commit()
+                            conn.close()
+                            st.success(f"✅ Viaje **{gi_destino}** registrado con {gi_cupos} cupos.")
+                            st.rerun()
+                        except Exception as e:
+                            st.error(f"❌ Error: {e}")
+
+            with subtab_gi[1]:
+                st.markdown("#### ✏️ Editar o Cerrar un Viaje")
+                conn = conectar_db()
+                try:
+                    df_gi_edit = read_sql_query("""
+                        SELECT id, destino, cupos_totales, cupos_vendidos, cupos_disponibles,
+                               precio_adulto_doble_usd, precio_adulto_triple_usd,
+                               precio_menor_doble_usd, precio_menor_triple_usd,
+                               porcentaje_ganancia, estado
+                        FROM viajes_internacionales ORDER BY id DESC
+                    """, conn)
+                except:
+                    df_gi_edit = pd.DataFrame()
+                conn.close()
+
+                if df_gi_edit.empty:
+                    st.info("No hay viajes para editar.")
+                else:
+                    gi_edit_opts = {
+                        f"ID {row['id']} | {row['destino']} ({row['estado']})": row
+                        for _, row in df_gi_edit.iterrows()
+                    }
+                    gi_edit_label = st.selectbox("Selecciona viaje:", list(gi_edit_opts.keys()), key="gi_edit_sel")
+                    gi_edit_row = gi_edit_opts[gi_edit_label]
+
+                    col1, col2 = st.columns(2)
+                    with col1:
+                        gi_e_cupos   = st.number_input("Cupos totales",
+                            min_value=int(gi_edit_row["cupos_vendidos"]),
+                            value=int(gi_edit_row["cupos_totales"]), key="gi_e_cupos")
+                        gi_e_pad     = st.number_input("Adulto doble (USD)",
+                            min_value=0.0, value=float(gi_edit_row["precio_adulto_doble_usd"]),
+                            step=50.0, format="%.2f", key="gi_e_pad")
+                        gi_e_pat     = st.number_input("Adulto triple (USD)",
+                            min_value=0.0, value=float(gi_edit_row["precio_adulto_triple_usd"]),
+                            step=50.0, format="%.2f", key="gi_e_pat")
+                    with col2:
+                        gi_e_pmd     = st.number_input("Menor doble (USD)",
+                            min_value=0.0, value=float(gi_edit_row["precio_menor_doble_usd"]),
+                            step=50.0, format="%.2f", key="gi_e_pmd")
+                        gi_e_pmt     = st.number_input("Menor triple (USD)",
+                            min_value=0.0, value=float(gi_edit_row["precio_menor_triple_usd"]),
+                            step=50.0, format="%.2f", key="gi_e_pmt")
+                        gi_e_estado  = st.selectbox("Estado",
+                            ["ACTIVO","AGOTADO","CERRADO"],
+                            index=["ACTIVO","AGOTADO","CERRADO"].index(gi_edit_row["estado"]),
+                            key="gi_e_estado")
+
+                    if st.button("💾 Guardar Cambios", type="primary", key="gi_e_guardar"):
+                        try:
+                            conn = conectar_db()
+                            cursor = conn.cursor()
+                            nuevos_disp_i = gi_e_cupos - int(gi_edit_row["cupos_vendidos"])
+                            cursor.execute("""
+                                UPDATE viajes_internacionales
+                                SET cupos_totales = ?, cupos_disponibles = ?,
+                                    precio_adulto_doble_usd = ?, precio_adulto_triple_usd = ?,
+                                    precio_menor_doble_usd  = ?, precio_menor_triple_usd  = ?,
+                                    estado = ?
+                                WHERE id = ?
+                            """, (gi_e_cupos, max(0, nuevos_disp_i),
+                                  gi_e_pad, gi_e_pat, gi_e_pmd, gi_e_pmt,
+                                  gi_e_estado, int(gi_edit_row["id"])))
+                            conn.commit()
+                            conn.close()
+                            st.success("✅ Viaje actualizado correctamente.")
+                            st.rerun()
+                        except Exception as e:
+                            st.error(f"❌ Error: {e}")
@@ -0,0 +1,1238 @@
+"""
+PÁGINA VIAJES NACIONALES - Sistema Agencia Riviera Maya
+Viajes nacionales, cotizaciones, registro de clientes, pasajeros y abonos.
+"""
+
+from datetime import datetime
+
+import streamlit as st
+import pandas as pd
+
+from app_nucleo import conectar_db, obtener_vendedoras, read_sql_query, siguiente_num_recibo
+from componentes_pdf import boton_recibo
+from migracion_fechas_iso import fecha_a_iso
+
+
+def obtener_viajes_nacionales_activos():
+    """Obtiene lista de viajes nacionales activos"""
+    conn = conectar_db()
+    cursor = conn.cursor()
+    try:
+        cursor.execute("""
+            SELECT id, nombre_viaje, destino, fecha_salida, fecha_regreso,
+                   dias, noches, cupos_totales, cupos_vendidos, cupos_disponibles,
+                   precio_persona_doble, precio_persona_triple, estado
+            FROM viajes_nacionales
+            WHERE estado = 'ACTIVO'
+            ORDER BY fecha_salida
+        """)
+        cols = ['id','nombre_viaje','destino','fecha_salida','fecha_regreso',
+                'dias','noches','cupos_totales','cupos_vendidos','cupos_disponibles',
+                'precio_doble','precio_triple','estado']
+        rows = cursor.fetchall()
+        conn.close()
+        return [dict(zip(cols, r)) for r in rows]
+    except Exception as e:
+        conn.close()
+        return []
+
+
+def obtener_cotizaciones_nacionales():
+    """Obtiene cotizaciones disponibles para cargar en viaje"""
+    conn = conectar_db()
+    cursor = conn.cursor()
+    try:
+        cursor.execute("""
+            SELECT id, nombre_viaje, destino, fecha_salida, fecha_regreso,
+                   dias, noches, personas_proyectadas,
+                   precio_persona_doble, precio_persona_triple
+            FROM cotizaciones_nacionales
+            ORDER BY id DESC
+        """)
+        cols = ['id','nombre_viaje','destino','fecha_salida','fecha_regreso',
+                'dias','noches','personas_proyectadas','precio_doble','precio_triple']
+        rows = cursor.fetchall()
+        conn.close()
+        return [dict(zip(cols, r)) for r in rows]
+    except:
+        conn.close()
+        return []
+
+
+def formulario_registro_cliente_nacional():
+    """Formulario para registrar un cliente en un viaje nacional"""
+    st.subheader("➕ Registrar Cliente en Viaje Nacional")
+    usuario = st.session_state.usuario_actual
+
+    viajes = obtener_viajes_nacionales_activos()
+    if not viajes:
+        st.warning("⚠️ No hay viajes nacionales activos con cupos. Pide al administrador que registre viajes primero.")
+        return
+
+    # ── Selección de viaje ──────────────────────────────────────────────────
+    st.markdown("#### 🎫 Selecciona el Viaje")
+    opciones_viaje = {
+        f"{v['nombre_viaje']} | {v['destino']} | {v['fecha_salida']} → {v['fecha_regreso']} | Disp: {v['cupos_disponibles']}": v
+        for v in viajes if v['cupos_disponibles'] > 0
+    }
+    if not opciones_viaje:
+        st.error("❌ No hay viajes con cupos disponibles.")
+        return
+
+    viaje_label = st.selectbox("Viaje disponible:", list(opciones_viaje.keys()), key="cn_viaje")
+    viaje_sel = opciones_viaje[viaje_label]
+
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Cupos disponibles", viaje_sel['cupos_disponibles'])
+    col2.metric("Días / Noches", f"{viaje_sel['dias']}d / {viaje_sel['noches']}n")
+    col3.metric("Precio doble p/p", f"${viaje_sel['precio_doble']:,.2f}")
+    col4.metric("Precio triple p/p", f"${viaje_sel['precio_triple']:,.2f}")
+
+    st.divider()
+
+    # ── Datos del cliente ──────────────────────────────────────────────────
+    st.markdown("#### 👤 Datos del Cliente")
+    col1, col2 = st.columns(2)
+    with col1:
+        cliente = st.text_input("Nombre del cliente *", key="cn_cliente")
+    with col2:
+        celular = st.text_input("Celular del cliente *", key="cn_celular")
+
+    # Vendedora
+    if usuario["rol"] == "ADMIN":
+        vendedoras = obtener_vendedoras()
+        if not vendedoras:
+            st.error("❌ No hay vendedoras registradas.")
+            return
+        vend_dict = {v[1]: v[0] for v in vendedoras}
+        id_vendedora = vend_dict[st.selectbox("Vendedora *", list(vend_dict.keys()), key="cn_vend")]
+    else:
+        id_vendedora = usuario["id_vendedora"]
+        st.info(f"Vendedora: **{usuario['nombre']}**")
+
+    st.divider()
+
+    # ── Distribución de habitaciones ────────────────────────────────────────
+    st.markdown("#### 🛏️ Distribución de Habitaciones")
+    col1, col2 = st.columns(2)
+    with col1:
+        hab_dobles = st.number_input(
+            f"Habitaciones dobles (2 pax × ${viaje_sel['precio_doble']:,.2f})",
+            min_value=0, value=1, step=1, key="cn_dobles"
+        )
+    with col2:
+        hab_triples = st.number_input(
+            f"Habitaciones triples (3 pax × ${viaje_sel['precio_triple']:,.2f})",
+            min_value=0, value=0, step=1, key="cn_triples"
+        )
+
+    adultos_hab = (hab_dobles * 2) + (hab_triples * 3)
+
+    col1, col2 = st.columns(2)
+    with col1:
+        menores = st.number_input("Número de menores (sin cupo extra)", min_value=0, value=0, step=1, key="cn_menores")
+    with col2:
+        st.metric("Total adultos por habitación", adultos_hab)
+
+    total_personas = adultos_hab + menores
+
+    if total_personas == 0:
+        st.warning("⚠️ Selecciona al menos una habitación.")
+        return
+
+    if adultos_hab > viaje_sel['cupos_disponibles']:
+        st.error(f"❌ Solo hay {viaje_sel['cupos_disponibles']} cupos disponibles. Reduce las habitaciones.")
+        return
+
+    # ── Cálculo de precios ──────────────────────────────────────────────────
+    st.markdown("#### 💰 Resumen de Precios")
+
+    total_dobles  = hab_dobles  * 2 * viaje_sel['precio_doble']
+    total_triples = hab_triples * 3 * viaje_sel['precio_triple']
+    total_pagar   = total_dobles + total_triples
+
+    col1, col2, col3 = st.columns(3)
+    if hab_dobles > 0:
+        col1.metric(
+            f"{hab_dobles} hab. doble(s) × 2 × ${viaje_sel['precio_doble']:,.2f}",
+            f"${total_dobles:,.2f}"
+        )
+    if hab_triples > 0:
+        col2.metric(
+            f"{hab_triples} hab. triple(s) × 3 × ${viaje_sel['precio_triple']:,.2f}",
+            f"${total_triples:,.2f}"
+        )
+    col3.metric("💵 TOTAL A PAGAR", f"${total_pagar:,.2f}")
+
+    # ── Abono inicial ──────────────────────────────────────────────────────
+    st.markdown("#### 💳 Abono Inicial")
+    col1, col2 = st.columns(2)
+    with col1:
+        abono_inicial = st.number_input(
+            "Abono inicial *",
+            min_value=0.0, max_value=float(total_pagar),
+            step=100.0, format="%.2f", key="cn_abono"
+        )
+    with col2:
+        metodo_abono = st.selectbox("Método de pago *",
+            ["Efectivo","Transferencia","Tarjeta de crédito",
+             "Tarjeta de débito","Depósito bancario","Otro"], key="cn_metodo")
+
+    saldo = total_pagar - abono_inicial
+    liquidado = saldo <= 0.01
+
+    col1, col2 = st.columns(2)
+    col1.metric("Abono inicial", f"${abono_inicial:,.2f}")
+    col2.metric("Saldo restante", f"${saldo:,.2f}")
+    if liquidado:
+        st.success("🎉 ¡Este cliente liquidará el viaje con el abono inicial!")
+
+    st.divider()
+
+    # ── Nombres de pasajeros por habitación ─────────────────────────────────
+    st.markdown("#### 🧳 Pasajeros por Habitación")
+    pasajeros = []
+
+    for i in range(hab_dobles):
+        st.markdown(f"**🛏️ Habitación Doble {i+1}**")
+        cols_d = st.columns(2)
+        for j in range(2):
+            with cols_d[j]:
+                nombre = st.text_input(f"Pasajero {j+1}", key=f"cn_d{i}_{j}", placeholder="Nombre completo")
+                pasajeros.append({"nombre": nombre, "tipo": "ADULTO", "habitacion": f"Doble {i+1}"})
+
+    for i in range(hab_triples):
+        st.markdown(f"**🛏️ Habitación Triple {i+1}**")
+        cols_t = st.columns(3)
+        for j in range(3):
+            with cols_t[j]:
+                nombre = st.text_input(f"Pasajero {j+1}", key=f"cn_t{i}_{j}", placeholder="Nombre completo")
+                pasajeros.append({"nombre": nombre, "tipo": "ADULTO", "habitacion": f"Triple {i+1}"})
+
+    if menores > 0:
+        st.markdown(f"**👶 Menores ({menores})**")
+        cols_m = st.columns(2)
+        for i in range(menores):
+            with cols_m[i % 2]:
+                nombre_m = st.text_input(f"Menor {i+1}", key=f"cn_m{i}", placeholder="Nombre completo")
+                hab_m = st.selectbox(
+                    f"Habitación del menor {i+1}",
+                    [f"Doble {j+1}" for j in range(hab_dobles)] +
+                    [f"Triple {j+1}" for j in range(hab_triples)],
+                    key=f"cn_mh{i}"
+                )
+                pasajeros.append({"nombre": nombre_m, "tipo": "MENOR", "habitacion": hab_m})
+
+    st.divider()
+
+    if st.button("💾 Registrar Cliente en Viaje", type="primary", use_container_width=True):
+        errores = []
+        if not cliente.strip():
+            errores.append("El nombre del cliente es obligatorio.")
+        if not celular.strip():
+            errores.append("El celular es obligatorio.")
+        if adultos_hab == 0:
+            errores.append("Debes seleccionar al menos una habitación.")
+        if total_pagar <= 0:
+            errores.append("El total a pagar debe ser mayor a 0.")
+        if any(p["nombre"].strip() == "" for p in pasajeros):
+            errores.append("Todos los nombres de pasajeros son obligatorios.")
+
+        if errores:
+            for e in errores:
+                st.error(f"❌ {e}")
+            return
+
+        try:
+            conn = conectar_db()
+            cursor = conn.cursor()
+            fecha_registro = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            estado_cliente = "LIQUIDADO" if liquidado else "ADEUDO"
+
+            cursor.execute("""
+                INSERT INTO clientes_nacionales (
+                    viaje_id, vendedora_id, nombre_cliente, celular_responsable,
+                    adultos, menores,
+                    habitaciones_doble, habitaciones_triple,
+                    total_pagar, total_abonado, saldo, estado, fecha_registro
+                ) VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?)
+            """, (
+                viaje_sel['id'], id_vendedora,
+                cliente.strip(), celular.strip(),
+                adultos_hab, menores,
+                hab_dobles, hab_triples,
+                total_pagar, abono_inicial, saldo,
+                estado_cliente, fecha_registro
+            ))
+            cliente_id = cursor.lastrowid
+
+            # Abono inicial
+            try:
+                cursor.execute(
+                    "INSERT INTO abonos_nacionales (cliente_id, monto, fecha, vendedora_id, metodo_pago) VALUES (?,?,?,?,?)",
+                    (cliente_id, abono_inicial, fecha_registro, id_vendedora, metodo_abono)
+                )
+            except:
+                cursor.execute(
+                    "INSERT INTO abonos_nacionales (cliente_id, monto, fecha, vendedora_id) VALUES (?,?,?,?)",
+                    (cliente_id, abono_inicial, fecha_registro, id_vendedora)
+                )
+
+            # Pasajeros
+            for p in pasajeros:
+                cursor.execute(
+                    "INSERT INTO pasajeros_nacionales (cliente_id, nombre_completo, tipo, habitacion_asignada) VALUES (?,?,?,?)",
+                    (cliente_id, p["nombre"].strip(), p["tipo"], p["habitacion"])
+                )
+
+            # Actualizar cupos
+            cursor.execute("""
+                UPDATE viajes_nacionales
+                SET cupos_vendidos = cupos_vendidos + ?,
+                    cupos_disponibles = cupos_disponibles - ?
+                WHERE id = ?
+            """, (adultos_hab, adultos_hab, viaje_sel['id']))
+
+            cursor.execute("""
+                UPDATE viajes_nacionales SET estado = 'AGOTADO'
+                WHERE id = ? AND cupos_disponibles <= 0
+            """, (viaje_sel['id'],))
+
+            conn.commit()
+            conn.close()
+
+            st.success(f"✅ **{cliente}** registrado en **{viaje_sel['nombre_viaje']}** — {total_personas} pasajero(s) | Saldo: ${saldo:,.2f}")
+            if liquidado:
+                st.balloons()
+
+            # ── Recibo del abono inicial ───────────────────────────────────
+            if abono_inicial > 0:
+                num_rec_cn  = siguiente_num_recibo()
+                fecha_rec_cn = datetime.now().strftime("%d-%B-%Y").replace(
+                    "January","enero").replace("February","febrero").replace(
+                    "March","marzo").replace("April","abril").replace(
+                    "May","mayo").replace("June","junio").replace(
+                    "July","julio").replace("August","agosto").replace(
+                    "September","septiembre").replace("October","octubre").replace(
+                    "November","noviembre").replace("December","diciembre")
+                concepto_cn = f"Abono inicial — {viaje_sel['nombre_viaje']} ({viaje_sel.get('destino','')})"
+                vend_cn     = usuario.get("nombre", "Agente")
+                st.divider()
+                st.markdown("#### 🧾 Recibo del Abono Inicial")
+                boton_recibo(
+                    numero     = num_rec_cn,
+                    fecha_str  = fecha_rec_cn,
+                    cliente    = cliente.strip(),
+                    monto      = abono_inicial,
+                    concepto   = concepto_cn,
+                    forma_pago = metodo_abono,
+                    agente     = vend_cn,
+                    key_suffix = f"cn_new_{cliente_id}",
+                    total_viaje      = total_pagar,
+                    pagado_acumulado = abono_inicial,
+                    nuevo_saldo      = saldo,
+                )
+            else:
+                st.rerun()
+
+        except Exception as e:
+            st.error(f"❌ Error al guardar: {e}")
+            st.caption("💡 Verifica que las tablas `clientes_nacionales`, `pasajeros_nacionales` y `abonos_nacionales` existan en la BD.")
+
+
+def pagina_viajes_nacionales():
+    """Página completa de viajes nacionales"""
+    st.title("🎫 Viajes Nacionales")
+    usuario = st.session_state.usuario_actual
+
+    tabs_labels = ["📋 Ver Viajes", "👥 Ver Clientes", "➕ Registrar Cliente", "💰 Registrar Pago"]
+    if usuario["rol"] == "ADMIN":
+        tabs_labels.append("📝 Cotizador")
+        tabs_labels.append("⚙️ Gestionar Viajes")
+
+    tabs = st.tabs(tabs_labels)
+
+    # ── TAB 0: VER VIAJES ──────────────────────────────────────────────────
+    with tabs[0]:
+        st.subheader("Viajes Nacionales")
+
+        conn = conectar_db()
+        try:
+            df_viajes = read_sql_query("""
+                SELECT id, nombre_viaje, destino, fecha_salida, fecha_regreso,
+                       dias, noches, cupos_totales, cupos_vendidos, cupos_disponibles,
+                       precio_persona_doble, precio_persona_triple, estado
+                FROM viajes_nacionales
+                ORDER BY fecha_salida
+            """, conn)
+        except:
+            df_viajes = pd.DataFrame()
+        conn.close()
+
+        if df_viajes.empty:
+            st.info("ℹ️ No hay viajes nacionales registrados aún.")
+        else:
+            activos = df_viajes[df_viajes['estado'] == 'ACTIVO']
+            col1, col2, col3 = st.columns(3)
+            col1.metric("Viajes activos", len(activos))
+            col2.metric("Cupos disponibles", int(activos['cupos_disponibles'].sum()) if not activos.empty else 0)
+            col3.metric("Total viajes", len(df_viajes))
+
+            st.divider()
+
+            filtro_estado = st.selectbox("Filtrar por estado:",
+                ["Todos"] + sorted(df_viajes['estado'].unique().tolist()), key="vn_filtro")
+            df_f = df_viajes if filtro_estado == "Todos" else df_viajes[df_viajes['estado'] == filtro_estado]
+
+            df_show = df_f.copy()
+            df_show['precio_persona_doble']  = df_show['precio_persona_doble'].apply(lambda x: f"${x:,.2f}")
+            df_show['precio_persona_triple'] = df_show['precio_persona_triple'].apply(lambda x: f"${x:,.2f}")
+            df_show.columns = ['ID','Viaje','Destino','Salida','Regreso',
+                                'Días','Noches','Cupos Total','Vendidos','Disponibles',
+                                'P. Doble p/p','P. Triple p/p','Estado']
+            st.dataframe(df_show, use_container_width=True, hide_index=True)
+
+            # Detalle
+            st.divider()
+            st.markdown("#### 🔍 Detalle de un viaje")
+            viaje_ids = df_f['id'].tolist()
+            if viaje_ids:
+                id_sel = st.selectbox("Selecciona ID:", viaje_ids, key="vn_det_id")
+                row = df_f[df_f['id'] == id_sel].iloc[0]
+                with st.expander(f"📄 {row['nombre_viaje']} — {row['destino']}", expanded=True):
+                    c1, c2, c3 = st.columns(3)
+                    c1.write(f"**Viaje:** {row['nombre_viaje']}")
+                    c1.write(f"**Destino:** {row['destino']}")
+                    c1.write(f"**Salida:** {row['fecha_salida']}  →  **Regreso:** {row['fecha_regreso']}")
+                    c2.metric("Días / Noches", f"{row['dias']}d / {row['noches']}n")
+                    c2.metric("Cupos totales", row['cupos_totales'])
+                    c3.metric("Cupos disponibles", row['cupos_disponibles'])
+                    c3.metric("Estado", row['estado'])
+
+                    st.markdown(f"**💰 Precio doble p/p:** ${row['precio_persona_doble']:,.2f}  |  **Precio triple p/p:** ${row['precio_persona_triple']:,.2f}")
+
+                    if row['cupos_totales'] > 0:
+                        pct = row['cupos_vendidos'] / row['cupos_totales']
+                        st.markdown(f"**Ocupación: {pct*100:.0f}%**")
+                        st.progress(pct)
+
+    # ── TAB 1: VER CLIENTES ────────────────────────────────────────────────
+    with tabs[1]:
+        st.subheader("Clientes de Viajes Nacionales")
+
+        conn = conectar_db()
+        try:
+            if usuario["rol"] == "VENDEDORA":
+                query_cl = f"""
+                    SELECT cn.id, cn.nombre_cliente, cn.celular_responsable,
+                           vj.nombre_viaje, vj.destino, vj.fecha_salida, vj.fecha_regreso,
+                           cn.adultos, cn.menores,
+                           cn.habitaciones_doble, cn.habitaciones_triple,
+                           cn.total_pagar, cn.total_abonado, cn.saldo,
+                           cn.estado, vd.nombre AS vendedora
+                    FROM clientes_nacionales cn
+                    JOIN viajes_nacionales vj ON cn.viaje_id = vj.id
+                    JOIN vendedoras vd ON cn.vendedora_id = vd.id
+                    WHERE cn.estado != 'CERRADO'
+                    ORDER BY cn.id DESC
+                """
+            else:
+                query_cl = """
+                    SELECT cn.id, cn.nombre_cliente, cn.celular_responsable,
+                           vj.nombre_viaje, vj.destino, vj.fecha_salida, vj.fecha_regreso,
+                           cn.adultos, cn.menores,
+                           cn.habitaciones_doble, cn.habitaciones_triple,
+                           cn.total_pagar, cn.total_abonado, cn.saldo,
+                           cn.estado, vd.nombre AS vendedora
+                    FROM clientes_nacionales cn
+                    JOIN viajes_nacionales vj ON cn.viaje_id = vj.id
+                    JOIN vendedoras vd ON cn.vendedora_id = vd.id
+                    WHERE cn.estado != 'CERRADO'
+                    ORDER BY cn.id DESC
+                """
+            df_cl = read_sql_query(query_cl, conn)
+        except Exception as e:
+            df_cl = pd.DataFrame()
+            st.caption(f"⚠️ {e}")
+        conn.close()
+
+        if df_cl.empty:
+            st.info("No hay clientes de viajes nacionales registrados.")
+        else:
+            df_cl.columns = ['ID','Cliente','Celular','Viaje','Destino','Salida','Regreso',
+                              'Adultos','Menores','Hab. Doble','Hab. Triple',
+                              'Total','Abonado','Saldo','Estado','Vendedora']
+
+            col1, col2, col3, col4 = st.columns(4)
+            col1.metric("Clientes", len(df_cl))
+            col2.metric("Total a cobrar",  f"${df_cl['Total'].sum():,.2f}")
+            col3.metric("Total cobrado",   f"${df_cl['Abonado'].sum():,.2f}")
+            col4.metric("Saldo pendiente", f"${df_cl['Saldo'].sum():,.2f}")
+
+            st.divider()
+
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                filtro_vj = st.selectbox("Filtrar por viaje",
+                    ["Todos"] + sorted(df_cl['Viaje'].unique().tolist()), key="cl_vj")
+            with col2:
+                filtro_vend_nac = st.selectbox("Filtrar por vendedora",
+                    ["Todas"] + sorted(df_cl['Vendedora'].unique().tolist()), key="cl_vend")
+            with col3:
+                filtro_cl_buscar = st.text_input("🔍 Buscar cliente", key="cl_buscar")
+
+            df_clf = df_cl.copy()
+            if filtro_vj != "Todos":
+                df_clf = df_clf[df_clf['Viaje'] == filtro_vj]
+            if filtro_vend_nac != "Todas":
+                df_clf = df_clf[df_clf['Vendedora'] == filtro_vend_nac]
+            if filtro_cl_buscar:
+                df_clf = df_clf[df_clf['Cliente'].str.contains(filtro_cl_buscar, case=False, na=False)]
+
+            df_show_cl = df_clf.copy()
+            for col in ['Total','Abonado','Saldo']:
+                df_show_cl[col] = df_show_cl[col].apply(lambda x: f"${x:,.2f}")
+            st.dataframe(df_show_cl, use_container_width=True, hide_index=True)
+
+            # Detalle expandible
+            st.divider()
+            st.markdown("#### 🔍 Ver detalle de cliente")
+            cl_ids = df_clf['ID'].tolist()
+            if cl_ids:
+                id_cl_sel = st.selectbox("Selecciona ID cliente:", cl_ids, key="cl_det")
+                row_cl = df_clf[df_clf['ID'] == id_cl_sel].iloc[0]
+                with st.expander(f"📄 {row_cl['Cliente']} | {row_cl['Viaje']}", expanded=True):
+                    c1, c2, c3 = st.columns(3)
+                    c1.write(f"**Cliente:** {row_cl['Cliente']}")
+                    c1.write(f"**Celular:** {row_cl['Celular']}")
+                    c1.write(f"**Vendedora:** {row_cl['Vendedora']}")
+                    c2.write(f"**Viaje:** {row_cl['Viaje']}")
+                    c2.write(f"**Destino:** {row_cl['Destino']}")
+                    c2.write(f"**Salida:** {row_cl['Salida']} → {row_cl['Regreso']}")
+                    c3.write(f"**Adultos:** {row_cl['Adultos']}  |  **Menores:** {row_cl['Menores']}")
+                    c3.write(f"**Hab. Dobles:** {row_cl['Hab. Doble']}  |  **Hab. Triples:** {row_cl['Hab. Triple']}")
+                    c3.write(f"**Estado:** {row_cl['Estado']}")
+
+                    st.divider()
+                    c1, c2, c3 = st.columns(3)
+                    total_val   = df_clf[df_clf['ID']==id_cl_sel]['Total'].values[0]
+                    abonado_val = df_clf[df_clf['ID']==id_cl_sel]['Abonado'].values[0]
+                    saldo_val   = df_clf[df_clf['ID']==id_cl_sel]['Saldo'].values[0]
+                    c1.metric("Total",   f"${total_val:,.2f}")
+                    c2.metric("Abonado", f"${abonado_val:,.2f}")
+                    c3.metric("Saldo",   f"${saldo_val:,.2f}")
+
+                    conn2 = conectar_db()
+                    try:
+                        df_pas_n = read_sql_query(
+                            "SELECT nombre_completo, tipo, habitacion_asignada FROM pasajeros_nacionales WHERE cliente_id = ?",
+                            conn2, params=(id_cl_sel,))
+                        df_abonos_n = read_sql_query(
+                            "SELECT id, fecha, monto, metodo_pago FROM abonos_nacionales WHERE cliente_id = ? ORDER BY fecha",
+                            conn2, params=(id_cl_sel,))
+                    except:
+                        df_pas_n = pd.DataFrame()
+                        df_abonos_n = pd.DataFrame()
+                    conn2.close()
+
+                    c1, c2 = st.columns(2)
+                    with c1:
+                        st.markdown("**🧳 Pasajeros:**")
+                        if not df_pas_n.empty:
+                            df_pas_n.columns = ['Nombre','Tipo','Habitación']
+                            st.dataframe(df_pas_n, hide_index=True, use_container_width=True)
+                        else:
+                            st.caption("Sin pasajeros registrados")
+                    with c2:
+                        st.markdown("**💳 Historial de abonos:**")
+                        if not df_abonos_n.empty:
+                            # Botones de reimprimir para cada abono
+                            for idx, row in df_abonos_n.iterrows():
+                                col_a, col_b = st.columns([3, 1])
+                                with col_a:
+                                    st.text(f"{row['fecha']}: ${row['monto']:,.2f}")
+                                with col_b:
+                                    if st.button(f"🖨️", key=f"reimp_abono_nac_{row['id']}"):
+                                        # Obtener datos del cliente
+                                        conn_cli = conectar_db()
+                                        df_cliente = read_sql_query(
+                                            "SELECT nombre_cliente, total_pagar, total_abonado, saldo FROM clientes_nacionales WHERE id = ?",
+                                            conn_cli, params=(id_cl_sel,))
+                                        conn_cli.close()
+
+                                        if not df_cliente.empty:
+                                            cliente_row = df_cliente.iloc[0]
+                                            num_rec = siguiente_num_recibo()
+                                            fecha_rec = datetime.now().strftime("%d-%B-%Y").replace(
+                                                "January","enero").replace("February","febrero").replace(
+                                                "March","marzo").replace("April","abril").replace(
+                                                "May","mayo").replace("June","junio").replace(
+                                                "July","julio").replace("August","agosto").replace(
+                                                "September","septiembre").replace("October","octubre").replace(
+                                                "November","noviembre").replace("December","diciembre")
+                                            boton_recibo(
+                                                numero     = num_rec,
+                                                fecha_str  = fecha_rec,
+                                                cliente    = cliente_row['nombre_cliente'],
+                                                monto      = row['monto'],
+                                                concepto   = f"Abono - Viaje Nacional",
+                                                forma_pago = row.get('metodo_pago', 'Efectivo'),
+                                                agente     = usuario.get("nombre", "Agente"),
+                                                key_suffix = f"reimp_nac_{row['id']}",
+                                                total_viaje      = cliente_row['total_pagar'],
+                                                pagado_acumulado = cliente_row['total_abonado'],
+                                                nuevo_saldo      = cliente_row['saldo'],
+                                            )
+                        else:
+                            st.caption("Sin abonos registrados")
+
+            csv_cl = df_show_cl.to_csv(index=False).encode('utf-8')
+            st.download_button("📥 Descargar CSV", csv_cl,
+                file_name=f"clientes_nacionales_{datetime.now().strftime('%Y%m%d')}.csv",
+                mime="text/csv")
+
+    # ── TAB 2: REGISTRAR CLIENTE ───────────────────────────────────────────
+    with tabs[2]:
+        formulario_registro_cliente_nacional()
+
+    # ── TAB 3: REGISTRAR PAGO ─────────────────────────────────────────────
+    with tabs[3]:
+        st.subheader("💰 Registrar Pago - Viajes Nacionales")
+
+        conn = conectar_db()
+        try:
+            if usuario["rol"] == "VENDEDORA":
+                query_pago = f"""
+                    SELECT cn.id, cn.nombre_cliente, vj.nombre_viaje, vj.destino,
+                           cn.total_pagar, cn.total_abonado, cn.saldo
+                    FROM clientes_nacionales cn
+                    JOIN viajes_nacionales vj ON cn.viaje_id = vj.id
+                    WHERE cn.estado NOT IN ('CERRADO','LIQUIDADO')
+                    ORDER BY cn.id DESC
+                """
+            else:
+                query_pago = """
+                    SELECT cn.id, cn.nombre_cliente, vj.nombre_viaje, vj.destino,
+                           cn.total_pagar, cn.total_abonado, cn.saldo
+                    FROM clientes_nacionales cn
+                    JOIN viajes_nacionales vj ON cn.viaje_id = vj.id
+                    WHERE cn.estado NOT IN ('CERRADO','LIQUIDADO')
+                    ORDER BY cn.id DESC
+                """
+            df_pago = read_sql_query(query_pago, conn)
+        except Exception as e:
+            df_pago = pd.DataFrame()
+            st.caption(f"⚠️ {e}")
+        conn.close()
+
+        if df_pago.empty:
+            st.info("No hay clientes con saldo pendiente.")
+        else:
+            df_pago.columns = ['id','cliente','viaje','destino','total_pagar','total_abonado','saldo']
+            opciones_pago = {
+                f"ID {row['id']} | {row['cliente']} — {row['viaje']} | Saldo: ${row['saldo']:,.2f}": row
+                for _, row in df_pago.iterrows()
+            }
+            pago_label = st.selectbox("Selecciona el cliente:", list(opciones_pago.keys()), key="vn_pago_sel")
+            pago_sel = opciones_pago[pago_label]
+
+            col1, col2, col3 = st.columns(3)
+            col1.metric("Total",          f"${pago_sel['total_pagar']:,.2f}")
+            col2.metric("Ya abonado",     f"${pago_sel['total_abonado']:,.2f}")
+            col3.metric("Saldo pendiente",f"${pago_sel['saldo']:,.2f}")
+
+            st.divider()
+            st.markdown("#### 💳 Datos del Abono")
+            col1, col2 = st.columns(2)
+            with col1:
+                monto_pago_n = st.number_input("Monto del abono *",
+                    min_value=0.01, max_value=float(pago_sel['saldo']),
+                    step=100.0, format="%.2f", key="vn_monto_pago")
+            with col2:
+                metodo_pago_n = st.selectbox("Método de pago *",
+                    ["Efectivo","Transferencia","Tarjeta de crédito",
+                     "Tarjeta de débito","Depósito bancario","Otro"], key="vn_metodo_pago")
+
+            nuevo_abonado_n = pago_sel['total_abonado'] + monto_pago_n
+            nuevo_saldo_n   = pago_sel['saldo'] - monto_pago_n
+            liquidado_n     = nuevo_saldo_n <= 0.01
+
+            col1, col2 = st.columns(2)
+            col1.metric("Nuevo total abonado", f"${nuevo_abonado_n:,.2f}", delta=f"+${monto_pago_n:,.2f}")
+            col2.metric("Nuevo saldo",         f"${nuevo_saldo_n:,.2f}",  delta=f"-${monto_pago_n:,.2f}")
+
+            if liquidado_n:
+                st.success("🎉 ¡Con este pago el cliente quedará **LIQUIDADO**!")
+            else:
+                pct_n = (nuevo_abonado_n / pago_sel['total_pagar']) * 100
+                st.info(f"📊 Avance: **{pct_n:.1f}%** cobrado")
+
+            st.divider()
+            if st.button("💾 Registrar Abono Nacional", type="primary", use_container_width=True):
+                try:
+                    conn = conectar_db()
+                    cursor = conn.cursor()
+                    fecha_pago_n = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+                    try:
+                        cursor.execute(
+                            "INSERT INTO abonos_nacionales (cliente_id, monto, fecha, vendedora_id, metodo_pago) VALUES (?,?,?,?,?)",
+                            (int(pago_sel['id']), monto_pago_n, fecha_pago_n, usuario['id_vendedora'], metodo_pago_n)
+                        )
+                    except:
+                        cursor.execute(
+                            "INSERT INTO abonos_nacionales (cliente_id, monto, fecha, vendedora_id) VALUES (?,?,?,?)",
+                            (int(pago_sel['id']), monto_pago_n, fecha_pago_n, usuario['id_vendedora'])
+                        )
+
+                    nuevo_estado_n = "LIQUIDADO" if liquidado_n else "ADEUDO"
+                    cursor.execute("""
+                        UPDATE clientes_nacionales
+                        SET total_abonado = total_abonado + ?,
+                            saldo = saldo - ?,
+                            estado = ?
+                        WHERE id = ?
+                    """, (monto_pago_n, monto_pago_n, nuevo_estado_n, int(pago_sel['id'])))
+
+                    conn.commit()
+                    conn.close()
+
+                    # ── Recibo ─────────────────────────────────────────────
+                    num_rec_n   = siguiente_num_recibo()
+                    fecha_rec_n = datetime.now().strftime("%d-%B-%Y").replace(
+                        "January","enero").replace("February","febrero").replace(
+                        "March","marzo").replace("April","abril").replace(
+                        "May","mayo").replace("June","junio").replace(
+                        "July","julio").replace("August","agosto").replace(
+                        "September","septiembre").replace("October","octubre").replace(
+                        "November","noviembre").replace("December","diciembre")
+                    vend_n      = usuario.get("nombre", "Agente")
+                    concepto_n  = f"{'Liquidación' if liquidado_n else 'Abono'} - {pago_sel.get('viaje','Viaje Nacional')}"
+
+                    if liquidado_n:
+                        st.success(f"✅ ¡**{pago_sel['cliente']}** ha LIQUIDADO su viaje! 🎉")
+                        st.balloons()
+                    else:
+                        st.success(f"✅ Abono de ${monto_pago_n:,.2f} ({metodo_pago_n}) registrado. Saldo: ${nuevo_saldo_n:,.2f}")
+
+                    st.divider()
+                    st.markdown("#### 🧾 Recibo de Pago")
+                    boton_recibo(
+                        numero     = num_rec_n,
+                        fecha_str  = fecha_rec_n,
+                        cliente    = pago_sel['cliente'],
+                        monto      = monto_pago_n,
+                        concepto   = concepto_n,
+                        forma_pago = metodo_pago_n,
+                        agente     = vend_n,
+                        key_suffix = f"nac_{pago_sel['id']}",
+                    )
+
+                except Exception as e:
+                    st.error(f"❌ Error: {e}")
+
+    # ── TAB 4: COTIZADOR (solo ADMIN) ──────────────────────────────────────
+    if usuario["rol"] == "ADMIN":
+        with tabs[4]:
+            st.subheader("📝 Cotizador de Viajes Nacionales")
+            subtab_cot = st.tabs(["➕ Nueva Cotización", "📋 Ver Cotizaciones"])
+
+            # ── Nueva Cotización ────────────────────────────────────────────
+            with subtab_cot[0]:
+                st.markdown("#### Datos Generales del Viaje")
+                col1, col2 = st.columns(2)
+                with col1:
+                    cot_nombre  = st.text_input("Nombre del viaje *", key="cot_nombre", placeholder="Ej: Cascadas de Agua Azul")
+                    cot_destino = st.text_input("Destino *", key="cot_destino", placeholder="Ej: Chiapas, México")
+                with col2:
+                    cot_salida  = st.date_input("Fecha de salida *", key="cot_salida")
+                    cot_regreso = st.date_input("Fecha de regreso *", key="cot_regreso")
+
+                if cot_regreso > cot_salida:
+                    cot_dias   = (cot_regreso - cot_salida).days + 1
+                    cot_noches = cot_dias - 1
+                    st.success(f"✅ {cot_dias} días / {cot_noches} noches")
+                else:
+                    cot_dias, cot_noches = 0, 0
+                    st.error("❌ La fecha de regreso debe ser posterior a la salida")
+
+                cot_personas = st.number_input("Personas proyectadas *", min_value=1, value=20, step=1, key="cot_personas")
+
+                st.divider()
+
+                # ── VUELOS ──────────────────────────────────────────────────
+                st.markdown("#### ✈️ Vuelos")
+                col1, col2 = st.columns(2)
+                with col1:
+                    cot_vuelo_costo  = st.number_input("Costo real por persona *", min_value=0.0, step=100.0, format="%.2f", key="cot_vc")
+                with col2:
+                    cot_vuelo_venta  = st.number_input("Precio venta por persona *", min_value=0.0, step=100.0, format="%.2f", key="cot_vv")
+
+                if cot_vuelo_venta > 0:
+                    gan_vuelo_pax   = cot_vuelo_venta - cot_vuelo_costo
+                    gan_vuelo_total = gan_vuelo_pax * cot_personas
+                    col1, col2 = st.columns(2)
+                    col1.metric("Ganancia por persona", f"${gan_vuelo_pax:,.2f}")
+                    col2.metric("Ganancia total vuelos", f"${gan_vuelo_total:,.2f}")
+                else:
+                    gan_vuelo_pax   = 0.0
+                    gan_vuelo_total = 0.0
+
+                st.divider()
+
+                # ── HOSPEDAJE ───────────────────────────────────────────────
+                st.markdown("#### 🏨 Hospedaje")
+                num_hoteles = st.radio("¿Cuántos hoteles?", [1, 2, 3, 4], horizontal=True, key="cot_num_hoteles")
+
+                hoteles_data = []
+                costo_total_doble  = 0.0
+                precio_total_doble = 0.0
+                costo_total_triple  = 0.0
+                precio_total_triple = 0.0
+
+                for i in range(num_hoteles):
+                    st.markdown(f"**🏨 Hotel {i+1}**")
+                    col1, col2, col3 = st.columns(3)
+                    with col1:
+                        h_nombre = st.text_input(f"Nombre del hotel {i+1}", key=f"cot_h_nom{i}", placeholder="Ej: Hotel Palenque")
+                    with col2:
+                        h_noches = st.number_input(f"Noches en hotel {i+1}", min_value=1, value=cot_noches if cot_noches > 0 else 1, key=f"cot_h_noch{i}")
+                    with col3:
+                        st.write("")  # spacer
+
+                    col1, col2 = st.columns(2)
+                    with col1:
+                        st.markdown("**Base Doble** (precio por noche)")
+                        h_costo_doble  = st.number_input("Costo real/noche", min_value=0.0, step=50.0, format="%.2f", key=f"cot_h_cd{i}")
+                        h_precio_doble = st.number_input("Precio venta/noche", min_value=0.0, step=50.0, format="%.2f", key=f"cot_h_pd{i}")
+                    with col2:
+                        st.markdown("**Base Triple** (precio por noche)")
+                        h_costo_triple  = st.number_input("Costo real/noche ", min_value=0.0, step=50.0, format="%.2f", key=f"cot_h_ct{i}")
+                        h_precio_triple = st.number_input("Precio venta/noche ", min_value=0.0, step=50.0, format="%.2f", key=f"cot_h_pt{i}")
+
+                    h_costo_doble_total  = h_costo_doble  * h_noches
+                    h_precio_doble_total = h_precio_doble * h_noches
+                    h_costo_triple_total  = h_costo_triple  * h_noches
+                    h_precio_triple_total = h_precio_triple * h_noches
+
+                    if h_precio_doble > 0 or h_precio_triple > 0:
+                        col1, col2, col3, col4 = st.columns(4)
+                        col1.metric(f"Total doble ({h_noches}n)", f"${h_precio_doble_total:,.2f}")
+                        col2.metric("Gan. doble/noche", f"${(h_precio_doble - h_costo_doble):,.2f}")
+                        col3.metric(f"Total triple ({h_noches}n)", f"${h_precio_triple_total:,.2f}")
+                        col4.metric("Gan. triple/noche", f"${(h_precio_triple - h_costo_triple):,.2f}")
+
+                    hoteles_data.append({
+                        "nombre": h_nombre,
+                        "noches": h_noches,
+                        "costo_doble": h_costo_doble_total,
+                        "precio_doble": h_precio_doble_total,
+                        "costo_triple": h_costo_triple_total,
+                        "precio_triple": h_precio_triple_total
+                    })
+
+                    costo_total_doble  += h_costo_doble_total
+                    precio_total_doble += h_precio_doble_total
+                    costo_total_triple  += h_costo_triple_total
+                    precio_total_triple += h_precio_triple_total
+
+                st.divider()
+
+                # ── TRASLADOS ───────────────────────────────────────────────
+                st.markdown("#### 🚌 Traslados / Transporte")
+                col1, col2 = st.columns(2)
+                with col1:
+                    cot_traslado_costo_total = st.number_input("Costo TOTAL del transporte *", min_value=0.0, step=500.0, format="%.2f", key="cot_tc")
+                with col2:
+                    cot_traslado_venta_pax   = st.number_input("Precio venta por persona *",   min_value=0.0, step=100.0, format="%.2f", key="cot_tv")
+
+                if cot_personas > 0 and cot_traslado_costo_total > 0:
+                    cot_traslado_costo_pax = cot_traslado_costo_total / cot_personas
+                    gan_traslado_pax       = cot_traslado_venta_pax - cot_traslado_costo_pax
+                    gan_traslado_total     = gan_traslado_pax * cot_personas
+                    col1, col2, col3 = st.columns(3)
+                    col1.metric("Costo real por persona", f"${cot_traslado_costo_pax:,.2f}")
+                    col2.metric("Ganancia por persona",   f"${gan_traslado_pax:,.2f}")
+                    col3.metric("Ganancia total traslados", f"${gan_traslado_total:,.2f}")
+                else:
+                    cot_traslado_costo_pax = 0.0
+                    gan_traslado_pax       = 0.0
+                    gan_traslado_total     = 0.0
+
+                st.divider()
+
+                # ── ENTRADAS / TOURS ────────────────────────────────────────
+                st.markdown("#### 🎫 Entradas / Tours / Atracciones")
+                col1, col2 = st.columns(2)
+                with col1:
+                    cot_entradas_costo = st.number_input("Costo real por persona *", min_value=0.0, step=50.0, format="%.2f", key="cot_ec")
+                with col2:
+                    cot_entradas_venta = st.number_input("Precio venta por persona *", min_value=0.0, step=50.0, format="%.2f", key="cot_ev")
+
+                if cot_entradas_venta > 0:
+                    gan_entradas_pax   = cot_entradas_venta - cot_entradas_costo
+                    gan_entradas_total = gan_entradas_pax * cot_personas
+                    col1, col2 = st.columns(2)
+                    col1.metric("Ganancia por persona", f"${gan_entradas_pax:,.2f}")
+                    col2.metric("Ganancia total entradas", f"${gan_entradas_total:,.2f}")
+                else:
+                    gan_entradas_pax   = 0.0
+                    gan_entradas_total = 0.0
+
+                st.divider()
+
+                # ── RESUMEN FINAL ───────────────────────────────────────────
+                precio_pax_doble  = cot_vuelo_venta + precio_total_doble  + cot_traslado_venta_pax + cot_entradas_venta
+                precio_pax_triple = cot_vuelo_venta + precio_total_triple + cot_traslado_venta_pax + cot_entradas_venta
+
+                inversion_vuelos    = cot_vuelo_costo * cot_personas
+                inversion_hoteles   = costo_total_doble * (cot_personas / 2) if cot_personas > 0 else 0
+                inversion_traslados = cot_traslado_costo_total
+                inversion_entradas  = cot_entradas_costo * cot_personas
+                inversion_total     = inversion_vuelos + inversion_hoteles + inversion_traslados + inversion_entradas
+
+                ganancia_proyectada = (
+                    gan_vuelo_total + gan_traslado_total + gan_entradas_total +
+                    ((precio_total_doble - costo_total_doble) * (cot_personas / 2))
+                )
+
+                if precio_pax_doble > 0 or precio_pax_triple > 0:
+                    st.markdown("### 📊 Resumen de Cotización")
+
+                    col1, col2 = st.columns(2)
+                    with col1:
+                        st.markdown("**🎯 Precio por persona — Base DOBLE**")
+                        desglose_doble = {
+                            "✈️ Vuelo":      cot_vuelo_venta,
+                            "🏨 Hotel":      precio_total_doble,
+                            "🚌 Traslados":  cot_traslado_venta_pax,
+                            "🎫 Entradas":   cot_entradas_venta,
+                        }
+                        for concepto, valor in desglose_doble.items():
+                            col_a, col_b = st.columns([2,1])
+                            col_a.write(concepto)
+                            col_b.write(f"${valor:,.2f}")
+                        st.markdown(f"**TOTAL DOBLE: ${precio_pax_doble:,.2f}**")
+
+                    with col2:
+                        st.markdown("**🎯 Precio por persona — Base TRIPLE**")
+                        desglose_triple = {
+                            "✈️ Vuelo":      cot_vuelo_venta,
+                            "🏨 Hotel":      precio_total_triple,
+                            "🚌 Traslados":  cot_traslado_venta_pax,
+                            "🎫 Entradas":   cot_entradas_venta,
+                        }
+                        for concepto, valor in desglose_triple.items():
+                            col_a, col_b = st.columns([2,1])
+                            col_a.write(concepto)
+                            col_b.write(f"${valor:,.2f}")
+                        st.markdown(f"**TOTAL TRIPLE: ${precio_pax_triple:,.2f}**")
+
+                    st.divider()
+                    col1, col2 = st.columns(2)
+                    col1.metric("💸 Inversión total estimada", f"${inversion_total:,.2f}")
+                    col2.metric("📈 Ganancia proyectada",      f"${ganancia_proyectada:,.2f}")
+
+                    st.divider()
+                    if st.button("💾 Guardar Cotización", type="primary", use_container_width=True, key="cot_guardar"):
+                        errores_cot = []
+                        if not cot_nombre.strip():  errores_cot.append("El nombre del viaje es obligatorio.")
+                        if not cot_destino.strip(): errores_cot.append("El destino es obligatorio.")
+                        if cot_dias <= 0:           errores_cot.append("Las fechas no son válidas.")
+                        if precio_pax_doble <= 0:   errores_cot.append("El precio base doble debe ser mayor a 0.")
+
+                        if errores_cot:
+                            for e in errores_cot:
+                                st.error(f"❌ {e}")
+                        else:
+                            try:
+                                conn = conectar_db()
+                                cursor = conn.cursor()
+                                fecha_reg_cot = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+                                cursor.execute("""
+                                    INSERT INTO cotizaciones_nacionales (
+                                        nombre_viaje, destino, fecha_salida, fecha_regreso, dias, noches,
+                                        personas_proyectadas, costo_vuelo_real, precio_vuelo_venta,
+                                        costo_traslados_total, precio_traslados_persona,
+                                        costo_entradas_real, precio_entradas_venta,
+                                        precio_persona_doble, precio_persona_triple,
+                                        inversion_total, ganancia_proyectada, estado, fecha_registro
+                                    ) VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,'BORRADOR',?)
+                                """, (
+                                    cot_nombre.strip(), cot_destino.strip(),
+                                    cot_salida.strftime("%d-%m-%Y"), cot_regreso.strftime("%d-%m-%Y"),
+                                    cot_dias, cot_noches,
+                                    cot_personas, cot_vuelo_costo, cot_vuelo_venta,
+                                    cot_traslado_costo_total, cot_traslado_venta_pax,
+                                    cot_entradas_costo, cot_entradas_venta,
+                                    precio_pax_doble, precio_pax_triple,
+                                    inversion_total, ganancia_proyectada,
+                                    fecha_reg_cot
+                                ))
+                                cot_id = cursor.lastrowid
+
+                                for hotel in hoteles_data:
+                                    if hotel["nombre"].strip():
+                                        cursor.execute("""
+                                            INSERT INTO hoteles_cotizacion (
+                                                cotizacion_id, nombre_hotel, noches,
+                                                costo_doble_real, precio_doble_venta,
+                                                costo_triple_real, precio_triple_venta
+                                            ) VALUES (?,?,?,?,?,?,?)
+                                        """, (
+                                            cot_id, hotel["nombre"].strip(), hotel["noches"],
+                                            hotel["costo_doble"],  hotel["precio_doble"],
+                                            hotel["costo_triple"], hotel["precio_triple"]
+                                        ))
+
+                                conn.commit()
+                                conn.close()
+                                st.success(f"✅ Cotización **{cot_nombre}** guardada con ID: {cot_id}")
+                                st.info("💡 Ahora puedes crear el viaje desde esta cotización en **Gestionar Viajes → Desde Cotización**")
+                                st.rerun()
+                            except Exception as e:
+                                st.error(f"❌ Error al guardar: {e}")
+                                st.caption("💡 Verifica que existan las tablas `cotizaciones_nacionales` y `hoteles_cotizacion` en la BD.")
+
+            # ── Ver Cotizaciones ────────────────────────────────────────────
+            with subtab_cot[1]:
+                st.markdown("#### 📋 Cotizaciones Registradas")
+                conn = conectar_db()
+                try:
+                    df_cots = read_sql_query("""
+                        SELECT id, nombre_viaje, destino, fecha_salida, fecha_regreso,
+                               dias, noches, personas_proyectadas,
+                               precio_persona_doble, precio_persona_triple,
+                               inversion_total, ganancia_proyectada, estado
+                        FROM cotizaciones_nacionales
+                        ORDER BY id DESC
+                    """, conn)
+                except:
+                    df_cots = pd.DataFrame()
+                conn.close()
+
+                if df_cots.empty:
+                    st.info("No hay cotizaciones registradas aún.")
+                else:
+                    df_cots_show = df_cots.copy()
+                    for col in ['precio_persona_doble','precio_persona_triple','inversion_total','ganancia_proyectada']:
+                        df_cots_show[col] = df_cots_show[col].apply(lambda x: f"${x:,.2f}")
+                    df_cots_show.columns = ['ID','Viaje','Destino','Salida','Regreso',
+                                            'Días','Noches','Personas',
+                                            'P. Doble p/p','P. Triple p/p',
+                                            'Inversión','Ganancia Proy.','Estado']
+                    st.dataframe(df_cots_show, use_container_width=True, hide_index=True)
+
+                    # Detalle
+                    st.divider()
+                    cot_ids = df_cots['id'].tolist()
+                    id_cot_det = st.selectbox("Ver detalle de cotización:", cot_ids, key="cot_det_id")
+                    row_cot = df_cots[df_cots['id'] == id_cot_det].iloc[0]
+
+                    with st.expander(f"📄 {row_cot['nombre_viaje']} — {row_cot['destino']}", expanded=True):
+                        c1, c2, c3 = st.columns(3)
+                        c1.write(f"**Viaje:** {row_cot['nombre_viaje']}")
+                        c1.write(f"**Destino:** {row_cot['destino']}")
+                        c1.write(f"**Fechas:** {row_cot['fecha_salida']} → {row_cot['fecha_regreso']}")
+                        c2.metric("Días / Noches", f"{row_cot['dias']}d / {row_cot['noches']}n")
+                        c2.metric("Personas proyectadas", row_cot['personas_proyectadas'])
+                        c3.metric("Precio doble p/p",  f"${row_cot['precio_persona_doble']:,.2f}")
+                        c3.metric("Precio triple p/p", f"${row_cot['precio_persona_triple']:,.2f}")
+
+                        st.divider()
+                        col1, col2 = st.columns(2)
+                        col1.metric("💸 Inversión total", f"${row_cot['inversion_total']:,.2f}")
+                        col2.metric("📈 Ganancia proyectada", f"${row_cot['ganancia_proyectada']:,.2f}")
+
+                        # Hoteles de la cotización
+                        conn2 = conectar_db()
+                        try:
+                            df_hots = read_sql_query(
+                                "SELECT nombre_hotel, noches, costo_doble_real, precio_doble_venta, costo_triple_real, precio_triple_venta FROM hoteles_cotizacion WHERE cotizacion_id = ?",
+                                conn2, params=(id_cot_det,))
+                        except:
+                            df_hots = pd.DataFrame()
+                        conn2.close()
+
+                        if not df_hots.empty:
+                            st.markdown("**🏨 Hoteles incluidos:**")
+                            df_hots.columns = ['Hotel','Noches','Costo Doble','P. Doble','Costo Triple','P. Triple']
+                            for col in ['Costo Doble','P. Doble','Costo Triple','P. Triple']:
+                                df_hots[col] = df_hots[col].apply(lambda x: f"${x:,.2f}")
+                            st.dataframe(df_hots, hide_index=True, use_container_width=True)
+
+    # ── TAB 5: GESTIONAR VIAJES (solo ADMIN) ──────────────────────────────
+    if usuario["rol"] == "ADMIN":
+        with tabs[5]:
+            st.subheader("⚙️ Gestionar Viajes Nacionales")
+            subtab_g = st.tabs(["➕ Nuevo Viaje", "📋 Desde Cotización", "✏️ Editar / Cerrar Viaje"])
+
+            # ── Nuevo viaje manual ──────────────────────────────────────────
+            with subtab_g[0]:
+                st.markdown("#### ✈️ Registrar Nuevo Viaje Nacional (Manual)")
+                col1, col2 = st.columns(2)
+                with col1:
+                    g_nombre  = st.text_input("Nombre del viaje *", key="g_nombre", placeholder="Ej: Cascadas de Agua Azul")
+                    g_destino = st.text_input("Destino *", key="g_destino", placeholder="Ej: Chiapas, México")
+                    g_salida  = st.date_input("Fecha de salida *", key="g_salida")
+                    g_regreso = st.date_input("Fecha de regreso *", key="g_regreso")
+                with col2:
+                    g_cupos    = st.number_input("Cupos totales *", min_value=1, value=20, key="g_cupos")
+                    g_p_doble  = st.number_input("Precio por persona (base doble) *", min_value=0.0, step=100.0, format="%.2f", key="g_p_doble")
+                    g_p_triple = st.number_input("Precio por persona (base triple)",  min_value=0.0, step=100.0, format="%.2f", key="g_p_triple")
+
+                if g_regreso > g_salida:
+                    dias_g   = (g_regreso - g_salida).days + 1
+                    noches_g = dias_g - 1
+                    st.info(f"📅 {dias_g} días / {noches_g} noches")
+
+                if st.button("💾 Registrar Viaje", type="primary", use_container_width=True, key="g_registrar"):
+                    errores_g = []
+                    if not g_nombre.strip():  errores_g.append("El nombre del viaje es obligatorio.")
+                    if not g_destino.strip(): errores_g.append("El destino es obligatorio.")
+                    if g_regreso <= g_salida: errores_g.append("La fecha de regreso debe ser posterior a la salida.")
+                    if g_p_doble <= 0:        errores_g.append("El precio base doble debe ser mayor a 0.")
+
+                    if errores_g:
+                        for e in errores_g:
+                            st.error(f"❌ {e}")
+                    else:
+                        try:
+                            dias_g   = (g_regreso - g_salida).days + 1
+                            noches_g = dias_g - 1
+                            conn = conectar_db()
+                            cursor = conn.cursor()
+                            cursor.execute("""
+                                INSERT INTO viajes_nacionales (
+                                    nombre_viaje, destino, fecha_salida, fecha_regreso,
+                                    dias, noches, cupos_totales, cupos_vendidos, cupos_disponibles,
+                                    precio_persona_doble, precio_persona_triple, estado, fecha_registro,
+                                    fecha_salida_iso, fecha_regreso_iso
+                                ) VALUES (?,?,?,?,?,?,?,0,?,?,?,'ACTIVO',?,?,?)
+                            """, (
+                                g_nombre.strip(), g_destino.strip(),
+                                g_salida.strftime("%d-%m-%Y"), g_regreso.strftime("%d-%m-%Y"),
+                                dias_g, noches_g, g_cupos, g_cupos,
+                                g_p_doble, g_p_triple,
+                                datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                                fecha_a_iso(g_salida), fecha_a_iso(g_regreso)
+                            ))
+                            conn.commit()
+                            conn.close()
+                            st.success(f"✅ Viaje **{g_nombre}** registrado con {g_cupos} cupos.")
+                            st.rerun()
+                        except Exception as e:
+                            st.error(f"❌ Error: {e}")
+
+            # ── Cargar desde cotización ─────────────────────────────────────
+            with subtab_g[1]:
+                st.markdown("#### 📋 Crear Viaje desde Cotización")
+                cotizaciones = obtener_cotizaciones_nacionales()
+                if not cotizaciones:
+                    st.info("No hay cotizaciones disponibles en la tabla `cotizaciones`.")
+                else:
+                    opts_cot = {
+                        f"ID {c['id']} | {c['nombre_viaje']} | {c['destino']} | {c['fecha_salida']} → {c['fecha_regreso']}": c
+                        for c in cotizaciones
+                    }
+                    cot_label = st.selectbox("Selecciona cotización:", list(opts_cot.keys()), key="cot_sel")
+                    cot_sel = opts_cot[cot_label]
+
+                    col1, col2 = st.columns(2)
+                    col1.write(f"**Nombre:** {cot_sel['nombre_viaje']}")
+                    col1.write(f"**Destino:** {cot_sel['destino']}")
+                    col1.write(f"**Fechas:** {cot_sel['fecha_salida']} → {cot_sel['fecha_regreso']}")
+                    col2.metric("Personas proyectadas", cot_sel['personas_proyectadas'])
+                    col2.metric("Precio doble p/p",   f"${cot_sel['precio_doble']:,.2f}")
+                    col2.metric("Precio triple p/p",  f"${cot_sel['precio_triple']:,.2f}")
+
+                    cupos_override = st.number_input("Cupos a registrar (editable)",
+                        min_value=1, value=int(cot_sel['personas_proyectadas']), key="cot_cupos")
+
+                    if st.button("💾 Crear Viaje desde Cotización", type="primary", key="cot_crear"):
+                        try:
+                            conn = conectar_db()
+                            cursor = conn.cursor()
+                            cursor.execute("""
+                                INSERT INTO viajes_nacionales (
+                                    cotizacion_id, nombre_viaje, destino, fecha_salida, fecha_regreso,
+                                    dias, noches, cupos_totales, cupos_vendidos, cupos_disponibles,
+                                    precio_persona_doble, precio_persona_triple, estado, fecha_registro,
+                                    fecha_salida_iso, fecha_regreso_iso
+                                ) VALUES (?,?,?,?,?,?,?,?,0,?,?,?,'ACTIVO',?,?,?)
+                            """, (
+                                cot_sel['id'], cot_sel['nombre_viaje'], cot_sel['destino'],
+                                cot_sel['fecha_salida'], cot_sel['fecha_regreso'],
+                                cot_sel['dias'], cot_sel['noches'],
+                                cupos_override, cupos_override,
+                                cot_sel['precio_doble'], cot_sel['precio_triple'],
+                                datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                                fecha_a_iso(cot_sel['fecha_salida']), fecha_a_iso(cot_sel['fecha_regreso'])
+                            ))
+                            conn.commit()
+                            conn.close()
+                            st.success(f"✅ Viaje **{cot_sel['nombre_viaje']}** creado desde cotización con {cupos_override} cupos.")
+                            st.rerun()
+                        except Exception as e:
+                            st.error(f"❌ Error: {e}")
+
+            # ── Editar / Cerrar viaje ───────────────────────────────────────
+            with subtab_g[2]:
+                st.markdown("#### ✏️ Editar o Cerrar un Viaje")
+                conn = conectar_db()
+                try:
+                    df_edit = read_sql_query(
+                        "SELECT id, nombre_viaje, destino, cupos_totales, cupos_vendidos, cupos_disponibles, precio_persona_doble, precio_persona_triple, estado FROM viajes_nacionales ORDER BY id DESC",
+                        conn)
+                except:
+                    df_edit = pd.DataFrame()
+                conn.close()
+
+                if df_edit.empty:
+                    st.info("No hay viajes para editar.")
+                else:
+                    viaje_edit_opts = {
+                        f"ID {row['id']} | {row['nombre_viaje']} ({row['estado']})": row
+                        for _, row in df_edit.iterrows()
+                    }
+                    edit_label = st.selectbox("Selecciona viaje:", list(viaje_edit_opts.keys()), key="edit_viaje")
+                    edit_row = viaje_edit_opts[edit_label]
+
+                    col1, col2 = st.columns(2)
+                    with col1:
+                        edit_cupos   = st.number_input("Cupos totales",
+                            min_value=int(edit_row['cupos_vendidos']),
+                            value=int(edit_row['cupos_totales']), key="edit_cupos")
+                        edit_p_doble = st.number_input("Precio doble p/p",
+                            min_value=0.0, value=float(edit_row['precio_persona_doble']),
+                            step=100.0, format="%.2f", key="edit_pd")
+                    with col2:
+                        edit_p_triple = st.number_input("Precio triple p/p",
+                            min_value=0.0, value=float(edit_row['precio_persona_triple']),
+                            step=100.0, format="%.2f", key="edit_pt")
+                        edit_estado = st.selectbox("Estado",
+                            ["ACTIVO","AGOTADO","CERRADO"],
+                            index=["ACTIVO","AGOTADO","CERRADO"].index(edit_row['estado']),
+                            key="edit_estado")
+
+                    if st.button("💾 Guardar Cambios", type="primary", key="edit_guardar"):
+                        try:
+                            conn = conectar_db()
+                            cursor = conn.cursor()
+                            nuevos_disp = edit_cupos - int(edit_row['cupos_vendidos'])
+                            cursor.execute("""
+                                UPDATE viajes_nacionales
+                                SET cupos_totales = ?, cupos_disponibles = ?,
+                                    precio_persona_doble = ?, precio_persona_triple = ?,
+                                    estado = ?
+                                WHERE id = ?
+                            """, (edit_cupos, max(0, nuevos_disp),
+                                  edit_p_doble, edit_p_triple,
+                                  edit_estado, int(edit_row['id'])))
+                            conn.commit()
+                            conn.close()
+                            st.success("✅ Viaje actualizado correctamente.")
+                            st.rerun()
+                        except Exception as e:
+                            st.error(f"❌ Error: {e}")
@@ -0,0 +1,487 @@
+"""
+PÁGINA OTROS SERVICIOS - Sistema Agencia Riviera Maya
+Pasaportes, visas y vuelos con sus abonos.
+"""
+
+from datetime import datetime
+
+import streamlit as st
+import pandas as pd
+
+from app_nucleo import conectar_db, read_sql_query
+
+
+def pagina_otros():
+    """Página de Otros servicios: Pasaportes, Visas, Vuelos"""
+    st.title("🗂️ Otros Servicios")
+
+    usuario  = st.session_state.usuario_actual
+    es_admin = usuario.get("rol") == "ADMIN"
+    id_vend  = usuario.get("id_vendedora", 0) or 0
+
+    tab_pas, tab_vis, tab_vue = st.tabs(["🛂 Pasaportes", "🌎 Visas", "✈️ Vuelos"])
+
+    # ══════════════════════════════════════════════════════════════
+    # TAB 1 — PASAPORTES
+    # ══════════════════════════════════════════════════════════════
+    with tab_pas:
+        st.subheader("🛂 Gestión de Pasaportes")
+
+        with st.expander("➕ Registrar nuevo trámite de pasaporte", expanded=False):
+            conn = conectar_db()
+            vendedoras_df = read_sql_query("SELECT id, nombre FROM vendedoras WHERE activa=1 ORDER BY nombre", conn)
+            conn.close()
+
+            c1, c2 = st.columns(2)
+            with c1:
+                pas_cliente  = st.text_input("👤 Nombre del cliente *", key="pas_cliente")
+                pas_celular  = st.text_input("📞 Celular", key="pas_celular")
+                pas_tipo     = st.selectbox("Tipo", ["Nuevo", "Renovación"], key="pas_tipo")
+                pas_estado   = st.selectbox("Estado", ["En trámite", "Cita agendada", "Listo", "Entregado"], key="pas_estado")
+            with c2:
+                pas_cita     = st.date_input("📅 Fecha de cita", value=None, key="pas_cita")
+                pas_entrega  = st.date_input("📅 Fecha estimada entrega", value=None, key="pas_entrega")
+                if es_admin and not vendedoras_df.empty:
+                    pas_vend_idx = st.selectbox("👩‍💼 Vendedora", vendedoras_df['nombre'].tolist(), key="pas_vend")
+                    pas_vend_id  = int(vendedoras_df[vendedoras_df['nombre']==pas_vend_idx]['id'].values[0])
+                else:
+                    pas_vend_id = id_vend
+
+            c3, c4 = st.columns(2)
+            with c3:
+                pas_costo    = st.number_input("💰 Costo oficial ($)", min_value=0.0, step=50.0, key="pas_costo")
+            with c4:
+                pas_servicio = st.number_input("🛎️ Cargo por servicio ($)", min_value=0.0, step=50.0, key="pas_servicio")
+
+            pas_total = pas_costo + pas_servicio
+            st.markdown(f"**Total a cobrar al cliente: ${pas_total:,.2f}**")
+            pas_notas = st.text_area("📝 Notas", key="pas_notas", height=80)
+
+            if st.button("💾 Guardar Pasaporte", type="primary", key="btn_guardar_pas"):
+                if not pas_cliente.strip():
+                    st.error("El nombre del cliente es obligatorio.")
+                else:
+                    conn = conectar_db()
+                    conn.execute("""
+                        INSERT INTO pasaportes
+                        (vendedora_id, cliente, celular, tipo, fecha_cita, fecha_entrega_est,
+                         costo_oficial, cargo_servicio, total, pagado, saldo, estado, notas, fecha_registro)
+                        VALUES (?,?,?,?,?,?,?,?,?,0,?,?,?,?)
+                    """, (
+                        pas_vend_id, pas_cliente.strip(), pas_celular.strip(), pas_tipo,
+                        str(pas_cita) if pas_cita else None,
+                        str(pas_entrega) if pas_entrega else None,
+                        pas_costo, pas_servicio, pas_total, pas_total,
+                        pas_estado, pas_notas.strip(),
+                        datetime.now().strftime("%Y-%m-%d %H:%M")
+                    ))
+                    conn.commit()
+                    conn.close()
+                    st.success(f"✅ Pasaporte de {pas_cliente} registrado correctamente.")
+                    st.rerun()
+
+        st.divider()
+
+        conn = conectar_db()
+        filtro_pas = "" if es_admin else f"WHERE p.vendedora_id = {id_vend}"
+        try:
+            df_pas = read_sql_query(f"""
+                SELECT p.id, p.cliente, p.celular, p.tipo, p.fecha_cita,
+                       p.fecha_entrega_est, p.costo_oficial, p.cargo_servicio,
+                       p.total, p.pagado, p.saldo, p.estado, p.notas,
+                       COALESCE(v.nombre,'—') AS vendedora, p.fecha_registro
+                FROM pasaportes p
+                LEFT JOIN vendedoras v ON p.vendedora_id = v.id
+                {filtro_pas}
+                ORDER BY p.fecha_registro DESC
+            """, conn)
+        except:
+            df_pas = pd.DataFrame()
+        conn.close()
+
+        if df_pas.empty:
+            st.info("No hay trámites de pasaporte registrados aún.")
+        else:
+            col_f1, col_f2 = st.columns(2)
+            with col_f1:
+                filtro_est_pas = st.selectbox("Filtrar por estado", ["Todos","En trámite","Cita agendada","Listo","Entregado"], key="filtro_est_pas")
+            with col_f2:
+                buscar_pas = st.text_input("🔍 Buscar cliente", key="buscar_pas")
+
+            df_pas_show = df_pas.copy()
+            if filtro_est_pas != "Todos":
+                df_pas_show = df_pas_show[df_pas_show['estado'] == filtro_est_pas]
+            if buscar_pas:
+                df_pas_show = df_pas_show[df_pas_show['cliente'].str.contains(buscar_pas, case=False, na=False)]
+
+            for _, row in df_pas_show.iterrows():
+                estado_color = {"En trámite":"#E65100","Cita agendada":"#00B4D8","Listo":"#2E7D32","Entregado":"#555"}.get(row['estado'],"#555")
+                saldo_v = float(row['saldo']) if row['saldo'] else 0
+                with st.expander(f"🛂 {row['cliente']} — {row['tipo']} — {row['estado']} | Saldo: ${saldo_v:,.2f}"):
+                    c1, c2, c3 = st.columns(3)
+                    with c1:
+                        st.markdown(f"**👤 Cliente:** {row['cliente']}")
+                        st.markdown(f"**📞 Celular:** {row['celular'] or '—'}")
+                        st.markdown(f"**📋 Tipo:** {row['tipo']}")
+                        st.markdown(f"**👩‍💼 Vendedora:** {row['vendedora']}")
+                    with c2:
+                        st.markdown(f"**📅 Fecha cita:** {row['fecha_cita'] or '—'}")
+                        st.markdown(f"**📅 Entrega est.:** {row['fecha_entrega_est'] or '—'}")
+                        st.markdown(f"<span style='color:{estado_color};font-weight:700;'>Estado: {row['estado']}</span>", unsafe_allow_html=True)
+                    with c3:
+                        st.markdown(f"**💰 Costo oficial:** ${float(row['costo_oficial']):,.2f}")
+                        st.markdown(f"**🛎️ Servicio:** ${float(row['cargo_servicio']):,.2f}")
+                        st.markdown(f"**Total: ${float(row['total']):,.2f}**")
+                        st.markdown(f"**✅ Pagado:** ${float(row['pagado']):,.2f}")
+                        st.markdown(f"**⚠️ Saldo:** ${saldo_v:,.2f}")
+
+                    if row['notas']:
+                        st.caption(f"📝 {row['notas']}")
+
+                    col_est, col_abn = st.columns(2)
+                    with col_est:
+                        nuevo_est = st.selectbox("Cambiar estado", ["En trámite","Cita agendada","Listo","Entregado"],
+                            index=["En trámite","Cita agendada","Listo","Entregado"].index(row['estado']) if row['estado'] in ["En trámite","Cita agendada","Listo","Entregado"] else 0,
+                            key=f"est_pas_{row['id']}")
+                        if st.button("💾 Actualizar estado", key=f"upd_pas_{row['id']}"):
+                            conn = conectar_db()
+                            conn.execute("UPDATE pasaportes SET estado=? WHERE id=?", (nuevo_est, row['id']))
+                            conn.commit()
+                            conn.close()
+                            st.rerun()
+                    with col_abn:
+                        if saldo_v > 0:
+                            monto_abn = st.number_input("💵 Registrar abono ($)", min_value=0.0, max_value=saldo_v, step=50.0, key=f"abn_pas_{row['id']}")
+                            metodo_abn = st.selectbox("Método", ["Efectivo","Transferencia","Tarjeta"], key=f"met_pas_{row['id']}")
+                            if st.button("➕ Abonar", key=f"btn_abn_pas_{row['id']}"):
+                                if monto_abn > 0:
+                                    conn = conectar_db()
+                                    nuevo_pagado = float(row['pagado']) + monto_abn
+                                    nuevo_saldo  = float(row['total']) - nuevo_pagado
+                                    nuevo_estado = "Entregado" if nuevo_saldo <= 0 else row['estado']
+                                    conn.execute("INSERT INTO abonos_pasaportes (pasaporte_id, monto, fecha, metodo_pago) VALUES (?,?,?,?)",
+                                        (row['id'], monto_abn, datetime.now().strftime("%Y-%m-%d"), metodo_abn))
+                                    conn.execute("UPDATE pasaportes SET pagado=?, saldo=?, estado=? WHERE id=?",
+                                        (nuevo_pagado, nuevo_saldo, nuevo_estado, row['id']))
+                                    conn.commit()
+                                    conn.close()
+                                    st.success(f"✅ Abono de ${monto_abn:,.2f} registrado.")
+                                    st.rerun()
+
+    # ══════════════════════════════════════════════════════════════
+    # TAB 2 — VISAS
+    # ══════════════════════════════════════════════════════════════
+    with tab_vis:
+        st.subheader("🌎 Gestión de Visas")
+
+        with st.expander("➕ Registrar nuevo trámite de visa", expanded=False):
+            conn = conectar_db()
+            vendedoras_df = read_sql_query("SELECT id, nombre FROM vendedoras WHERE activa=1 ORDER BY nombre", conn)
+            conn.close()
+
+            c1, c2 = st.columns(2)
+            with c1:
+                vis_cliente   = st.text_input("👤 Nombre del cliente *", key="vis_cliente")
+                vis_celular   = st.text_input("📞 Celular", key="vis_celular")
+                vis_pais      = st.text_input("🌍 País destino", key="vis_pais", placeholder="Ej: Estados Unidos")
+                vis_tipo      = st.selectbox("Tipo de visa", ["Turista","Negocios","Estudiante","Trabajo","Tránsito","Otra"], key="vis_tipo")
+            with c2:
+                vis_familiar  = st.checkbox("👨‍👩‍👧 Trámite familiar", key="vis_familiar")
+                vis_integ     = st.number_input("# Integrantes", min_value=1, value=1, step=1, key="vis_integ") if vis_familiar else 1
+                vis_cita      = st.date_input("📅 Fecha de cita", value=None, key="vis_cita")
+                vis_entrega   = st.date_input("📅 Fecha estimada entrega", value=None, key="vis_entrega")
+                vis_estado    = st.selectbox("Estado", ["En trámite","Cita agendada","Aprobada","Rechazada","Entregada"], key="vis_estado")
+                if es_admin and not vendedoras_df.empty:
+                    vis_vend_idx = st.selectbox("👩‍💼 Vendedora", vendedoras_df['nombre'].tolist(), key="vis_vend")
+                    vis_vend_id  = int(vendedoras_df[vendedoras_df['nombre']==vis_vend_idx]['id'].values[0])
+                else:
+                    vis_vend_id = id_vend
+
+            c3, c4 = st.columns(2)
+            with c3:
+                vis_costo    = st.number_input("💰 Costo oficial ($)", min_value=0.0, step=50.0, key="vis_costo")
+            with c4:
+                vis_servicio = st.number_input("🛎️ Cargo por servicio ($)", min_value=0.0, step=50.0, key="vis_servicio")
+
+            vis_total = vis_costo + vis_servicio
+            st.markdown(f"**Total a cobrar al cliente: ${vis_total:,.2f}**")
+            vis_notas = st.text_area("📝 Notas", key="vis_notas", height=80)
+
+            if st.button("💾 Guardar Visa", type="primary", key="btn_guardar_vis"):
+                if not vis_cliente.strip():
+                    st.error("El nombre del cliente es obligatorio.")
+                else:
+                    conn = conectar_db()
+                    conn.execute("""
+                        INSERT INTO visas
+                        (vendedora_id, cliente, celular, pais_destino, tipo_visa, es_familiar,
+                         num_integrantes, fecha_cita, fecha_entrega_est, costo_oficial, cargo_servicio,
+                         total, pagado, saldo, estado, notas, fecha_registro)
+                        VALUES (?,?,?,?,?,?,?,?,?,?,?,?,0,?,?,?,?)
+                    """, (
+                        vis_vend_id, vis_cliente.strip(), vis_celular.strip(),
+                        vis_pais.strip(), vis_tipo, 1 if vis_familiar else 0, int(vis_integ),
+                        str(vis_cita) if vis_cita else None,
+                        str(vis_entrega) if vis_entrega else None,
+                        vis_costo, vis_servicio, vis_total, vis_total,
+                        vis_estado, vis_notas.strip(),
+                        datetime.now().strftime("%Y-%m-%d %H:%M")
+                    ))
+                    conn.commit()
+                    conn.close()
+                    st.success(f"✅ Visa de {vis_cliente} registrada correctamente.")
+                    st.rerun()
+
+        st.divider()
+
+        conn = conectar_db()
+        filtro_vis = "" if es_admin else f"WHERE vi.vendedora_id = {id_vend}"
+        try:
+            df_vis = read_sql_query(f"""
+                SELECT vi.id, vi.cliente, vi.celular, vi.pais_destino, vi.tipo_visa,
+                       vi.es_familiar, vi.num_integrantes, vi.fecha_cita, vi.fecha_entrega_est,
+                       vi.costo_oficial, vi.cargo_servicio, vi.total, vi.pagado, vi.saldo,
+                       vi.estado, vi.notas, COALESCE(v.nombre,'—') AS vendedora
+                FROM visas vi
+                LEFT JOIN vendedoras v ON vi.vendedora_id = v.id
+                {filtro_vis}
+                ORDER BY vi.fecha_registro DESC
+            """, conn)
+        except:
+            df_vis = pd.DataFrame()
+        conn.close()
+
+        if df_vis.empty:
+            st.info("No hay trámites de visa registrados aún.")
+        else:
+            col_f1, col_f2 = st.columns(2)
+            with col_f1:
+                filtro_est_vis = st.selectbox("Filtrar por estado", ["Todos","En trámite","Cita agendada","Aprobada","Rechazada","Entregada"], key="filtro_est_vis")
+            with col_f2:
+                buscar_vis = st.text_input("🔍 Buscar cliente", key="buscar_vis")
+
+            df_vis_show = df_vis.copy()
+            if filtro_est_vis != "Todos":
+                df_vis_show = df_vis_show[df_vis_show['estado'] == filtro_est_vis]
+            if buscar_vis:
+                df_vis_show = df_vis_show[df_vis_show['cliente'].str.contains(buscar_vis, case=False, na=False)]
+
+            for _, row in df_vis_show.iterrows():
+                estado_color = {"En trámite":"#E65100","Cita agendada":"#00B4D8","Aprobada":"#2E7D32","Rechazada":"#CC0000","Entregada":"#555"}.get(row['estado'],"#555")
+                saldo_v = float(row['saldo']) if row['saldo'] else 0
+                fam_txt = f"Familiar ({int(row['num_integrantes'])} integrantes)" if row['es_familiar'] else "Personal"
+                with st.expander(f"🌎 {row['cliente']} — {row['pais_destino'] or '—'} — {row['tipo_visa']} — {row['estado']}"):
+                    c1, c2, c3 = st.columns(3)
+                    with c1:
+                        st.markdown(f"**👤 Cliente:** {row['cliente']}")
+                        st.markdown(f"**📞 Celular:** {row['celular'] or '—'}")
+                        st.markdown(f"**🌍 País:** {row['pais_destino'] or '—'}")
+                        st.markdown(f"**📋 Tipo:** {row['tipo_visa']} — {fam_txt}")
+                        st.markdown(f"**👩‍💼 Vendedora:** {row['vendedora']}")
+                    with c2:
+                        st.markdown(f"**📅 Fecha cita:** {row['fecha_cita'] or '—'}")
+                        st.markdown(f"**📅 Entrega est.:** {row['fecha_entrega_est'] or '—'}")
+                        st.markdown(f"<span style='color:{estado_color};font-weight:700;'>Estado: {row['estado']}</span>", unsafe_allow_html=True)
+                    with c3:
+                        st.markdown(f"**💰 Costo oficial:** ${float(row['costo_oficial']):,.2f}")
+                        st.markdown(f"**🛎️ Servicio:** ${float(row['cargo_servicio']):,.2f}")
+                        st.markdown(f"**Total: ${float(row['total']):,.2f}**")
+                        st.markdown(f"**✅ Pagado:** ${float(row['pagado']):,.2f}")
+                        st.markdown(f"**⚠️ Saldo:** ${saldo_v:,.2f}")
+
+                    if row['notas']:
+                        st.caption(f"📝 {row['notas']}")
+
+                    col_est, col_abn = st.columns(2)
+                    with col_est:
+                        estados_vis = ["En trámite","Cita agendada","Aprobada","Rechazada","Entregada"]
+                        nuevo_est = st.selectbox("Cambiar estado", estados_vis,
+                            index=estados_vis.index(row['estado']) if row['estado'] in estados_vis else 0,
+                            key=f"est_vis_{row['id']}")
+                        if st.button("💾 Actualizar estado", key=f"upd_vis_{row['id']}"):
+                            conn = conectar_db()
+                            conn.execute("UPDATE visas SET estado=? WHERE id=?", (nuevo_est, row['id']))
+                            conn.commit()
+                            conn.close()
+                            st.rerun()
+                    with col_abn:
+                        if saldo_v > 0:
+                            monto_abn = st.number_input("💵 Registrar abono ($)", min_value=0.0, max_value=saldo_v, step=50.0, key=f"abn_vis_{row['id']}")
+                            metodo_abn = st.selectbox("Método", ["Efectivo","Transferencia","Tarjeta"], key=f"met_vis_{row['id']}")
+                            if st.button("➕ Abonar", key=f"btn_abn_vis_{row['id']}"):
+                                if monto_abn > 0:
+                                    conn = conectar_db()
+                                    nuevo_pagado = float(row['pagado']) + monto_abn
+                                    nuevo_saldo  = float(row['total']) - nuevo_pagado
+                                    nuevo_estado = "Entregada" if nuevo_saldo <= 0 else row['estado']
+                                    conn.execute("INSERT INTO abonos_visas (visa_id, monto, fecha, metodo_pago) VALUES (?,?,?,?)",
+                                        (row['id'], monto_abn, datetime.now().strftime("%Y-%m-%d"), metodo_abn))
+                                    conn.execute("UPDATE visas SET pagado=?, saldo=?, estado=? WHERE id=?",
+                                        (nuevo_pagado, nuevo_saldo, nuevo_estado, row['id']))
+                                    conn.commit()
+                                    conn.close()
+                                    st.success(f"✅ Abono de ${monto_abn:,.2f} registrado.")
+                                    st.rerun()
+
+    # ══════════════════════════════════════════════════════════════
+    # TAB 3 — VUELOS
+    # ══════════════════════════════════════════════════════════════
+    with tab_vue:
+        st.subheader("✈️ Gestión de Vuelos")
+
+        with st.expander("➕ Registrar nuevo vuelo", expanded=False):
+            conn = conectar_db()
+            vendedoras_df = read_sql_query("SELECT id, nombre FROM vendedoras WHERE activa=1 ORDER BY nombre", conn)
+            conn.close()
+
+            c1, c2 = st.columns(2)
+            with c1:
+                vue_pasajero  = st.text_input("👤 Nombre del pasajero *", key="vue_pasajero")
+                vue_celular   = st.text_input("📞 Celular", key="vue_celular")
+                vue_tipo      = st.selectbox("Tipo de vuelo", ["Nacional","Internacional"], key="vue_tipo")
+                vue_aerolinea = st.selectbox("✈️ Aerolínea", ["Volaris","Aeroméxico","Viva Aerobus","Interjet","American Airlines","United","Delta","Copa Airlines","Otra"], key="vue_aerolinea")
+                vue_num_pas   = st.number_input("👥 Número de pasajeros", min_value=1, value=1, step=1, key="vue_num_pas")
+            with c2:
+                vue_origen    = st.text_input("🛫 Origen", key="vue_origen", placeholder="Ej: Mérida (MID)")
+                vue_destino   = st.text_input("🛬 Destino", key="vue_destino", placeholder="Ej: Cancún (CUN)")
+                vue_fecha     = st.date_input("📅 Fecha del vuelo", value=None, key="vue_fecha")
+                vue_hora      = st.text_input("🕐 Hora del vuelo", key="vue_hora", placeholder="Ej: 14:30")
+                vue_estado    = st.selectbox("Estado", ["Cotizado","Confirmado","Emitido","Cancelado"], key="vue_estado")
+                if es_admin and not vendedoras_df.empty:
+                    vue_vend_idx = st.selectbox("👩‍💼 Vendedora", vendedoras_df['nombre'].tolist(), key="vue_vend")
+                    vue_vend_id  = int(vendedoras_df[vendedoras_df['nombre']==vue_vend_idx]['id'].values[0])
+                else:
+                    vue_vend_id = id_vend
+
+            c3, c4 = st.columns(2)
+            with c3:
+                vue_costo    = st.number_input("💰 Costo de compra ($)", min_value=0.0, step=100.0, key="vue_costo",
+                                               help="Lo que pagó la agencia en la plataforma")
+            with c4:
+                vue_servicio = st.number_input("🛎️ Cargo por servicio ($)", min_value=0.0, step=50.0, key="vue_servicio")
+
+            vue_total = vue_costo + vue_servicio
+            st.markdown(f"**Total a cobrar al cliente: ${vue_total:,.2f}**")
+            vue_notas = st.text_area("📝 Notas (# confirmación, equipaje, etc.)", key="vue_notas", height=80)
+
+            if st.button("💾 Guardar Vuelo", type="primary", key="btn_guardar_vue"):
+                if not vue_pasajero.strip():
+                    st.error("El nombre del pasajero es obligatorio.")
+                else:
+                    conn = conectar_db()
+                    conn.execute("""
+                        INSERT INTO vuelos
+                        (vendedora_id, pasajero, celular, tipo, aerolinea, origen, destino,
+                         fecha_vuelo, hora_vuelo, num_pasajeros, costo_compra, cargo_servicio,
+                         total, pagado, saldo, estado, notas, fecha_registro)
+                        VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,0,?,?,?,?)
+                    """, (
+                        vue_vend_id, vue_pasajero.strip(), vue_celular.strip(),
+                        vue_tipo, vue_aerolinea, vue_origen.strip(), vue_destino.strip(),
+                        str(vue_fecha) if vue_fecha else None, vue_hora.strip(),
+                        int(vue_num_pas), vue_costo, vue_servicio, vue_total, vue_total,
+                        vue_estado, vue_notas.strip(),
+                        datetime.now().strftime("%Y-%m-%d %H:%M")
+                    ))
+                    conn.commit()
+                    conn.close()
+                    st.success(f"✅ Vuelo de {vue_pasajero} registrado correctamente.")
+                    st.rerun()
+
+        st.divider()
+
+        conn = conectar_db()
+        filtro_vue = "" if es_admin else f"WHERE vu.vendedora_id = {id_vend}"
+        try:
+            df_vue = read_sql_query(f"""
+                SELECT vu.id, vu.pasajero, vu.celular, vu.tipo, vu.aerolinea,
+                       vu.origen, vu.destino, vu.fecha_vuelo, vu.hora_vuelo,
+                       vu.num_pasajeros, vu.costo_compra, vu.cargo_servicio,
+                       vu.total, vu.pagado, vu.saldo, vu.estado, vu.notas,
+                       COALESCE(v.nombre,'—') AS vendedora
+                FROM vuelos vu
+                LEFT JOIN vendedoras v ON vu.vendedora_id = v.id
+                {filtro_vue}
+                ORDER BY vu.fecha_vuelo DESC
+            """, conn)
+        except:
+            df_vue = pd.DataFrame()
+        conn.close()
+
+        if df_vue.empty:
+            st.info("No hay vuelos registrados aún.")
+        else:
+            col_f1, col_f2, col_f3 = st.columns(3)
+            with col_f1:
+                filtro_est_vue = st.selectbox("Estado", ["Todos","Cotizado","Confirmado","Emitido","Cancelado"], key="filtro_est_vue")
+            with col_f2:
+                filtro_tipo_vue = st.selectbox("Tipo", ["Todos","Nacional","Internacional"], key="filtro_tipo_vue")
+            with col_f3:
+                buscar_vue = st.text_input("🔍 Buscar pasajero", key="buscar_vue")
+
+            df_vue_show = df_vue.copy()
+            if filtro_est_vue != "Todos":
+                df_vue_show = df_vue_show[df_vue_show['estado'] == filtro_est_vue]
+            if filtro_tipo_vue != "Todos":
+                df_vue_show = df_vue_show[df_vue_show['tipo'] == filtro_tipo_vue]
+            if buscar_vue:
+                df_vue_show = df_vue_show[df_vue_show['pasajero'].str.contains(buscar_vue, case=False, na=False)]
+
+            for _, row in df_vue_show.iterrows():
+                estado_color = {"Cotizado":"#E65100","Confirmado":"#00B4D8","Emitido":"#2E7D32","Cancelado":"#CC0000"}.get(row['estado'],"#555")
+                saldo_v = float(row['saldo']) if row['saldo'] else 0
+                with st.expander(f"✈️ {row['pasajero']} — {row['origen'] or '—'} → {row['destino'] or '—'} | {row['aerolinea']} | {row['fecha_vuelo'] or '—'} | {row['estado']}"):
+                    c1, c2, c3 = st.columns(3)
+                    with c1:
+                        st.markdown(f"**👤 Pasajero:** {row['pasajero']}")
+                        st.markdown(f"**📞 Celular:** {row['celular'] or '—'}")
+                        st.markdown(f"**✈️ Aerolínea:** {row['aerolinea']}")
+                        st.markdown(f"**🏷️ Tipo:** {row['tipo']}")
+                        st.markdown(f"**👥 Pasajeros:** {int(row['num_pasajeros']) if row['num_pasajeros'] else 1}")
+                        st.markdown(f"**👩‍💼 Vendedora:** {row['vendedora']}")
+                    with c2:
+                        st.markdown(f"**🛫 Origen:** {row['origen'] or '—'}")
+                        st.markdown(f"**🛬 Destino:** {row['destino'] or '—'}")
+                        st.markdown(f"**📅 Fecha:** {row['fecha_vuelo'] or '—'}")
+                        st.markdown(f"**🕐 Hora:** {row['hora_vuelo'] or '—'}")
+                        st.markdown(f"<span style='color:{estado_color};font-weight:700;'>Estado: {row['estado']}</span>", unsafe_allow_html=True)
+                    with c3:
+                        st.markdown(f"**💰 Costo compra:** ${float(row['costo_compra']):,.2f}")
+                        st.markdown(f"**🛎️ Servicio:** ${float(row['cargo_servicio']):,.2f}")
+                        st.markdown(f"**Total: ${float(row['total']):,.2f}**")
+                        st.markdown(f"**✅ Pagado:** ${float(row['pagado']):,.2f}")
+                        st.markdown(f"**⚠️ Saldo:** ${saldo_v:,.2f}")
+
+                    if row['notas']:
+                        st.caption(f"📝 {row['notas']}")
+
+                    col_est, col_abn = st.columns(2)
+                    with col_est:
+                        estados_vue = ["Cotizado","Confirmado","Emitido","Cancelado"]
+                        nuevo_est = st.selectbox("Cambiar estado", estados_vue,
+                            index=estados_vue.index(row['estado']) if row['estado'] in estados_vue else 0,
+                            key=f"est_vue_{row['id']}")
+                        if st.button("💾 Actualizar estado", key=f"upd_vue_{row['id']}"):
+                            conn = conectar_db()
+                            conn.execute("UPDATE vuelos SET estado=? WHERE id=?", (nuevo_est, row['id']))
+                            conn.commit()
+                            conn.close()
+                            st.rerun()
+                    with col_abn:
+                        if saldo_v > 0:
+                            monto_abn = st.number_input("💵 Registrar abono ($)", min_value=0.0, max_value=saldo_v, step=50.0, key=f"abn_vue_{row['id']}")
+                            metodo_abn = st.selectbox("Método", ["Efectivo","Transferencia","Tarjeta"], key=f"met_vue_{row['id']}")
+                            if st.button("➕ Abonar", key=f"btn_abn_vue_{row['id']}"):
+                                if monto_abn > 0:
+                                    conn = conectar_db()
+                                    nuevo_pagado = float(row['pagado']) + monto_abn
+                                    nuevo_saldo  = float(row['total']) - nuevo_pagado
+                                    nuevo_estado = "Emitido" if nuevo_saldo <= 0 else row['estado']
+                                    conn.execute("INSERT INTO abonos_vuelos (vuelo_id, monto, fecha, metodo_pago) VALUES (?,?,?,?)",
+                                        (row['id'], monto_abn, datetime.now().strftime("%Y-%m-%d"), metodo_abn))
+                                    conn.execute("UPDATE vuelos SET pagado=?, saldo=?, estado=? WHERE id=?",
+                                        (nuevo_pagado, nuevo_saldo, nuevo_estado, row['id']))
+                                    conn.commit()
+                                    conn.close()
+                                    st.success(f"✅ Abono de ${monto_abn:,.2f} registrado.")
+                                    st.rerun()
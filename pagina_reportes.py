@@ -0,0 +1,1052 @@
+"""
+PÁGINA REPORTES - Sistema Agencia Riviera Maya
+Reportes Excel (Riviera, nacionales, internacionales, financiero), reporte
+semanal por periodo, recibos y cupones en lote, y la cola de reportes en
+segundo plano.
+"""
+
+import os
+from datetime import datetime
+from functools import partial
+
+import streamlit as st
+import pandas as pd
+
+from app_nucleo import (ES_POSTGRES, LOGO_PATH, PSYCOPG2_DISPONIBLE, conectar_db,
+                        consulta_cacheada, read_sql_query, reservar_nums_recibo)
+from cola_reportes import ColaReportes, EN_COLA, ERROR, GENERANDO, LISTO
+from componentes_pdf import CUPONES_DISPONIBLES, RECIBOS_DISPONIBLES
+from excel_stream import LibroExcel
+from lotes_pdf import DOCUMENTOS, FORMATOS, ORIGENES, contar_lote, generar_lote, tareas_lote
+from migracion_fechas_iso import fecha_a_iso
+from reporte_periodo import (COLUMNAS as COLUMNAS_PERIODO, calcular_periodo, nombre_periodo,
+                             rango_mes, rango_semana, rango_trimestre)
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+#  MÓDULO DE REPORTES — TURISMAR
+# ═══════════════════════════════════════════════════════════════════════════
+
+def _query_rep(sql, params=None):
+    conn = conectar_db()
+    try:
+        df = read_sql_query(sql, conn, params=params)
+    except Exception as e:
+        conn.close()
+        raise e
+    finally:
+        try: conn.close()
+        except: pass
+    return df
+
+def _filas_rep(sql, params=None, lote=2000):
+    """
+    Recorre el resultado de una consulta fila por fila sin cargarlo completo.
+    En PostgreSQL usa un cursor del lado del servidor (requiere transacción,
+    así que se desactiva el autocommit mientras dura el recorrido).
+    """
+    conn = conectar_db()
+    try:
+        if ES_POSTGRES and PSYCOPG2_DISPONIBLE:
+            raw = conn._conn
+            raw.autocommit = False
+            try:
+                cur = raw.cursor(name=f"rep_{id(conn)}")
+                cur.itersize = lote
+                cur.execute(sql.replace('?', '%s'), params)
+                for fila in cur:
+                    yield fila
+                cur.close()
+            finally:
+                raw.rollback()
+                raw.autocommit = True
+        else:
+            cur = conn.cursor()
+            cur.execute(sql, params or ())
+            while True:
+                filas = cur.fetchmany(lote)
+                if not filas:
+                    break
+                yield from filas
+    finally:
+        conn.close()
+
+def _hoja_titulo(libro, nombre, titulo, anchos, con_fecha=False):
+    """Crea una hoja con el título estándar (y la fecha de generación si se pide)."""
+    h = libro.hoja(nombre, anchos)
+    subtitulo = f"Generado: {datetime.now().strftime('%d/%m/%Y %H:%M')}" if con_fecha else ""
+    h.titulo(titulo, subtitulo)
+    return h
+
+def _fila_total(h, n, etiqueta, col_etiqueta, cols_suma, ancho, moneda=()):
+    """Fila de totales con =SUM sobre las `n` filas anteriores."""
+    fila = [None] * ancho
+    fila[col_etiqueta - 1] = etiqueta
+    for c in cols_suma:
+        fila[c - 1] = h.suma(c, h.siguiente - n, h.siguiente - 1)
+    h.fila(fila, bg="29ABE2", bold=True, moneda=moneda)
+
+# ─── RIVIERA MAYA ────────────────────────────────────────────────────────────
+
+def _excel_riviera(tipo_filtro="todos", valor_filtro=None, label="General", id_vend=None,
+                   desde=None, hasta=None, progreso=None):
+    """
+    Reporte Riviera Maya. `desde`/`hasta` (date o 'YYYY-MM-DD') limitan las
+    ventas por fecha de viaje (fecha_inicio_iso); el historial de pagos usa
+    el mismo filtro, así que sólo se leen los abonos de las ventas elegidas.
+    `progreso(fraccion, mensaje)` es opcional (lo usa la cola de reportes).
+    """
+    condiciones, params = [], []
+    if tipo_filtro == "bloqueos":
+        condiciones.append("v.es_bloqueo = 1")
+    elif tipo_filtro == "grupos":
+        condiciones.append("v.es_grupo = 1")
+    elif tipo_filtro == "vendedora" and valor_filtro:
+        condiciones.append("vd.nombre = ?")
+        params.append(valor_filtro)
+    elif id_vend:
+        condiciones.append("v.vendedora_id = ?")
+        params.append(id_vend)
+    if desde:
+        condiciones.append("v.fecha_inicio_iso >= ?")
+        params.append(fecha_a_iso(desde))
+    if hasta:
+        condiciones.append("v.fecha_inicio_iso <= ?")
+        params.append(fecha_a_iso(hasta))
+    where = ("WHERE " + " AND ".join(condiciones)) if condiciones else ""
+    params = tuple(params)
+
+    libro = LibroExcel()
+    # Las hojas se crean en el orden final; Resumen y Habitaciones se llenan
+    # al terminar de recorrer las ventas
+    ws1 = _hoja_titulo(libro, "Resumen", f"TURISMAR — Riviera Maya: {label}", [30, 22], con_fecha=True)
+    ws2 = _hoja_titulo(libro, "Clientes y Pagos", f"Clientes — {label}",
+                       [6,18,22,14,28,12,12,12,8,8,8,14,14,14,14,14,12,14])
+    ws3 = _hoja_titulo(libro, "Habitaciones", f"Distribución Habitaciones — {label}", [22,12,18,18,18,18])
+    ws4 = _hoja_titulo(libro, "Historial Pagos", f"Historial de Pagos — {label}", [10,24,28,18,18,14,16])
+
+    # Hoja 2 — Clientes y Pagos (se va acumulando lo de Resumen y Habitaciones)
+    if progreso: progreso(0.05, "Clientes y pagos")
+    hdrs=["ID","Vendedora","Cliente","Celular","Destino","Habitación","Salida","Regreso",
+          "Noches","Adultos","Menores","Total","Pagado","Saldo","Ganancia","Comisión","Estado","Com.Estado"]
+    ws2.encabezado(hdrs, bg="E91E8C")
+    n = 0
+    suma = {"total": 0.0, "pagado": 0.0, "saldo": 0.0, "ganancia": 0.0}
+    por_estado = {}
+    comision = {"Pendiente": 0.0, "Pagada": 0.0}
+    habitaciones = {}
+    for row in _filas_rep(f"""
+        SELECT v.id, COALESCE(vd.nombre,'—') AS vendedora,
+               v.cliente, v.celular_responsable AS celular, v.destino, v.tipo_habitacion,
+               v.fecha_inicio, v.fecha_fin, v.noches, v.adultos, v.menores,
+               v.precio_total, v.pagado, v.saldo, v.ganancia,
+               COALESCE(v.comision_vendedora, ROUND(v.ganancia*0.10,2)) AS comision,
+               v.estado,
+               CASE v.comision_pagada WHEN 1 THEN 'Pagada' ELSE 'Pendiente' END AS estado_comision
+        FROM ventas v
+        LEFT JOIN vendedoras vd ON v.vendedora_id = vd.id
+        {where} ORDER BY v.id DESC
+    """, params):
+        ws2.fila(row, bg=ws2.bg_alterno("FFF0F7"), moneda=(12,13,14,15,16))
+        n += 1
+        total, pagado, saldo, ganancia = (float(x or 0) for x in row[11:15])
+        suma["total"] += total; suma["pagado"] += pagado
+        suma["saldo"] += saldo; suma["ganancia"] += ganancia
+        por_estado[row[16]] = por_estado.get(row[16], 0) + 1
+        comision[row[17]] += float(row[15] or 0)
+        hab = habitaciones.setdefault(row[5] or "SIN TIPO", [0, 0.0, 0.0, 0.0, 0.0])
+        hab[0] += 1; hab[1] += total; hab[2] += pagado; hab[3] += saldo; hab[4] += ganancia
+    if n:
+        _fila_total(ws2, n, "TOTALES", 1, (12,13,14,15,16), len(hdrs), moneda=(12,13,14,15,16))
+
+    # Hoja 1 — Resumen
+    if progreso: progreso(0.6, "Resumen y habitaciones")
+    totales = [
+        ("Total ventas",          n),
+        ("Total vendido ($)",     suma["total"]),
+        ("Total cobrado ($)",     suma["pagado"]),
+        ("Saldo por cobrar ($)",  suma["saldo"]),
+        ("Ganancia total ($)",    suma["ganancia"]),
+        ("Ventas ACTIVAS",        por_estado.get("ACTIVO", 0)),
+        ("Ventas LIQUIDADAS",     por_estado.get("LIQUIDADO", 0)),
+        ("Ventas CERRADAS",       por_estado.get("CERRADO", 0)),
+        ("Comisiones pendientes ($)", comision["Pendiente"]),
+        ("Comisiones pagadas ($)",    comision["Pagada"]),
+    ]
+    ws1.encabezado(["Indicador", "Valor"], bg="29ABE2")
+    for i,(k,v_val) in enumerate(totales):
+        ws1.fila([k, v_val], bg="F0F9FF" if i%2==0 else "FFFFFF",
+                 moneda=(2,) if isinstance(v_val, float) else ())
+
+    # Hoja 3 — Habitaciones
+    if n:
+        ws3.encabezado(["Tipo","Cantidad","Total Vendido","Total Cobrado","Saldo","Ganancia"], bg="1F4E79")
+        for tipo in sorted(habitaciones):
+            ws3.fila([tipo] + habitaciones[tipo], bg=ws3.bg_alterno("EFF9FF"), moneda=(3,4,5,6))
+        _fila_total(ws3, len(habitaciones), "TOTAL", 1, (2,3,4,5,6), 6, moneda=(3,4,5,6))
+
+    # Hoja 4 — Historial Pagos (mismo WHERE que las ventas)
+    if progreso: progreso(0.7, "Historial de pagos")
+    n4 = 0
+    if n:
+        for row in _filas_rep(f"""
+            SELECT a.venta_id, v.cliente, v.destino, COALESCE(vd.nombre,'—') AS vendedora,
+                   a.fecha, a.monto, COALESCE(a.metodo_pago,'Efectivo') AS metodo
+            FROM abonos a
+            JOIN ventas v ON a.venta_id = v.id
+            LEFT JOIN vendedoras vd ON v.vendedora_id = vd.id
+            {where} ORDER BY a.venta_id, a.fecha
+        """, params):
+            if n4 == 0:
+                ws4.encabezado(["ID Venta","Cliente","Destino","Vendedora","Fecha","Monto","Método"], bg="2D6A4F")
+            ws4.fila(row, bg=ws4.bg_alterno("F0FFF4"), moneda=(6,))
+            n4 += 1
+    if n4:
+        _fila_total(ws4, n4, "TOTAL", 5, (6,), 7, moneda=(6,))
+    elif n:
+        ws4.texto("Sin abonos registrados para estas ventas")
+    else:
+        ws4.texto("Sin abonos registrados")
+
+    return libro.a_bytes()
+
+
+# ─── NACIONALES ──────────────────────────────────────────────────────────────
+# NOTA: clientes_nacionales usa habitaciones_doble/triple (no tipo_habitacion)
+#       y los pasajeros están en pasajeros_nacionales
+
+def _excel_nacionales_viaje(viaje_id, nombre_viaje, id_vend_filtro=None, progreso=None):
+    filtro_vend = "AND cn.vendedora_id = ?" if id_vend_filtro else ""
+    params = (viaje_id, id_vend_filtro) if id_vend_filtro else (viaje_id,)
+
+    libro = LibroExcel()
+    ws1 = _hoja_titulo(libro, "Info General", f"TURISMAR — {nombre_viaje}", [28, 30], con_fecha=True)
+    ws2 = _hoja_titulo(libro, "Clientes y Pagos", f"Clientes — {nombre_viaje}",
+                       [6,18,24,14,8,8,10,10,14,14,14,14,12])
+    ws3 = _hoja_titulo(libro, "Pasajeros", f"Lista de Pasajeros — {nombre_viaje}", [10,24,28,12,14])
+    ws4 = _hoja_titulo(libro, "Habitaciones", f"Distribución Habitaciones — {nombre_viaje}", [22,14,16])
+    ws5 = _hoja_titulo(libro, "Historial Pagos", f"Historial de Pagos — {nombre_viaje}", [10,26,18,14,16])
+
+    # Hoja 2 — Clientes y Pagos (acumula lo de Info General y Habitaciones)
+    if progreso: progreso(0.05, "Clientes y pagos")
+    hdrs=["ID","Vendedora","Cliente","Celular","Adultos","Menores",
+          "Hab. Doble","Hab. Triple","Total","Abonado","Saldo","Ganancia","Estado"]
+    ws2.encabezado(hdrs, bg="E91E8C")
+    mapa_cl = {}
+    suma = [0.0, 0.0, 0.0, 0.0]
+    dobles = triples = pax = 0
+    for row in _filas_rep(f"""
+        SELECT cn.id, COALESCE(vd.nombre,'—') AS vendedora,
+               cn.nombre_cliente AS cliente, cn.celular_responsable AS celular,
+               cn.adultos, cn.menores,
+               cn.habitaciones_doble, cn.habitaciones_triple,
+               cn.total_pagar, cn.total_abonado AS pagado, cn.saldo,
+               COALESCE(cn.ganancia, 0) AS ganancia,
+               cn.estado
+        FROM clientes_nacionales cn
+        LEFT JOIN vendedoras vd ON cn.vendedora_id = vd.id
+        WHERE cn.viaje_id = ? {filtro_vend}
+        ORDER BY cn.id
+    """, params):
+        ws2.fila(row, bg=ws2.bg_alterno("FFF0F7"), moneda=(9,10,11,12))
+        mapa_cl[row[0]] = row[2]
+        for i in range(4):
+            suma[i] += float(row[8 + i] or 0)
+        dobles += int(row[6] or 0); triples += int(row[7] or 0)
+        pax += int(row[4] or 0) + int(row[5] or 0)
+    if mapa_cl:
+        _fila_total(ws2, len(mapa_cl), "TOTALES", 1, (9,10,11,12), len(hdrs), moneda=(9,10,11,12))
+
+    # Hoja 1 — Info General
+    for rv in _filas_rep("""
+        SELECT nombre_viaje, destino, fecha_salida, fecha_regreso,
+               dias, noches, cupos_totales, cupos_vendidos, cupos_disponibles,
+               precio_persona_doble, precio_persona_triple, estado
+        FROM viajes_nacionales WHERE id = ?
+    """, (viaje_id,)):
+        campos = [
+            ("Nombre del viaje",   rv[0]),
+            ("Destino",            rv[1]),
+            ("Fecha salida",       rv[2]),
+            ("Fecha regreso",      rv[3]),
+            ("Días / Noches",      f"{rv[4]} días / {rv[5]} noches"),
+            ("Cupos totales",      rv[6]),
+            ("Cupos vendidos",     rv[7]),
+            ("Cupos disponibles",  rv[8]),
+            ("Precio doble",       float(rv[9] or 0)),
+            ("Precio triple",      float(rv[10] or 0)),
+            ("Estado del viaje",   rv[11]),
+            ("Total clientes",     len(mapa_cl)),
+            ("Total a pagar ($)",  suma[0]),
+            ("Total abonado ($)",  suma[1]),
+            ("Saldo pendiente ($)",suma[2]),
+            ("Ganancia total ($)", suma[3]),
+        ]
+        ws1.encabezado(["Campo", "Valor"], bg="29ABE2")
+        for i,(k,val) in enumerate(campos):
+            ws1.fila([k, val], bg="F0F9FF" if i%2==0 else "FFFFFF",
+                     moneda=(2,) if isinstance(val, float) else ())
+
+    # Hoja 3 — Pasajeros (nombre real de cada uno)
+    if progreso: progreso(0.4, "Pasajeros")
+    n3 = 0
+    if mapa_cl:
+        for cliente_id, nombre, tipo, habitacion in _filas_rep(f"""
+            SELECT pn.cliente_id, pn.nombre_completo, pn.tipo, pn.habitacion_asignada
+            FROM pasajeros_nacionales pn
+            JOIN clientes_nacionales cn ON pn.cliente_id = cn.id
+            WHERE cn.viaje_id = ? {filtro_vend}
+            ORDER BY pn.cliente_id, pn.tipo
+        """, params):
+            if n3 == 0:
+                ws3.encabezado(["ID Cliente","Nombre Cliente","Pasajero","Tipo","Habitación"], bg="1F4E79")
+            ws3.fila([cliente_id, mapa_cl.get(cliente_id, "—"), nombre, tipo, habitacion],
+                     bg=ws3.bg_alterno("EFF9FF"))
+            n3 += 1
+    if not n3:
+        ws3.texto("Sin pasajeros registrados")
+
+    # Hoja 4 — Distribución Habitaciones
+    if mapa_cl:
+        ws4.encabezado(["Tipo Habitación","Cantidad","Pax promedio"], bg="1F4E79")
+        for tipo,cant in [("DOBLE",dobles),("TRIPLE",triples)]:
+            ws4.fila([tipo, cant, 2 if tipo=="DOBLE" else 3], bg=ws4.bg_alterno("EFF9FF"))
+        ws4.fila(["TOTAL HABITACIONES", dobles+triples, f"{pax} pax"], bg="29ABE2", bold=True)
+
+    # Hoja 5 — Historial Pagos
+    if progreso: progreso(0.7, "Historial de pagos")
+    n5 = 0
+    for row in _filas_rep(f"""
+        SELECT an.cliente_id, cn.nombre_cliente AS cliente,
+               an.fecha, an.monto, COALESCE(an.metodo_pago,'Efectivo') AS metodo
+        FROM abonos_nacionales an
+        JOIN clientes_nacionales cn ON an.cliente_id = cn.id
+        WHERE cn.viaje_id = ? {filtro_vend}
+        ORDER BY an.fecha
+    """, params):
+        if n5 == 0:
+            ws5.encabezado(["ID Cliente","Cliente","Fecha","Monto","Método"], bg="2D6A4F")
+        ws5.fila(row, bg=ws5.bg_alterno("F0FFF4"), moneda=(4,))
+        n5 += 1
+    if n5:
+        _fila_total(ws5, n5, "TOTAL", 3, (4,), 5, moneda=(4,))
+    else:
+        ws5.texto("Sin abonos registrados")
+
+    return libro.a_bytes()
+
+
+# ─── INTERNACIONALES ─────────────────────────────────────────────────────────
+
+def _excel_internacionales_viaje(viaje_id, nombre_viaje, id_vend_filtro=None, progreso=None):
+    filtro_vend = "AND ci.vendedora_id = ?" if id_vend_filtro else ""
+    params = (viaje_id, id_vend_filtro) if id_vend_filtro else (viaje_id,)
+
+    libro = LibroExcel()
+    ws1 = _hoja_titulo(libro, "Info General", f"TURISMAR — Internacional: {nombre_viaje}", [25, 30], con_fecha=True)
+    ws2 = _hoja_titulo(libro, "Clientes y Pagos", f"Clientes — {nombre_viaje}",
+                       [6,18,26,8,8,10,10,14,14,14,14,12])
+    ws3 = _hoja_titulo(libro, "Pasajeros", f"Pasajeros — {nombre_viaje}", [10,24,28,12,14])
+    ws4 = _hoja_titulo(libro, "Habitaciones", f"Habitaciones — {nombre_viaje}", [22,14])
+    ws5 = _hoja_titulo(libro, "Historial Pagos", f"Historial Pagos — {nombre_viaje}", [10,26,18,14,12,14,14])
+
+    # Hoja 2 — Clientes y Pagos
+    if progreso: progreso(0.05, "Clientes y pagos")
+    hdrs=["ID","Vendedora","Cliente","Adultos","Menores","Hab.Doble","Hab.Triple",
+          "Total USD","Pagado USD","Saldo USD","Ganancia USD","Estado"]
+    ws2.encabezado(hdrs, bg="E91E8C")
+    mapa_cl = {}
+    suma = [0.0, 0.0, 0.0]
+    dobles = triples = 0
+    for row in _filas_rep(f"""
+        SELECT ci.id, COALESCE(vd.nombre,'—') AS vendedora,
+               ci.nombre_cliente AS cliente,
+               ci.adultos, ci.menores,
+               ci.habitaciones_doble, ci.habitaciones_triple,
+               ci.total_usd AS total, ci.abonado_usd AS pagado,
+               ci.saldo_usd AS saldo,
+               COALESCE(ci.ganancia_usd, 0) AS ganancia,
+               ci.estado
+        FROM clientes_internacionales ci
+        LEFT JOIN vendedoras vd ON ci.vendedora_id = vd.id
+        WHERE ci.viaje_id = ? {filtro_vend}
+        ORDER BY ci.id
+    """, params):
+        ws2.fila(row, bg=ws2.bg_alterno("FFF0F7"), moneda=(8,9,10,11))
+        mapa_cl[row[0]] = row[2]
+        for i in range(3):
+            suma[i] += float(row[7 + i] or 0)
+        dobles += int(row[5] or 0); triples += int(row[6] or 0)
+    if mapa_cl:
+        _fila_total(ws2, len(mapa_cl), "TOTALES", 1, (8,9,10,11), len(hdrs), moneda=(8,9,10,11))
+
+    # Hoja 1 — Info General
+    for rv in _filas_rep("""
+        SELECT destino, fecha_salida, fecha_regreso, dias, noches, estado
+        FROM viajes_internacionales WHERE id = ?
+    """, (viaje_id,)):
+        campos=[("Viaje",rv[0]),("Destino",rv[0]),
+                ("Salida",rv[1]),("Regreso",rv[2]),
+                ("Días/Noches",f"{rv[3]} / {rv[4]}"),
+                ("Estado",rv[5]),
+                ("Total clientes",len(mapa_cl)),
+                ("Total USD",suma[0]),
+                ("Cobrado USD",suma[1]),
+                ("Saldo USD",suma[2])]
+        ws1.encabezado(["Campo", "Valor"], bg="1F4E79")
+        for i,(k,val) in enumerate(campos):
+            ws1.fila([k, val], bg="EFF9FF" if i%2==0 else "FFFFFF",
+                     moneda=(2,) if isinstance(val, float) else ())
+
+    # Hoja 3 — Pasajeros
+    if progreso: progreso(0.4, "Pasajeros")
+    n3 = 0
+    if mapa_cl:
+        for cliente_id, nombre, tipo, habitacion in _filas_rep(f"""
+            SELECT pi.cliente_id, pi.nombre_completo, pi.tipo, pi.habitacion_asignada
+            FROM pasajeros_internacionales pi
+            JOIN clientes_internacionales ci ON pi.cliente_id = ci.id
+            WHERE ci.viaje_id = ? {filtro_vend}
+            ORDER BY pi.cliente_id, pi.tipo
+        """, params):
+            if n3 == 0:
+                ws3.encabezado(["ID Cliente","Nombre Cliente","Pasajero","Tipo","Habitación"], bg="1F4E79")
+            ws3.fila([cliente_id, mapa_cl.get(cliente_id, "—"), nombre, tipo, habitacion or ""],
+                     bg=ws3.bg_alterno("EFF9FF"))
+            n3 += 1
+    if not n3:
+        ws3.texto("Sin pasajeros registrados")
+
+    # Hoja 4 — Distribución Habitaciones
+    if mapa_cl:
+        ws4.encabezado(["Tipo","Cantidad"], bg="1F4E79")
+        for tipo,cant in [("DOBLE",dobles),("TRIPLE",triples)]:
+            ws4.fila([tipo, cant], bg=ws4.bg_alterno("EFF9FF"))
+        ws4.fila(["TOTAL", dobles+triples], bg="29ABE2", bold=True)
+
+    # Hoja 5 — Historial Pagos
+    if progreso: progreso(0.7, "Historial de pagos")
+    n5 = 0
+    for row in _filas_rep(f"""
+        SELECT ai.cliente_id, ci.nombre_cliente AS cliente, ai.fecha,
+               ai.monto_usd, COALESCE(ai.tipo_cambio, 0) AS tipo_cambio,
+               COALESCE(ai.monto_mxn, 0) AS monto_mxn,
+               COALESCE(ai.metodo_pago,'Efectivo') AS metodo
+        FROM abonos_internacionales ai
+        JOIN clientes_internacionales ci ON ai.cliente_id = ci.id
+        WHERE ci.viaje_id = ? {filtro_vend}
+        ORDER BY ai.fecha
+    """, params):
+        if n5 == 0:
+            ws5.encabezado(["ID Cliente","Cliente","Fecha","Monto USD","Tipo Cambio","Monto MXN","Método"], bg="2D6A4F")
+        ws5.fila(row, bg=ws5.bg_alterno("F0FFF4"), moneda=(4,6))
+        n5 += 1
+    if n5:
+        _fila_total(ws5, n5, "TOTAL", 3, (4,6), 7, moneda=(4,6))
+    else:
+        ws5.texto("Sin abonos registrados")
+
+    return libro.a_bytes()
+
+
+# ─── FINANCIERO ──────────────────────────────────────────────────────────────
+
+def _excel_financiero(anio, progreso=None):
+    MESES=["Ene","Feb","Mar","Abr","May","Jun","Jul","Ago","Sep","Oct","Nov","Dic"]
+    def mes_dict(df,col,col_mes="mes"):
+        d={}
+        if not df.empty:
+            for _,row in df.iterrows():
+                try: d[int(row[col_mes])]=float(row[col] or 0)
+                except: pass
+        return d
+    if progreso: progreso(0.05, "Consultando el año")
+    df_rv=_query_rep(f"""SELECT strftime('%m',fecha_registro) AS mes, COUNT(*) AS ventas,
+        SUM(precio_total) AS vendido, SUM(pagado) AS cobrado, SUM(ganancia) AS ganancia
+        FROM ventas WHERE strftime('%Y',fecha_registro)='{anio}' GROUP BY mes ORDER BY mes""")
+    df_nac=_query_rep(f"""SELECT strftime('%m',fecha_registro) AS mes, COUNT(*) AS ventas,
+        SUM(total_pagar) AS vendido, SUM(total_abonado) AS cobrado
+        FROM clientes_nacionales WHERE strftime('%Y',fecha_registro)='{anio}'
+        GROUP BY mes ORDER BY mes""")
+    df_int=_query_rep(f"""SELECT strftime('%m',fecha_registro) AS mes, COUNT(*) AS ventas,
+        SUM(total_usd) AS vendido, SUM(abonado_usd) AS cobrado
+        FROM clientes_internacionales WHERE strftime('%Y',fecha_registro)='{anio}'
+        GROUP BY mes ORDER BY mes""")
+    # Abonos Riviera del libro de pagos: un recorrido del índice de fecha por el año
+    df_flujo=_query_rep(f"""SELECT SUBSTR(m.fecha,6,2) AS mes, SUM(m.monto_mxn) AS ingreso
+        FROM movimientos_pagos m
+        WHERE m.fecha>='{anio}-01-01' AND m.fecha<'{anio+1}-01-01' AND m.producto='riviera'
+        GROUP BY mes ORDER BY mes""")
+    df_ant=_query_rep(f"""SELECT strftime('%m',fecha_registro) AS mes,
+        SUM(precio_total) AS vendido, SUM(pagado) AS cobrado, SUM(ganancia) AS ganancia
+        FROM ventas WHERE strftime('%Y',fecha_registro)='{anio-1}'
+        GROUP BY mes ORDER BY mes""")
+    df_vend=_query_rep(f"""SELECT vd.nombre AS vendedora, COUNT(v.id) AS ventas,
+        SUM(v.precio_total) AS vendido, SUM(v.pagado) AS cobrado,
+        SUM(v.saldo) AS saldo, SUM(v.ganancia) AS ganancia,
+        SUM(COALESCE(v.comision_vendedora,ROUND(v.ganancia*0.10,2))) AS comision_total,
+        COUNT(CASE WHEN v.estado='LIQUIDADO' THEN 1 END) AS liquidadas,
+        COUNT(CASE WHEN v.estado='CERRADO' THEN 1 END) AS cerradas
+        FROM ventas v JOIN vendedoras vd ON v.vendedora_id=vd.id
+        WHERE strftime('%Y',v.fecha_registro)='{anio}'
+        GROUP BY vd.nombre ORDER BY vendido DESC""")
+    rv_v=mes_dict(df_rv,"ventas"); rv_vnd=mes_dict(df_rv,"vendido")
+    rv_cob=mes_dict(df_rv,"cobrado"); rv_gan=mes_dict(df_rv,"ganancia")
+    nac_v=mes_dict(df_nac,"ventas"); nac_vnd=mes_dict(df_nac,"vendido"); nac_cob=mes_dict(df_nac,"cobrado")
+    int_v=mes_dict(df_int,"ventas"); int_vnd=mes_dict(df_int,"vendido"); int_cob=mes_dict(df_int,"cobrado")
+    flujo=mes_dict(df_flujo,"ingreso")
+    ant_vnd=mes_dict(df_ant,"vendido"); ant_cob=mes_dict(df_ant,"cobrado"); ant_gan=mes_dict(df_ant,"ganancia")
+    if progreso: progreso(0.8, "Armando hojas")
+    libro=LibroExcel()
+    # Hoja 1
+    ws1=_hoja_titulo(libro,"Resumen Anual",f"TURISMAR — Reporte Financiero {anio}",
+                     [10,10,16,16,16,10,16,16,10,16,16,16],con_fecha=True)
+    hdrs=["Mes","Ventas RV","Vendido RV","Cobrado RV","Ganancia RV",
+          "Ventas Nac","Vendido Nac","Cobrado Nac",
+          "Ventas Int","Vendido Int USD","Cobrado Int USD","Flujo Caja"]
+    ws1.encabezado(hdrs,bg="1F4E79")
+    for m in range(1,13):
+        rd=[MESES[m-1],rv_v.get(m,0),rv_vnd.get(m,0),rv_cob.get(m,0),rv_gan.get(m,0),
+            nac_v.get(m,0),nac_vnd.get(m,0),nac_cob.get(m,0),
+            int_v.get(m,0),int_vnd.get(m,0),int_cob.get(m,0),flujo.get(m,0)]
+        ws1.fila(rd,bg="F0F9FF" if m%2==0 else "FFFFFF",moneda=(3,4,5,7,8,10,11,12))
+    fila_total=[f"TOTAL {anio}"]+[ws1.suma(ci,ws1.siguiente-12,ws1.siguiente-1) for ci in range(2,13)]
+    ws1.fila(fila_total,bg="E91E8C",bold=True,moneda=(3,4,5,7,8,10,11,12))
+    # Hoja 2
+    ws2=_hoja_titulo(libro,"Comparativa",f"Comparativa {anio-1} vs {anio}",[10]+[14]*12)
+    hdrs2=["Mes",f"Vendido {anio-1}",f"Vendido {anio}","Var $","Var %",
+           f"Cobrado {anio-1}",f"Cobrado {anio}","Var $","Var %",
+           f"Ganancia {anio-1}",f"Ganancia {anio}","Var $","Var %"]
+    ws2.encabezado(hdrs2,bg="2D6A4F")
+    for m in range(1,13):
+        a0v=ant_vnd.get(m,0); a1v=rv_vnd.get(m,0)
+        a0c=ant_cob.get(m,0); a1c=rv_cob.get(m,0)
+        a0g=ant_gan.get(m,0); a1g=rv_gan.get(m,0)
+        rd=[MESES[m-1],a0v,a1v,a1v-a0v,(a1v-a0v)/a0v if a0v else 0,
+            a0c,a1c,a1c-a0c,(a1c-a0c)/a0c if a0c else 0,
+            a0g,a1g,a1g-a0g,(a1g-a0g)/a0g if a0g else 0]
+        ws2.fila(rd,bg="F0FFF4" if m%2==0 else "FFFFFF",
+                 moneda=(2,3,4,6,7,8,10,11,12),pct=(5,9,13))
+    # Hoja 3
+    ws3=_hoja_titulo(libro,"Por Vendedora",f"Rendimiento por Vendedora — {anio}",
+                     [20,8,16,16,16,16,16,10,10,14])
+    hdrs3=["Vendedora","Ventas","Vendido","Cobrado","Saldo","Ganancia",
+           "Comisión Total","Liquidadas","Cerradas","% Liquidación"]
+    ws3.encabezado(hdrs3,bg="E91E8C")
+    for _,row in (df_vend.iterrows() if not df_vend.empty else []):
+        tot=row.get("ventas",0)
+        liq_pct=(float(row.get("liquidadas",0))+float(row.get("cerradas",0)))/float(tot) if tot>0 else 0
+        ws3.fila([row.get("vendedora"),row.get("ventas"),row.get("vendido"),
+                  row.get("cobrado"),row.get("saldo"),row.get("ganancia"),
+                  row.get("comision_total"),row.get("liquidadas"),
+                  row.get("cerradas"),liq_pct],
+                 bg=ws3.bg_alterno("FFF0F7"),moneda=(3,4,5,6,7),pct=(10,))
+    return libro.a_bytes()
+
+
+# ════════════════════════════════════════════════════════════════════════════
+#  REPORTE SEMANAL — Resumen de la semana (o mes, trimestre, rango) seleccionado
+# ════════════════════════════════════════════════════════════════════════════
+
+_HOJAS_PERIODO = [
+    ("riviera", "Reservas Riviera", "29ABE2"),
+    ("abono_riviera", "Abonos Riviera", "29ABE2"),
+    ("nacional", "Nacionales", "E91E8C"),
+    ("abono_nacional", "Abonos Nacionales", "E91E8C"),
+    ("internacional", "Internacionales", "1F4E79"),
+    ("abono_internacional", "Abonos Internacionales", "1F4E79"),
+    ("gasto", "Gastos", "0066CC"),
+    ("comision", "Comisiones", "0066CC"),
+]
+_COLUMNAS_MONEDA_PERIODO = {"Total", "Pagado", "Saldo", "Monto", "Total USD", "Pagado USD",
+                            "Saldo USD", "Monto USD", "Monto MXN"}
+
+def _excel_semanal(resumen, progreso=None):
+    """
+    Excel del reporte por periodo. `resumen` es el ResumenPeriodo que ya
+    calculó la página: totales y detalle salen de ahí, sin volver a la base.
+    """
+    libro = LibroExcel()
+    ws = _hoja_titulo(libro, "Resumen", f"TURISMAR — Reporte {resumen.nombre}", [30, 18], con_fecha=True)
+    ws.encabezado(["Concepto", "Valor"], bg="0066CC")
+    ws.fila(["Reservas Nuevas", resumen.total_reservas])
+    for concepto, valor in [
+        ("Monto Reservas", resumen.monto_reservas),
+        ("Pagado en Reservas", resumen.pagado_reservas),
+        ("Abonos Riviera", resumen.abonos_riviera),
+        ("Abonos Nacionales", resumen.abonos_nacionales),
+        ("Abonos Internacionales (USD)", resumen.abonos_internacionales),
+        ("Total Abonos", resumen.total_abonos),
+        ("Gastos", resumen.total_gastos),
+        ("Comisiones", resumen.total_comisiones),
+    ]:
+        ws.fila([concepto, valor], moneda=(2,))
+    ws.fila(["Balance", resumen.balance], bg="29ABE2", bold=True, moneda=(2,))
+
+    for i, (seccion, titulo, color) in enumerate(_HOJAS_PERIODO, 1):
+        if progreso: progreso(i / (len(_HOJAS_PERIODO) + 1), titulo)
+        columnas = COLUMNAS_PERIODO[seccion]
+        h = libro.hoja(titulo, [8] + [16] * (len(columnas) - 1))
+        h.encabezado(columnas, bg=color)
+        moneda = tuple(c for c, nombre in enumerate(columnas, 1) if nombre in _COLUMNAS_MONEDA_PERIODO)
+        if seccion in resumen.secciones_faltantes:
+            h.texto("Tabla no disponible en esta base")
+        for fila in resumen.detalle[seccion]:
+            h.fila(fila, moneda=moneda)
+
+    return libro.a_bytes()
+
+
+def _tabla_periodo(resumen, seccion, vacio):
+    """Detalle de una sección del reporte por periodo (o el aviso si no hay filas)."""
+    if seccion in resumen.secciones_faltantes:
+        st.warning("Tabla no disponible en esta base.")
+    elif resumen.detalle[seccion]:
+        st.dataframe(pd.DataFrame(resumen.detalle[seccion], columns=COLUMNAS_PERIODO[seccion]),
+                     use_container_width=True, hide_index=True)
+    else:
+        st.info(vacio)
+
+
+def pagina_reporte_semanal():
+    """Reporte por periodo: semana (domingo a sábado), mes, trimestre o rango libre"""
+    st.title("📅 Reporte Semanal")
+    st.markdown("Selecciona una semana, un mes, un trimestre o un rango de fechas")
+
+    hoy = datetime.now().date()
+    tipo = st.radio("Periodo:", ["Semana", "Mes", "Trimestre", "Rango"], horizontal=True, key="rs_tipo")
+    if tipo == "Rango":
+        col1, col2 = st.columns(2)
+        with col1:
+            fecha_inicio = st.date_input("Desde", value=hoy.replace(day=1), key="rs_desde")
+        with col2:
+            fecha_fin = st.date_input("Hasta", value=hoy, key="rs_hasta")
+        if fecha_inicio > fecha_fin:
+            st.warning("⚠️ La fecha 'Desde' es posterior a 'Hasta'.")
+            return
+        etiqueta = f"Del {fecha_inicio.strftime('%d/%m/%Y')} al {fecha_fin.strftime('%d/%m/%Y')}"
+    elif tipo == "Semana":
+        fecha_sabado = st.date_input(
+            "📆 Selecciona el sábado de la semana:",
+            value=hoy,
+            help="Las semanas van de domingo a sábado"
+        )
+        fecha_inicio, fecha_fin = rango_semana(fecha_sabado)
+        etiqueta = f"Semana del {fecha_inicio.strftime('%d/%m/%Y')} al {fecha_fin.strftime('%d/%m/%Y')}"
+    else:
+        fecha = st.date_input(f"📆 Selecciona un día del {tipo.lower()}:", value=hoy, key="rs_fecha")
+        fecha_inicio, fecha_fin = (rango_mes if tipo == "Mes" else rango_trimestre)(fecha)
+        etiqueta = f"{nombre_periodo(fecha_inicio, fecha_fin)} ({fecha_inicio.strftime('%d/%m/%Y')} al {fecha_fin.strftime('%d/%m/%Y')})"
+
+    st.markdown(f"**📅 {etiqueta}**")
+
+    # Una sola consulta para todo el periodo; el Excel reusa este mismo resultado
+    r = calcular_periodo(consulta_cacheada, fecha_inicio, fecha_fin)
+
+    # ===== RESUMEN EJECUTIVO =====
+    st.subheader("📈 Resumen Ejecutivo")
+
+    # Mostrar tarjetas de resumen
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("🏖️ Reservas Nuevas", f"{r.total_reservas}", f"${r.monto_reservas:,.0f}")
+    with col2:
+        st.metric("💰 Total Abonos", f"${r.total_abonos:,.0f}")
+    with col3:
+        st.metric("📤 Gastos", f"${r.total_gastos:,.0f}")
+    with col4:
+        st.metric("👩‍💼 Comisiones", f"${r.total_comisiones:,.0f}")
+
+    # Balance del periodo
+    col_bal1, col_bal2 = st.columns(2)
+    with col_bal1:
+        st.metric("💵 Balance (Abonos - Gastos - Comisiones)", f"${r.balance:,.0f}")
+    with col_bal2:
+        st.metric("💳 Total Pagado en Reservas", f"${r.pagado_reservas:,.0f}")
+
+    # ===== BOTÓN DE DESCARGA EXCEL =====
+    if st.button("📥 Descargar Reporte en Excel", type="primary"):
+        _encolar_reporte(
+            f"Reporte {etiqueta}",
+            f"reporte_{fecha_inicio.strftime('%Y%m%d')}_{fecha_fin.strftime('%Y%m%d')}.xlsx",
+            _excel_semanal, r)
+    _panel_reportes_generados("semanal")
+
+    # ===== DETALLE POR SECCIONES =====
+    st.markdown("---")
+    tabs = st.tabs(["🏖️ Reservas Riviera", "🎫 Nacionales", "🌎 Internacionales", "💰 Gastos", "👩‍💼 Comisiones"])
+
+    # Reservas Riviera
+    with tabs[0]:
+        st.subheader("🏖️ Reservas Riviera Maya")
+        _tabla_periodo(r, "riviera", "No hay reservas de Riviera en este periodo.")
+        st.markdown("#### Abonos de Riviera")
+        _tabla_periodo(r, "abono_riviera", "No hay abonos de Riviera en este periodo.")
+
+    # Nacionales
+    with tabs[1]:
+        st.subheader("🎫 Viajes Nacionales")
+        _tabla_periodo(r, "nacional", "No hay clientes nacionales nuevos en este periodo.")
+        st.markdown("#### Abonos de Nacionales")
+        _tabla_periodo(r, "abono_nacional", "No hay abonos de nacionales en este periodo.")
+
+    # Internacionales
+    with tabs[2]:
+        st.subheader("🌎 Viajes Internacionales")
+        _tabla_periodo(r, "internacional", "No hay clientes internacionales nuevos en este periodo.")
+        st.markdown("#### Abonos de Internacionales")
+        _tabla_periodo(r, "abono_internacional", "No hay abonos de internacionales en este periodo.")
+
+    # Gastos
+    with tabs[3]:
+        st.subheader("💰 Gastos Operativos")
+        _tabla_periodo(r, "gasto", "No hay gastos registrados en este periodo.")
+        if r.gastos_por_categoria:
+            st.markdown("#### Total por Categoría")
+            for cat, total in r.gastos_por_categoria.items():
+                st.write(f"- **{cat}**: ${total:,.0f}")
+
+    # Comisiones
+    with tabs[4]:
+        st.subheader("👩‍💼 Comisiones Pagadas")
+        _tabla_periodo(r, "comision", "No hay comisiones pagadas en este periodo.")
+
+
+# ════════════════════════════════════════════════════════════════════════════
+#  PÁGINA PRINCIPAL DE REPORTES — con control de roles
+# ════════════════════════════════════════════════════════════════════════════
+
+REPORTES_EN_PANEL = 15   # Trabajos que se listan en "Reportes generados"
+_MIME_REPORTES = {
+    ".xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    ".pdf":  "application/pdf",
+    ".zip":  "application/zip",
+}
+
+@st.cache_resource(show_spinner=False)
+def _obtener_cola_reportes():
+    """Cola de reportes en segundo plano (una por proceso)."""
+    return ColaReportes()
+
+def _encolar_reporte(descripcion, nombre_archivo, funcion, *args, **kwargs):
+    """Manda un reporte a la cola en lugar de generarlo dentro de la sesión."""
+    usuario = st.session_state.usuario_actual
+    clave = f"{funcion.__name__}:{args!r}:{sorted(kwargs.items())!r}"
+    _obtener_cola_reportes().encolar(funcion, args, kwargs, descripcion=descripcion,
+                                     nombre_archivo=nombre_archivo,
+                                     usuario=usuario.get("usuario"), clave=clave)
+    st.success(f"📨 En cola: **{descripcion}**. Puedes seguir trabajando; "
+               "lo descargas en 'Reportes generados' cuando esté listo.")
+
+def _panel_reportes_generados(key):
+    """Reportes en cola y terminados (la vendedora sólo ve los suyos)."""
+    usuario = st.session_state.usuario_actual
+    cola = _obtener_cola_reportes()
+    filtro = None if usuario.get("rol") == "ADMIN" else usuario.get("usuario")
+    habia_pendientes = cola.pendientes(filtro) > 0
+
+    # Mientras haya reportes en curso el panel se refresca solo
+    @st.fragment(run_every=2 if habia_pendientes else None)
+    def _panel():
+        trabajos = cola.trabajos(filtro)
+        if not trabajos:
+            return
+        pendientes = sum(1 for t in trabajos if t["estado"] in (EN_COLA, GENERANDO))
+        titulo = f"📂 Reportes generados ({len(trabajos)})" + (f" — ⏳ {pendientes} en curso" if pendientes else "")
+        with st.expander(titulo, expanded=pendientes > 0):
+            for t in trabajos[:REPORTES_EN_PANEL]:
+                col1, col2, col3 = st.columns([4, 3, 1])
+                with col1:
+                    st.markdown(f"**{t['descripcion']}**")
+                    detalle = f"{t['creado'][:16]}"
+                    if filtro is None and t.get("usuario"):
+                        detalle += f" · {t['usuario']}"
+                    st.caption(detalle)
+                with col2:
+                    if t["estado"] == EN_COLA:
+                        st.caption("⏳ En cola")
+                    elif t["estado"] == GENERANDO:
+                        st.progress(t["progreso"], text=t["mensaje"] or "Generando...")
+                    elif t["estado"] == LISTO:
+                        st.download_button(f"⬇️ Descargar ({t['tamano']/1024:,.0f} KB)",
+                            data=partial(cola.leer, t["id"]), file_name=t["nombre_archivo"],
+                            mime=_MIME_REPORTES.get(os.path.splitext(t["nombre_archivo"])[1],
+                                                    "application/octet-stream"),
+                            key=f"dl_{key}_{t['id']}")
+                    else:
+                        st.error(f"❌ {t['error']}")
+                with col3:
+                    if t["estado"] in (LISTO, ERROR):
+                        if st.button("🗑️", key=f"del_{key}_{t['id']}", help="Eliminar"):
+                            cola.eliminar(t["id"])
+                            st.rerun()
+        if habia_pendientes and not pendientes:
+            st.rerun()  # Deja de refrescar cuando ya no hay nada en curso
+    _panel()
+
+def _lote_pdf(origen, origen_id, documento, formato, agente, progreso=None):
+    """Recibos o cupones de todo un bloqueo / grupo / viaje nacional (corre en la cola)."""
+    conn = conectar_db()
+    try:
+        tareas = tareas_lote(conn, origen, origen_id, documento, agente,
+                             reservar_folios=reservar_nums_recibo, logo_path=LOGO_PATH)
+    finally:
+        conn.close()
+    return generar_lote(tareas, formato, progreso=progreso)
+
+def _tab_lotes_pdf():
+    """Impresión en lote de recibos y cupones."""
+    st.subheader("🖨️ Recibos y Cupones en lote")
+    if not (RECIBOS_DISPONIBLES and CUPONES_DISPONIBLES):
+        st.warning("⚠️ Generadores PDF no disponibles (falta reportlab).")
+        return
+    col1, col2 = st.columns(2)
+    with col1:
+        origen = st.selectbox("Origen:", list(ORIGENES), format_func=ORIGENES.get, key="lote_origen")
+    with col2:
+        documentos = ["recibo"] if origen == "viaje" else list(DOCUMENTOS)
+        documento = st.selectbox("Documento:", documentos, format_func=DOCUMENTOS.get, key="lote_doc")
+
+    if origen == "bloqueo":
+        df_o = _query_rep("SELECT id, hotel || ' (' || fecha_inicio || ')' AS nombre FROM bloqueos ORDER BY fecha_inicio DESC")
+    elif origen == "grupo":
+        df_o = _query_rep("SELECT id, nombre_grupo || ' — ' || hotel || ' (' || fecha_inicio || ')' AS nombre FROM grupos ORDER BY fecha_inicio DESC")
+    else:
+        df_o = _query_rep("SELECT id, nombre_viaje || ' — ' || destino || ' (' || fecha_salida || ')' AS nombre FROM viajes_nacionales ORDER BY fecha_salida DESC")
+    if df_o.empty:
+        st.info(f"Sin registros de tipo {ORIGENES[origen].lower()}.")
+        return
+    op = dict(zip(df_o["nombre"], df_o["id"]))
+    sel = st.selectbox(f"{ORIGENES[origen]}:", list(op.keys()), key="lote_sel")
+    formato = st.radio("Formato:", list(FORMATOS), format_func=FORMATOS.get, horizontal=True, key="lote_fmt")
+
+    conn = conectar_db()
+    try:
+        cantidad, omitidas = contar_lote(conn, origen, int(op[sel]), documento)
+    finally:
+        conn.close()
+    if documento == "recibo":
+        st.caption(f"{cantidad} recibos (uno por abono registrado). "
+                   "Cada uno toma un número de recibo nuevo.")
+    else:
+        st.caption(f"{cantidad} cupones" + (f" · {omitidas} ventas sin clave de confirmación se omiten" if omitidas else ""))
+
+    if st.button(f"🖨️ Generar {DOCUMENTOS[documento].lower()}", type="primary",
+                 key="lote_btn", disabled=cantidad == 0):
+        agente = st.session_state.usuario_actual.get("nombre", "Agente")
+        _encolar_reporte(f"{DOCUMENTOS[documento]} — {sel}",
+                         f"{documento}s_{origen}{op[sel]}_{datetime.now().strftime('%Y%m%d')}.{formato}",
+                         _lote_pdf, origen, int(op[sel]), documento, formato, agente)
+
+def _rango_viaje_rep(key):
+    """Filtro opcional por fecha de viaje para los reportes de Riviera Maya."""
+    if not st.checkbox("📅 Filtrar por fecha de viaje", key=f"{key}_rango"):
+        return None, None, ""
+    hoy = datetime.now().date()
+    col1, col2 = st.columns(2)
+    with col1:
+        desde = st.date_input("Desde", value=hoy.replace(day=1), key=f"{key}_desde")
+    with col2:
+        hasta = st.date_input("Hasta", value=hoy, key=f"{key}_hasta")
+    if desde > hasta:
+        st.warning("⚠️ La fecha 'Desde' es posterior a 'Hasta'; el reporte saldrá vacío.")
+    return desde, hasta, f" ({desde.strftime('%d/%m/%Y')} – {hasta.strftime('%d/%m/%Y')})"
+
+def pagina_reportes():
+    """Reportes — Admin ve todo, vendedora solo sus propios reportes."""
+    usuario  = st.session_state.usuario_actual
+    es_admin = usuario.get("rol") == "ADMIN"
+    id_vend  = usuario.get("id_vendedora")
+
+    st.title("📊 Reportes y Análisis")
+    _panel_reportes_generados("reportes")
+
+    # ── VENDEDORA ────────────────────────────────────────────────────────────
+    if not es_admin:
+        st.info(f"👋 Hola **{usuario['nombre']}** — descarga el reporte de tus ventas.")
+        tabs_v = st.tabs(["🏖️ Mis Ventas Riviera","🎫 Mis Nacionales","🌎 Mis Internacionales"])
+
+        with tabs_v[0]:
+            st.markdown("Reporte de **tus** ventas Riviera Maya con resumen, clientes, habitaciones e historial.")
+            desde, hasta, rango = _rango_viaje_rep("v_rv")
+            if st.button("📥 Generar mi reporte Riviera", type="primary", key="v_rv"):
+                _encolar_reporte(f"Riviera Maya — {usuario['nombre']}{rango}",
+                                 f"mis_ventas_riviera_{datetime.now().strftime('%Y%m%d')}.xlsx",
+                                 _excel_riviera, id_vend=id_vend, label=usuario['nombre']+rango,
+                                 desde=desde, hasta=hasta)
+
+        with tabs_v[1]:
+            df_vj_v=_query_rep(f"""SELECT DISTINCT vj.id, vj.nombre_viaje, vj.destino, vj.fecha_salida
+                FROM viajes_nacionales vj JOIN clientes_nacionales cn ON cn.viaje_id=vj.id
+                WHERE cn.vendedora_id={id_vend} ORDER BY vj.fecha_salida DESC""")
+            if df_vj_v.empty:
+                st.info("No tienes clientes en viajes nacionales.")
+            else:
+                op={f"{r['nombre_viaje']} — {r['destino']} ({r['fecha_salida']})": r['id'] for _,r in df_vj_v.iterrows()}
+                sel=st.selectbox("Viaje:", list(op.keys()), key="v_nac_sel")
+                if st.button("📥 Generar reporte", type="primary", key="v_nac_btn"):
+                    _encolar_reporte(f"Nacional — {sel}",
+                                     f"mis_nacionales_{datetime.now().strftime('%Y%m%d')}.xlsx",
+                                     _excel_nacionales_viaje, op[sel], sel.split("—")[0].strip(),
+                                     id_vend_filtro=id_vend)
+
+        with tabs_v[2]:
+            df_vj_vi=_query_rep(f"""SELECT DISTINCT vi.id, vi.destino as nombre_viaje, vi.destino, vi.fecha_salida
+                FROM viajes_internacionales vi JOIN clientes_internacionales ci ON ci.viaje_id=vi.id
+                WHERE ci.vendedora_id={id_vend} ORDER BY vi.fecha_salida DESC""")
+            if df_vj_vi.empty:
+                st.info("No tienes clientes en viajes internacionales.")
+            else:
+                op_i={f"{r['nombre_viaje']} — {r['destino']} ({r['fecha_salida']})": r['id'] for _,r in df_vj_vi.iterrows()}
+                sel_i=st.selectbox("Viaje:", list(op_i.keys()), key="v_int_sel")
+                if st.button("📥 Generar reporte", type="primary", key="v_int_btn"):
+                    _encolar_reporte(f"Internacional — {sel_i}",
+                                     f"mis_internacionales_{datetime.now().strftime('%Y%m%d')}.xlsx",
+                                     _excel_internacionales_viaje, op_i[sel_i], sel_i.split("—")[0].strip(),
+                                     id_vend_filtro=id_vend)
+        return
+
+    # ── ADMIN ────────────────────────────────────────────────────────────────
+    tabs = st.tabs(["🏖️ Riviera Maya","🎫 Nacionales","🌎 Internacionales","💰 Financiero","🖨️ Recibos y Cupones"])
+
+    with tabs[0]:
+        st.subheader("🏖️ Reportes — Riviera Maya")
+        desde, hasta, rango = _rango_viaje_rep("rv")
+        subtabs=st.tabs(["📋 General","🔒 Bloqueos","👥 Grupos","🗂️ Todas","👩‍💼 Por Vendedora"])
+        def _btn_rv(label, tipo, key, valor=None):
+            st.caption("4 hojas: Resumen · Clientes y pagos · Habitaciones · Historial pagos")
+            if st.button(f"📥 {label}", type="primary", key=key):
+                _encolar_reporte(f"Riviera Maya — {label}{rango}",
+                                 f"riviera_{key}_{datetime.now().strftime('%Y%m%d')}.xlsx",
+                                 _excel_riviera, tipo, valor_filtro=valor, label=label+rango,
+                                 desde=desde, hasta=hasta)
+        with subtabs[0]: _btn_rv("Generar Excel General","todos","rv_gen")
+        with subtabs[1]: _btn_rv("Generar Excel Bloqueos","bloqueos","rv_bloq")
+        with subtabs[2]: _btn_rv("Generar Excel Grupos","grupos","rv_grp")
+        with subtabs[3]: _btn_rv("Generar Excel — Todas las Ventas","todos","rv_all")
+        with subtabs[4]:
+            df_vends=_query_rep("SELECT nombre FROM vendedoras ORDER BY nombre")
+            if not df_vends.empty:
+                vsel=st.selectbox("Vendedora:", df_vends["nombre"].tolist(), key="rv_vend_sel")
+                _btn_rv(f"Generar Excel — {vsel}","vendedora","rv_vend",valor=vsel)
+
+    with tabs[1]:
+        st.subheader("🎫 Reportes — Nacionales")
+        subtabs_n=st.tabs(["📋 Por Viaje","🌐 Resumen Global"])
+        with subtabs_n[0]:
+            df_vj=_query_rep("SELECT id,nombre_viaje,destino,fecha_salida,estado,cupos_vendidos,cupos_totales FROM viajes_nacionales ORDER BY fecha_salida DESC")
+            if df_vj.empty:
+                st.info("Sin viajes nacionales.")
+            else:
+                op={f"{r['nombre_viaje']} — {r['destino']} ({r['fecha_salida']}) [{r['estado']}]": r['id'] for _,r in df_vj.iterrows()}
+                sel=st.selectbox("Viaje:", list(op.keys()), key="nac_sel")
+                rs=df_vj[df_vj['id']==op[sel]].iloc[0]
+                st.caption(f"Cupos: {int(rs['cupos_vendidos'])}/{int(rs['cupos_totales'])} vendidos")
+                st.caption("5 hojas: Info general · Clientes · Pasajeros · Habitaciones · Historial pagos")
+                if st.button("📥 Generar Excel", type="primary", key="nac_btn"):
+                    _encolar_reporte(f"Nacional — {sel}",
+                                     f"nacional_{datetime.now().strftime('%Y%m%d')}.xlsx",
+                                     _excel_nacionales_viaje, op[sel], sel.split("—")[0].strip())
+        with subtabs_n[1]:
+            st.caption("Resumen de todos los viajes nacionales con ocupación y saldo.")
+            if st.button("📥 Generar Excel Global", type="primary", key="nac_global"):
+                with st.spinner("Generando..."):
+                    try:
+                        ws=_hoja_titulo(LibroExcel(),"Resumen Global","TURISMAR — Resumen Global Nacionales",
+                                        [28,20,12,12,10,8,8,8,16,16,16],con_fecha=True)
+                        hdrs=["Viaje","Destino","Salida","Regreso","Estado",
+                              "Cupos Tot","Cupos Vend","Clientes","Total Vendido","Total Cobrado","Saldo"]
+                        ws.encabezado(hdrs,bg="E91E8C")
+                        for row in _filas_rep("""SELECT vj.nombre_viaje,vj.destino,vj.fecha_salida,vj.fecha_regreso,
+                            vj.estado,vj.cupos_totales,vj.cupos_vendidos,
+                            COUNT(cn.id) AS clientes,
+                            SUM(cn.total_pagar) AS total_vendido,
+                            SUM(cn.total_abonado) AS total_cobrado,
+                            SUM(cn.saldo) AS saldo_pendiente
+                            FROM viajes_nacionales vj
+                            LEFT JOIN clientes_nacionales cn ON cn.viaje_id=vj.id
+                            GROUP BY vj.id ORDER BY vj.fecha_salida DESC"""):
+                            ws.fila(row,bg=ws.bg_alterno("FFF0F7"),moneda=(9,10,11))
+                        xls2=ws.libro.a_bytes()
+                        st.download_button("⬇️ Descargar Excel", data=xls2,
+                            file_name=f"nacionales_global_{datetime.now().strftime('%Y%m%d')}.xlsx",
+                            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                            key="dl_nac_g")
+                        st.success("✅ Listo")
+                    except Exception as e:
+                        st.error(f"❌ {e}")
+
+    with tabs[2]:
+        st.subheader("🌎 Reportes — Internacionales")
+        subtabs_i=st.tabs(["📋 Por Viaje","🌐 Resumen Global"])
+        with subtabs_i[0]:
+            df_vi=_query_rep("SELECT id, destino AS nombre_viaje, destino, fecha_salida, estado FROM viajes_internacionales ORDER BY fecha_salida DESC")
+            if df_vi.empty:
+                st.info("Sin viajes internacionales.")
+            else:
+                op_i={f"{r['nombre_viaje']} — {r['destino']} ({r['fecha_salida']}) [{r['estado']}]": r['id'] for _,r in df_vi.iterrows()}
+                sel_i=st.selectbox("Viaje:", list(op_i.keys()), key="int_sel")
+                st.caption("5 hojas: Info general · Clientes · Pasajeros · Habitaciones · Historial pagos")
+                if st.button("📥 Generar Excel", type="primary", key="int_btn"):
+                    _encolar_reporte(f"Internacional — {sel_i}",
+                                     f"internacional_{datetime.now().strftime('%Y%m%d')}.xlsx",
+                                     _excel_internacionales_viaje, op_i[sel_i], sel_i.split("—")[0].strip())
+        with subtabs_i[1]:
+            st.caption("Resumen de todos los viajes internacionales en USD.")
+            if st.button("📥 Generar Excel Global", type="primary", key="int_global"):
+                with st.spinner("Generando..."):
+                    try:
+                        ws=_hoja_titulo(LibroExcel(),"Resumen Global","TURISMAR — Resumen Global Internacionales",
+                                        [28,20,12,10,8,14,14,14],con_fecha=True)
+                        hdrs=["Viaje","Destino","Salida","Estado","Clientes","Total USD","Cobrado USD","Saldo USD"]
+                        ws.encabezado(hdrs,bg="1F4E79")
+                        for row in _filas_rep("""SELECT vi.destino AS nombre_viaje, vi.destino, vi.fecha_salida, vi.estado,
+                            COUNT(ci.id) AS clientes,
+                            SUM(ci.total_usd) AS total_usd,
+                            SUM(ci.abonado_usd) AS cobrado_usd,
+                            SUM(ci.saldo_usd) AS saldo_usd
+                            FROM viajes_internacionales vi
+                            LEFT JOIN clientes_internacionales ci ON ci.viaje_id=vi.id
+                            GROUP BY vi.id ORDER BY vi.fecha_salida DESC"""):
+                            ws.fila(row,bg=ws.bg_alterno("EFF9FF"),moneda=(6,7,8))
+                        xls3=ws.libro.a_bytes()
+                        st.download_button("⬇️ Descargar Excel", data=xls3,
+                            file_name=f"internacionales_global_{datetime.now().strftime('%Y%m%d')}.xlsx",
+                            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                            key="dl_int_g")
+                        st.success("✅ Listo")
+                    except Exception as e:
+                        st.error(f"❌ {e}")
+
+    with tabs[3]:
+        st.subheader("💰 Reporte Financiero")
+        col1,col2=st.columns([1,2])
+        with col1:
+            anio_sel=st.selectbox("Año:", list(range(datetime.now().year, 2022, -1)), key="fin_anio")
+        with col2:
+            st.info("3 hojas: Resumen anual · Comparativa vs año anterior · Por vendedora")
+        MESES_ES=["Ene","Feb","Mar","Abr","May","Jun","Jul","Ago","Sep","Oct","Nov","Dic"]
+        df_prev=_query_rep(f"""SELECT strftime('%m',fecha_registro) AS mes, COUNT(*) AS ventas,
+            SUM(precio_total) AS vendido, SUM(pagado) AS cobrado, SUM(ganancia) AS ganancia
+            FROM ventas WHERE strftime('%Y',fecha_registro)='{anio_sel}'
+            GROUP BY mes ORDER BY mes""")
+        if not df_prev.empty:
+            df_prev["mes_nombre"]=df_prev["mes"].astype(int).apply(lambda x: MESES_ES[x-1])
+            c1,c2,c3,c4=st.columns(4)
+            c1.metric("Ventas Riviera",int(df_prev["ventas"].sum()))
+            c2.metric("Total vendido",f"${df_prev['vendido'].sum():,.0f}")
+            c3.metric("Total cobrado",f"${df_prev['cobrado'].sum():,.0f}")
+            c4.metric("Ganancia",f"${df_prev['ganancia'].sum():,.0f}")
+            st.divider()
+            df_ch=df_prev[["mes_nombre","vendido","cobrado","ganancia"]].copy()
+            df_ch.columns=["Mes","Vendido","Cobrado","Ganancia"]
+            st.bar_chart(df_ch.set_index("Mes"))
+        else:
+            st.info(f"Sin datos de Riviera Maya para {anio_sel}.")
+        st.divider()
+        if st.button("📥 Generar Excel Financiero Completo", type="primary", key="fin_btn"):
+            _encolar_reporte(f"Financiero {anio_sel}", f"financiero_turismar_{anio_sel}.xlsx",
+                             _excel_financiero, anio_sel)
+
+    with tabs[4]:
+        _tab_lotes_pdf()
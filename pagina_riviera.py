@@ -0,0 +1,1011 @@
+"""
+PÁGINA RIVIERA MAYA - Sistema Agencia Riviera Maya
+Registro de ventas (individuales, grupos y bloqueos), abonos, recibos y
+cupones de hotel.
+"""
+
+from datetime import datetime
+
+import streamlit as st
+
+from app_nucleo import (ES_POSTGRES, LOGO_PATH, PSYCOPG2_DISPONIBLE, conectar_db,
+                        obtener_bloqueos_disponibles, obtener_grupos_disponibles, obtener_hotel,
+                        obtener_hoteles, obtener_operadores, obtener_vendedoras, read_sql_query,
+                        siguiente_num_recibo)
+from alertas import alertas_riviera
+from componentes_pdf import CUPONES_DISPONIBLES, boton_recibo, generar_cupon_pdf
+from grilla_ventas import (PAGINA_VENTAS, estados_activos, pagina_ventas, totales_ventas,
+                           vendedoras_con_ventas, ventas_filtradas)
+from inventario_habitaciones import (APARTADO_MINUTOS, apartar_habitaciones, confirmar_apartado,
+                                     consultar_apartado, descontar_habitaciones, liberar_apartado)
+from migracion_fechas_iso import fecha_a_iso
+from transacciones import transaccion
+
+
+def _apartado_sesion(tipo, inventario_id):
+    """Clave del apartado de la sesión si es de este bloqueo/grupo, o None."""
+    apartado = st.session_state.get("rv_apartado")
+    if apartado and (apartado["tipo"], apartado["id"]) == (tipo, inventario_id):
+        return apartado["clave"]
+    return None
+
+
+def _liberar_apartado_sesion():
+    """Devuelve al inventario la habitación que la sesión tenía apartada."""
+    apartado = st.session_state.pop("rv_apartado", None)
+    if not apartado:
+        return
+    conn = conectar_db()
+    try:
+        with transaccion(conn, ES_POSTGRES and PSYCOPG2_DISPONIBLE):
+            liberar_apartado(conn.cursor(), apartado["clave"])
+    finally:
+        conn.close()
+
+
+def _control_apartado(tipo, inventario_id, usuario):
+    """
+    Aparta una habitación del bloqueo/grupo elegido mientras se capturan los
+    datos de la venta (vence sola en APARTADO_MINUTOS).
+    """
+    apartado = st.session_state.get("rv_apartado")
+    if apartado and (apartado["tipo"], apartado["id"]) != (tipo, inventario_id):
+        _liberar_apartado_sesion()      # cambió de bloqueo/grupo
+        apartado = None
+
+    vigente = None
+    if apartado:
+        conn = conectar_db()
+        try:
+            vigente = consultar_apartado(conn.cursor(), apartado["clave"])
+        finally:
+            conn.close()
+        if vigente is None:
+            st.session_state.pop("rv_apartado", None)
+            st.warning("⌛ El apartado venció y la habitación volvió al inventario.")
+
+    col_a1, col_a2 = st.columns([3, 1])
+    if vigente:
+        col_a1.success(f"🔒 Tienes una habitación apartada para esta venta hasta las {vigente['expira'][11:16]}.")
+        if col_a2.button("🔓 Liberar", use_container_width=True, key="rv_liberar_apartado"):
+            _liberar_apartado_sesion()
+            st.rerun()
+        return
+
+    col_a1.caption("Aparta la habitación mientras capturas los pasajeros; nadie más podrá venderla.")
+    if col_a2.button(f"🔒 Apartar ({APARTADO_MINUTOS:g} min)", use_container_width=True, key="rv_apartar"):
+        conn = conectar_db()
+        try:
+            with transaccion(conn, ES_POSTGRES and PSYCOPG2_DISPONIBLE):
+                clave = apartar_habitaciones(conn.cursor(), tipo, inventario_id,
+                                             apartado_por=usuario.get("usuario"))
+        finally:
+            conn.close()
+        if clave:
+            st.session_state.rv_apartado = {"tipo": tipo, "id": inventario_id, "clave": clave}
+            st.rerun()
+        st.error("❌ Ya no quedan habitaciones disponibles; elige otro.")
+
+
+def formulario_nueva_venta():
+    """Formulario completo para registrar nueva venta Riviera Maya — con Grupos y Bloqueos"""
+    st.subheader("➕ Nueva Venta - Riviera Maya")
+    usuario = st.session_state.usuario_actual
+
+    # ── Tipo de venta ─────────────────────────────────────────────────────────
+    st.markdown("#### 🏷️ Tipo de Venta")
+
+    col_t1, col_t2, col_t3 = st.columns(3)
+    with col_t1:
+        st.markdown("""
+        <div style="background:linear-gradient(135deg,#E3F2FD,#BBDEFB);border-left:4px solid #00B4D8;
+        border-radius:10px;padding:14px 18px;text-align:center;">
+        <div style="font-size:1.8rem">🏨</div>
+        <div style="font-weight:700;color:#00B4D8;font-size:0.95rem">VENTA GENERAL</div>
+        <div style="font-size:0.78rem;color:#4a6fa5;margin-top:4px">Hotel libre, fechas y precios propios</div>
+        </div>""", unsafe_allow_html=True)
+    with col_t2:
+        st.markdown("""
+        <div style="background:linear-gradient(135deg,#fff8e1,#fff0b3);border-left:4px solid #FFB703;
+        border-radius:10px;padding:14px 18px;text-align:center;">
+        <div style="font-size:1.8rem">📦</div>
+        <div style="font-weight:700;color:#856404;font-size:0.95rem">BLOQUEO</div>
+        <div style="font-size:0.78rem;color:#9a7520;margin-top:4px">Habitaciones pre-compradas al mayorista</div>
+        </div>""", unsafe_allow_html=True)
+    with col_t3:
+        st.markdown("""
+        <div style="background:linear-gradient(135deg,#f0fff4,#d8f5e5);border-left:4px solid #2D6A4F;
+        border-radius:10px;padding:14px 18px;text-align:center;">
+        <div style="font-size:1.8rem">👥</div>
+        <div style="font-weight:700;color:#2D6A4F;font-size:0.95rem">GRUPO</div>
+        <div style="font-size:0.78rem;color:#3d8b65;margin-top:4px">Venta dentro de un grupo registrado</div>
+        </div>""", unsafe_allow_html=True)
+
+    tipo_venta = st.radio(
+        "Selecciona el tipo:",
+        ["🏨 Venta General", "📦 Bloqueo", "👥 Grupo"],
+        horizontal=True,
+        label_visibility="collapsed",
+        key="rv_tipo_venta"
+    )
+    es_general = "General" in tipo_venta
+    es_bloqueo = "Bloqueo" in tipo_venta
+    es_grupo   = "Grupo"   in tipo_venta
+    if es_general:
+        _liberar_apartado_sesion()
+
+    st.divider()
+
+    # ── Selección de Bloqueo ──────────────────────────────────────────────────
+    bloqueo_sel = None
+    if es_bloqueo:
+        apartado = st.session_state.get("rv_apartado") or {}
+        bloqueos = obtener_bloqueos_disponibles(incluir=apartado.get("id") if apartado.get("tipo") == "bloqueo" else None)
+        if not bloqueos:
+            st.error("❌ No hay bloqueos disponibles actualmente. Registra uno en Configuración → Bloqueos.")
+            return
+        st.markdown("#### 📦 Seleccionar Bloqueo")
+        # Opciones por id: la disponibilidad del texto cambia al apartar o vender
+        # y no debe mover la selección
+        opciones_bloqueo = {b['id']: b for b in bloqueos}
+        bloqueo_id  = st.selectbox(
+            "Bloqueo disponible:", list(opciones_bloqueo.keys()), key="rv_bloqueo_sel",
+            format_func=lambda i: (f"ID {i} | 🏨 {opciones_bloqueo[i]['hotel']} | "
+                                   f"{opciones_bloqueo[i]['fecha_inicio']} → {opciones_bloqueo[i]['fecha_fin']} | "
+                                   f"{opciones_bloqueo[i]['noches']}n | Disp: {opciones_bloqueo[i]['disponibles']} hab"))
+        bloqueo_sel = opciones_bloqueo[bloqueo_id]
+        st.markdown(f"""
+        <div class="card-bloqueo">
+        🏨 <b>{bloqueo_sel['hotel']}</b> &nbsp;|&nbsp;
+        📅 {bloqueo_sel['fecha_inicio']} → {bloqueo_sel['fecha_fin']} &nbsp;|&nbsp;
+        🌙 {bloqueo_sel['noches']} noches &nbsp;|&nbsp;
+        🏠 {bloqueo_sel['disponibles']} habitaciones disponibles
+        </div>""", unsafe_allow_html=True)
+        _control_apartado("bloqueo", bloqueo_sel['id'], usuario)
+        st.divider()
+
+    # ── Selección de Grupo ────────────────────────────────────────────────────
+    grupo_sel = None
+    if es_grupo:
+        apartado = st.session_state.get("rv_apartado") or {}
+        grupos = obtener_grupos_disponibles(incluir=apartado.get("id") if apartado.get("tipo") == "grupo" else None)
+        if not grupos:
+            st.error("❌ No hay grupos activos con habitaciones disponibles. Regístralos en Configuración → Grupos.")
+            return
+        st.markdown("#### 👥 Seleccionar Grupo")
+        opciones_grupo = {g['id']: g for g in grupos}
+        grupo_id  = st.selectbox(
+            "Grupo disponible:", list(opciones_grupo.keys()), key="rv_grupo_sel",
+            format_func=lambda i: (f"ID {i} | 👥 {opciones_grupo[i]['nombre_grupo']} | 🏨 {opciones_grupo[i]['hotel']} | "
+                                   f"{opciones_grupo[i]['fecha_inicio']} → {opciones_grupo[i]['fecha_fin']} | "
+                                   f"Disp: {opciones_grupo[i]['habitaciones_disponibles']} hab"))
+        grupo_sel = opciones_grupo[grupo_id]
+
+        col_g1, col_g2, col_g3, col_g4 = st.columns(4)
+        col_g1.metric("Hotel", grupo_sel['hotel'])
+        col_g2.metric("Noches", grupo_sel['noches'])
+        col_g3.metric("Hab. disponibles", grupo_sel['habitaciones_disponibles'])
+        col_g4.metric("Operador", grupo_sel['operador'] or "—")
+
+        st.markdown(f"""
+        <div class="card-grupo">
+        👤 <b>Responsable:</b> {grupo_sel['responsable']} &nbsp;|&nbsp;
+        📱 {grupo_sel['celular_responsable']} &nbsp;|&nbsp;
+        📅 {grupo_sel['fecha_inicio']} → {grupo_sel['fecha_fin']}
+        </div>""", unsafe_allow_html=True)
+        _control_apartado("grupo", grupo_sel['id'], usuario)
+        st.divider()
+
+    # ── Datos del cliente ─────────────────────────────────────────────────────
+    st.markdown("#### 👤 Datos del Cliente")
+    col1, col2 = st.columns(2)
+    with col1:
+        cliente = st.text_input("Nombre del cliente *", key="rv_cliente")
+    with col2:
+        celular = st.text_input("Celular del cliente *", key="rv_celular")
+
+    # ── Hotel y Operador (solo General) ──────────────────────────────────────
+    if es_general:
+        st.markdown("#### 🏨 Hotel y Operador")
+        col1, col2 = st.columns(2)
+        with col1:
+            hoteles = obtener_hoteles()
+            destino = st.selectbox("Hotel / Destino *", hoteles, key="rv_destino") if hoteles else st.text_input("Hotel / Destino *", key="rv_destino_txt")
+        with col2:
+            operadores = obtener_operadores()
+            if operadores:
+                ops_dict = {"Sin operador": None}
+                ops_dict.update({op[1]: op[1] for op in operadores})
+                operador = ops_dict[st.selectbox("Operador mayorista", list(ops_dict.keys()), key="rv_operador")]
+            else:
+                operador = st.text_input("Operador mayorista (opcional)", key="rv_operador_txt")
+    elif es_bloqueo:
+        destino  = bloqueo_sel['hotel']
+        operador = None
+    else:  # grupo
+        destino  = grupo_sel['hotel']
+        operador = grupo_sel['operador']
+
+    # ── Fechas ────────────────────────────────────────────────────────────────
+    if es_general:
+        st.markdown("#### 📅 Fechas")
+        col1, col2 = st.columns(2)
+        with col1:
+            fecha_inicio = st.date_input("Fecha de salida *", key="rv_fi")
+        with col2:
+            fecha_fin = st.date_input("Fecha de regreso *", key="rv_ff")
+        noches = (fecha_fin - fecha_inicio).days
+        if noches > 0:
+            st.success(f"✅ {noches} noches")
+        elif noches == 0:
+            st.warning("⚠️ 0 noches — verifica las fechas")
+        else:
+            st.error("❌ Fecha de regreso anterior a la de salida")
+    elif es_bloqueo:
+        from datetime import datetime as dt
+        fecha_inicio = dt.strptime(bloqueo_sel['fecha_inicio'], "%d-%m-%Y").date()
+        fecha_fin    = dt.strptime(bloqueo_sel['fecha_fin'],    "%d-%m-%Y").date()
+        noches = bloqueo_sel['noches']
+        st.info(f"📅 {bloqueo_sel['fecha_inicio']} → {bloqueo_sel['fecha_fin']} | 🌙 {noches} noches")
+    else:  # grupo
+        from datetime import datetime as dt
+        fecha_inicio = dt.strptime(grupo_sel['fecha_inicio'], "%d-%m-%Y").date()
+        fecha_fin    = dt.strptime(grupo_sel['fecha_fin'],    "%d-%m-%Y").date()
+        noches = grupo_sel['noches']
+        st.info(f"📅 {grupo_sel['fecha_inicio']} → {grupo_sel['fecha_fin']} | 🌙 {noches} noches")
+
+    # ── Pasajeros y habitación ────────────────────────────────────────────────
+    st.markdown("#### 🛏️ Habitación y Pasajeros")
+    col1, col2 = st.columns(2)
+    with col1:
+        adultos = st.selectbox("Número de adultos *", [2, 3, 4], key="rv_adultos")
+    with col2:
+        max_menores = {2: 2, 3: 1, 4: 0}[adultos]
+        menores = st.selectbox("Número de menores", list(range(max_menores + 1)), key="rv_menores")
+    tipo_habitacion = {2: "DOBLE", 3: "TRIPLE", 4: "CUÁDRUPLE"}[adultos]
+    st.info(f"🛏️ Habitación: **{tipo_habitacion}**  —  {adultos} adultos{f' + {menores} menor(es)' if menores else ''}")
+
+    # ── Precios ───────────────────────────────────────────────────────────────
+    st.markdown("#### 💰 Precios")
+
+    if es_bloqueo:
+        key_hab = {2: 'precio_doble', 3: 'precio_triple', 4: 'precio_cuadruple'}[adultos]
+        key_men = {2: 'menor_doble',  3: 'menor_triple',  4: 'menor_cuadruple'}[adultos]
+        precio_adulto = round((bloqueo_sel[key_hab] / adultos) * noches, 2)
+        precio_menor  = round(bloqueo_sel[key_men] * noches, 2)
+        col1, col2 = st.columns(2)
+        col1.metric("Precio por adulto (total estancia)", f"${precio_adulto:,.2f}")
+        col2.metric("Precio por menor (total estancia)",  f"${precio_menor:,.2f}")
+
+    elif es_grupo:
+        key_noche_ad = {2: 'precio_noche_doble', 3: 'precio_noche_triple', 4: 'precio_noche_cuadruple'}[adultos]
+        key_noche_mn = {2: 'precio_menor_doble', 3: 'precio_menor_triple', 4: 'precio_menor_cuadruple'}[adultos]
+        precio_adulto = round((grupo_sel[key_noche_ad] / adultos) * noches, 2)
+        precio_menor  = round(grupo_sel[key_noche_mn] * noches, 2)
+        col1, col2 = st.columns(2)
+        col1.metric("Precio por adulto (total estancia)", f"${precio_adulto:,.2f}")
+        col2.metric("Precio por menor (total estancia)",  f"${precio_menor:,.2f}")
+        st.caption(f"💡 Basado en precio/noche del grupo × {noches} noches ÷ {adultos} adultos")
+
+    else:  # general
+        col1, col2 = st.columns(2)
+        with col1:
+            precio_adulto = st.number_input("Precio por adulto *", min_value=0.0, step=100.0, format="%.2f", key="rv_precio_ad")
+        with col2:
+            precio_menor  = st.number_input("Precio por menor",   min_value=0.0, step=100.0, format="%.2f", key="rv_precio_mn")
+
+    total_adultos = adultos * precio_adulto
+    total_menores = menores * precio_menor
+    precio_total  = total_adultos + total_menores
+
+    if precio_total > 0:
+        st.markdown("**📊 Desglose del total:**")
+        col1, col2, col3 = st.columns(3)
+        col1.metric(f"{adultos} adultos × ${precio_adulto:,.2f}", f"${total_adultos:,.2f}")
+        if menores > 0:
+            col2.metric(f"{menores} menor(es) × ${precio_menor:,.2f}", f"${total_menores:,.2f}")
+        col3.metric("💵 TOTAL", f"${precio_total:,.2f}")
+
+    # ── Ganancia ──────────────────────────────────────────────────────────────
+    st.markdown("#### 📈 Ganancia")
+    porcentaje_ganancia = st.slider("Porcentaje de ganancia (%)", 1, 50, 15, key="rv_pct_gan")
+    ganancia        = round(precio_total * (porcentaje_ganancia / 100), 2)
+    costo_mayorista = round(precio_total - ganancia, 2)
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Ganancia", f"${ganancia:,.2f}")
+    col2.metric("Costo mayorista", f"${costo_mayorista:,.2f}")
+    col3.metric("Margen", f"{porcentaje_ganancia}%")
+
+    # ── Abono inicial ─────────────────────────────────────────────────────────
+    st.markdown("#### 💳 Abono Inicial")
+    col1, col2 = st.columns(2)
+    with col1:
+        abono_inicial = st.number_input(
+            "Abono inicial ($)", min_value=0.0,
+            max_value=float(precio_total) if precio_total > 0 else 999999.0,
+            step=100.0, format="%.2f", key="rv_abono"
+        )
+    with col2:
+        metodo_pago = st.selectbox("Método de pago *",
+            ["Efectivo", "Transferencia", "Tarjeta de crédito",
+             "Tarjeta de débito", "Depósito bancario", "Otro"], key="rv_metodo_pago")
+
+    saldo_inicial = precio_total - abono_inicial
+    liquidado     = saldo_inicial <= 0.01
+
+    col1, col2 = st.columns(2)
+    col1.metric("Saldo restante", f"${saldo_inicial:,.2f}")
+    if liquidado and precio_total > 0:
+        st.success("🎉 ¡Esta venta quedará LIQUIDADA con el abono inicial!")
+    elif abono_inicial > 0:
+        pct_ab = (abono_inicial / precio_total * 100) if precio_total > 0 else 0
+        st.info(f"📊 Adelanto: {pct_ab:.1f}% del total")
+
+    # ── Vendedora ─────────────────────────────────────────────────────────────
+    st.markdown("#### 🧑‍💼 Vendedora")
+    if usuario["rol"] == "ADMIN":
+        vendedoras = obtener_vendedoras()
+        if not vendedoras:
+            st.error("❌ No hay vendedoras registradas.")
+            return
+        vend_dict    = {v[1]: v[0] for v in vendedoras}
+        id_vendedora = vend_dict[st.selectbox("Vendedora *", list(vend_dict.keys()), key="rv_vendedora")]
+    else:
+        id_vendedora = usuario["id_vendedora"]
+        st.info(f"Vendedora: **{usuario['nombre']}**")
+
+    # ── Pasajeros ─────────────────────────────────────────────────────────────
+    st.markdown("#### 🧳 Nombres de Pasajeros")
+    nombres_pasajeros = []
+    cols_pas = st.columns(2)
+    for i in range(adultos):
+        with cols_pas[i % 2]:
+            n = st.text_input(f"Adulto {i+1}", key=f"rv_adulto_{i}")
+            nombres_pasajeros.append({"nombre": n, "tipo": "ADULTO"})
+    for i in range(menores):
+        with cols_pas[i % 2]:
+            n = st.text_input(f"Menor {i+1}", key=f"rv_menor_{i}")
+            nombres_pasajeros.append({"nombre": n, "tipo": "MENOR"})
+
+    # ── Localización y datos para cupón ──────────────────────────────────
+    st.markdown("#### 🔑 Localización y Datos del Cupón")
+    col1, col2 = st.columns(2)
+    with col1:
+        no_localizador = st.text_input(
+            "No. de Localizador",
+            placeholder="Ej: ABC123456",
+            help="Número de referencia que da el mayorista al reservar",
+            key="rv_localizador"
+        )
+    with col2:
+        clave_confirmacion = st.text_input(
+            "Clave de Confirmación",
+            placeholder="Ej: 69-7543060",
+            help="Se obtiene cuando el viaje está pagado al 100%. Puedes dejarla vacía y agregarla después.",
+            key="rv_clave_confirm"
+        )
+    if clave_confirmacion:
+        st.success("✅ Con clave de confirmación — se podrá generar el cupón al guardar.")
+    elif no_localizador:
+        st.info("💡 La clave de confirmación puede agregarse después cuando el cliente liquide.")
+
+    col1, col2 = st.columns(2)
+    with col1:
+        plan_alimento = st.selectbox(
+            "Plan de alimento",
+            ["Todo incluido", "Solo desayuno", "Media pensión", "Solo alojamiento", "Otro"],
+            key="rv_plan_alimento"
+        )
+    with col2:
+        edades_menores_txt = st.text_input(
+            "Edades de menores",
+            placeholder="Ej: 5 y 8 años",
+            key="rv_edades_menores"
+        ) if menores > 0 else ""
+
+    requerimientos_esp = st.text_area(
+        "Requerimientos especiales (opcional)",
+        placeholder="Ej: Luna de miel, solicito habitación planta baja, etc.",
+        height=70,
+        key="rv_requerimientos"
+    )
+
+    st.divider()
+
+    # ── Guardar ───────────────────────────────────────────────────────────────
+    if st.button("💾 Registrar Venta", type="primary", use_container_width=True, key="rv_guardar"):
+        errores = []
+        if not cliente.strip():   errores.append("El nombre del cliente es obligatorio.")
+        if not celular.strip():   errores.append("El celular del cliente es obligatorio.")
+        if noches <= 0:           errores.append("Las fechas no son válidas.")
+        if precio_total <= 0:     errores.append("El precio total debe ser mayor a 0.")
+        if any(p["nombre"].strip() == "" for p in nombres_pasajeros):
+            errores.append("Todos los nombres de pasajeros son obligatorios.")
+
+        if errores:
+            for e in errores:
+                st.error(f"❌ {e}")
+            return
+
+        try:
+            conn   = conectar_db()
+            cursor = conn.cursor()
+            fecha_registro = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            fecha_i_str    = fecha_inicio.strftime("%d-%m-%Y")
+            fecha_f_str    = fecha_fin.strftime("%d-%m-%Y")
+
+            if es_bloqueo:
+                tipo_venta_db = "Bloqueo"
+                bloqueo_id_db = bloqueo_sel['id']
+                grupo_id_db   = None
+                es_bloqueo_db = 1
+                es_grupo_db   = 0
+            elif es_grupo:
+                tipo_venta_db = "Grupo"
+                bloqueo_id_db = None
+                grupo_id_db   = grupo_sel['id']
+                es_bloqueo_db = 0
+                es_grupo_db   = 1
+            else:
+                tipo_venta_db = "General"
+                bloqueo_id_db = None
+                grupo_id_db   = None
+                es_bloqueo_db = 0
+                es_grupo_db   = 0
+
+            estado_inicial = "LIQUIDADO" if liquidado else "ACTIVO"
+
+            # Inventario: confirma el apartado de la sesión o descuenta con la
+            # sentencia condicional, en la misma transacción que la venta
+            try:
+                with transaccion(conn, ES_POSTGRES and PSYCOPG2_DISPONIBLE):
+                    if es_bloqueo or es_grupo:
+                        tipo_inv = "bloqueo" if es_bloqueo else "grupo"
+                        inv_id   = bloqueo_id_db if es_bloqueo else grupo_id_db
+                        clave    = _apartado_sesion(tipo_inv, inv_id)
+                        if not ((clave and confirmar_apartado(cursor, clave))
+                                or descontar_habitaciones(cursor, tipo_inv, inv_id)):
+                            st.error(f"❌ Ya no quedan habitaciones en este {tipo_inv}: otra venta tomó la última.")
+                            return
+
+                    cursor.execute("""
+                        INSERT INTO ventas (
+                            cliente, celular_responsable, tipo_venta, destino,
+                            fecha_inicio, fecha_fin, noches,
+                            adultos, menores, tipo_habitacion,
+                            precio_adulto, precio_menor, precio_total,
+                            porcentaje_ganancia, ganancia, costo_mayorista,
+                            pagado, saldo, estado, vendedora_id, usuario_id,
+                            es_bloqueo, bloqueo_id, es_grupo, grupo_id,
+                            operador, no_localizador, clave_confirmacion,
+                            plan_alimento, edades_menores, requerimientos_especiales,
+                            fecha_registro, fecha_inicio_iso, fecha_fin_iso
+                        ) VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)
+                    """, (
+                        cliente.strip(), celular.strip(), tipo_venta_db, destino,
+                        fecha_i_str, fecha_f_str, noches,
+                        adultos, menores, tipo_habitacion,
+                        precio_adulto, precio_menor, precio_total,
+                        porcentaje_ganancia, ganancia, costo_mayorista,
+                        abono_inicial, saldo_inicial, estado_inicial,
+                        id_vendedora, usuario.get("id_vendedora", id_vendedora),
+                        es_bloqueo_db, bloqueo_id_db, es_grupo_db, grupo_id_db,
+                        operador,
+                        no_localizador.strip() or None,
+                        clave_confirmacion.strip() or None,
+                        plan_alimento,
+                        edades_menores_txt.strip() if menores > 0 else None,
+                        requerimientos_esp.strip() or None,
+                        fecha_registro, fecha_a_iso(fecha_inicio), fecha_a_iso(fecha_fin)
+                    ))
+                    venta_id = cursor.lastrowid
+
+                    # Abono inicial si hay monto. Las columnas se revisan antes: en
+                    # PostgreSQL un INSERT fallido descartaría toda la transacción
+                    if abono_inicial > 0:
+                        cursor.execute("SELECT * FROM abonos WHERE 1 = 0")
+                        if "metodo_pago" in [d[0] for d in cursor.description]:
+                            cursor.execute(
+                                "INSERT INTO abonos (venta_id, monto, fecha, metodo_pago) VALUES (?,?,?,?)",
+                                (venta_id, abono_inicial, fecha_registro, metodo_pago)
+                            )
+                        else:
+                            cursor.execute(
+                                "INSERT INTO abonos (venta_id, monto, fecha) VALUES (?,?,?)",
+                                (venta_id, abono_inicial, fecha_registro)
+                            )
+
+                    # Pasajeros
+                    for p in nombres_pasajeros:
+                        cursor.execute(
+                            "INSERT INTO pasajeros (venta_id, nombre, tipo) VALUES (?,?,?)",
+                            (venta_id, p["nombre"].strip(), p["tipo"])
+                        )
+
+                    # Si liquidado: calcular comisión
+                    if liquidado:
+                        cursor.execute("""
+                            UPDATE ventas SET comision_vendedora = ROUND(ganancia * 0.10, 2)
+                            WHERE id = ?
+                        """, (venta_id,))
+            finally:
+                conn.close()
+            st.session_state.pop("rv_apartado", None)
+            tipo_icon = {"General": "🏨", "Bloqueo": "📦", "Grupo": "👥"}[tipo_venta_db]
+            st.success(f"✅ Venta {tipo_icon} **{tipo_venta_db}** registrada correctamente (ID: {venta_id})")
+            if liquidado:
+                st.success("🎉 ¡Venta LIQUIDADA desde el inicio!")
+                st.balloons()
+            else:
+                st.info(f"💳 Abono inicial registrado: ${abono_inicial:,.2f} | Saldo: ${saldo_inicial:,.2f}")
+
+            # ── Recibo del abono inicial ───────────────────────────────────
+            if abono_inicial > 0:
+                num_rec_rv  = siguiente_num_recibo()
+                fecha_rec_rv = datetime.now().strftime("%d-%B-%Y").replace(
+                    "January","enero").replace("February","febrero").replace(
+                    "March","marzo").replace("April","abril").replace(
+                    "May","mayo").replace("June","junio").replace(
+                    "July","julio").replace("August","agosto").replace(
+                    "September","septiembre").replace("October","octubre").replace(
+                    "November","noviembre").replace("December","diciembre")
+                concepto_rv = f"Abono inicial - {destino}"
+                vend_rv     = usuario.get("nombre","Agente")
+                st.divider()
+                st.markdown("#### 🧾 Recibo del Abono Inicial")
+                boton_recibo(
+                    numero     = num_rec_rv,
+                    fecha_str  = fecha_rec_rv,
+                    cliente    = cliente.strip(),
+                    monto      = abono_inicial,
+                    concepto   = concepto_rv,
+                    forma_pago = metodo_pago,
+                    agente     = vend_rv,
+                    key_suffix = f"rv_new_{venta_id}",
+                )
+
+        except Exception as e:
+            st.error(f"❌ Error al guardar: {e}")
+            st.caption("💡 Verifica que las columnas `es_grupo`, `grupo_id`, `pagado` existan en la tabla `ventas`.")
+
+
+def pagina_ventas_riviera():
+    """Página de ventas de Riviera Maya"""
+    st.title("\U0001f3d6\ufe0f Ventas - Riviera Maya")
+
+    tabs = st.tabs(["\U0001f4cb Ver Ventas", "\u2795 Nueva Venta", "\U0001f4b0 Registrar Pago"])
+
+    # TAB 0 — VER VENTAS
+    with tabs[0]:
+        alertas_riviera()
+        st.subheader("Ventas Activas")
+        usuario = st.session_state.usuario_actual
+
+        # Filtros, página y totales se resuelven en SQL (grilla_ventas)
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            filtro_estado = st.selectbox("Filtrar por estado", ["Todos"] + estados_activos())
+        with col2:
+            vendedoras_rv = dict(vendedoras_con_ventas())
+            filtro_vendedora_rv = st.selectbox("Filtrar por vendedora", ["Todas"] + list(vendedoras_rv),
+                format_func=lambda v: v if v == "Todas" else vendedoras_rv[v],
+                key="rv_filtro_vend")
+        with col3:
+            filtro_buscar = st.text_input("\U0001f50d Buscar cliente o destino")
+
+        filtros = {
+            "estado": None if filtro_estado == "Todos" else filtro_estado,
+            "vendedora_id": None if filtro_vendedora_rv == "Todas" else filtro_vendedora_rv,
+            "buscar": filtro_buscar,
+        }
+        # Cursores de las páginas ya vistas; se reinician al cambiar un filtro
+        if st.session_state.get("rv_filtros") != filtros:
+            st.session_state.rv_filtros = filtros
+            st.session_state.rv_cursores = [None]
+        cursores = st.session_state.rv_cursores
+
+        totales = totales_ventas(**filtros)
+        col1, col2, col3, col4 = st.columns(4)
+        col1.metric("Ventas", totales["ventas"])
+        col2.metric("Total vendido",   f"${totales['total']:,.2f}")
+        col3.metric("Total cobrado",   f"${totales['pagado']:,.2f}")
+        col4.metric("Saldo pendiente", f"${totales['saldo']:,.2f}")
+
+        st.divider()
+
+        df_f, siguiente = pagina_ventas(antes_de=cursores[-1], **filtros)
+
+        if df_f.empty:
+            st.info("No hay ventas activas.")
+        else:
+            df_show = df_f.copy()
+            for col in ['Total','Pagado','Saldo','Ganancia']:
+                df_show[col] = df_show[col].map("${:,.2f}".format)
+
+            st.dataframe(df_show, use_container_width=True, hide_index=True)
+
+            col_p1, col_p2, col_p3 = st.columns([1, 2, 1])
+            with col_p1:
+                if st.button("⬅️ Anteriores", disabled=len(cursores) == 1, key="rv_pag_ant",
+                             use_container_width=True):
+                    cursores.pop()
+                    st.rerun()
+            with col_p2:
+                desde = (len(cursores) - 1) * PAGINA_VENTAS + 1
+                st.caption(f"Ventas {desde:,}–{desde + len(df_f) - 1:,} de {totales['ventas']:,}")
+            with col_p3:
+                if st.button("Siguientes ➡️", disabled=siguiente is None, key="rv_pag_sig",
+                             use_container_width=True):
+                    cursores.append(siguiente)
+                    st.rerun()
+
+            # Detalle expandible
+            st.divider()
+            st.markdown("#### \U0001f50e Ver detalle de venta")
+            venta_ids = df_f['ID'].tolist()
+            if venta_ids:
+                id_sel = st.selectbox("Selecciona ID", venta_ids)
+                row = df_f[df_f['ID'] == id_sel].iloc[0]
+
+                with st.expander(f"\U0001f4c4 {row['Cliente']} | {row['Destino']}", expanded=True):
+                    c1, c2, c3 = st.columns(3)
+                    c1.write(f"**Cliente:** {row['Cliente']}")
+                    c1.write(f"**Celular:** {row['Celular']}")
+                    c1.write(f"**Operador:** {row['Operador'] or '—'}")
+                    c2.write(f"**Destino:** {row['Destino']}")
+                    c2.write(f"**Habitación:** {row['Habitación']}")
+                    c2.write(f"**Pasajeros:** {row['Adultos']} adultos + {row['Menores']} menores")
+                    c3.write(f"**Salida:** {row['Salida']}")
+                    c3.write(f"**Regreso:** {row['Regreso']}")
+                    c3.write(f"**Noches:** {row['Noches']}")
+
+                    st.divider()
+                    c1, c2, c3, c4 = st.columns(4)
+                    c1.metric("Total",   f"${row['Total']:,.2f}")
+                    c2.metric("Pagado",  f"${row['Pagado']:,.2f}")
+                    c3.metric("Saldo",   f"${row['Saldo']:,.2f}")
+                    c4.metric("Ganancia",f"${row['Ganancia']:,.2f} ({row['% Ganancia']}%)")
+
+                    conn2 = conectar_db()
+                    df_pas = read_sql_query(
+                        "SELECT nombre, tipo FROM pasajeros WHERE venta_id = ?",
+                        conn2, params=(id_sel,))
+                    df_abonos = read_sql_query(
+                        "SELECT fecha, monto FROM abonos WHERE venta_id = ? ORDER BY fecha",
+                        conn2, params=(id_sel,))
+                    conn2.close()
+
+                    c1, c2 = st.columns(2)
+                    with c1:
+                        st.markdown("**👥 Pasajeros:**")
+                        if not df_pas.empty:
+                            st.dataframe(df_pas, hide_index=True, use_container_width=True)
+                        else:
+                            st.caption("Sin pasajeros registrados")
+                    with c2:
+                        st.markdown("**💳 Historial de abonos:**")
+                        if not df_abonos.empty:
+                            # Obtener datos completos de abonos para reimprimir
+                            conn_abonos = conectar_db()
+                            df_abonos_full = read_sql_query(
+                                "SELECT id, fecha, monto, metodo_pago FROM abonos WHERE venta_id = ? ORDER BY fecha",
+                                conn_abonos, params=(id_sel,))
+                            conn_abonos.close()
+
+                            for _, abono in df_abonos_full.iterrows():
+                                col_a, col_b = st.columns([3, 1])
+                                with col_a:
+                                    st.text(f"{abono['fecha']}: ${abono['monto']:,.2f}")
+                                with col_b:
+                                    if st.button(f"🖨️", key=f"reimp_abono_{abono['id']}"):
+                                        # Obtener datos de la venta
+                                        conn_venta = conectar_db()
+                                        df_venta = read_sql_query(
+                                            "SELECT cliente, destino, precio_total, pagado, saldo FROM ventas WHERE id = ?",
+                                            conn_venta, params=(id_sel,))
+                                        conn_venta.close()
+
+                                        if not df_venta.empty:
+                                            venta_row = df_venta.iloc[0]
+                                            # Generar recibo
+                                            num_rec = siguiente_num_recibo()
+                                            fecha_rec = datetime.now().strftime("%d-%B-%Y").replace(
+                                                "January","enero").replace("February","febrero").replace(
+                                                "March","marzo").replace("April","abril").replace(
+                                                "May","mayo").replace("June","junio").replace(
+                                                "July","julio").replace("August","agosto").replace(
+                                                "September","septiembre").replace("October","octubre").replace(
+                                                "November","noviembre").replace("December","diciembre")
+                                            boton_recibo(
+                                                numero     = num_rec,
+                                                fecha_str  = fecha_rec,
+                                                cliente    = venta_row['cliente'],
+                                                monto      = abono['monto'],
+                                                concepto   = f"Abono - {venta_row['destino']}",
+                                                forma_pago = abono.get('metodo_pago', 'Efectivo'),
+                                                agente     = usuario.get("nombre", "Agente"),
+                                                key_suffix = f"reimp_{abono['id']}",
+                                                total_viaje      = venta_row['precio_total'],
+                                                pagado_acumulado = venta_row['pagado'],
+                                                nuevo_saldo      = venta_row['saldo'],
+                                            )
+                        else:
+                            st.caption("Sin abonos registrados")
+
+                    # ── Localización y cupón ───────────────────────────────
+                    st.divider()
+                    st.markdown("#### 🔑 Localización y Cupón")
+
+                    conn3 = conectar_db()
+                    try:
+                        row_extra = conn3.execute("""
+                            SELECT no_localizador, clave_confirmacion,
+                                   plan_alimento, edades_menores,
+                                   requerimientos_especiales
+                            FROM ventas WHERE id = ?
+                        """, (id_sel,)).fetchone()
+                    except Exception:
+                        row_extra = None
+                    conn3.close()
+
+                    loc_actual   = row_extra[0] if row_extra else ""
+                    clave_actual = row_extra[1] if row_extra else ""
+                    plan_actual  = row_extra[2] if row_extra else "Todo incluido"
+                    edad_actual  = row_extra[3] if row_extra else ""
+                    req_actual   = row_extra[4] if row_extra else ""
+
+                    col_loc1, col_loc2 = st.columns(2)
+                    with col_loc1:
+                        ed_localizador = st.text_input(
+                            "No. de Localizador",
+                            value=loc_actual or "",
+                            key=f"ed_loc_{id_sel}"
+                        )
+                    with col_loc2:
+                        ed_clave = st.text_input(
+                            "Clave de Confirmación",
+                            value=clave_actual or "",
+                            key=f"ed_clave_{id_sel}"
+                        )
+
+                    col_loc3, col_loc4 = st.columns(2)
+                    with col_loc3:
+                        planes    = ["Todo incluido","Solo desayuno","Media pensión","Solo alojamiento","Otro"]
+                        plan_idx  = planes.index(plan_actual) if plan_actual in planes else 0
+                        ed_plan   = st.selectbox("Plan de alimento", planes,
+                                                  index=plan_idx, key=f"ed_plan_{id_sel}")
+                    with col_loc4:
+                        ed_edades = st.text_input("Edades de menores",
+                                                   value=edad_actual or "",
+                                                   key=f"ed_edades_{id_sel}")
+
+                    ed_req = st.text_area("Requerimientos especiales",
+                                          value=req_actual or "",
+                                          height=60, key=f"ed_req_{id_sel}")
+
+                    col_b1, col_b2 = st.columns(2)
+                    with col_b1:
+                        if st.button("💾 Guardar cambios", key=f"save_loc_{id_sel}",
+                                     use_container_width=True):
+                            try:
+                                conn_upd = conectar_db()
+                                conn_upd.execute("""
+                                    UPDATE ventas
+                                    SET no_localizador         = ?,
+                                        clave_confirmacion     = ?,
+                                        plan_alimento          = ?,
+                                        edades_menores         = ?,
+                                        requerimientos_especiales = ?
+                                    WHERE id = ?
+                                """, (
+                                    ed_localizador.strip() or None,
+                                    ed_clave.strip() or None,
+                                    ed_plan,
+                                    ed_edades.strip() or None,
+                                    ed_req.strip() or None,
+                                    id_sel
+                                ))
+                                conn_upd.commit()
+                                conn_upd.close()
+                                st.success("✅ Datos actualizados correctamente.")
+                                st.rerun()
+                            except Exception as e:
+                                st.error(f"❌ Error al guardar: {e}")
+
+                    with col_b2:
+                        if ed_clave.strip() and CUPONES_DISPONIBLES:
+                            hotel_data = obtener_hotel(row['Destino'])
+                            try:
+                                pdf_cupon = generar_cupon_pdf(
+                                    titular         = row['Cliente'],
+                                    clave_confirm   = ed_clave.strip(),
+                                    hotel_nombre    = row['Destino'],
+                                    hotel_direccion = hotel_data.get('direccion', ''),
+                                    hotel_telefono  = hotel_data.get('telefono', ''),
+                                    hotel_estrellas = hotel_data.get('estrellas', 4),
+                                    tipo_habitacion = row['Habitación'],
+                                    plan_alimento   = ed_plan,
+                                    fecha_entrada   = row['Salida'],
+                                    fecha_salida    = row['Regreso'],
+                                    adultos         = int(row['Adultos']),
+                                    menores         = int(row['Menores']),
+                                    edades_menores  = ed_edades or "",
+                                    requerimientos  = ed_req or "",
+                                    logo_path       = LOGO_PATH,
+                                )
+                                st.download_button(
+                                    label    = "🎫 Descargar Cupón de Acceso",
+                                    data     = pdf_cupon,
+                                    file_name= f"cupon_{row['Cliente'].replace(' ','_')[:20]}.pdf",
+                                    mime     = "application/pdf",
+                                    key      = f"cupon_{id_sel}",
+                                    use_container_width=True,
+                                    type     = "primary"
+                                )
+                            except Exception as e:
+                                st.error(f"❌ Error al generar cupón: {e}")
+                        elif not ed_clave.strip():
+                            st.warning("⚠️ Agrega la Clave de Confirmación para generar el cupón.",
+                                       icon="🔑")
+                        elif not CUPONES_DISPONIBLES:
+                            st.caption("⚠️ generar_cupon.py no encontrado junto a app_streamlit.py")
+
+            def csv_filtrado():
+                df_csv = ventas_filtradas(**filtros)
+                for col in ['Total','Pagado','Saldo','Ganancia']:
+                    df_csv[col] = df_csv[col].map("${:,.2f}".format)
+                return df_csv.to_csv(index=False).encode('utf-8')
+
+            st.download_button("\U0001f4e5 Descargar CSV", csv_filtrado,
+                file_name=f"ventas_riviera_{datetime.now().strftime('%Y%m%d')}.csv",
+                mime="text/csv")
+
+    # TAB 1 — NUEVA VENTA
+    with tabs[1]:
+        formulario_nueva_venta()
+
+    # TAB 2 — REGISTRAR PAGO
+    with tabs[2]:
+        st.subheader("\U0001f4b0 Registrar Pago")
+        usuario = st.session_state.usuario_actual
+        conn = conectar_db()
+
+        if usuario["rol"] == "VENDEDORA":
+            query_ventas = f"""
+                SELECT v.id, v.cliente, v.destino, v.precio_total, v.pagado, v.saldo
+                FROM ventas v
+                WHERE v.estado NOT IN ('CERRADO','LIQUIDADO')
+                  AND v.usuario_id = {usuario['id_vendedora']}
+                ORDER BY v.id DESC
+            """
+        else:
+            query_ventas = """
+                SELECT v.id, v.cliente, v.destino, v.precio_total, v.pagado, v.saldo
+                FROM ventas v
+                WHERE v.estado NOT IN ('CERRADO','LIQUIDADO')
+                ORDER BY v.id DESC
+            """
+
+        df_ventas = read_sql_query(query_ventas, conn)
+        conn.close()
+
+        if df_ventas.empty:
+            st.info("No hay ventas con saldo pendiente.")
+        else:
+            opciones_venta = {
+                f"ID {row['id']} | {row['cliente']} — {row['destino']} | Saldo: ${row['saldo']:,.2f}": row
+                for _, row in df_ventas.iterrows()
+            }
+            venta_label = st.selectbox("Selecciona la venta:", list(opciones_venta.keys()))
+            venta_sel = opciones_venta[venta_label]
+
+            col1, col2, col3 = st.columns(3)
+            col1.metric("Total",           f"${venta_sel['precio_total']:,.2f}")
+            col2.metric("Ya pagado",        f"${venta_sel['pagado']:,.2f}")
+            col3.metric("Saldo pendiente",  f"${venta_sel['saldo']:,.2f}")
+
+            st.divider()
+            st.markdown("#### \U0001f4b3 Datos del pago")
+
+            col1, col2 = st.columns(2)
+            with col1:
+                monto_pago = st.number_input(
+                    "Monto del abono *",
+                    min_value=0.01,
+                    max_value=float(venta_sel['saldo']),
+                    step=100.0, format="%.2f"
+                )
+            with col2:
+                metodo_pago = st.selectbox("Método de pago *",
+                    ["Efectivo", "Transferencia", "Tarjeta de crédito",
+                     "Tarjeta de débito", "Depósito bancario", "Otro"])
+
+            nuevo_pagado = venta_sel['pagado'] + monto_pago
+            nuevo_saldo  = venta_sel['saldo']  - monto_pago
+            liquidado    = nuevo_saldo <= 0.01
+
+            col1, col2 = st.columns(2)
+            col1.metric("Nuevo total pagado", f"${nuevo_pagado:,.2f}", delta=f"+${monto_pago:,.2f}")
+            col2.metric("Nuevo saldo",        f"${nuevo_saldo:,.2f}", delta=f"-${monto_pago:,.2f}")
+
+            if liquidado:
+                st.success("\U0001f389 ¡Con este pago la venta quedará **LIQUIDADA**!")
+            else:
+                pct = (nuevo_pagado / venta_sel['precio_total']) * 100
+                st.info(f"\U0001f4ca Avance: **{pct:.1f}%** cobrado")
+
+            st.divider()
+
+            if st.button("\U0001f4be Registrar Pago", type="primary", use_container_width=True):
+                try:
+                    conn = conectar_db()
+                    cursor = conn.cursor()
+                    fecha_pago = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+                    # Intentar con metodo_pago
+                    try:
+                        cursor.execute(
+                            "INSERT INTO abonos (venta_id, monto, fecha, metodo_pago) VALUES (?,?,?,?)",
+                            (int(venta_sel['id']), monto_pago, fecha_pago, metodo_pago)
+                        )
+                    except:
+                        cursor.execute(
+                            "INSERT INTO abonos (venta_id, monto, fecha) VALUES (?,?,?)",
+                            (int(venta_sel['id']), monto_pago, fecha_pago)
+                        )
+
+                    nuevo_estado = "LIQUIDADO" if liquidado else "ACTIVO"
+                    if liquidado:
+                        # Al liquidar: calcular comisión = 10% de la ganancia
+                        cursor.execute("""
+                            UPDATE ventas
+                            SET pagado = pagado + ?, saldo = saldo - ?, estado = ?,
+                                comision_vendedora = ROUND(ganancia * 0.10, 2)
+                            WHERE id = ?
+                        """, (monto_pago, monto_pago, nuevo_estado, int(venta_sel['id'])))
+                    else:
+                        cursor.execute("""
+                            UPDATE ventas
+                            SET pagado = pagado + ?, saldo = saldo - ?, estado = ?
+                            WHERE id = ?
+                        """, (monto_pago, monto_pago, nuevo_estado, int(venta_sel['id'])))
+
+                    conn.commit()
+                    conn.close()
+
+                    # ── Generar recibo automático ──────────────────────────
+                    num_rec = siguiente_num_recibo()
+                    fecha_rec = datetime.now().strftime("%d-%B-%Y").replace(
+                        "January","enero").replace("February","febrero").replace(
+                        "March","marzo").replace("April","abril").replace(
+                        "May","mayo").replace("June","junio").replace(
+                        "July","julio").replace("August","agosto").replace(
+                        "September","septiembre").replace("October","octubre").replace(
+                        "November","noviembre").replace("December","diciembre")
+                    concepto_rec = f"{'Liquidación' if liquidado else 'Abono'} - {venta_sel['destino']}"
+                    vend_nombre  = usuario.get("nombre", "Agente")
+
+                    if liquidado:
+                        st.success("✅ ¡Venta **LIQUIDADA**! 🎉")
+                        st.balloons()
+                    else:
+                        st.success(f"✅ Abono de ${monto_pago:,.2f} ({metodo_pago}) registrado.")
+
+                    st.divider()
+                    st.markdown("#### 🧾 Recibo de Pago")
+                    boton_recibo(
+                        numero     = num_rec,
+                        fecha_str  = fecha_rec,
+                        cliente    = venta_sel['cliente'],
+                        monto      = monto_pago,
+                        concepto   = concepto_rec,
+                        forma_pago = metodo_pago,
+                        agente     = vend_nombre,
+                        key_suffix = f"rv_{venta_sel['id']}",
+                        total_viaje      = venta_sel['precio_total'],
+                        pagado_acumulado = nuevo_pagado,
+                        nuevo_saldo      = nuevo_saldo,
+                    )
+
+                except Exception as e:
+                    st.error(f"\u274c Error: {e}")
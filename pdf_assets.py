@@ -0,0 +1,142 @@
+"""
+pdf_assets.py  –  Turismar Agencia de Viajes
+============================================
+Recursos compartidos por generar_recibo.py y generar_cupon.py.
+
+- Imágenes: el logo original es un JPEG de 5000x5000 px (780 KB). Se decodifica
+  una sola vez por proceso, se reduce al tamaño en que se imprime (a DPI_IMAGENES)
+  y se guarda ya en JPEG; cada PDF sólo copia esos bytes.
+
+- PlantillaPDF: la parte fija de la página (fondos, orillas de color, textos
+  de la agencia, footer) se dibuja como Form XObject con la API pública de
+  reportlab (beginForm/endForm/doForm): en un PDF de varias páginas la
+  plantilla se dibuja y se guarda una sola vez.
+
+- CanvasPDF: canvas que escribe sus streams en binario, sin ASCII85.
+"""
+
+import io
+import os
+import threading
+from contextlib import contextmanager
+
+from PIL import Image
+from reportlab import rl_config
+from reportlab.lib.utils import ImageReader
+from reportlab.pdfgen import canvas
+
+DPI_IMAGENES = 200
+CALIDAD_JPEG = 88
+
+_lock = threading.Lock()
+_imagenes = {}      # (ruta, mtime, ancho_px, alto_px) -> ImageReader
+
+
+# ─── IMÁGENES ────────────────────────────────────────────────────────────────
+
+def imagen(ruta, ancho, alto):
+    """
+    ImageReader de la imagen reducida para ocupar ancho x alto puntos.
+    Devuelve None si el archivo no existe o no se puede leer.
+    """
+    try:
+        mtime = os.path.getmtime(ruta)
+    except OSError:
+        return None
+    ancho_px = max(1, round(ancho / 72 * DPI_IMAGENES))
+    alto_px = max(1, round(alto / 72 * DPI_IMAGENES))
+    clave = (os.path.abspath(ruta), mtime, ancho_px, alto_px)
+
+    with _lock:
+        lector = _imagenes.get(clave)
+        if lector is not None:
+            return lector
+        try:
+            with Image.open(ruta) as im:
+                im = im.convert("RGB")
+                im.thumbnail((ancho_px, alto_px), Image.LANCZOS)
+                buf = io.BytesIO()
+                im.save(buf, format="JPEG", quality=CALIDAD_JPEG, optimize=True)
+        except Exception:
+            return None
+        lector = ImageReader(io.BytesIO(buf.getvalue()))
+        lector.getRGBData()     # reportlab lo usa para nombrar la imagen en el PDF
+        _imagenes[clave] = lector
+        return lector
+
+
+def dibujar_imagen(cv, ruta, x, y, ancho, alto):
+    """Dibuja la imagen cacheada (preservando proporción). False si no se pudo."""
+    lector = imagen(ruta, ancho, alto)
+    if lector is None:
+        return False
+    # El lector comparte su buffer JPEG: un documento a la vez lo lee
+    with _lock:
+        cv.drawImage(lector, x, y, width=ancho, height=alto,
+                     preserveAspectRatio=True, mask="auto")
+    return True
+
+
+def precargar(*imagenes):
+    """Carga de antemano las imágenes [(ruta, ancho, alto)] (p. ej. al arrancar la app)."""
+    for ruta, ancho, alto in imagenes:
+        imagen(ruta, ancho, alto)
+
+
+# ─── CANVAS ──────────────────────────────────────────────────────────────────
+
+# Sin el acelerador en C de reportlab, codificar cada stream en ASCII85 es
+# lo más lento de armar un PDF (y lo hace ~25% más grande). El PDF binario es
+# válido igual; ASCII85 sólo hace falta para transportes de 7 bits.
+# reportlab lo lee de rl_config al crear las imágenes y al guardar, así que
+# sólo se apaga durante esas llamadas de nuestros canvas.
+_lock_a85 = threading.RLock()
+
+
+@contextmanager
+def _sin_ascii85():
+    with _lock_a85:
+        previo = rl_config.useA85
+        rl_config.useA85 = 0
+        try:
+            yield
+        finally:
+            rl_config.useA85 = previo
+
+
+class CanvasPDF(canvas.Canvas):
+    """Canvas de reportlab con streams binarios (sin ASCII85)."""
+
+    def drawImage(self, *args, **kwargs):
+        with _sin_ascii85():
+            return super().drawImage(*args, **kwargs)
+
+    def save(self):
+        with _sin_ascii85():
+            super().save()
+
+
+# ─── PLANTILLA ───────────────────────────────────────────────────────────────
+
+class PlantillaPDF:
+    """
+    Parte fija de una página. `dibujar(cv)` dibuja sólo lo que no cambia
+    entre documentos (nada de datos del cliente ni imágenes). Tampoco
+    transparencias (setFillAlpha): reportlab no agrega los estados gráficos
+    a los recursos del Form y el visor las pinta opacas.
+    """
+
+    def __init__(self, nombre, dibujar):
+        self.nombre = nombre
+        self._dibujar = dibujar
+
+    def colocar(self, cv):
+        """Dibuja la plantilla en la página actual del canvas."""
+        # Un Form por documento; en las páginas siguientes sólo se referencia
+        colocadas = cv.__dict__.setdefault("_plantillas_colocadas", set())
+        if self.nombre not in colocadas:
+            cv.beginForm(self.nombre)
+            self._dibujar(cv)
+            cv.endForm()
+            colocadas.add(self.nombre)
+        cv.doForm(self.nombre)
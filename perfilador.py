@@ -0,0 +1,193 @@
+"""
+PERFILADOR DE CONSULTAS - Sistema Agencia Riviera Maya
+Registra, por cada rerun de Streamlit, las consultas que hizo la página: SQL,
+hash de los parámetros (los valores no se guardan), filas devueltas y tiempo,
+junto con el tiempo total de dibujar la página.
+
+Los cursores de conectar_db() (SQLite y PostgreSQL) avisan cada execute y
+cada fetch; ejecutar_query, query_a_dataframe y read_sql_query marcan el
+origen de lo que ejecutan. Las consultas servidas por consulta_cacheada
+también se anotan, con origen "cache" y tiempo casi cero.
+
+Cada hilo de Streamlit corre un rerun a la vez, así que el rerun en curso se
+guarda por hilo. Lo que corre fuera de un rerun (cola de reportes, scripts)
+no se registra.
+
+Variables de entorno:
+    PERFIL_CONSULTAS       1 | 0                           (default 1)
+    PERFIL_RERUNS_MAX      reruns que se guardan en memoria (default 200)
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+
+PERFIL_CONSULTAS = os.environ.get("PERFIL_CONSULTAS", "1") != "0"
+PERFIL_RERUNS_MAX = int(os.environ.get("PERFIL_RERUNS_MAX", "200"))
+
+# SQL más largo que esto se recorta (los INSERT masivos o scripts de migración)
+_SQL_MAX = 2000
+_RE_ESPACIOS = re.compile(r"\s+")
+
+
+def hash_parametros(params):
+    """Hash corto de los parámetros: distingue llamadas sin guardar los datos."""
+    if not params:
+        return ""
+    return hashlib.sha1(repr(params).encode("utf-8", "replace")).hexdigest()[:12]
+
+
+def _normalizar_sql(sql):
+    sql = _RE_ESPACIOS.sub(" ", sql).strip()
+    return sql if len(sql) <= _SQL_MAX else sql[:_SQL_MAX] + " …"
+
+
+def _percentil(valores, p):
+    if not valores:
+        return 0.0
+    valores = sorted(valores)
+    return valores[min(len(valores) - 1, int(round(p / 100 * (len(valores) - 1))))]
+
+
+class PerfiladorConsultas:
+    """Reruns recientes del proceso con sus consultas (los últimos `max_reruns`)."""
+
+    def __init__(self, max_reruns=PERFIL_RERUNS_MAX, activo=PERFIL_CONSULTAS):
+        self.activo = activo
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._reruns = deque(maxlen=max_reruns)
+        self._siguiente_id = 1
+
+    # ── Rerun ─────────────────────────────────────────────
+    def iniciar_rerun(self, pagina, usuario=None):
+        """Abre el registro del rerun del hilo actual."""
+        if not self.activo:
+            return
+        with self._lock:
+            rerun_id = self._siguiente_id
+            self._siguiente_id += 1
+        self._local.rerun = {
+            "id": rerun_id,
+            "inicio": datetime.now().isoformat(timespec="seconds"),
+            "pagina": pagina,
+            "usuario": usuario,
+            "render_ms": None,
+            "consultas": [],
+            "_t0": time.perf_counter(),
+        }
+        self._local.origen = None
+
+    def etiquetar_rerun(self, pagina, usuario=None):
+        """Corrige la página del rerun en curso (el menú puede cambiarla a medio rerun)."""
+        rerun = getattr(self._local, "rerun", None)
+        if rerun is not None:
+            rerun["pagina"] = pagina
+            rerun["usuario"] = usuario or rerun["usuario"]
+
+    def terminar_rerun(self):
+        """Cierra el rerun del hilo actual con su tiempo total y lo guarda."""
+        rerun = getattr(self._local, "rerun", None)
+        if rerun is None:
+            return
+        self._local.rerun = None
+        rerun["render_ms"] = round((time.perf_counter() - rerun.pop("_t0")) * 1000, 2)
+        with self._lock:
+            self._reruns.append(rerun)
+
+    # ── Consultas ─────────────────────────────────────────
+    def consulta(self, sql, params=None, origen=None):
+        """
+        Anota una consulta del rerun en curso y la devuelve para que el cursor
+        le sume filas y tiempo al hacer fetch. None si no hay rerun activo.
+        """
+        rerun = getattr(self._local, "rerun", None) if self.activo else None
+        if rerun is None:
+            return None
+        registro = {
+            "sql": _normalizar_sql(sql),
+            "params_hash": hash_parametros(params),
+            "filas": None,
+            "ms": 0.0,
+            "origen": origen or getattr(self._local, "origen", None) or "cursor",
+        }
+        rerun["consultas"].append(registro)
+        return registro
+
+    @contextmanager
+    def origen(self, nombre):
+        """Las consultas del hilo dentro del bloque se anotan con este origen."""
+        anterior = getattr(self._local, "origen", None)
+        self._local.origen = nombre
+        try:
+            yield
+        finally:
+            self._local.origen = anterior
+
+    # ── Lectura ───────────────────────────────────────────
+    def reruns(self):
+        with self._lock:
+            return list(self._reruns)
+
+    def limpiar(self):
+        with self._lock:
+            self._reruns.clear()
+
+    def consultas_lentas(self, n=10):
+        """Las `n` consultas más lentas de los reruns guardados, con su página."""
+        filas = [dict(c, pagina=r["pagina"], rerun=r["id"])
+                 for r in self.reruns() for c in r["consultas"]]
+        filas.sort(key=lambda c: c["ms"], reverse=True)
+        return filas[:n]
+
+    def resumen_por_pagina(self):
+        """Por página: reruns, consultas por rerun y tiempos de render (promedio y p95)."""
+        paginas = {}
+        for r in self.reruns():
+            paginas.setdefault(r["pagina"], []).append(r)
+        resumen = []
+        for pagina, reruns in paginas.items():
+            render = [r["render_ms"] for r in reruns]
+            consultas = [len(r["consultas"]) for r in reruns]
+            sql_ms = [sum(c["ms"] for c in r["consultas"]) for r in reruns]
+            resumen.append({
+                "pagina": pagina,
+                "reruns": len(reruns),
+                "consultas_por_rerun": round(sum(consultas) / len(reruns), 1),
+                "consultas_max": max(consultas),
+                "sql_ms_promedio": round(sum(sql_ms) / len(reruns), 2),
+                "render_ms_promedio": round(sum(render) / len(reruns), 2),
+                "render_ms_p95": round(_percentil(render, 95), 2),
+            })
+        resumen.sort(key=lambda p: p["render_ms_promedio"], reverse=True)
+        return resumen
+
+    def exportar_jsonl(self):
+        """
+        Una línea por rerun ("tipo": "rerun") seguida de una por cada consulta
+        ("tipo": "consulta", con el id del rerun).
+        """
+        lineas = []
+        for r in self.reruns():
+            cabecera = {k: v for k, v in r.items() if k != "consultas"}
+            cabecera.update(tipo="rerun", consultas=len(r["consultas"]))
+            lineas.append(json.dumps(cabecera, ensure_ascii=False))
+            for orden, c in enumerate(r["consultas"], 1):
+                lineas.append(json.dumps(dict(c, tipo="consulta", rerun=r["id"], orden=orden,
+                                              pagina=r["pagina"]), ensure_ascii=False))
+        return "\n".join(lineas) + ("\n" if lineas else "")
+
+
+def sumar_medicion(registro, t0, filas=None):
+    """Suma al registro de una consulta el tiempo desde `t0` y las filas leídas."""
+    if registro is None:
+        return
+    registro["ms"] = round(registro["ms"] + (time.perf_counter() - t0) * 1000, 3)
+    if filas is not None:
+        registro["filas"] = (registro["filas"] or 0) + filas
@@ -0,0 +1,229 @@
+"""
+REPORTE POR PERIODO - Sistema Agencia Riviera Maya
+Motor del reporte semanal (y de cualquier rango: mes, trimestre o fechas
+libres). Todas las fuentes del periodo (reservas Riviera, clientes
+nacionales e internacionales, abonos de las tres líneas, gastos y
+comisiones pagadas) salen de una sola consulta UNION ALL, y los totales y el
+detalle por sección se arman en una pasada sobre esas filas. Los abonos se
+leen del libro movimientos_pagos, donde el Monto MXN de los internacionales
+ya viene calculado con el tipo de cambio del abono.
+
+El resultado (ResumenPeriodo) lo usan tanto la página como el Excel, así la
+descarga no vuelve a consultar la base.
+
+Las fechas se filtran como rango (col >= desde AND col < hasta + 1 día) en
+lugar de date(col) BETWEEN, para que se usen los índices de fecha (versión 2
+de migracion_indices.py). Las columnas guardan 'YYYY-MM-DD HH:MM:SS' o
+'YYYY-MM-DD', así que ambas formas dan el mismo resultado.
+"""
+
+from datetime import date, timedelta
+
+_MESES = ["", "Enero", "Febrero", "Marzo", "Abril", "Mayo", "Junio", "Julio",
+          "Agosto", "Septiembre", "Octubre", "Noviembre", "Diciembre"]
+
+# Columnas de cada sección tal como se muestran (página y Excel)
+COLUMNAS = {
+    "riviera":        ["ID", "Cliente", "Destino", "Fecha Inicio", "Total", "Pagado", "Saldo", "Vendedora"],
+    "abono_riviera":  ["ID", "Venta ID", "Monto", "Fecha", "Método"],
+    "nacional":       ["ID", "Cliente", "Viaje", "Destino", "Salida", "Total", "Pagado", "Saldo", "Vendedora"],
+    "abono_nacional": ["ID", "Cliente ID", "Monto", "Fecha", "Método"],
+    "internacional":  ["ID", "Cliente", "Destino", "Salida", "Total USD", "Pagado USD", "Saldo USD", "Vendedora"],
+    "abono_internacional": ["ID", "Cliente ID", "Monto USD", "Monto MXN", "Fecha", "Método"],
+    "gasto":          ["ID", "Categoría", "Descripción", "Monto", "Fecha", "Método"],
+    "comision":       ["ID", "Vendedora", "Monto", "Fecha Pago", "Notas"],
+}
+
+# Secciones que dependen de módulos opcionales (su tabla puede no existir)
+_OPCIONALES = ("gasto", "comision")
+
+# Cada rama produce: seccion, id, ref, fecha, n1, n2, n3, t1..t5 (una rama
+# puede llenar varias secciones).
+# `{rango}` se sustituye por el filtro de fechas sobre la columna indicada.
+_RAMAS = {
+    "riviera": ("v.fecha_registro", """
+        SELECT 'riviera', v.id, NULL, CAST(v.fecha_registro AS TEXT),
+               v.precio_total, v.pagado, v.saldo,
+               v.cliente, v.destino, CAST(v.fecha_inicio AS TEXT), vd.nombre, NULL
+        FROM ventas v
+        LEFT JOIN vendedoras vd ON v.vendedora_id = vd.id
+        WHERE {rango}"""),
+    "nacional": ("cn.fecha_registro", """
+        SELECT 'nacional', cn.id, NULL, CAST(cn.fecha_registro AS TEXT),
+               cn.total_pagar, cn.total_abonado, cn.saldo,
+               cn.nombre_cliente, vj.nombre_viaje, vj.destino, CAST(vj.fecha_salida AS TEXT), vd.nombre
+        FROM clientes_nacionales cn
+        JOIN viajes_nacionales vj ON cn.viaje_id = vj.id
+        LEFT JOIN vendedoras vd ON cn.vendedora_id = vd.id
+        WHERE {rango}"""),
+    "internacional": ("ci.fecha_registro", """
+        SELECT 'internacional', ci.id, NULL, CAST(ci.fecha_registro AS TEXT),
+               ci.total_usd, ci.abonado_usd, ci.saldo_usd,
+               ci.nombre_cliente, vi.destino, CAST(vi.fecha_salida AS TEXT), vd.nombre, NULL
+        FROM clientes_internacionales ci
+        JOIN viajes_internacionales vi ON ci.viaje_id = vi.id
+        LEFT JOIN vendedoras vd ON ci.vendedora_id = vd.id
+        WHERE {rango}"""),
+    # Abonos de las tres líneas desde el libro de pagos (movimientos_pagos.py):
+    # un solo recorrido del índice de fecha en lugar de tres tablas
+    "abonos": ("m.fecha", """
+        SELECT 'abono_' || m.producto, m.abono_id, m.referencia_id, m.fecha,
+               CASE WHEN m.producto = 'internacional' THEN m.monto_usd ELSE m.monto_mxn END,
+               m.monto_mxn, NULL,
+               m.metodo_pago, NULL, NULL, NULL, NULL
+        FROM movimientos_pagos m
+        WHERE m.producto IN ('riviera', 'nacional', 'internacional') AND {rango}"""),
+    "gasto": ("g.fecha_gasto", """
+        SELECT 'gasto', g.id, NULL, CAST(g.fecha_gasto AS TEXT),
+               g.monto, NULL, NULL,
+               g.categoria, g.descripcion, g.metodo_pago, NULL, NULL
+        FROM gastos_operativos g
+        WHERE {rango}"""),
+    "comision": ("hc.fecha", """
+        SELECT 'comision', hc.id, NULL, CAST(hc.fecha AS TEXT),
+               hc.monto, NULL, NULL,
+               COALESCE(vd.nombre, hc.vendedora), hc.nota, NULL, NULL, NULL
+        FROM historial_comisiones hc
+        LEFT JOIN vendedoras vd ON hc.vendedora_id = vd.id
+        WHERE {rango}"""),
+}
+
+
+# ─── RANGOS ──────────────────────────────────────────────────────────────────
+
+def rango_semana(fecha):
+    """Domingo a sábado de la semana que contiene `fecha`."""
+    fin = fecha + timedelta(days=(5 - fecha.weekday()) % 7)
+    return fin - timedelta(days=6), fin
+
+
+def rango_mes(fecha):
+    inicio = fecha.replace(day=1)
+    siguiente = (inicio + timedelta(days=32)).replace(day=1)
+    return inicio, siguiente - timedelta(days=1)
+
+
+def rango_trimestre(fecha):
+    mes = 3 * ((fecha.month - 1) // 3) + 1
+    inicio = date(fecha.year, mes, 1)
+    return inicio, rango_mes(date(fecha.year, mes + 2, 1))[1]
+
+
+def nombre_periodo(desde, hasta):
+    """Etiqueta legible del rango: mes, trimestre, o 'dd/mm/aaaa al dd/mm/aaaa'."""
+    if (desde, hasta) == rango_mes(desde):
+        return f"{_MESES[desde.month]} {desde.year}"
+    if (desde, hasta) == rango_trimestre(desde):
+        return f"Trimestre {(desde.month - 1) // 3 + 1} {desde.year}"
+    return f"{desde.strftime('%d/%m/%Y')} al {hasta.strftime('%d/%m/%Y')}"
+
+
+# ─── MOTOR ───────────────────────────────────────────────────────────────────
+
+class ResumenPeriodo:
+    """Totales y detalle de un periodo (lo que muestra la página y lleva el Excel)."""
+
+    def __init__(self, desde, hasta):
+        self.desde = desde
+        self.hasta = hasta
+        self.detalle = {seccion: [] for seccion in COLUMNAS}
+        self.gastos_por_categoria = {}
+        self.total_reservas = 0
+        self.monto_reservas = 0.0
+        self.pagado_reservas = 0.0
+        self.abonos_riviera = 0.0
+        self.abonos_nacionales = 0.0
+        self.abonos_internacionales = 0.0
+        self.total_gastos = 0.0
+        self.total_comisiones = 0.0
+        self.secciones_faltantes = []
+
+    @property
+    def total_abonos(self):
+        return self.abonos_riviera + self.abonos_nacionales + self.abonos_internacionales
+
+    @property
+    def balance(self):
+        return self.total_abonos - self.total_gastos - self.total_comisiones
+
+    @property
+    def nombre(self):
+        return nombre_periodo(self.desde, self.hasta)
+
+    def __repr__(self):
+        # Corto a propósito: la cola de reportes lo usa en la clave del trabajo
+        return f"ResumenPeriodo({self.desde.isoformat()}, {self.hasta.isoformat()})"
+
+    def _agregar(self, seccion, id_, ref, fecha, n1, n2, n3, t1, t2, t3, t4, t5):
+        n1 = n1 or 0
+        if seccion == "riviera":
+            self.total_reservas += 1
+            self.monto_reservas += n1
+            self.pagado_reservas += n2 or 0
+            fila = (id_, t1, t2, t3, n1, n2, n3, t4)
+        elif seccion == "abono_riviera":
+            self.abonos_riviera += n1
+            fila = (id_, ref, n1, fecha, t1)
+        elif seccion == "nacional":
+            fila = (id_, t1, t2, t3, t4, n1, n2, n3, t5)
+        elif seccion == "abono_nacional":
+            self.abonos_nacionales += n1
+            fila = (id_, ref, n1, fecha, t1)
+        elif seccion == "internacional":
+            fila = (id_, t1, t2, t3, n1, n2, n3, t4)
+        elif seccion == "abono_internacional":
+            self.abonos_internacionales += n1
+            fila = (id_, ref, n1, n2, fecha, t1)
+        elif seccion == "gasto":
+            self.total_gastos += n1
+            self.gastos_por_categoria[t1] = self.gastos_por_categoria.get(t1, 0) + n1
+            fila = (id_, t1, t2, n1, fecha, t3)
+        else:
+            self.total_comisiones += n1
+            fila = (id_, t1, n1, fecha, t2)
+        self.detalle[seccion].append(fila)
+
+
+def _consulta(secciones, desde, hasta):
+    hasta_excl = (hasta + timedelta(days=1)).isoformat()
+    partes, params = [], []
+    for seccion in secciones:
+        columna, sql = _RAMAS[seccion]
+        partes.append(sql.format(rango=f"{columna} >= ? AND {columna} < ?"))
+        params += [desde.isoformat(), hasta_excl]
+    # seccion, fecha más reciente primero
+    return "\nUNION ALL\n".join(partes) + "\nORDER BY 1, 4 DESC, 2 DESC", tuple(params)
+
+
+def calcular_periodo(consultar, desde, hasta):
+    """
+    ResumenPeriodo de `desde` a `hasta` (date, ambos incluidos).
+    `consultar(sql, params)` ejecuta una lectura y devuelve las filas
+    (consulta_cacheada en la app).
+    """
+    secciones = list(_RAMAS)
+    try:
+        filas = consultar(*_consulta(secciones, desde, hasta))
+    except Exception:
+        # Gastos y comisiones son módulos opcionales: se descartan sus
+        # secciones si su tabla no existe y se repite la consulta
+        faltantes = []
+        for seccion in _OPCIONALES:
+            try:
+                consultar(*_consulta([seccion], desde, desde))
+            except Exception:
+                faltantes.append(seccion)
+        if not faltantes:
+            raise
+        secciones = [s for s in secciones if s not in faltantes]
+        filas = consultar(*_consulta(secciones, desde, hasta))
+    else:
+        faltantes = []
+
+    resumen = ResumenPeriodo(desde, hasta)
+    resumen.secciones_faltantes = faltantes
+    for fila in filas:
+        resumen._agregar(*fila)
+    resumen.gastos_por_categoria = dict(sorted(resumen.gastos_por_categoria.items(),
+                                               key=lambda c: c[1], reverse=True))
+    return resumen
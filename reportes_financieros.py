@@ -3,124 +3,112 @@ from datetime import datetime
 import calendar
 
 
-def obtener_ingresos_riviera(mes, anio):
-    """Obtiene ingresos de Riviera Maya (general, bloqueos, grupos)"""
-    conexion = conectar()
-    cursor = conexion.cursor()
-    
-    # Ingresos Riviera General (ventas normales)
-    cursor.execute("""
-        SELECT SUM(pagado) as total
-        FROM ventas
-        WHERE CAST(substr(fecha_inicio, 4, 2) AS INTEGER) = ? 
-        AND CAST(substr(fecha_inicio, 7, 4) AS INTEGER) = ?
-        AND (es_bloqueo = 0 OR es_bloqueo IS NULL)
-        AND (es_grupo = 0 OR es_grupo IS NULL)
-    """, (mes, anio))
-    
-    riviera_general = cursor.fetchone()[0] or 0
-    
-    # Ingresos Riviera Bloqueos
-    cursor.execute("""
-        SELECT SUM(pagado) as total
-        FROM ventas
-        WHERE CAST(substr(fecha_inicio, 4, 2) AS INTEGER) = ? 
-        AND CAST(substr(fecha_inicio, 7, 4) AS INTEGER) = ?
-        AND es_bloqueo = 1
-    """, (mes, anio))
-    
-    riviera_bloqueos = cursor.fetchone()[0] or 0
-    
-    # Ingresos Riviera Grupos
-    cursor.execute("""
-        SELECT SUM(pagado) as total
-        FROM ventas
-        WHERE CAST(substr(fecha_inicio, 4, 2) AS INTEGER) = ? 
-        AND CAST(substr(fecha_inicio, 7, 4) AS INTEGER) = ?
-        AND es_grupo = 1
-    """, (mes, anio))
-    
-    riviera_grupos = cursor.fetchone()[0] or 0
-    
-    conexion.close()
-    
-    return {
-        'general': riviera_general,
-        'bloqueos': riviera_bloqueos,
-        'grupos': riviera_grupos,
-        'total': riviera_general + riviera_bloqueos + riviera_grupos
-    }
+# Sólo para abonos pagados en USD, que no guardan tipo de cambio (tipo_cambio = 1)
+TIPO_CAMBIO_RESPALDO = 17.0
+
+
+def _rango_anio(anio):
+    """Primer día del año y primer día del siguiente, en ISO, para filtrar por rango."""
+    return f"{anio:04d}-01-01", f"{anio + 1:04d}-01-01"
+
+
+def _mes(columna):
+    """Número de mes de una columna ISO 'YYYY-MM-DD...'."""
+    return f"CAST(SUBSTR({columna}, 6, 2) AS INTEGER)"
+
+
+def resumen_financiero(anio):
+    """
+    Ingresos y gastos de cada mes de `anio`: {mes: datos}, con
+        riviera              {'general', 'bloqueos', 'grupos', 'total'}
+        nacionales           total abonado (MXN)
+        internacionales_usd  abonado en USD
+        internacionales_mxn  lo mismo en pesos, con el tipo de cambio de cada abono
+        ingresos             riviera + nacionales + internacionales_mxn
+        gastos               {'total', 'categorias': [(categoria, monto), ...]}
+        utilidad             ingresos - gastos
 
+    Una consulta GROUP BY mes por fuente, todas en la misma conexión. Los
+    ingresos van al mes del viaje (fecha de inicio / salida); los gastos al
+    mes en que se registraron.
+    """
+    meses = {mes: {
+        'riviera': {'general': 0, 'bloqueos': 0, 'grupos': 0, 'total': 0},
+        'nacionales': 0,
+        'internacionales_usd': 0,
+        'internacionales_mxn': 0,
+        'gastos': {'total': 0, 'categorias': []},
+    } for mes in range(1, 13)}
 
-def obtener_ingresos_nacionales(mes, anio):
-    """Obtiene ingresos de viajes nacionales"""
     conexion = conectar()
     cursor = conexion.cursor()
-    
-    cursor.execute("""
-        SELECT SUM(c.total_abonado) as total
+
+    # Riviera Maya: general, bloqueos y grupos en la misma pasada
+    cursor.execute(f"""
+        SELECT {_mes('fecha_inicio_iso')} AS mes,
+               SUM(CASE WHEN COALESCE(es_bloqueo, 0) = 0 AND COALESCE(es_grupo, 0) = 0
+                        THEN pagado ELSE 0 END),
+               SUM(CASE WHEN es_bloqueo = 1 THEN pagado ELSE 0 END),
+               SUM(CASE WHEN es_grupo = 1 THEN pagado ELSE 0 END)
+        FROM ventas
+        WHERE fecha_inicio_iso >= ? AND fecha_inicio_iso < ?
+        GROUP BY 1
+    """, _rango_anio(anio))
+    for mes, general, bloqueos, grupos in cursor.fetchall():
+        meses[mes]['riviera'] = {
+            'general': general or 0,
+            'bloqueos': bloqueos or 0,
+            'grupos': grupos or 0,
+            'total': (general or 0) + (bloqueos or 0) + (grupos or 0),
+        }
+
+    # Nacionales
+    cursor.execute(f"""
+        SELECT {_mes('v.fecha_salida_iso')} AS mes, SUM(c.total_abonado)
         FROM clientes_nacionales c
         JOIN viajes_nacionales v ON c.viaje_id = v.id
-        WHERE CAST(substr(v.fecha_salida, 4, 2) AS INTEGER) = ? 
-        AND CAST(substr(v.fecha_salida, 7, 4) AS INTEGER) = ?
-    """, (mes, anio))
-    
-    total = cursor.fetchone()[0] or 0
-    conexion.close()
-    
-    return total
+        WHERE v.fecha_salida_iso >= ? AND v.fecha_salida_iso < ?
+        GROUP BY 1
+    """, _rango_anio(anio))
+    for mes, total in cursor.fetchall():
+        meses[mes]['nacionales'] = total or 0
 
-
-def obtener_ingresos_internacionales(mes, anio):
-    """Obtiene ingresos de viajes internacionales"""
-    conexion = conectar()
-    cursor = conexion.cursor()
-    
-    cursor.execute("""
-        SELECT SUM(c.abonado_usd) as total
-        FROM clientes_internacionales c
+    # Internacionales: los abonos en pesos cuentan por lo que se recibió; los
+    # abonos en dólares, con el tipo de cambio guardado en el abono
+    cursor.execute(f"""
+        SELECT {_mes('v.fecha_salida_iso')} AS mes,
+               SUM(a.monto_usd),
+               SUM(CASE WHEN a.moneda = 'MXN' THEN a.monto_original
+                        WHEN a.tipo_cambio > 1 THEN a.monto_usd * a.tipo_cambio
+                        ELSE a.monto_usd * ? END)
+        FROM abonos_internacionales a
+        JOIN clientes_internacionales c ON a.cliente_id = c.id
         JOIN viajes_internacionales v ON c.viaje_id = v.id
-        WHERE CAST(substr(v.fecha_salida, 4, 2) AS INTEGER) = ? 
-        AND CAST(substr(v.fecha_salida, 7, 4) AS INTEGER) = ?
-    """, (mes, anio))
-    
-    total_usd = cursor.fetchone()[0] or 0
-    conexion.close()
-    
-    return total_usd
+        WHERE v.fecha_salida_iso >= ? AND v.fecha_salida_iso < ?
+        GROUP BY 1
+    """, (TIPO_CAMBIO_RESPALDO,) + _rango_anio(anio))
+    for mes, usd, mxn in cursor.fetchall():
+        meses[mes]['internacionales_usd'] = usd or 0
+        meses[mes]['internacionales_mxn'] = mxn or 0
 
-
-def obtener_gastos_operativos(mes, anio):
-    """Obtiene gastos operativos del mes"""
-    conexion = conectar()
-    cursor = conexion.cursor()
-    
-    # Total de gastos
+    # Gastos operativos por mes y categoría
     cursor.execute("""
-        SELECT SUM(monto) as total
+        SELECT mes, categoria, SUM(monto) AS total
         FROM gastos_operativos
-        WHERE mes = ? AND anio = ?
-    """, (mes, anio))
-    
-    total = cursor.fetchone()[0] or 0
-    
-    # Gastos por categoría
-    cursor.execute("""
-        SELECT categoria, SUM(monto) as total
-        FROM gastos_operativos
-        WHERE mes = ? AND anio = ?
-        GROUP BY categoria
-        ORDER BY total DESC
-    """, (mes, anio))
-    
-    por_categoria = cursor.fetchall()
-    
+        WHERE anio = ?
+        GROUP BY mes, categoria
+        ORDER BY mes, total DESC
+    """, (anio,))
+    for mes, categoria, total in cursor.fetchall():
+        meses[mes]['gastos']['categorias'].append((categoria, total))
+        meses[mes]['gastos']['total'] += total or 0
+
     conexion.close()
-    
-    return {
-        'total': total,
-        'categorias': por_categoria
-    }
+
+    for datos in meses.values():
+        datos['ingresos'] = datos['riviera']['total'] + datos['nacionales'] + datos['internacionales_mxn']
+        datos['utilidad'] = datos['ingresos'] - datos['gastos']['total']
+    return meses
 
 
 def reporte_financiero_mensual():
@@ -150,28 +138,27 @@ def reporte_financiero_mensual():
     print("\n💰 INGRESOS:")
     print("-" * 60)
     
+    datos = resumen_financiero(anio)[mes]
+
     # Riviera Maya
-    riviera = obtener_ingresos_riviera(mes, anio)
+    riviera = datos['riviera']
     print(f"   Riviera Maya (General):    ${riviera['general']:>15,.2f}")
     print(f"   Riviera Maya (Bloqueos):   ${riviera['bloqueos']:>15,.2f}")
     print(f"   Riviera Maya (Grupos):     ${riviera['grupos']:>15,.2f}")
     
     # Nacionales
-    nacionales = obtener_ingresos_nacionales(mes, anio)
+    nacionales = datos['nacionales']
     print(f"   Viajes Nacionales:         ${nacionales:>15,.2f}")
     
-    # Internacionales
-    internacionales_usd = obtener_ingresos_internacionales(mes, anio)
-    
-    # Tipo de cambio promedio (puedes ajustarlo)
-    tipo_cambio = 17.0
-    internacionales_mxn = internacionales_usd * tipo_cambio
+    # Internacionales (cada abono con su tipo de cambio)
+    internacionales_usd = datos['internacionales_usd']
+    internacionales_mxn = datos['internacionales_mxn']
     
     print(f"   Viajes Internacionales:    ${internacionales_mxn:>15,.2f}")
     if internacionales_usd > 0:
-        print(f"                              (${internacionales_usd:,.2f} USD @ ${tipo_cambio:.2f})")
+        print(f"                              (${internacionales_usd:,.2f} USD @ ${internacionales_mxn / internacionales_usd:.2f} promedio)")
     
-    total_ingresos = riviera['total'] + nacionales + internacionales_mxn
+    total_ingresos = datos['ingresos']
     
     print(f"   {'-'*60}")
     print(f"   TOTAL INGRESOS:            ${total_ingresos:>15,.2f}")
@@ -180,7 +167,7 @@ def reporte_financiero_mensual():
     print("\n💸 GASTOS OPERATIVOS:")
     print("-" * 60)
     
-    gastos = obtener_gastos_operativos(mes, anio)
+    gastos = datos['gastos']
     
     if gastos['categorias']:
         for cat in gastos['categorias']:
@@ -249,21 +236,10 @@ def reporte_financiero_anual():
     total_ingresos_anual = 0
     total_gastos_anual = 0
     
-    for mes in range(1, 13):
-        # Ingresos
-        riviera = obtener_ingresos_riviera(mes, anio)
-        nacionales = obtener_ingresos_nacionales(mes, anio)
-        internacionales_usd = obtener_ingresos_internacionales(mes, anio)
-        internacionales_mxn = internacionales_usd * 17.0
-        
-        ingresos_mes = riviera['total'] + nacionales + internacionales_mxn
-        
-        # Gastos
-        gastos = obtener_gastos_operativos(mes, anio)
-        gastos_mes = gastos['total']
-        
-        # Utilidad
-        utilidad_mes = ingresos_mes - gastos_mes
+    for mes, datos in resumen_financiero(anio).items():
+        ingresos_mes = datos['ingresos']
+        gastos_mes = datos['gastos']['total']
+        utilidad_mes = datos['utilidad']
         
         mes_nombre = calendar.month_name[mes]
         print(f"{mes_nombre:12} ${ingresos_mes:>14,.2f} ${gastos_mes:>14,.2f} ${utilidad_mes:>14,.2f}")
@@ -321,16 +297,11 @@ def comparativa_meses():
     mejor_mes = None
     mejor_utilidad = 0
     
+    resumen = resumen_financiero(anio)
     for mes in range(mes_inicio, mes_fin + 1):
-        riviera = obtener_ingresos_riviera(mes, anio)
-        nacionales = obtener_ingresos_nacionales(mes, anio)
-        internacionales_usd = obtener_ingresos_internacionales(mes, anio)
-        internacionales_mxn = internacionales_usd * 17.0
-        
-        ingresos = riviera['total'] + nacionales + internacionales_mxn
-        gastos_data = obtener_gastos_operativos(mes, anio)
-        gastos = gastos_data['total']
-        utilidad = ingresos - gastos
+        ingresos = resumen[mes]['ingresos']
+        gastos = resumen[mes]['gastos']['total']
+        utilidad = resumen[mes]['utilidad']
         margen = (utilidad / ingresos * 100) if ingresos > 0 else 0
         
         mes_nombre = calendar.month_name[mes]
@@ -9,25 +9,20 @@ from openpyxl.chart import BarChart, PieChart, Reference
 def crear_reporte_excel_mensual(mes, anio):
     """Genera reporte financiero mensual en Excel"""
     
-    from reportes_financieros import (
-        obtener_ingresos_riviera,
-        obtener_ingresos_nacionales,
-        obtener_ingresos_internacionales,
-        obtener_gastos_operativos
-    )
+    from reportes_financieros import resumen_financiero
     
     mes_nombre = calendar.month_name[mes]
     
     # Obtener datos
-    riviera = obtener_ingresos_riviera(mes, anio)
-    nacionales = obtener_ingresos_nacionales(mes, anio)
-    internacionales_usd = obtener_ingresos_internacionales(mes, anio)
-    tipo_cambio = 17.0
-    internacionales_mxn = internacionales_usd * tipo_cambio
+    datos = resumen_financiero(anio)[mes]
+    riviera = datos['riviera']
+    nacionales = datos['nacionales']
+    internacionales_usd = datos['internacionales_usd']
+    internacionales_mxn = datos['internacionales_mxn']
     
-    total_ingresos = riviera['total'] + nacionales + internacionales_mxn
+    total_ingresos = datos['ingresos']
     
-    gastos_data = obtener_gastos_operativos(mes, anio)
+    gastos_data = datos['gastos']
     total_gastos = gastos_data['total']
     
     utilidad_neta = total_ingresos - total_gastos
@@ -181,12 +176,7 @@ def crear_reporte_excel_mensual(mes, anio):
 def crear_reporte_excel_anual(anio):
     """Genera reporte financiero anual en Excel"""
     
-    from reportes_financieros import (
-        obtener_ingresos_riviera,
-        obtener_ingresos_nacionales,
-        obtener_ingresos_internacionales,
-        obtener_gastos_operativos
-    )
+    from reportes_financieros import resumen_financiero
     
     wb = Workbook()
     ws1 = wb.active
@@ -228,16 +218,10 @@ def crear_reporte_excel_anual(anio):
     total_ingresos = 0
     total_gastos = 0
     
-    for mes in range(1, 13):
-        riviera = obtener_ingresos_riviera(mes, anio)
-        nacionales = obtener_ingresos_nacionales(mes, anio)
-        internacionales_usd = obtener_ingresos_internacionales(mes, anio)
-        internacionales_mxn = internacionales_usd * 17.0
-        
-        ingresos = riviera['total'] + nacionales + internacionales_mxn
-        gastos_data = obtener_gastos_operativos(mes, anio)
-        gastos = gastos_data['total']
-        utilidad = ingresos - gastos
+    for mes, datos in resumen_financiero(anio).items():
+        ingresos = datos['ingresos']
+        gastos = datos['gastos']['total']
+        utilidad = datos['utilidad']
         margen = (utilidad / ingresos * 100) if ingresos > 0 else 0
         
         ws1[f'A{row}'] = calendar.month_name[mes]
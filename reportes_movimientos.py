@@ -2,6 +2,54 @@ from database import conectar
 from datetime import datetime, timedelta
 import os
 
+from movimientos_pagos import instalar_movimientos_pagos
+
+
+def _abonos_periodo(conexion, fecha_inicio, fecha_fin_excl):
+    """
+    Abonos de Riviera, nacionales e internacionales del rango en un solo
+    recorrido del índice de fecha del libro de pagos (movimientos_pagos.py).
+    Devuelve (riviera, nacionales, internacionales) con las columnas de cada reporte.
+    """
+    # Crea el libro si esta base aún no lo tiene (idempotente)
+    instalar_movimientos_pagos(conexion)
+    cursor = conexion.cursor()
+    cursor.execute("""
+        SELECT m.producto, m.fecha, m.referencia_id, m.monto_mxn, m.monto_usd,
+               v.cliente, v.destino, v.tipo_venta,
+               cn.nombre_cliente, vn.id, vn.nombre_viaje, vn.destino,
+               ci.nombre_cliente, vi.id, vi.destino, ai.moneda, ai.monto_original, ai.tipo_cambio,
+               vd.nombre
+        FROM movimientos_pagos m
+        LEFT JOIN ventas v ON m.producto = 'riviera' AND v.id = m.referencia_id
+        LEFT JOIN clientes_nacionales cn ON m.producto = 'nacional' AND cn.id = m.referencia_id
+        LEFT JOIN viajes_nacionales vn ON vn.id = cn.viaje_id
+        LEFT JOIN abonos_nacionales an ON m.producto = 'nacional' AND an.id = m.abono_id
+        LEFT JOIN clientes_internacionales ci ON m.producto = 'internacional' AND ci.id = m.referencia_id
+        LEFT JOIN viajes_internacionales vi ON vi.id = ci.viaje_id
+        LEFT JOIN abonos_internacionales ai ON m.producto = 'internacional' AND ai.id = m.abono_id
+        LEFT JOIN vendedoras vd
+               ON vd.id = CASE WHEN m.producto = 'nacional' THEN an.vendedora_id ELSE m.vendedora_id END
+        WHERE m.fecha >= ? AND m.fecha < ?
+          AND m.producto IN ('riviera', 'nacional', 'internacional')
+        ORDER BY m.fecha DESC
+    """, (fecha_inicio, fecha_fin_excl))
+
+    riviera, nacionales, internacionales = [], [], []
+    for (producto, fecha, ref, mxn, usd, cliente, destino, tipo_venta,
+         cliente_nac, viaje_nac, nombre_viaje, destino_nac,
+         cliente_int, viaje_int, destino_int, moneda, monto_original, tipo_cambio,
+         vendedora) in cursor.fetchall():
+        if producto == "riviera":
+            riviera.append((fecha, cliente, destino, mxn, vendedora, tipo_venta, ref))
+        elif producto == "nacional":
+            nacionales.append((fecha, cliente_nac, nombre_viaje, destino_nac, mxn,
+                               vendedora, viaje_nac, ref))
+        else:
+            internacionales.append((fecha, cliente_int, destino_int, moneda, monto_original,
+                                    tipo_cambio, usd, viaje_int, ref))
+    return riviera, nacionales, internacionales
+
 def reporte_movimientos_semanal_consola():
     """Muestra reporte de todos los abonos de la semana en consola"""
     print("\n" + "="*70)
@@ -47,8 +95,12 @@ def reporte_movimientos_semanal_consola():
         print("❌ Opción inválida.")
         return
     
+    # Rango abierto al final para que se use el índice de fecha del libro de pagos
+    fecha_fin_excl = (datetime.strptime(fecha_fin, "%Y-%m-%d") + timedelta(days=1)).strftime("%Y-%m-%d")
+
     conexion = conectar()
-    cursor = conexion.cursor()
+    abonos_riviera, abonos_nacionales, abonos_internacionales = _abonos_periodo(
+        conexion, fecha_inicio, fecha_fin_excl)
     
     print("\n" + "="*70)
     print(f"💰 MOVIMIENTOS - {titulo_periodo}")
@@ -59,16 +111,6 @@ def reporte_movimientos_semanal_consola():
     print("🏖️  ABONOS - RIVIERA MAYA")
     print("="*70)
     
-    cursor.execute("""
-        SELECT a.fecha, v.cliente, v.destino, a.monto, vd.nombre, v.tipo_venta, v.id
-        FROM abonos a
-        JOIN ventas v ON a.venta_id = v.id
-        JOIN vendedoras vd ON v.vendedora_id = vd.id
-        WHERE DATE(a.fecha) BETWEEN ? AND ?
-        ORDER BY a.fecha DESC
-    """, (fecha_inicio, fecha_fin))
-    
-    abonos_riviera = cursor.fetchall()
     total_riviera = 0
     
     if abonos_riviera:
@@ -94,18 +136,6 @@ def reporte_movimientos_semanal_consola():
     print("🎫 ABONOS - VIAJES NACIONALES")
     print("="*70)
     
-    cursor.execute("""
-        SELECT a.fecha, c.nombre_cliente, vn.nombre_viaje, vn.destino, a.monto, 
-               vd.nombre, vn.id, c.id
-        FROM abonos_nacionales a
-        JOIN clientes_nacionales c ON a.cliente_id = c.id
-        JOIN viajes_nacionales vn ON c.viaje_id = vn.id
-        JOIN vendedoras vd ON a.vendedora_id = vd.id
-        WHERE DATE(a.fecha) BETWEEN ? AND ?
-        ORDER BY a.fecha DESC
-    """, (fecha_inicio, fecha_fin))
-    
-    abonos_nacionales = cursor.fetchall()
     total_nacionales = 0
     
     if abonos_nacionales:
@@ -129,17 +159,6 @@ def reporte_movimientos_semanal_consola():
     print("🌎 ABONOS - VIAJES INTERNACIONALES")
     print("="*70)
     
-    cursor.execute("""
-        SELECT a.fecha, c.nombre_cliente, vi.destino, a.moneda, a.monto_original,
-               a.tipo_cambio, a.monto_usd, vi.id, c.id
-        FROM abonos_internacionales a
-        JOIN clientes_internacionales c ON a.cliente_id = c.id
-        JOIN viajes_internacionales vi ON c.viaje_id = vi.id
-        WHERE DATE(a.fecha) BETWEEN ? AND ?
-        ORDER BY a.fecha DESC
-    """, (fecha_inicio, fecha_fin))
-    
-    abonos_internacionales = cursor.fetchall()
     total_internacionales_usd = 0
     
     if abonos_internacionales:
@@ -242,8 +261,12 @@ def exportar_movimientos_excel():
         print("❌ Opción inválida.")
         return
     
+    # Rango abierto al final para que se use el índice de fecha del libro de pagos
+    fecha_fin_excl = (datetime.strptime(fecha_fin, "%Y-%m-%d") + timedelta(days=1)).strftime("%Y-%m-%d")
+
     conexion = conectar()
-    cursor = conexion.cursor()
+    abonos_riviera, abonos_nacionales, abonos_internacionales = _abonos_periodo(
+        conexion, fecha_inicio, fecha_fin_excl)
     
     # Crear libro de Excel
     wb = openpyxl.Workbook()
@@ -277,18 +300,6 @@ def exportar_movimientos_excel():
         cell.alignment = Alignment(horizontal='center')
         cell.border = border
     
-    # Obtener datos
-    cursor.execute("""
-        SELECT a.fecha, v.cliente, v.destino, a.monto, vd.nombre, v.tipo_venta, v.id
-        FROM abonos a
-        JOIN ventas v ON a.venta_id = v.id
-        JOIN vendedoras vd ON v.vendedora_id = vd.id
-        WHERE DATE(a.fecha) BETWEEN ? AND ?
-        ORDER BY a.fecha DESC
-    """, (fecha_inicio, fecha_fin))
-    
-    abonos_riviera = cursor.fetchall()
-    
     row = 4
     total_riviera = 0
     
@@ -338,20 +349,6 @@ def exportar_movimientos_excel():
         cell.alignment = Alignment(horizontal='center')
         cell.border = border
     
-    # Obtener datos
-    cursor.execute("""
-        SELECT a.fecha, c.nombre_cliente, vn.nombre_viaje, vn.destino, a.monto, 
-               vd.nombre, vn.id, c.id
-        FROM abonos_nacionales a
-        JOIN clientes_nacionales c ON a.cliente_id = c.id
-        JOIN viajes_nacionales vn ON c.viaje_id = vn.id
-        JOIN vendedoras vd ON a.vendedora_id = vd.id
-        WHERE DATE(a.fecha) BETWEEN ? AND ?
-        ORDER BY a.fecha DESC
-    """, (fecha_inicio, fecha_fin))
-    
-    abonos_nacionales = cursor.fetchall()
-    
     row = 4
     total_nacionales = 0
     
@@ -402,19 +399,6 @@ def exportar_movimientos_excel():
         cell.alignment = Alignment(horizontal='center')
         cell.border = border
     
-    # Obtener datos
-    cursor.execute("""
-        SELECT a.fecha, c.nombre_cliente, vi.destino, a.moneda, a.monto_original,
-               a.tipo_cambio, a.monto_usd, vi.id, c.id
-        FROM abonos_internacionales a
-        JOIN clientes_internacionales c ON a.cliente_id = c.id
-        JOIN viajes_internacionales vi ON c.viaje_id = vi.id
-        WHERE DATE(a.fecha) BETWEEN ? AND ?
-        ORDER BY a.fecha DESC
-    """, (fecha_inicio, fecha_fin))
-    
-    abonos_internacionales = cursor.fetchall()
-    
     row = 4
     total_internacionales_usd = 0
     
@@ -0,0 +1,181 @@
+"""
+RESUMEN DE VENTAS - Sistema Agencia Riviera Maya
+Totales acumulados de ventas Riviera Maya por vendedora y estado, para que
+el dashboard lea unas cuantas filas en lugar de recorrer toda la tabla
+ventas en cada recarga.
+
+La tabla resumen_ventas se mantiene con triggers sobre ventas: cada INSERT,
+UPDATE o DELETE resta lo que aportaba la fila anterior y suma lo que aporta
+la nueva, dentro de la misma transacción. Los abonos entran por ahí también,
+porque registrar un abono actualiza ventas.pagado y ventas.saldo.
+
+Columnas por (usuario_id, estado): cantidad de ventas, vendido, cobrado,
+saldo, ganancia y comisiones (comision_vendedora). usuario_id es la misma
+columna con la que el dashboard filtra las ventas de cada vendedora.
+
+Si alguna vez se cambian ventas por fuera de la base (restauración de un
+respaldo, edición con triggers deshabilitados) se recalcula desde cero con:
+    python resumen_ventas.py
+"""
+
+import os
+import sqlite3
+
+from transacciones import transaccion
+
+DB_NAME = "agencia.db"
+
+# Columnas de ventas que afectan el resumen (los UPDATE de otras columnas no disparan nada)
+_COLUMNAS_VENTAS = "usuario_id, estado, precio_total, pagado, saldo, ganancia, comision_vendedora"
+
+_CREAR_TABLA = """
+    CREATE TABLE IF NOT EXISTS resumen_ventas (
+        usuario_id INTEGER NOT NULL,
+        estado TEXT NOT NULL,
+        cantidad INTEGER NOT NULL DEFAULT 0,
+        vendido NUMERIC(14,2) NOT NULL DEFAULT 0,
+        cobrado NUMERIC(14,2) NOT NULL DEFAULT 0,
+        saldo NUMERIC(14,2) NOT NULL DEFAULT 0,
+        ganancia NUMERIC(14,2) NOT NULL DEFAULT 0,
+        comisiones NUMERIC(14,2) NOT NULL DEFAULT 0,
+        PRIMARY KEY (usuario_id, estado)
+    )
+"""
+
+
+def _aplicar(fila, signo):
+    """Upsert que suma (signo 1) o resta (signo -1) la fila NEW/OLD de ventas."""
+    return f"""
+        INSERT INTO resumen_ventas (usuario_id, estado, cantidad, vendido, cobrado, saldo, ganancia, comisiones)
+        VALUES (COALESCE({fila}.usuario_id, 0), {fila}.estado, {signo},
+                {signo} * COALESCE({fila}.precio_total, 0), {signo} * COALESCE({fila}.pagado, 0),
+                {signo} * COALESCE({fila}.saldo, 0), {signo} * COALESCE({fila}.ganancia, 0),
+                {signo} * COALESCE({fila}.comision_vendedora, 0))
+        ON CONFLICT (usuario_id, estado) DO UPDATE SET
+            cantidad   = resumen_ventas.cantidad   + excluded.cantidad,
+            vendido    = resumen_ventas.vendido    + excluded.vendido,
+            cobrado    = resumen_ventas.cobrado    + excluded.cobrado,
+            saldo      = resumen_ventas.saldo      + excluded.saldo,
+            ganancia   = resumen_ventas.ganancia   + excluded.ganancia,
+            comisiones = resumen_ventas.comisiones + excluded.comisiones;
+    """
+
+
+def _triggers_sqlite():
+    return {
+        "trg_resumen_ventas_ins": f"AFTER INSERT ON ventas BEGIN {_aplicar('NEW', 1)} END",
+        "trg_resumen_ventas_upd": (f"AFTER UPDATE OF {_COLUMNAS_VENTAS} ON ventas BEGIN "
+                                   f"{_aplicar('OLD', -1)} {_aplicar('NEW', 1)} END"),
+        "trg_resumen_ventas_del": f"AFTER DELETE ON ventas BEGIN {_aplicar('OLD', -1)} END",
+    }
+
+
+_FUNCION_POSTGRES = f"""
+    CREATE OR REPLACE FUNCTION resumen_ventas_trigger() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP IN ('UPDATE', 'DELETE') THEN
+            {_aplicar('OLD', -1)}
+        END IF;
+        IF TG_OP IN ('INSERT', 'UPDATE') THEN
+            {_aplicar('NEW', 1)}
+        END IF;
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql
+"""
+
+
+def _existe_tabla(cursor, es_postgres):
+    if es_postgres:
+        cursor.execute("SELECT 1 FROM information_schema.tables "
+                       "WHERE table_schema = current_schema() AND table_name = 'resumen_ventas'")
+    else:
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'resumen_ventas'")
+    return cursor.fetchone() is not None
+
+
+def instalar_resumen_ventas(conn, es_postgres=False):
+    """
+    Crea la tabla y los triggers si faltan. La primera vez llena la tabla
+    con reconstruir_resumen_ventas(). Devuelve True si la reconstruyó.
+    """
+    cursor = conn.cursor()
+    nueva = not _existe_tabla(cursor, es_postgres)
+    cursor.execute(_CREAR_TABLA)
+    if es_postgres:
+        cursor.execute(_FUNCION_POSTGRES)
+        cursor.execute("SELECT 1 FROM pg_trigger WHERE tgname = 'trg_resumen_ventas'")
+        if cursor.fetchone() is None:
+            cursor.execute(f"""
+                CREATE TRIGGER trg_resumen_ventas
+                AFTER INSERT OR DELETE OR UPDATE OF {_COLUMNAS_VENTAS} ON ventas
+                FOR EACH ROW EXECUTE PROCEDURE resumen_ventas_trigger()
+            """)
+    else:
+        for nombre, cuerpo in _triggers_sqlite().items():
+            cursor.execute(f"CREATE TRIGGER IF NOT EXISTS {nombre} {cuerpo}")
+    conn.commit()
+    if nueva:
+        reconstruir_resumen_ventas(conn, es_postgres)
+    return nueva
+
+
+def reconstruir_resumen_ventas(conn, es_postgres=False):
+    """Recalcula resumen_ventas desde ventas. Devuelve cuántas filas quedaron."""
+    cursor = conn.cursor()
+    with transaccion(conn, es_postgres):
+        if es_postgres:
+            # El candado detiene las escrituras en ventas (no las lecturas)
+            # hasta el commit
+            cursor.execute("LOCK TABLE ventas IN SHARE MODE")
+        cursor.execute("DELETE FROM resumen_ventas")
+        cursor.execute("""
+            INSERT INTO resumen_ventas (usuario_id, estado, cantidad, vendido, cobrado, saldo, ganancia, comisiones)
+            SELECT COALESCE(usuario_id, 0), estado, COUNT(*),
+                   COALESCE(SUM(precio_total), 0), COALESCE(SUM(pagado), 0), COALESCE(SUM(saldo), 0),
+                   COALESCE(SUM(ganancia), 0), COALESCE(SUM(comision_vendedora), 0)
+            FROM ventas
+            GROUP BY COALESCE(usuario_id, 0), estado
+        """)
+    cursor.execute("SELECT COUNT(*) FROM resumen_ventas")
+    return cursor.fetchone()[0]
+
+
+def ejecutar_reconstruccion():
+    """Reconstruye el resumen en PostgreSQL (DATABASE_URL) o agencia.db"""
+    print("\n" + "="*60)
+    print("📊 RESUMEN DE VENTAS - RECONSTRUCCIÓN")
+    print("="*60)
+
+    database_url = os.environ.get("DATABASE_URL", "")
+    if database_url:
+        import psycopg2
+        conn = psycopg2.connect(database_url)
+        conn.autocommit = True
+        print("\n🐘 Base: PostgreSQL")
+    else:
+        conn = sqlite3.connect(DB_NAME)
+        print(f"\n🗄️ Base: {DB_NAME}")
+
+    es_postgres = bool(database_url)
+    try:
+        if not instalar_resumen_ventas(conn, es_postgres):
+            reconstruir_resumen_ventas(conn, es_postgres)
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT usuario_id, SUM(cantidad), SUM(vendido), SUM(saldo)
+            FROM resumen_ventas GROUP BY usuario_id ORDER BY usuario_id
+        """)
+        for usuario_id, cantidad, vendido, saldo in cursor.fetchall():
+            print(f"   👤 {usuario_id:>4}: {cantidad:>6} ventas · vendido ${float(vendido):,.2f} · saldo ${float(saldo):,.2f}")
+        print("\n✅ RESUMEN RECONSTRUIDO\n")
+        return True
+    except Exception as e:
+        print(f"\n❌ ERROR: {e}\n")
+        return False
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    ejecutar_reconstruccion()
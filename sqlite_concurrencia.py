@@ -0,0 +1,114 @@
+"""
+SQLITE CONCURRENCIA - Sistema Agencia Riviera Maya
+Modo de SQLite para cuando varias sesiones de Streamlit (o la app y los
+scripts de consola) comparten agencia.db en la oficina.
+
+Modo "wal" (default):
+    journal_mode=WAL     los lectores no esperan al escritor ni al revés
+    synchronous=NORMAL   en WAL es seguro ante caídas de la app; sólo un
+                         corte de luz puede perder la última transacción
+    cache_size/mmap_size caché de páginas y lectura por memoria mapeada
+    busy_timeout         espera el candado en lugar de fallar con
+                         "database is locked"
+
+Modo "compat": sólo busy_timeout; para cuando agencia.db vive en una carpeta
+de red compartida, donde WAL no funciona. Una base que ya quedó en WAL
+sigue en WAL (el modo se guarda en el archivo); se regresa con
+    sqlite3 agencia.db "PRAGMA journal_mode=DELETE"
+
+Turno de escritura: SQLite admite un solo escritor a la vez. Si dos
+transacciones empiezan leyendo y luego las dos quieren escribir, una recibe
+"database is locked" de inmediato, sin esperar el busy_timeout. Para
+evitarlo, las conexiones de la app piden el TurnoEscritura antes de su
+primer INSERT/UPDATE/DELETE y abren la transacción con BEGIN IMMEDIATE;
+el turno se suelta en commit/rollback. Los escritores del proceso esperan
+en fila (en orden de llegada) y los lectores no esperan nunca.
+
+Variables de entorno:
+    SQLITE_MODO              wal | compat                    (default wal)
+    SQLITE_CACHE_MB          caché de páginas por conexión   (default 32)
+    SQLITE_MMAP_MB           lectura por mmap                (default 256)
+    SQLITE_BUSY_TIMEOUT_MS   espera del candado              (default 10000)
+"""
+
+import os
+import re
+import time
+import threading
+
+SQLITE_MODO = os.environ.get("SQLITE_MODO", "wal").lower()
+SQLITE_CACHE_MB = int(os.environ.get("SQLITE_CACHE_MB", "32"))
+SQLITE_MMAP_MB = int(os.environ.get("SQLITE_MMAP_MB", "256"))
+SQLITE_BUSY_TIMEOUT_MS = int(os.environ.get("SQLITE_BUSY_TIMEOUT_MS", "10000"))
+
+# Sentencias con las que sqlite3 abre la transacción implícita
+_RE_ESCRITURA = re.compile(r"^\s*(?:INSERT|UPDATE|DELETE|REPLACE)\b", re.IGNORECASE)
+
+
+def es_escritura(sql):
+    """True si `sql` es un INSERT/UPDATE/DELETE/REPLACE."""
+    return bool(_RE_ESCRITURA.match(sql))
+
+
+def configurar_conexion(conn, modo=None):
+    """Aplica los PRAGMA del modo a una conexión recién abierta. Devuelve el journal_mode."""
+    modo = modo or SQLITE_MODO
+    conn.execute(f"PRAGMA busy_timeout = {SQLITE_BUSY_TIMEOUT_MS}")
+    if modo == "wal":
+        journal = conn.execute("PRAGMA journal_mode = WAL").fetchone()[0]
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute(f"PRAGMA cache_size = -{SQLITE_CACHE_MB * 1024}")
+        conn.execute(f"PRAGMA mmap_size = {SQLITE_MMAP_MB * 1024 * 1024}")
+        return journal
+    return conn.execute("PRAGMA journal_mode").fetchone()[0]
+
+
+class TurnoEscritura:
+    """
+    Fila de escritores del proceso: uno escribe, los demás esperan en orden
+    de llegada. Si la espera pasa de `espera_max` segundos se deja pasar al
+    que espera (el busy_timeout de SQLite decide entonces) para que una
+    conexión olvidada sin commit no congele la app.
+    """
+
+    def __init__(self, espera_max=SQLITE_BUSY_TIMEOUT_MS / 1000):
+        self._cond = threading.Condition()
+        self._siguiente = 0     # turno que se entrega al próximo que llega
+        self._atendiendo = 0    # turno que puede escribir
+        self.espera_max = espera_max
+        self._metricas = {"escrituras": 0, "esperas": 0, "vencidas": 0,
+                          "espera_total_s": 0.0, "espera_max_s": 0.0}
+
+    def tomar(self):
+        inicio = time.perf_counter()
+        with self._cond:
+            turno = self._siguiente
+            self._siguiente += 1
+            limite = time.monotonic() + self.espera_max
+            while self._atendiendo < turno:
+                restante = limite - time.monotonic()
+                if restante <= 0:
+                    self._metricas["vencidas"] += 1
+                    break
+                self._cond.wait(restante)
+            # Al vencer se adelanta la fila hasta este turno
+            self._atendiendo = max(self._atendiendo, turno)
+            espera = time.perf_counter() - inicio
+            self._metricas["escrituras"] += 1
+            if espera > 0.001:
+                self._metricas["esperas"] += 1
+            self._metricas["espera_total_s"] += espera
+            self._metricas["espera_max_s"] = max(self._metricas["espera_max_s"], espera)
+        return turno
+
+    def soltar(self, turno):
+        with self._cond:
+            if self._atendiendo == turno:
+                self._atendiendo += 1
+                self._cond.notify_all()
+
+    def metricas(self):
+        with self._cond:
+            m = dict(self._metricas)
+            m["en_curso"] = self._siguiente - self._atendiendo    # escribiendo + en fila
+        return m
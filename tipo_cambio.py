@@ -0,0 +1,219 @@
+"""
+TIPO DE CAMBIO USD/MXN - Sistema Agencia Riviera Maya
+Servicio de tipo de cambio para los abonos internacionales.
+
+El tipo de cambio se consulta una vez al día (Megatravel, con
+exchangerate-api de respaldo), se guarda en la tabla tipos_cambio y se sirve
+desde memoria; la consulta a internet corre en un hilo aparte para que
+registrar un abono no espere 8-10 s a que responda la página.
+
+Regla de fin de semana: sábado y domingo usan el tipo de cambio del viernes.
+
+Fuente configurable con la variable de entorno TIPO_CAMBIO_FUENTE:
+    web   (default) Megatravel -> exchangerate-api
+    stub  valor fijo de TIPO_CAMBIO_STUB (default 17.50), sin internet;
+          para trabajar sin conexión o en pruebas
+"""
+
+import os
+import re
+import json
+import threading
+import urllib.request
+from datetime import datetime, date, timedelta
+
+TIPO_CAMBIO_FUENTE = os.environ.get("TIPO_CAMBIO_FUENTE", "web").lower()
+TIPO_CAMBIO_STUB = float(os.environ.get("TIPO_CAMBIO_STUB", "17.50"))
+TIPO_CAMBIO_REFRESCO_S = int(os.environ.get("TIPO_CAMBIO_REFRESCO_S", "3600"))
+TIPO_CAMBIO_REINTENTO_S = 600
+
+_DIAS_FIN_SEMANA = {5: "sábado", 6: "domingo"}
+
+
+# ─── FUENTES ─────────────────────────────────────────────────────────────────
+
+def fuente_megatravel():
+    """Tipo de cambio publicado en la página de Megatravel, o None."""
+    try:
+        url = "https://www.megatravel.com.mx/"
+        headers = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"}
+        req = urllib.request.Request(url, headers=headers)
+        with urllib.request.urlopen(req, timeout=8) as resp:
+            html = resp.read().decode("utf-8")
+        # Patron principal
+        match = re.search(r"Tipo de\s+Cambio\s+([\d.]+)", html)
+        if not match:
+            # Patron alternativo: buscar número de 2 dígitos punto 2 dígitos cerca de "Cambio"
+            match = re.search(r"[Cc]ambio[^\d]*(\d{2}\.\d{2,4})", html)
+        if match:
+            tc = float(match.group(1))
+            if 10 <= tc <= 30:   # Rango razonable MXN/USD
+                return tc
+    except Exception:
+        pass
+    return None
+
+
+def fuente_exchangerate_api():
+    """API de respaldo exchangerate-api, o None."""
+    try:
+        url = "https://api.exchangerate-api.com/v4/latest/USD"
+        with urllib.request.urlopen(url, timeout=5) as resp:
+            data = json.loads(resp.read().decode())
+            return float(data["rates"]["MXN"])
+    except Exception:
+        pass
+    return None
+
+
+def consultar_fuentes(fuente=None):
+    """
+    Consulta el tipo de cambio según la fuente configurada.
+    Retorna (tipo_cambio, nombre_fuente) o (None, None).
+    """
+    fuente = fuente or TIPO_CAMBIO_FUENTE
+    if fuente == "stub":
+        return TIPO_CAMBIO_STUB, "Local (stub)"
+    tc = fuente_megatravel()
+    if tc:
+        return tc, "Megatravel"
+    tc = fuente_exchangerate_api()
+    if tc:
+        return tc, "exchangerate-api.com"
+    return None, None
+
+
+def fecha_vigente(hoy=None):
+    """Fecha cuyo tipo de cambio aplica hoy: sábado y domingo usan el viernes."""
+    hoy = hoy or date.today()
+    if hoy.weekday() in _DIAS_FIN_SEMANA:
+        return hoy - timedelta(days=hoy.weekday() - 4)
+    return hoy
+
+
+# ─── SERVICIO ────────────────────────────────────────────────────────────────
+
+class ServicioTipoCambio:
+    """
+    Tipo de cambio diario en memoria, respaldado por la tabla tipos_cambio.
+    `conectar` es la función que abre la conexión (conectar_db de la app o
+    database.conectar en consola).
+    """
+
+    def __init__(self, conectar, fuente=None):
+        self._conectar = conectar
+        self._fuente = fuente or TIPO_CAMBIO_FUENTE
+        self._memoria = {}               # 'YYYY-MM-DD' -> (tipo_cambio, fuente)
+        self._lock = threading.Lock()
+        self._consultando = threading.Lock()
+        self._hilo = None
+        self._crear_tabla()
+        self._cargar()
+
+    def _crear_tabla(self):
+        conn = self._conectar()
+        try:
+            cursor = conn.cursor()
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS tipos_cambio (
+                    fecha TEXT PRIMARY KEY,
+                    tipo_cambio REAL NOT NULL,
+                    fuente TEXT,
+                    fecha_consulta TEXT NOT NULL
+                )
+            """)
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _cargar(self, dias=30):
+        """Sube a memoria los últimos días guardados."""
+        desde = (date.today() - timedelta(days=dias)).isoformat()
+        conn = self._conectar()
+        try:
+            cursor = conn.cursor()
+            cursor.execute("SELECT fecha, tipo_cambio, fuente FROM tipos_cambio WHERE fecha >= ?", (desde,))
+            filas = cursor.fetchall()
+        finally:
+            conn.close()
+        with self._lock:
+            for fecha, tc, fuente in filas:
+                self._memoria[fecha] = (float(tc), fuente)
+
+    def _guardar(self, fecha, tc, fuente):
+        conn = self._conectar()
+        try:
+            cursor = conn.cursor()
+            cursor.execute("""
+                INSERT INTO tipos_cambio (fecha, tipo_cambio, fuente, fecha_consulta)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT (fecha) DO UPDATE SET tipo_cambio = excluded.tipo_cambio,
+                    fuente = excluded.fuente, fecha_consulta = excluded.fecha_consulta
+            """, (fecha, tc, fuente, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
+            conn.commit()
+        finally:
+            conn.close()
+        with self._lock:
+            self._memoria[fecha] = (tc, fuente)
+
+    def refrescar(self, hoy=None):
+        """
+        Consulta la fuente y guarda el tipo de cambio de la fecha vigente.
+        Devuelve True si se obtuvo. Si ya hay una consulta en curso no lanza otra.
+        """
+        if not self._consultando.acquire(blocking=False):
+            return False
+        try:
+            tc, fuente = consultar_fuentes(self._fuente)
+            if tc:
+                self._guardar(fecha_vigente(hoy).isoformat(), round(tc, 4), fuente)
+            return bool(tc)
+        finally:
+            self._consultando.release()
+
+    def refrescar_en_segundo_plano(self, hoy=None):
+        hilo = threading.Thread(target=self.refrescar, args=(hoy,), name="tipo-cambio", daemon=True)
+        hilo.start()
+        return hilo
+
+    def iniciar(self):
+        """Arranca el hilo que mantiene al día el tipo de cambio."""
+        if self._hilo is not None:
+            return
+        def _ciclo():
+            espera = threading.Event()
+            while True:
+                if fecha_vigente().isoformat() in self._memoria:
+                    pausa = TIPO_CAMBIO_REFRESCO_S
+                else:
+                    pausa = TIPO_CAMBIO_REFRESCO_S if self.refrescar() else TIPO_CAMBIO_REINTENTO_S
+                espera.wait(pausa)
+        self._hilo = threading.Thread(target=_ciclo, name="tipo-cambio-ciclo", daemon=True)
+        self._hilo.start()
+
+    def obtener(self, hoy=None, esperar=0):
+        """
+        Tipo de cambio vigente desde memoria: (tipo_cambio, fuente).
+        Si el del día aún no está, pide la consulta en segundo plano y espera
+        hasta `esperar` segundos; si no llega, regresa el último guardado
+        (indicando su fecha) o (None, None) si no hay ninguno.
+        """
+        hoy = hoy or date.today()
+        vigente = fecha_vigente(hoy).isoformat()
+        if vigente not in self._memoria and not self._consultando.locked():
+            hilo = self.refrescar_en_segundo_plano(hoy)
+            if esperar:
+                hilo.join(esperar)
+
+        with self._lock:
+            if vigente in self._memoria:
+                tc, fuente = self._memoria[vigente]
+                if hoy.weekday() in _DIAS_FIN_SEMANA:
+                    fuente += f" (viernes — hoy es {_DIAS_FIN_SEMANA[hoy.weekday()]})"
+                return tc, fuente
+            anteriores = sorted(f for f in self._memoria if f < vigente)
+            if anteriores:
+                tc, fuente = self._memoria[anteriores[-1]]
+                fecha = datetime.strptime(anteriores[-1], "%Y-%m-%d").strftime("%d/%m/%Y")
+                return tc, f"{fuente} (último registrado: {fecha})"
+        return None, None
@@ -0,0 +1,37 @@
+"""
+TRANSACCIONES - Sistema Agencia Riviera Maya
+Bloques de escrituras que se confirman o se descartan juntos, en SQLite y
+PostgreSQL.
+
+Las conexiones PostgreSQL de la app (y las de los scripts que crean índices
+con CONCURRENTLY) tienen autocommit: cada sentencia se confirma sola y
+commit()/rollback() de psycopg2 no envían nada. Un BEGIN escrito a mano
+queda abierto y la conexión vuelve al pool en medio de la transacción.
+transaccion() apaga el autocommit mientras dura el bloque y lo restaura al
+salir:
+
+    with transaccion(conn, es_postgres):
+        cursor.execute("DELETE FROM resumen_ventas")
+        cursor.execute("INSERT INTO resumen_ventas ...")
+
+En SQLite sólo hace commit al salir o rollback si hubo excepción.
+"""
+
+from contextlib import contextmanager
+
+
+@contextmanager
+def transaccion(conn, es_postgres=False):
+    """Confirma las escrituras del bloque al salir; las descarta si hay excepción."""
+    autocommit = es_postgres and conn.autocommit
+    if autocommit:
+        conn.autocommit = False
+    try:
+        yield
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
+    finally:
+        if autocommit and not conn.closed:
+            conn.autocommit = True
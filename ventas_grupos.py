@@ -176,6 +176,13 @@ def registrar_venta_grupo():
     saldo = precio_total - abono_inicial
     
     # ===== GUARDAR VENTA =====
+    # La habitación se descuenta en la misma transacción que la venta: si otra
+    # vendedora se llevó la última, no se registra nada
+    if not descontar_habitacion_grupo(grupo_id, 1, cursor):
+        print("❌ Ya no quedan habitaciones en este grupo.")
+        conexion.close()
+        return
+    
     fecha_registro = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     
     # Usar tabla ventas pero con campos adicionales para grupos
@@ -226,10 +233,6 @@ def registrar_venta_grupo():
             VALUES (?, ?, ?)
         """, (venta_id, pasajero["nombre"], pasajero["tipo"]))
     
-    # Descontar habitación del grupo
-    if not descontar_habitacion_grupo(grupo_id, 1):
-        print("⚠️  Error al descontar habitación del grupo.")
-    
     conexion.commit()
     conexion.close()
     
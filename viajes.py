@@ -177,6 +177,14 @@ def registrar_viaje_bloqueo(usuario_actual):
     conexion = conectar()
     cursor = conexion.cursor()
     
+    # ===== DESCONTAR HABITACIÓN DEL BLOQUEO =====
+    # En la misma transacción que la venta: si otra vendedora se llevó la
+    # última habitación, no se registra nada
+    if not descontar_habitacion(id_bloqueo, cursor):
+        conexion.close()
+        print("❌ Ya no quedan habitaciones en este bloqueo.")
+        return
+    
     fecha_registro = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     
     cursor.execute("""
@@ -215,9 +223,6 @@ def registrar_viaje_bloqueo(usuario_actual):
     conexion.commit()
     conexion.close()
     
-    # ===== DESCONTAR HABITACIÓN DEL BLOQUEO =====
-    descontar_habitacion(id_bloqueo)
-    
     print("\n✅ Viaje de bloqueo registrado correctamente.")
     print(f"📦 Habitaciones restantes en bloqueo: {bloqueo['habitaciones_disponibles'] - 1}")
 